@@ -31,12 +31,34 @@ __maintainer__ = ['Gui Talarico', 'Ehsan Iran-Nejad']
 __license__ = 'MIT'
 __contact__ = 'github.com/gtalarico/revitpythonwrapper'
 
+import sys
+
 from rpw.utils.logger import logger
 from rpw.__revit import revit, DB, UI
-import rpw.db
-import rpw.ui
-import rpw.extras
 
-# For Compatibility. Use `from rpw import revit; revit.doc` instead.doc
-# This module import will be disable on rpw 2.0
-doc, uidoc = revit.doc, revit.uidoc
+# Subpackages are loaded on first attribute access (PEP 562), so scripts that
+# only need ``revit`` or ``DB`` don't pay for every wrapper and form module.
+_LAZY_SUBMODULES = ('db', 'ui', 'extras')
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        return importlib.import_module('rpw.{}'.format(name))
+    # For Compatibility. Use `from rpw import revit; revit.doc` instead.doc
+    # This module import will be disable on rpw 2.0
+    if name in ('doc', 'uidoc'):
+        return getattr(revit, name)
+    raise AttributeError("module 'rpw' has no attribute '{}'".format(name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | {'doc', 'uidoc'})
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported (IronPython): load eagerly
+    import rpw.db
+    import rpw.ui
+    import rpw.extras
+    doc, uidoc = revit.doc, revit.uidoc
@@ -1,45 +1,123 @@
-import rpw
-from rpw import revit, DB
+"""
+Bounding Box Wrapper
+
+>>> from rpw import db
+>>> box = db.BoundingBox.from_element(wall)
+>>> box.min, box.max, box.center
+>>> box.intersects(other_box)
+>>> box.contains(point)
+
+"""  #
+
+from rpw import DB
 from rpw.base import BaseObjectWrapper
+from rpw.db.xyz import XYZ
+from rpw.exceptions import RpwCoerceError
 
 
 class BoundingBox(BaseObjectWrapper):
+    """
+    `DB.BoundingBoxXYZ` Wrapper
+
+    Attributes:
+        _revit_object (DB.BoundingBoxXYZ): Wrapped ``DB.BoundingBoxXYZ``
+
+    Note:
+        ``min`` and ``max`` ignore ``BoundingBoxXYZ.Transform``: boxes
+        returned by ``get_BoundingBox`` are in model coordinates.
+    """
+
+    _revit_object_class = DB.BoundingBoxXYZ
+
+    @classmethod
+    def from_element(cls, element, view=None):
+        """
+        Bounding box of ``element`` (``DB.Element`` or wrapped), in
+        ``view`` if given, or ``None`` if the element has no extents.
+        """
+        if hasattr(element, 'unwrap'):
+            element = element.unwrap()
+        box = element.get_BoundingBox(view)
+        return cls(box) if box is not None else None
+
+    @property
+    def min(self):
+        """ Minimum point (:any:`XYZ`) """
+        return XYZ(self._revit_object.Min)
+
+    @property
+    def max(self):
+        """ Maximum point (:any:`XYZ`) """
+        return XYZ(self._revit_object.Max)
+
+    @property
+    def center(self):
+        """ Center point (:any:`XYZ`) """
+        low, high = self._revit_object.Min, self._revit_object.Max
+        return XYZ((low.X + high.X) / 2.0, (low.Y + high.Y) / 2.0, (low.Z + high.Z) / 2.0)
+
+    @property
+    def bounds(self):
+        """ ``(min x, min y, min z, max x, max y, max z)`` """
+        return to_bounds(self._revit_object)
+
+    def get_outline(self):
+        """ Returns: ``DB.Outline`` with the box extents """
+        return DB.Outline(self._revit_object.Min, self._revit_object.Max)
+
+    def intersects(self, other, tolerance=0.0):
+        """ ``True`` if the box touches or overlaps ``other`` (any box like
+        reference, see :func:`to_bounds`) """
+        a, b = self.bounds, to_bounds(other)
+        return (a[0] <= b[3] + tolerance and b[0] <= a[3] + tolerance and
+                a[1] <= b[4] + tolerance and b[1] <= a[4] + tolerance and
+                a[2] <= b[5] + tolerance and b[2] <= a[5] + tolerance)
+
+    def contains(self, point, tolerance=0.0):
+        """ ``True`` if ``point`` (point like) is inside the box """
+        x, y, z = XYZ(point).as_tuple
+        a = self.bounds
+        return (a[0] - tolerance <= x <= a[3] + tolerance and
+                a[1] - tolerance <= y <= a[4] + tolerance and
+                a[2] - tolerance <= z <= a[5] + tolerance)
+
+    def __repr__(self):
+        return super(BoundingBox, self).__repr__(data={'min': self.min.as_tuple,
+                                                       'max': self.max.as_tuple})
+
+
+def to_bounds(box_reference):
+    """
+    Coerces a box like reference to ``(min x, min y, min z, max x, max y, max z)``.
+
+    Accepts ``DB.BoundingBoxXYZ``, ``DB.Outline``, :any:`BoundingBox`,
+    an element (its model bounding box) or a ``(min point, max point)``
+    pair of point like objects.
+
+    Raises:
+        :class:`RpwCoerceError`
+    """
+    if hasattr(box_reference, 'unwrap'):
+        box_reference = box_reference.unwrap()
+    if isinstance(box_reference, DB.Element):
+        box = box_reference.get_BoundingBox(None)
+        if box is None:
+            raise RpwCoerceError(box_reference, 'element with a bounding box')
+        box_reference = box
+    if isinstance(box_reference, DB.BoundingBoxXYZ):
+        low, high = box_reference.Min, box_reference.Max
+    elif isinstance(box_reference, DB.Outline):
+        low, high = box_reference.MinimumPoint, box_reference.MaximumPoint
+    elif isinstance(box_reference, (tuple, list)) and len(box_reference) == 2:
+        low, high = [XYZ(point).unwrap() for point in box_reference]
+    else:
+        raise RpwCoerceError(box_reference, 'bounding box like object')
+    return (low.X, low.Y, low.Z, high.X, high.Y, high.Z)
+
 
-#     """ BoundingBoxElement receives a Revit Object for access to properties.
-#     Usage:
-#     bbox = BoundingBoxElement(element)
-#     bbox.element: element
-#     Properties:
-#     bbox.min: min coordinate of bounding box
-#     bbox.max: min coordinate of bounding box
-#     bbox.average: min coordinate of bounding box
-#     """
-#
-    def __init__(self, element):
-        raise NotImplemented
-#         self.element = element
-#         self.bbox = element.get_BoundingBox(revit.doc.ActiveView)
-#
-#     @property
-#     def min(self):
-#         x, y, z = self.bbox.Min.X, self.bbox.Min.Y, self.bbox.Min.Z
-#         return PointElement(x, y, z)
-#
-#     @property
-#     def max(self):
-#         x, y, z = self.bbox.Max.X, self.bbox.Max.Y, self.bbox.Max.Z
-#         return PointElement(x, y, z)
-#
-#     @property
-#     def average(self):
-#         return PointCollection(self.min, self.max).average
-#
-#     def __repr__(self):
-#         return '<BB: MIN{} MAX={} CENTER={}>'.format(self.min, self.max,
-#                                                      self.center)
-#
-#     def __str__(self):
-#         return repr(self)
-#
-# class Curve():
-#     pass
+def to_outline(box_reference):
+    """ Coerces a box like reference (see :func:`to_bounds`) to ``DB.Outline`` """
+    if isinstance(box_reference, DB.Outline):
+        return box_reference
+    bounds = to_bounds(box_reference)
+    return DB.Outline(DB.XYZ(*bounds[:3]), DB.XYZ(*bounds[3:]))
@@ -18,6 +18,7 @@ from rpw import revit, DB
 from rpw.base import BaseObject, BaseObjectWrapper
 from rpw.utils.dotnet import Enum
 from rpw.exceptions import RpwCoerceError
+from rpw.db.index import id_key
 
 
 class _BiParameter(BaseObjectWrapper):
@@ -155,8 +156,8 @@ class _BiCategory(BaseObjectWrapper):
         Returns:
             ``DB.BuiltInCategory`` member
         """
-        bic = Enum.ToObject(DB.BuiltInCategory, category_id.IntegerValue)
-        if DB.ElementId(bic).IntegerValue < -1:
+        bic = Enum.ToObject(DB.BuiltInCategory, id_key(category_id))
+        if id_key(DB.ElementId(bic)) < -1:
             return bic
         else:
             # If you pass a regular element to category_id, it converts it to BIC.
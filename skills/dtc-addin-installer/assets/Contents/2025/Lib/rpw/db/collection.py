@@ -9,6 +9,7 @@ from rpw.db.xyz import XYZ
 from rpw.db.element import Element
 from rpw.base import BaseObject
 from rpw.utils.coerce import to_elements, to_element_ids, to_element_id
+from rpw.db.index import id_key
 from rpw.utils.dotnet import List
 from rpw.utils.logger import deprecate_warning
 
@@ -28,14 +29,18 @@ class ElementSet(BaseObject):
     NOTE:
         Similar to DB.ElementSet, doesnt wrap since there is no advantage
 
+    Ids are kept in insertion order, with a hash set of their values for
+    constant time membership tests.
+
     Args:
         (`DB.Element`, `DB.ElementID`, optional): Elements or Element Ids.
 
     """
 
-    def __init__(self, elements_or_ids=None, doc=revit.doc):
-        self.doc = doc
+    def __init__(self, elements_or_ids=None, doc=None):
+        self.doc = doc or revit.doc
         self._element_id_set = []
+        self._element_id_keys = set()
         if elements_or_ids:
             self.add(elements_or_ids)
 
@@ -48,8 +53,11 @@ class ElementSet(BaseObject):
 
         """
         element_ids = to_element_ids(elements_or_ids)
+        keys = self._element_id_keys
         for id_ in element_ids:
-            if id_ not in self._element_id_set:
+            key = id_key(id_)
+            if key not in keys:
+                keys.add(key)
                 self._element_id_set.append(id_)
 
     def pop(self, element_reference, wrapped=True):
@@ -65,12 +73,14 @@ class ElementSet(BaseObject):
         """
         element_id = to_element_id(element_reference)
         element = self.__getitem__(element_id)
+        self._element_id_keys.discard(id_key(element_id))
         self._element_id_set.remove(element_id)
         return element if wrapped else element.unwrap()
 
     def clear(self):
         """ Clears Set """
         self._element_id_set = []
+        self._element_id_keys = set()
 
     @property
     def _elements(self):
@@ -78,7 +88,7 @@ class ElementSet(BaseObject):
 
     @property
     def _wrapped_elements(self):
-        return Element.from_list(self._element_id_set)
+        return Element.from_list(self._element_id_set, doc=self.doc)
 
     def get_elements(self, wrapped=True, as_list=False):
         """
@@ -158,7 +168,7 @@ class ElementSet(BaseObject):
     def __iter__(self):
         """ Iterator: Wrapped """
         for element in self._element_id_set:
-            yield Element.from_id(element)
+            yield Element.from_id(element, doc=self.doc)
 
     def __getitem__(self, element_reference):
         """
@@ -171,10 +181,9 @@ class ElementSet(BaseObject):
             (wrapped_element): Wrapped Element. Raises Key Error if not found.
         """
         eid_key = to_element_id(element_reference)
-        for element in self.__iter__():
-            if element.Id == eid_key:
-                return element
-        raise KeyError(eid_key)
+        if id_key(eid_key) not in self._element_id_keys:
+            raise KeyError(eid_key)
+        return Element.from_id(eid_key, doc=self.doc)
 
     def __contains__(self, element_or_id):
         """
@@ -188,7 +197,7 @@ class ElementSet(BaseObject):
         """
         # TODO Write Tests
         element_id = to_element_id(element_or_id)
-        return bool(element_id in self._element_id_set)
+        return id_key(element_id) in self._element_id_keys
 
     def __bool__(self):
         return bool(self._element_id_set)
@@ -211,8 +220,8 @@ class ElementCollection(BaseObject):
     Args:
         (`DB.Element`, `DB.ElementID`, optional): Elements or Element Ids.
     """
-    def __init__(self, elements_or_ids=None, doc=revit.doc):
-        self.doc = doc
+    def __init__(self, elements_or_ids=None, doc=None):
+        self.doc = doc or revit.doc
         self._elements = []
         if elements_or_ids:
             self.append(elements_or_ids)
@@ -20,7 +20,6 @@ Note:
 
 """  #
 
-import rpw
 from rpw import revit, DB
 from rpw.db.element import Element
 from rpw.base import BaseObjectWrapper
@@ -29,6 +28,7 @@ from rpw.utils.logger import logger, deprecate_warning
 from rpw.utils.mixins import CategoryMixin
 from rpw.db.builtins import BicEnum
 from rpw.db.category import Category
+from rpw.db.index import FamilyIndex, id_key
 
 
 class FamilyInstance(Element, CategoryMixin):
@@ -93,7 +93,7 @@ class FamilyInstance(Element, CategoryMixin):
         Returns:
             (bool): True if element is inside an AssemblyInstance
         """
-        if self._revit_object.AssemblyInstanceId.IntegerValue == -1:
+        if id_key(self._revit_object.AssemblyInstanceId) == -1:
             return False
         else:
             return True
@@ -159,8 +159,9 @@ class FamilySymbol(Element, CategoryMixin):
             [``DB.FamilyInstance``]: List of model instances of
                 the symbol (unwrapped)
         """
-        collector = rpw.db.Collector(symbol=self._revit_object.Id, is_not_type=True)
-        return collector.get_elements(wrapped)
+        index = FamilyIndex.get(self.doc)
+        instance_ids = index.get_instance_ids(self._revit_object.Id)
+        return index.get_elements(instance_ids, wrapped=wrapped)
 
     @property
     def instances(self):
@@ -207,14 +208,12 @@ class Family(Element, CategoryMixin):
 
     def get_instances(self, wrapped=True):
         """Returns:
-            [``DB.FamilyInstance``]: List of model instances in this family (unwrapped)
+            [``DB.FamilyInstance``]: List of model instances in this family,
+                symbol by symbol (unwrapped)
         """
-        # There has to be a better way
-        instances = []
-        for symbol in self.get_symbols(wrapped=True):
-            symbol_instances = symbol.get_instances(wrapped=wrapped)
-            instances.append(symbol_instances)
-        return instances
+        index = FamilyIndex.get(self.doc)
+        instance_ids = index.get_instance_ids(self._revit_object.Id)
+        return index.get_elements(instance_ids, wrapped=wrapped)
 
     @property
     def instances(self):
@@ -9,6 +9,7 @@ Parameter Wrapper
 """  #
 from rpw import revit, DB
 from rpw.db.builtins import BipEnum
+from rpw.db.index import id_key
 from rpw.base import BaseObjectWrapper
 from rpw.exceptions import RpwException, RpwWrongStorageType
 from rpw.exceptions import RpwParameterNotFound, RpwTypeError
@@ -260,26 +261,36 @@ class Parameter(BaseObjectWrapper):
             definition_name = self._revit_object.Definition.Name
             raise RpwException('Parameter is Read Only: {}'.format(definition_name))
 
+        value = self.cast_value(value)
+        param = self._revit_object.Set(value)
+        return param
+
+    def cast_value(self, value):
+        """ Casts ``value`` to the parameter storage type, as the ``value``
+        setter does before setting it.
+
+        Raises:
+            :class:`RpwWrongStorageType`
+        """
+        parameter_type = self.type
         # Check if value provided matches storage type
-        if not isinstance(value, self.type):
+        if not isinstance(value, parameter_type):
             # If not, try to handle
-            if self.type is str and value is None:
+            if parameter_type is str and value is None:
                 value = ''
-            if self.type is str and value is not None:
+            if parameter_type is str and value is not None:
                 value = str(value)
-            elif self.type is DB.ElementId and value is None:
+            elif parameter_type is DB.ElementId and value is None:
                 value = DB.ElementId.InvalidElementId
-            elif isinstance(value, int) and self.type is float:
+            elif isinstance(value, int) and parameter_type is float:
                 value = float(value)
-            elif isinstance(value, float) and self.type is int:
+            elif isinstance(value, float) and parameter_type is int:
                 value = int(value)
-            elif isinstance(value, bool) and self.type is int:
+            elif isinstance(value, bool) and parameter_type is int:
                 value = int(value)
             else:
-                raise RpwWrongStorageType(self.type, value)
-
-        param = self._revit_object.Set(value)
-        return param
+                raise RpwWrongStorageType(parameter_type, value)
+        return value
 
     @property
     def value_string(self):
@@ -296,8 +307,9 @@ class Parameter(BaseObjectWrapper):
             * value: Uses best parameter method based on StorageType
             * value_string: Parameter.AsValueString
         """
-        value = self.value if not isinstance(self.value, DB.ElementId) \
-                           else self.value.IntegerValue
+        value = self.value
+        if isinstance(value, DB.ElementId):
+            value = id_key(value)
         return {
                 'name': self.name,
                 'type': self.type.__name__,
@@ -0,0 +1,254 @@
+"""
+Spatial Index
+
+Answers "what is near / inside / overlapping this box" without testing
+every element: :any:`SpatialIndex` packs the model bounding boxes of a
+document into an :any:`RTree`, with one collector pass, and is cached per
+document like the other :mod:`rpw.db.index` indexes.
+
+>>> from rpw import db
+>>> index = db.SpatialIndex.get()
+>>> index.get_intersecting_ids(wall)                   # clashes with a wall
+>>> index.get_nearest_ids((10, 20, 0), count=5)       # 5 closest elements
+>>> index.get_ids_within_distance(point, 3.0)          # elements within 3 ft
+>>> index.get_inside_ids(((0, 0, 0), (50, 50, 20)))    # elements inside a box
+
+Boxes are compared as Revit's bounding box filters do: touching boxes
+intersect. For exact geometry tests, use the ids returned here as
+candidates for ``ElementIntersectsElementFilter`` or solid intersections.
+
+"""  #
+
+import heapq
+import math
+
+from rpw import DB
+from rpw.db.index import DocumentIndex
+from rpw.db.bounding_box import to_bounds
+from rpw.db.xyz import XYZ
+
+
+class RTree(object):
+    """
+    Static R-tree over axis aligned 3D boxes, bulk loaded with
+    Sort-Tile-Recursive packing: boxes are sorted into ``x`` slabs, ``y``
+    slices and ``z`` runs of ``node_size`` boxes, and nodes are packed the
+    same way until one root remains. Built once, queried many times; it
+    cannot be edited.
+
+    >>> tree = RTree([((0, 0, 0, 1, 1, 1), 'a'), ((5, 5, 0, 6, 6, 1), 'b')])
+    >>> tree.intersection((0.5, 0.5, 0, 2, 2, 2))
+    ['a']
+    >>> tree.nearest((4, 4, 0), count=1)
+    ['b']
+
+    Args:
+        items (iterable): ``(bounds, value)`` pairs, where ``bounds`` is
+            ``(min x, min y, min z, max x, max y, max z)``
+        node_size (int): Maximum children per node
+    """
+
+    def __init__(self, items, node_size=16):
+        self.node_size = node_size
+        # Nodes: [min x, min y, min z, max x, max y, max z, children, is_leaf]
+        # Leaf children are (bounds, value) pairs
+        entries = [(tuple(bounds), value) for bounds, value in items]
+        self.count = len(entries)
+        if not entries:
+            self.root = None
+            return
+        level = self._pack([self._node(chunk, True) for chunk in self._tile(
+            entries, lambda entry, axis: entry[0][axis] + entry[0][axis + 3])])
+        while len(level) > 1:
+            level = self._pack(level)
+        self.root = level[0]
+
+    def _pack(self, nodes):
+        if len(nodes) <= 1:
+            return nodes
+        chunks = self._tile(nodes, lambda node, axis: node[axis] + node[axis + 3])
+        return [self._node(chunk, False) for chunk in chunks]
+
+    def _tile(self, entries, center):
+        """ Sort-Tile-Recursive split of ``entries`` into runs of node_size """
+        size = self.node_size
+        leaves = int(math.ceil(len(entries) / float(size)))
+        slices = int(math.ceil(leaves ** (1.0 / 3)))
+        slab_size = size * slices * slices
+        slice_size = size * slices
+        chunks = []
+        entries = sorted(entries, key=lambda entry: center(entry, 0))
+        for i in range(0, len(entries), slab_size):
+            slab = sorted(entries[i:i + slab_size], key=lambda entry: center(entry, 1))
+            for j in range(0, len(slab), slice_size):
+                run = sorted(slab[j:j + slice_size], key=lambda entry: center(entry, 2))
+                for k in range(0, len(run), size):
+                    chunks.append(run[k:k + size])
+        return chunks
+
+    @staticmethod
+    def _node(children, is_leaf):
+        boxes = [child[0] for child in children] if is_leaf else children
+        return [min(box[0] for box in boxes), min(box[1] for box in boxes),
+                min(box[2] for box in boxes), max(box[3] for box in boxes),
+                max(box[4] for box in boxes), max(box[5] for box in boxes),
+                children, is_leaf]
+
+    def __len__(self):
+        return self.count
+
+    def intersection(self, bounds, tolerance=0.0):
+        """ Values of the boxes that touch or overlap ``bounds`` """
+        if self.root is None:
+            return []
+        x0, y0, z0, x1, y1, z1 = bounds
+        x0, y0, z0 = x0 - tolerance, y0 - tolerance, z0 - tolerance
+        x1, y1, z1 = x1 + tolerance, y1 + tolerance, z1 + tolerance
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node[7]:
+                for box, value in node[6]:
+                    if (box[0] <= x1 and box[3] >= x0 and box[1] <= y1 and
+                            box[4] >= y0 and box[2] <= z1 and box[5] >= z0):
+                        found.append(value)
+            else:
+                for child in node[6]:
+                    if (child[0] <= x1 and child[3] >= x0 and child[1] <= y1 and
+                            child[4] >= y0 and child[2] <= z1 and child[5] >= z0):
+                        stack.append(child)
+        return found
+
+    def contained(self, bounds, tolerance=0.0):
+        """ Values of the boxes completely inside ``bounds`` """
+        if self.root is None:
+            return []
+        x0, y0, z0, x1, y1, z1 = bounds
+        x0, y0, z0 = x0 - tolerance, y0 - tolerance, z0 - tolerance
+        x1, y1, z1 = x1 + tolerance, y1 + tolerance, z1 + tolerance
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node[7]:
+                for box, value in node[6]:
+                    if (box[0] >= x0 and box[3] <= x1 and box[1] >= y0 and
+                            box[4] <= y1 and box[2] >= z0 and box[5] <= z1):
+                        found.append(value)
+            else:
+                for child in node[6]:
+                    if (child[0] <= x1 and child[3] >= x0 and child[1] <= y1 and
+                            child[4] >= y0 and child[2] <= z1 and child[5] >= z0):
+                        stack.append(child)
+        return found
+
+    def within_distance(self, point, distance):
+        """ Values of the boxes at most ``distance`` from ``point`` """
+        limit = distance * distance
+        x, y, z = point
+        found = []
+        if self.root is None:
+            return found
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node[7]:
+                for box, value in node[6]:
+                    if _distance_squared(box, x, y, z) <= limit:
+                        found.append(value)
+            else:
+                for child in node[6]:
+                    if _distance_squared(child, x, y, z) <= limit:
+                        stack.append(child)
+        return found
+
+    def nearest(self, point, count=1, max_distance=None):
+        """
+        Values of the ``count`` boxes closest to ``point``, closest first.
+        Distance is measured to the box, so boxes containing the point come
+        first (distance 0).
+        """
+        if self.root is None or count < 1:
+            return []
+        x, y, z = point
+        limit = max_distance * max_distance if max_distance is not None else None
+        found = []
+        # (distance, tie breaker, node or None, value)
+        tie = 0
+        heap = [(0.0, tie, self.root, None)]
+        while heap and len(found) < count:
+            distance, _, node, value = heapq.heappop(heap)
+            if limit is not None and distance > limit:
+                break
+            if node is None:
+                found.append(value)
+            elif node[7]:
+                for box, child_value in node[6]:
+                    tie += 1
+                    heapq.heappush(heap, (_distance_squared(box, x, y, z), tie, None, child_value))
+            else:
+                for child in node[6]:
+                    tie += 1
+                    heapq.heappush(heap, (_distance_squared(child, x, y, z), tie, child, None))
+        return found
+
+
+def _distance_squared(box, x, y, z):
+    """ Squared distance from a point to a box (0 if inside) """
+    dx = box[0] - x if x < box[0] else (x - box[3] if x > box[3] else 0.0)
+    dy = box[1] - y if y < box[1] else (y - box[4] if y > box[4] else 0.0)
+    dz = box[2] - z if z < box[2] else (z - box[5] if z > box[5] else 0.0)
+    return dx * dx + dy * dy + dz * dz
+
+
+class SpatialIndex(DocumentIndex):
+    """
+    :any:`RTree` of the model bounding boxes (``get_BoundingBox(None)``) of
+    every element of the document that has one, built in one collector
+    pass. Queries take box like references (see
+    :func:`rpw.db.bounding_box.to_bounds`: elements, bounding boxes,
+    outlines, ``(min, max)`` point pairs) or point like references, and
+    return ``DB.ElementId`` lists.
+
+    >>> index = SpatialIndex.get(doc)
+    >>> index.get_intersecting_ids(duct)
+    >>> index.get_nearest_ids(door_point, count=3)
+    """
+
+    def _build(self):
+        items = []
+        collector = DB.FilteredElementCollector(self.doc).WhereElementIsNotElementType()
+        for element in collector:
+            box = element.get_BoundingBox(None)
+            if box is None:
+                continue
+            low, high = box.Min, box.Max
+            items.append(((low.X, low.Y, low.Z, high.X, high.Y, high.Z), element.Id))
+        self.tree = RTree(items)
+
+    def __len__(self):
+        return len(self.tree)
+
+    def get_intersecting_ids(self, box_reference, tolerance=0.0):
+        """ Returns: [``DB.ElementId``] Elements whose box touches or overlaps
+        ``box_reference``. An element reference is not included in its own result. """
+        found = self.tree.intersection(to_bounds(box_reference), tolerance)
+        element_id = getattr(box_reference, 'Id', None)
+        if isinstance(element_id, DB.ElementId):
+            found = [found_id for found_id in found if found_id != element_id]
+        return found
+
+    def get_inside_ids(self, box_reference, tolerance=0.0):
+        """ Returns: [``DB.ElementId``] Elements whose box is inside ``box_reference`` """
+        return self.tree.contained(to_bounds(box_reference), tolerance)
+
+    def get_ids_within_distance(self, point, distance):
+        """ Returns: [``DB.ElementId``] Elements whose box is at most
+        ``distance`` from ``point`` (point like) """
+        return self.tree.within_distance(XYZ(point).as_tuple, distance)
+
+    def get_nearest_ids(self, point, count=1, max_distance=None):
+        """ Returns: [``DB.ElementId``] The ``count`` elements whose box is
+        closest to ``point`` (point like), closest first """
+        return self.tree.nearest(XYZ(point).as_tuple, count, max_distance)
@@ -1,2 +1,35 @@
-from rpw.ui import forms
-from rpw.ui.selection import Selection, Pick
+"""
+``forms``, ``Selection`` and ``Pick`` are loaded on first access, so
+importing rpw.ui does not load the WPF forms.
+"""
+
+import sys
+import importlib
+
+_LAZY_ATTRIBUTES = {'forms': 'rpw.ui.forms',
+                    'Selection': 'rpw.ui.selection',
+                    'Pick': 'rpw.ui.selection',
+                    }
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError("module 'rpw.ui' has no attribute '{}'".format(name))
+    module = importlib.import_module(module_name)
+    is_submodule = module_name == '{}.{}'.format(__name__, name)
+    value = module if is_submodule else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported (IronPython): load eagerly
+    from rpw.ui import forms
+    from rpw.ui.selection import Selection, Pick
@@ -6,21 +6,60 @@ All classes documented in this section can be imported as such:
 
 >>> from rpw.ui.forms import Console
 
+Form modules (and the WPF references they add) are only loaded when one of
+their classes is first accessed.
+
 """
 
-# FlexForm + Componets
-from rpw.ui.forms.flexform import FlexForm
-from rpw.ui.forms.flexform import Label, TextBox, Button, ComboBox, CheckBox
-from rpw.ui.forms.flexform import Separator
+import sys
+import importlib
+
+_LAZY_ATTRIBUTES = (
+    # FlexForm + Componets
+    ('FlexForm', 'rpw.ui.forms.flexform'),
+    ('Label', 'rpw.ui.forms.flexform'),
+    ('TextBox', 'rpw.ui.forms.flexform'),
+    ('Button', 'rpw.ui.forms.flexform'),
+    ('ComboBox', 'rpw.ui.forms.flexform'),
+    ('CheckBox', 'rpw.ui.forms.flexform'),
+    ('Separator', 'rpw.ui.forms.flexform'),
+
+    # Pre-built, easy to use FlexForms
+    ('SelectFromList', 'rpw.ui.forms.quickform'),
+    ('TextInput', 'rpw.ui.forms.quickform'),
+
+    # Out-of-the Box TaskDialogs
+    ('Alert', 'rpw.ui.forms.taskdialog'),
+    ('TaskDialog', 'rpw.ui.forms.taskdialog'),
+    ('CommandLink', 'rpw.ui.forms.taskdialog'),
+
+    # RPW Interactive Console
+    ('Console', 'rpw.ui.forms.console'),
+
+    # Out-of-the Box TaskDialogs
+    ('select_file', 'rpw.ui.forms.os_dialog'),
+    ('select_folder', 'rpw.ui.forms.os_dialog'),
+    )
+
+_LAZY_MODULES = dict(_LAZY_ATTRIBUTES)
+
+__all__ = [name for name, _ in _LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module 'rpw.ui.forms' has no attribute '{}'".format(name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-# Pre-built, easy to use FlexForms
-from rpw.ui.forms.quickform import SelectFromList, TextInput
 
-# Out-of-the Box TaskDialogs
-from rpw.ui.forms.taskdialog import Alert, TaskDialog, CommandLink
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# RPW Interactive Console
-from rpw.ui.forms.console import Console
 
-# Out-of-the Box TaskDialogs
-from rpw.ui.forms.os_dialog import select_file, select_folder
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported (IronPython): load eagerly
+    for _name in __all__:
+        __getattr__(_name)
@@ -0,0 +1,299 @@
+"""
+Profiling
+
+Opt-in counters and timers for rpw hot paths, to tell whether a slow
+script spends its time filtering collectors, wrapping elements, reading
+and writing parameters, or committing transactions.
+
+>>> from rpw.utils import profiling
+>>> with profiling.profile():
+>>>     run_my_script()
+>>> profiling.report()
+[{'operation': 'Parameter.value.set', 'call_site': 'script.py:12 (main)',
+  'count': 5000, 'total': 0.41, 'self': 0.41, 'max': 0.002}, ...]
+>>> profiling.to_json('profile.json')
+>>> profiling.to_collapsed('profile.folded')
+
+Instrumented operations:
+
+    * ``Collector._collect[<FilterClass>]``: one filter applied to a collector
+    * ``Collector.get_elements`` / ``Collector.get_element_ids``: collector
+      results as a list
+    * ``Collector.__iter__``: one element read from the collector
+    * ``Element.__new__``: element wrapping
+    * ``ParameterSet.__getitem__``: parameter lookup by name
+    * ``Parameter.value.get`` / ``Parameter.value.set``
+    * ``Transaction.__exit__``: transaction commit (or roll back)
+    * ``TransactionBatch.commit``: sub-transaction commit of a batch
+
+:func:`enable` replaces these methods with timed wrappers and
+:func:`disable` puts the originals back, so rpw runs unchanged while
+profiling is off.
+
+Each call is recorded against its call site: the innermost frame outside of
+rpw, which is the line of the script that called into rpw. The collapsed
+stack export (``frame;frame;operation microseconds`` per line) keeps the
+script frames and nested operations, and can be rendered with
+``flamegraph.pl`` or speedscope. Times are self times: time spent in nested
+instrumented operations is reported under those operations.
+
+Note:
+    Profiling state is global and not thread safe.
+
+"""  #
+
+import os
+import sys
+import json
+import time
+
+import rpw
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+_RPW_DIR = os.path.dirname(os.path.abspath(rpw.__file__))
+# Script frames recorded per call, innermost first
+_DEPTH = [16]
+
+# {(script frames, operation path): [count, total, self, max]}
+_STATS = {}
+# [[operation, child time]] of the operations in progress
+_ACTIVE = []
+# [(owner class, attribute name, original value or None if inherited)]
+_PATCHES = []
+# {code filename: True if the file is part of rpw}
+_IN_RPW = {}
+
+
+def is_enabled():
+    """ Returns: (``bool``) ``True`` if the instrumentation is installed """
+    return bool(_PATCHES)
+
+
+def _script_frames(frame):
+    """ Labels of the frames outside rpw, outermost first """
+    frames = []
+    depth = _DEPTH[0]
+    while frame is not None and len(frames) < depth:
+        code = frame.f_code
+        in_rpw = _IN_RPW.get(code.co_filename)
+        if in_rpw is None:
+            in_rpw = os.path.abspath(code.co_filename).startswith(_RPW_DIR)
+            _IN_RPW[code.co_filename] = in_rpw
+        if not in_rpw:
+            frames.append('{}:{}:{}'.format(os.path.basename(code.co_filename),
+                                            code.co_name, frame.f_lineno))
+        frame = frame.f_back
+    frames.reverse()
+    return tuple(frames)
+
+
+def _timed(operation, func, args, kwargs):
+    active = _ACTIVE
+    entry = [operation, 0.0]
+    active.append(entry)
+    start = _clock()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        elapsed = _clock() - start
+        active.pop()
+        operations = tuple(name for name, _ in active) + (operation,)
+        if active:
+            active[-1][1] += elapsed
+        key = (_script_frames(sys._getframe(2)), operations)
+        stats = _STATS.get(key)
+        if stats is None:
+            stats = _STATS[key] = [0, 0.0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - entry[1]
+        if elapsed > stats[3]:
+            stats[3] = elapsed
+
+
+def _wrap(operation, func):
+    def wrapper(*args, **kwargs):
+        return _timed(operation, func, args, kwargs)
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _wrap_iter(operation, func):
+    def wrapper(*args, **kwargs):
+        # Each step is timed: the time between steps belongs to the caller
+        iterator = iter(func(*args, **kwargs))
+        while True:
+            try:
+                item = _timed(operation, next, (iterator,), {})
+            except StopIteration:
+                return
+            yield item
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _wrap_filter(func):
+    def method(cls, *args):
+        operation = 'Collector._collect[{}]'.format(cls.__name__)
+        return _timed(operation, func, (cls,) + args, {})
+    method.__name__ = func.__name__
+    method.__doc__ = func.__doc__
+    method.__wrapped__ = func
+    return method
+
+
+def _patch(owner, name, value):
+    _PATCHES.append((owner, name, owner.__dict__.get(name)))
+    setattr(owner, name, value)
+
+
+def enable(depth=16):
+    """
+    Installs the instrumentation. Recorded stats are kept.
+
+    Args:
+        depth (int): Script frames kept per call for the collapsed stacks.
+            Deeper stacks cost more per call.
+    """
+    _DEPTH[0] = depth
+    if _PATCHES:
+        return
+    from rpw.db.collector import Collector, FilterClasses
+    from rpw.db.element import Element
+    from rpw.db.parameter import ParameterSet, Parameter
+    from rpw.db.transaction import Transaction, TransactionBatch
+
+    for filter_class in FilterClasses.get_available_filters():
+        # Collector builds native filters with get_filter, combines
+        # logical filters when it can, and applies the others
+        if filter_class.native:
+            names = ('get_filter',)
+        else:
+            names = [name for name in ('combine', 'apply') if hasattr(filter_class, name)]
+        for name in names:
+            method = getattr(filter_class, name).__func__
+            # Subclasses of patched filters inherit the wrapper
+            method = getattr(method, '__wrapped__', method)
+            _patch(filter_class, name, classmethod(_wrap_filter(method)))
+
+    for name in ('get_elements', 'get_element_ids'):
+        _patch(Collector, name, _wrap('Collector.' + name, Collector.__dict__[name]))
+    _patch(Collector, '__iter__', _wrap_iter('Collector.__iter__', Collector.__dict__['__iter__']))
+
+    new = Element.__dict__['__new__']
+    _patch(Element, '__new__', staticmethod(_wrap('Element.__new__', new.__func__)))
+    _patch(ParameterSet, '__getitem__',
+           _wrap('ParameterSet.__getitem__', ParameterSet.__dict__['__getitem__']))
+
+    value = Parameter.__dict__['value']
+    _patch(Parameter, 'value', property(_wrap('Parameter.value.get', value.fget),
+                                        _wrap('Parameter.value.set', value.fset),
+                                        None, value.__doc__))
+
+    _patch(Transaction, '__exit__',
+           _wrap('Transaction.__exit__', Transaction.__dict__['__exit__']))
+    _patch(TransactionBatch, '_commit',
+           _wrap('TransactionBatch.commit', TransactionBatch.__dict__['_commit']))
+
+
+def disable():
+    """ Removes the instrumentation. Recorded stats are kept. """
+    while _PATCHES:
+        owner, name, original = _PATCHES.pop()
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+    del _ACTIVE[:]
+
+
+def reset():
+    """ Drops recorded stats """
+    _STATS.clear()
+
+
+class profile(object):
+    """
+    Context that enables profiling on enter and disables it on exit.
+
+    >>> with profiling.profile(reset=True):
+    >>>     run_my_script()
+
+    Args:
+        reset (bool): Drop previously recorded stats on enter.
+    """
+
+    def __init__(self, reset=False):
+        self.reset = reset
+
+    def __enter__(self):
+        if self.reset:
+            reset()
+        enable()
+        return self
+
+    def __exit__(self, exception, exception_msg, tb):
+        disable()
+
+
+def report(by_call_site=True):
+    """
+    Aggregated stats, slowest first.
+
+    Args:
+        by_call_site (bool): One row per operation and call site. If
+            ``False``, one row per operation.
+
+    Returns:
+        [``dict``]: ``operation``, ``call_site``, ``count``, ``total``,
+        ``self``, ``max``. Times in seconds.
+    """
+    rows = {}
+    for (frames, operations), (count, total, self_time, max_time) in _STATS.items():
+        operation = operations[-1]
+        call_site = None
+        if by_call_site and frames:
+            filename, function, lineno = frames[-1].rsplit(':', 2)
+            call_site = '{}:{} ({})'.format(filename, lineno, function)
+        row = rows.get((operation, call_site))
+        if row is None:
+            row = rows[(operation, call_site)] = {
+                'operation': operation, 'call_site': call_site,
+                'count': 0, 'total': 0.0, 'self': 0.0, 'max': 0.0}
+        row['count'] += count
+        row['total'] += total
+        row['self'] += self_time
+        row['max'] = max(row['max'], max_time)
+    return sorted(rows.values(), key=lambda row: row['total'], reverse=True)
+
+
+def _write(text, path):
+    if path:
+        with open(path, 'w') as fp:
+            fp.write(text)
+    return text
+
+
+def to_json(path=None, by_call_site=True):
+    """ Returns :func:`report` as JSON, and writes it to ``path`` if given """
+    return _write(json.dumps(report(by_call_site), indent=2), path)
+
+
+def to_collapsed(path=None):
+    """
+    Returns the stats in collapsed stack format, one
+    ``frame;...;operation self_microseconds`` line per stack, and writes
+    them to ``path`` if given.
+    """
+    lines = {}
+    for (frames, operations), stats in _STATS.items():
+        stack = ';'.join(frames + operations).replace(' ', '_')
+        lines[stack] = lines.get(stack, 0) + int(round(stats[2] * 1e6))
+    text = '\n'.join('{} {}'.format(stack, micro_seconds)
+                     for stack, micro_seconds in sorted(lines.items()))
+    return _write(text + '\n' if text else text, path)
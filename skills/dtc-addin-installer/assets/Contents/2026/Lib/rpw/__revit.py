@@ -27,6 +27,26 @@ from rpw.utils.logger import logger
 from rpw.base import BaseObject
 
 
+def _load_revit_api():
+    """ Returns the ``DB`` and ``UI`` namespaces, or Mock Objects if the
+    RevitAPI references cannot be added (Sphinx, ipy direct exec) """
+    try:
+        clr.AddReference('RevitAPI')
+        clr.AddReference('RevitAPIUI')
+        from Autodesk.Revit import DB, UI
+        return DB, UI
+    except Exception:
+        logger.warning('RevitAPI References could not be added')
+        from rpw.utils.sphinx_compat import MockObject
+        return (MockObject(fullname='Autodesk.Revit.DB'),
+                MockObject(fullname='Autodesk.Revit.DB'))
+
+
+# Add DB UI Import to globals so it can be imported by rpw
+DB, UI = _load_revit_api()
+_API_IS_MOCK = type(DB).__name__ == 'MockObject'
+
+
 class Revit(BaseObject):
     """
     Revit Application Wrapper
@@ -40,6 +60,10 @@ class Revit(BaseObject):
         In other words, to use this wrapper all you need is to import
         ``from rpw import revit``
 
+        The application handle is only looked up the first time it is
+        needed (``uiapp``, ``host``, ``doc``, ...), so importing rpw does not
+        probe ``__revit__`` or load ``RevitServices``.
+
     >>> from rpw import revit
     >>> revit.doc
     <Autodesk.Revit.DB.Document>
@@ -55,31 +79,39 @@ class Revit(BaseObject):
         DYNAMO = 'Dynamo'
 
     def __init__(self):
+        self._uiapp = None
+        self._host = None
+        self._host_detected = False
+
+    def _detect_host(self):
+        """ Finds the Revit Application handle. Runs once, on first use """
+        self._host_detected = True
+        if _API_IS_MOCK:
+            from rpw.utils.sphinx_compat import MockObject
+            self._uiapp = MockObject(fullname='Autodesk.Revit.UI.UIApplication')
+            return
         try:
-            self.uiapp = __revit__
+            self._uiapp = __revit__
             self._host = Revit.HOSTS.RPS
         except NameError:
             try:
                 # Try Getting handler from Dynamo RevitServices
-                self.uiapp = self.find_dynamo_uiapp()
+                self._uiapp = self.find_dynamo_uiapp()
                 self._host = Revit.HOSTS.DYNAMO
             except Exception as errmsg:
                 logger.warning('Revit Application handle could not be found')
 
-        try:
-            # Add DB UI Import to globals so it can be imported by rpw
-            clr.AddReference('RevitAPI')
-            clr.AddReference('RevitAPIUI')
-            from Autodesk.Revit import DB, UI
-            globals().update({'DB': DB, 'UI': UI})
-        except Exception:
-            # Replace Globals with Mock Objects for Sphinx and ipy direct exec.
-            logger.warning('RevitAPI References could not be added')
-            from rpw.utils.sphinx_compat import MockObject
-            globals().update({'DB': MockObject(fullname='Autodesk.Revit.DB'),
-                              'UI': MockObject(fullname='Autodesk.Revit.DB')})
-            self.uiapp = MockObject(fullname='Autodesk.Revit.UI.UIApplication')
-            self._host = None
+    @property
+    def uiapp(self):
+        """ Returns: UIApplication handle (found on first access) """
+        if not self._host_detected:
+            self._detect_host()
+        return self._uiapp
+
+    @uiapp.setter
+    def uiapp(self, uiapp):
+        self._host_detected = True
+        self._uiapp = uiapp
 
     def find_dynamo_uiapp(self):
         clr.AddReference("RevitServices")
@@ -97,6 +129,8 @@ class Revit(BaseObject):
         Returns:
             Host (str): Revit Application Host ['RPS', 'Dynamo']
         """
+        if not self._host_detected:
+            self._detect_host()
         return self._host
 
     def open(self, path):
@@ -105,7 +139,7 @@ class Revit(BaseObject):
     @property
     def doc(self):
         """ Returns: uiapp.ActiveUIDocument.Document """
-        return getattr(self.uiapp.ActiveUIDocument, 'Document', None)
+        return getattr(self.uidoc, 'Document', None)
 
     @property
     def uidoc(self):
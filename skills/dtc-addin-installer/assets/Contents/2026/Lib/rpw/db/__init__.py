@@ -1,42 +1,118 @@
 """ rpw.db modules
 
-Import all class so they are available in the .db namespace
+All classes are available in the .db namespace
 wrapper classes stay available in rpw.db
 
+Wrapper modules are imported on first attribute access (PEP 562), so
+``from rpw.db import Collector`` only loads the modules it needs.
+
 """
 
-import rpw.db
+import sys
+import importlib
+
+# Attribute name > module. Order is the wrapper lookup order used by Element()
+_LAZY_ATTRIBUTES = (
+    ('Element', 'rpw.db.element'),
+    ('FamilyInstance', 'rpw.db.family'),
+    ('FamilySymbol', 'rpw.db.family'),
+    ('Family', 'rpw.db.family'),
+    ('Category', 'rpw.db.category'),
+
+    ('Wall', 'rpw.db.wall'),
+    ('WallType', 'rpw.db.wall'),
+    ('WallKind', 'rpw.db.wall'),
+    ('WallCategory', 'rpw.db.wall'),
+    ('AssemblyInstance', 'rpw.db.assembly'),
+    ('AssemblyType', 'rpw.db.assembly'),
+
+    ('Room', 'rpw.db.spatial_element'),
+    ('Area', 'rpw.db.spatial_element'),
+    ('AreaScheme', 'rpw.db.spatial_element'),
+
+    ('View', 'rpw.db.view'),
+    ('ViewPlan', 'rpw.db.view'),
+    ('ViewSheet', 'rpw.db.view'),
+    ('ViewSection', 'rpw.db.view'),
+    ('ViewSchedule', 'rpw.db.view'),
+    ('View3D', 'rpw.db.view'),
+    ('ViewFamilyType', 'rpw.db.view'),
+    ('ViewFamily', 'rpw.db.view'),     # Enums
+    ('ViewType', 'rpw.db.view'),
+    ('ViewPlanType', 'rpw.db.view'),
+
+    ('LinePatternElement', 'rpw.db.pattern'),
+    ('FillPatternElement', 'rpw.db.pattern'),
+
+    ('Parameter', 'rpw.db.parameter'),
+    ('ParameterSet', 'rpw.db.parameter'),
+    ('BicEnum', 'rpw.db.builtins'),
+    ('BipEnum', 'rpw.db.builtins'),
+
+    ('XYZ', 'rpw.db.xyz'),
+    ('Curve', 'rpw.db.curve'),
+    ('Line', 'rpw.db.curve'),
+    ('Ellipse', 'rpw.db.curve'),
+    ('Circle', 'rpw.db.curve'),
+    ('Arc', 'rpw.db.curve'),
+    ('Transform', 'rpw.db.transform'),
+    ('BoundingBox', 'rpw.db.bounding_box'),
+
+    ('Reference', 'rpw.db.reference'),
+
+    ('ElementSet', 'rpw.db.collection'),
+    ('ElementCollection', 'rpw.db.collection'),
+    ('XyzCollection', 'rpw.db.collection'),
+
+    ('Collector', 'rpw.db.collector'),
+    ('ParameterFilter', 'rpw.db.collector'),
+    ('Transaction', 'rpw.db.transaction'),
+    ('TransactionGroup', 'rpw.db.transaction'),
+    ('TransactionBatch', 'rpw.db.transaction'),
+    ('WriteQueue', 'rpw.db.write_queue'),
+    ('Exporter', 'rpw.db.export'),
+
+    ('FamilyIndex', 'rpw.db.index'),
+    ('ViewIndex', 'rpw.db.index'),
+    ('NameIndex', 'rpw.db.index'),
+    ('SpatialIndex', 'rpw.db.spatial'),
+    )
+
+_LAZY_MODULES = dict(_LAZY_ATTRIBUTES)
 
-from rpw.db.element import Element
-from rpw.db.family import FamilyInstance, FamilySymbol, Family
-from rpw.db.category import Category
+__all__ = [name for name, _ in _LAZY_ATTRIBUTES]
 
-from rpw.db.wall import Wall, WallType, WallKind, WallCategory
-from rpw.db.assembly import AssemblyInstance, AssemblyType
 
-from rpw.db.spatial_element import Room, Area, AreaScheme
+def __getattr__(name):
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module 'rpw.db' has no attribute '{}'".format(name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-from rpw.db.view import View, ViewPlan, ViewSheet, ViewSection
-from rpw.db.view import ViewSchedule, View3D
-from rpw.db.view import ViewFamilyType
-from rpw.db.view import ViewFamily, ViewType, ViewPlanType  # Enums
 
-from rpw.db.pattern import LinePatternElement, FillPatternElement
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from rpw.db.parameter import Parameter, ParameterSet
-from rpw.db.builtins import BicEnum, BipEnum
 
-from rpw.db.xyz import XYZ
-from rpw.db.curve import Curve, Line, Ellipse, Circle, Arc
-from rpw.db.transform import Transform
-from rpw.db.bounding_box import BoundingBox
+_wrapper_classes = None
 
-from rpw.db.reference import Reference
 
-from rpw.db.collection import ElementSet, ElementCollection
-from rpw.db.collection import XyzCollection
+def get_wrapper_classes():
+    """
+    Returns all wrapper classes defined in rpw.db, in lookup order.
+    Wrapper modules are imported the first time this is called.
+    """
+    global _wrapper_classes
+    if _wrapper_classes is None:
+        module = sys.modules[__name__]
+        classes = [getattr(module, name) for name in __all__]
+        _wrapper_classes = [cls for cls in classes if isinstance(cls, type)]
+    return _wrapper_classes
 
-from rpw.db.collector import Collector, ParameterFilter
-from rpw.db.transaction import Transaction, TransactionGroup
 
-__all__ = [cls for cls in locals().values() if isinstance(cls, type)]
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported (IronPython): load eagerly
+    for _name in __all__:
+        __getattr__(_name)
@@ -4,11 +4,11 @@ Category Wrapper
 """  #
 
 import rpw
-from rpw import revit, DB
-from rpw.db.element import Element
+from rpw import DB
 from rpw.base import BaseObjectWrapper
 from rpw.utils.logger import logger, deprecate_warning
 from rpw.db.builtins import BicEnum
+from rpw.db.index import FamilyIndex
 
 
 class Category(BaseObjectWrapper):
@@ -33,13 +33,10 @@ class Category(BaseObjectWrapper):
             same category
 
         """
-        # There has to be a better way, but perhaps not: https://goo.gl/MqdzWg
-        unique_family_ids = set()
-        for symbol in self.get_symbols(wrapped=True):
-            unique_family_ids.add(symbol.family.Id)
-        doc = doc or revit.doc
-        elements = [doc.GetElement(family_id) for family_id in unique_family_ids]
-        return [Element(e) for e in elements] if wrapped else elements
+        # Families are found through their symbols: https://goo.gl/MqdzWg
+        index = FamilyIndex.get(doc)
+        family_ids = index.get_family_ids(self._revit_object.Id)
+        return index.get_elements(family_ids, wrapped=wrapped)
 
     @property
     def families(self):
@@ -11,6 +11,8 @@ Note:
 
     | ``ElementCategoryFilter`` = ``of_category``
     | ``ElementClassFilter`` = ``of_class``
+    | ``ElementMulticategoryFilter`` = ``of_category`` (list)
+    | ``ElementMulticlassFilter`` = ``of_class`` (list)
     | ``ElementIsCurveDrivenFilter`` = ``is_curve_driven``
     | ``ElementIsElementTypeFilter`` = ``is_type`` + ``is_not_type``
     | ``ElementOwnerViewFilter`` = ``view``
@@ -20,23 +22,29 @@ Note:
     | ``FamilyInstanceFilter`` = ``symbol``
     | ``ElementParameterFilter`` = ``parameter_filter``
     | ``Exclusion`` = ``exclude``
-    | ``UnionWith`` = ``or_collector``
-    | ``IntersectWith`` = ``and_collector``
+    | ``BoundingBoxIntersectsFilter`` = ``bbox_intersects``
+    | ``BoundingBoxIsInsideFilter`` = ``bbox_inside``
+    | ``BoundingBoxContainsPointFilter`` = ``bbox_contains``
+    | ``LogicalOrFilter`` / ``UnionWith`` = ``or_collector``
+    | ``LogicalAndFilter`` / ``IntersectWith`` = ``and_collector``
     | ``Custom`` = where
 
 """
 
 from rpw import revit, DB
-from rpw.utils.dotnet import List
+from rpw.utils.dotnet import List, Type, clr
 from rpw.base import BaseObjectWrapper, BaseObject
 from rpw.exceptions import RpwException, RpwTypeError, RpwCoerceError
 from rpw.db.element import Element
 from rpw.db.builtins import BicEnum, BipEnum
 from rpw.ui.selection import Selection
 from rpw.db.collection import ElementSet
+from rpw.db.index import NameIndex
+from rpw.db.bounding_box import to_outline
+from rpw.db.xyz import XYZ
 from rpw.utils.coerce import to_element_id, to_element_ids
 from rpw.utils.coerce import to_category, to_class
-from rpw.utils.logger import logger
+from rpw.utils.logger import logger, DEBUG
 from rpw.utils.logger import deprecate_warning
 
 # More Info on Performance and ElementFilters:
@@ -47,6 +55,8 @@ class BaseFilter(BaseObject):
     """ Base Filter and Apply Logic """
 
     method = 'WherePasses'
+    # Compiles to a single DB.ElementFilter (see get_filter)
+    native = True
 
     @classmethod
     def process_value(cls, value):
@@ -63,6 +73,18 @@ class BaseFilter(BaseObject):
         """
         raise NotImplemented
 
+    @classmethod
+    def get_filter(cls, doc, value):
+        """
+        Returns the ``DB.ElementFilter`` built from the input `value`.
+        Used by :any:`Collector` for ``native`` filters, so they can be
+        combined with other collectors in logical filter trees.
+        """
+        # FamilyInstanceFilter is the only Filter that  requires Doc
+        if cls is not FilterClasses.FamilyInstanceFilter:
+            return cls.process_value(value)
+        return cls.process_value(value, doc)
+
     @classmethod
     def apply(cls, doc, collector, value):
         """
@@ -72,14 +94,7 @@ class BaseFilter(BaseObject):
         """
         method_name = cls.method
         method = getattr(collector, method_name)
-
-        # FamilyInstanceFilter is the only Filter that  requires Doc
-        if cls is not FilterClasses.FamilyInstanceFilter:
-            value = cls.process_value(value)
-        else:
-            value = cls.process_value(value, doc)
-
-        return method(value)
+        return method(cls.get_filter(doc, value))
 
 
 class SuperQuickFilter(BaseFilter):
@@ -104,6 +119,7 @@ class SuperSlowFilter(BaseFilter):
 class LogicalFilter(BaseFilter):
     """ Leave it after Last as it must be completed """
     priority_group = 4
+    native = False
 
 class FilterClasses():
     """
@@ -122,12 +138,12 @@ class FilterClasses():
         X Revit.DB.ExclusionFilter = exclude
         X Revit.DB.IntersectWidth = and_collector
         X Revit.DB.UnionWidth = or_collector
-        _ Revit.DB.BoundingBoxContainsPointFilter
-        _ Revit.DB.BoundingBoxIntersectsFilter
-        _ Revit.DB.BoundingBoxIsInsideFilter
+        X Revit.DB.BoundingBoxContainsPointFilter = bbox_contains
+        X Revit.DB.BoundingBoxIntersectsFilter = bbox_intersects
+        X Revit.DB.BoundingBoxIsInsideFilter = bbox_inside
         _ Revit.DB.ElementDesignOptionFilter
-        _ Revit.DB.ElementMulticategoryFilter
-        _ Revit.DB.ElementMulticlassFilter
+        X Revit.DB.ElementMulticategoryFilter = of_category (list)
+        X Revit.DB.ElementMulticlassFilter = of_class (list)
         _ Revit.DB.ElementStructuralTypeFilter
         _ Revit.DB.ElementWorksetFilter
         _ Revit.DB.ExtensibleStorage ExtensibleStorageFilter
@@ -152,8 +168,8 @@ class FilterClasses():
         _ Autodesk.Revit.UI.Selection SelectableInViewFilter
 
     Logical
-        _ Revit.DB.LogicalAndFilter = and_filter
-        _ Revit.DB.LogicalOrFilter = or_filter
+        X Revit.DB.LogicalAndFilter = and_collector
+        X Revit.DB.LogicalOrFilter = or_collector
 
     Others
         X Custom where - uses lambda
@@ -179,6 +195,12 @@ class FilterClasses():
 
         @classmethod
         def process_value(cls, class_reference):
+            if isinstance(class_reference, (list, tuple, set)):
+                classes = [to_class(reference) for reference in class_reference]
+                if len(classes) != 1:
+                    clr_types = [clr.GetClrType(class_) for class_ in classes]
+                    return DB.ElementMulticlassFilter(List[Type](clr_types))
+                class_reference = classes[0]
             class_ = to_class(class_reference)
             return DB.ElementClassFilter(class_)
 
@@ -187,6 +209,11 @@ class FilterClasses():
 
         @classmethod
         def process_value(cls, category_reference):
+            if isinstance(category_reference, (list, tuple, set)):
+                categories = [to_category(reference) for reference in category_reference]
+                if len(categories) != 1:
+                    return DB.ElementMulticategoryFilter(List[DB.BuiltInCategory](categories))
+                category_reference = categories[0]
             category = to_category(category_reference)
             return DB.ElementCategoryFilter(category)
 
@@ -252,20 +279,21 @@ class FilterClasses():
         reverse = False
 
         @classmethod
-        def process_value(cls, level_reference):
+        def process_value(cls, level_reference, doc=None):
             """ Process level= input to allow for level name """
             if isinstance(level_reference, str):
-                level = Collector(of_class='Level', is_type=False,
-                                  where=lambda x:
-                                  x.Name == level_reference)
-                try:
-                    level_id = level[0].Id
-                except IndexError:
-                    RpwCoerceError(level_reference, DB.Level)
+                level_id = NameIndex.get(doc).get_id(DB.Level, level_reference)
+                if level_id is None:
+                    raise RpwCoerceError(level_reference, DB.Level)
             else:
                 level_id = to_element_id(level_reference)
             return DB.ElementLevelFilter(level_id, cls.reverse)
 
+        @classmethod
+        def get_filter(cls, doc, value):
+            # Level names are resolved in the collector document
+            return cls.process_value(value, doc)
+
     class NotLevelFilter(LevelFilter):
         keyword = 'not_level'
         reverse = True
@@ -292,6 +320,7 @@ class FilterClasses():
         >>> Collector(of_class='Wall', where=lambda x: 'Desk' in x.parameters['Length'] > 5.0)
         """
         keyword = 'where'
+        native = False
 
         @classmethod
         def apply(cls, doc, collector, func):
@@ -314,7 +343,41 @@ class FilterClasses():
             element_set = ElementSet(element_references)
             return DB.ExclusionFilter(element_set.as_element_id_list)
 
+    class BoundingBoxIntersectsFilter(QuickFilter):
+        """
+        Elements whose bounding box touches or overlaps a box like
+        reference (see :func:`rpw.db.bounding_box.to_bounds`)
+
+        >>> Collector(of_class='FamilyInstance', bbox_intersects=room_box)
+        >>> Collector(bbox_intersects=((0, 0, 0), (10, 10, 10)))
+        """
+        keyword = 'bbox_intersects'
+
+        @classmethod
+        def process_value(cls, box_reference):
+            return DB.BoundingBoxIntersectsFilter(to_outline(box_reference), 0.0, False)
+
+    class BoundingBoxIsInsideFilter(QuickFilter):
+        keyword = 'bbox_inside'
+
+        @classmethod
+        def process_value(cls, box_reference):
+            return DB.BoundingBoxIsInsideFilter(to_outline(box_reference), 0.0, False)
+
+    class BoundingBoxContainsPointFilter(QuickFilter):
+        keyword = 'bbox_contains'
+
+        @classmethod
+        def process_value(cls, point_reference):
+            return DB.BoundingBoxContainsPointFilter(XYZ(point_reference).unwrap(), 0.0, False)
+
     class InteresectFilter(LogicalFilter):
+        """
+        Combines the filters of both collectors in a ``LogicalAndFilter``
+        when both can be expressed as filters (see
+        :any:`Collector.get_element_filter`), so the result is collected in
+        one pass. Otherwise the collectors are chained with ``IntersectWith``.
+        """
         keyword = 'and_collector'
 
         @classmethod
@@ -323,14 +386,26 @@ class FilterClasses():
                 collector = collector.unwrap()
             return collector
 
+        @classmethod
+        def combine(cls, doc, collector, element_filter, other_filter):
+            """ Returns: (collector, ``DB.ElementFilter`` of the result) """
+            combined = DB.LogicalAndFilter(element_filter, other_filter)
+            return collector.WherePasses(other_filter), combined
+
         @classmethod
         def apply(cls, doc, collector, value):
             new_collector = cls.process_value(value)
             return collector.IntersectWith(new_collector)
 
     class UnionFilter(InteresectFilter):
+        """ Same as :any:`InteresectFilter`, with ``LogicalOrFilter`` and ``UnionWith`` """
         keyword = 'or_collector'
 
+        @classmethod
+        def combine(cls, doc, collector, element_filter, other_filter):
+            combined = DB.LogicalOrFilter(element_filter, other_filter)
+            return DB.FilteredElementCollector(doc).WherePasses(combined), combined
+
         @classmethod
         def apply(cls, doc, collector, value):
             new_collector = cls.process_value(value)
@@ -404,8 +479,10 @@ class Collector(BaseObjectWrapper):
         Filter Options:
             * is_type (``bool``): Same as ``WhereElementIsElementType``
             * is_not_type (``bool``): Same as ``WhereElementIsNotElementType``
-            * of_class (``Type``): Same as ``OfClass``. Type can be ``DB.SomeType`` or string: ``DB.Wall`` or ``'Wall'``
-            * of_category (``BuiltInCategory``): Same as ``OfCategory``. Can be ``DB.BuiltInCategory.OST_Wall`` or ``'Wall'``
+            * of_class (``Type``): Same as ``OfClass``. Type can be ``DB.SomeType`` or string: ``DB.Wall`` or ``'Wall'``.
+              A list of types uses ``ElementMulticlassFilter``: ``['Wall', 'Floor']``
+            * of_category (``BuiltInCategory``): Same as ``OfCategory``. Can be ``DB.BuiltInCategory.OST_Wall`` or ``'Wall'``.
+              A list of categories uses ``ElementMulticategoryFilter``: ``['Walls', 'Floors', 'Roofs']``
             * owner_view (``DB.ElementId, View`): ``WhereElementIsViewIndependent(True)``
             * is_view_independent (``bool``): ``WhereElementIsViewIndependent(True)``
             * family (``DB.ElementId``, ``DB.Element``): Element or ElementId of Family
@@ -414,13 +491,19 @@ class Collector(BaseObjectWrapper):
             * not_level (``DB.Level``, ``DB.ElementId``, ``Level Name``): Level, ElementId of Level, or Level Name
             * parameter_filter (:any:`ParameterFilter`): Applies ``ElementParameterFilter``
             * exclude (`element_references`): Element(s) or ElementId(s) to exlude from result
+            * bbox_intersects (``box``): Bounding box touches or overlaps ``box``: element, ``DB.BoundingBoxXYZ``, ``DB.Outline`` or ``(min, max)`` points
+            * bbox_inside (``box``): Bounding box is inside ``box``
+            * bbox_contains (``point``): Bounding box contains ``point`` (``DB.XYZ``, :any:`XYZ` or ``(x, y, z)``)
             * and_collector (``collector``): Collector to intersect with. Elements must be present in both
             * or_collector (``collector``): Collector to Union with. Elements must be present on of the two.
+              Filters of both collectors are combined in a ``LogicalAndFilter`` / ``LogicalOrFilter``
+              unless one of them uses ``where`` or a scope (``view``, ``elements``, ``element_ids``).
             * where (`function`): function to test your elements against
 
         """
         # Define Filtered Element Collector Scope + Doc
         collector_doc = filters.pop('doc') if 'doc' in filters else revit.doc
+        scoped = bool({'view', 'elements', 'element_ids'} & set(filters))
 
         if 'view' in filters:
             view = filters.pop('view')
@@ -437,6 +520,10 @@ class Collector(BaseObjectWrapper):
             collector = DB.FilteredElementCollector(collector_doc)
 
         super(Collector, self).__init__(collector)
+        self._collector_doc = collector_doc
+        self._is_scoped = scoped
+        # DB.ElementFilter applied so far, or None once a step can't be expressed as one
+        self._element_filters = []
 
         for key in filters.keys():
             if key not in [f.keyword for f in FilterClasses.get_sorted()]:
@@ -460,11 +547,52 @@ class Collector(BaseObjectWrapper):
             if filter_class.keyword not in filters:
                 continue
             filter_value = filters.pop(filter_class.keyword)
-            logger.debug('Applying Filter: {}:{}'.format(filter_class, filter_value))
-            new_collector = filter_class.apply(doc, collector, filter_value)
+            logger.debug('Applying Filter: %s:%s', filter_class, filter_value)
+            if filter_class.native:
+                element_filter = filter_class.get_filter(doc, filter_value)
+                new_collector = getattr(collector, filter_class.method)(element_filter)
+                if self._element_filters is not None:
+                    self._element_filters.append(element_filter)
+            elif issubclass(filter_class, LogicalFilter):
+                new_collector = self._combine(doc, collector, filter_class, filter_value)
+            else:
+                new_collector = filter_class.apply(doc, collector, filter_value)
+                self._element_filters = None
             return self._collect(doc, new_collector, filters)
         return collector
 
+    def _combine(self, doc, collector, filter_class, other):
+        """ Applies and_collector / or_collector as a logical filter tree if possible """
+        element_filter = self.get_element_filter()
+        other_filter = None
+        if isinstance(other, Collector) and other._collector_doc == doc and not other._is_scoped:
+            other_filter = other.get_element_filter()
+        if (element_filter is not None and other_filter is not None and
+                not (self._is_scoped and filter_class is FilterClasses.UnionFilter)):
+            new_collector, combined = filter_class.combine(doc, collector, element_filter,
+                                                           other_filter)
+            self._element_filters = [combined]
+            return new_collector
+        self._element_filters = None
+        return filter_class.apply(doc, collector, other)
+
+    def get_element_filter(self):
+        """
+        Returns the ``DB.ElementFilter`` equivalent to the filters of the
+        collector, or ``None`` if it has no filters, uses ``where``, or was
+        combined with a collector that could not be expressed as a filter.
+        The scope of the collector (``view``, ``elements``, ``element_ids``)
+        is not part of the filter.
+
+        >>> walls = Collector(of_class='Wall', level='Level 1')
+        >>> Collector(of_category='OST_Doors', or_collector=walls)  # Single pass
+        """
+        if not self._element_filters:
+            return None
+        if len(self._element_filters) == 1:
+            return self._element_filters[0]
+        return DB.LogicalAndFilter(List[DB.ElementFilter](self._element_filters))
+
     def __iter__(self):
         """ Uses iterator to reduce unecessary memory usage """
         # TODO: Depracate or Make return Wrapped ?
@@ -627,7 +755,7 @@ class ParameterFilter(BaseObjectWrapper):
                 raise RpwException('Rule not valid: {}'.format(condition))
 
         rules = []
-        for condition_name, condition_value in conditions.iteritems():
+        for condition_name, condition_value in conditions.items():
 
             # Returns on of the CreateRule factory method names above
             rule_factory_name = ParameterFilter.RULES.get(condition_name)
@@ -646,12 +774,13 @@ class ParameterFilter(BaseObjectWrapper):
             if 'not_' in condition_name:
                 filter_rule = DB.FilterInverseRule(filter_rule)
 
-            logger.debug('ParamFilter Conditions: {}'.format(conditions))
-            logger.debug('Case sensitive: {}'.format(case_sensitive))
-            logger.debug('Reverse: {}'.format(reverse))
-            logger.debug('ARGS: {}'.format(args))
-            logger.debug(filter_rule)
-            logger.debug(str(dir(filter_rule)))
+            if logger.isEnabledFor(DEBUG):
+                logger.debug('ParamFilter Conditions: %s', conditions)
+                logger.debug('Case sensitive: %s', case_sensitive)
+                logger.debug('Reverse: %s', reverse)
+                logger.debug('ARGS: %s', args)
+                logger.debug('%s', filter_rule)
+                logger.debug('%s', dir(filter_rule))
 
             rules.append(filter_rule)
         if not rules:
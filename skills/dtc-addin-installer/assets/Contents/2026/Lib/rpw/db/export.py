@@ -0,0 +1,253 @@
+"""
+Export
+
+Streams element parameters to NDJSON or CSV, one chunk of rows at a time,
+so a model can be exported without holding every element or row in memory.
+
+>>> from rpw import db
+>>> from rpw.db import export
+>>> walls = db.Collector(of_class='Wall', is_not_type=True)
+>>> export.to_ndjson(walls, ['id', 'Mark', 'Comments', 'Length'], 'walls.ndjson')
+{'rows': 12500, 'chunks': 13, 'seconds': 0.42, 'rows_per_second': 29761.9, ...}
+
+Rows can be written to any stream with a ``write()`` method, for example
+``sys.stdout`` when running through the Revit bridge:
+
+>>> export.to_csv(walls, ['id', 'Mark'], sys.stdout)
+
+Fields are resolved once per element type, not once per element: the
+first element of each ``(class, type id)`` pair decides how every field is
+read (built-in parameter id, parameter name lookup, or absent) and which
+``As*`` accessor matches its storage type. Elements of the same type share
+their parameter definitions, so the rest of them only run the resolved
+accessors. Elements without a type (``type_id`` -1) are also grouped by
+category, and fields they lack are looked up again on every element.
+
+Field specs:
+
+    * ``'id'``, ``'unique_id'``, ``'category'``, ``'type_id'``: element properties
+    * ``'Mark'``: parameter name
+    * ``DB.BuiltInParameter.ALL_MODEL_MARK``: built-in parameter
+    * ``('Column Name', spec)``: any of the above, or a ``function(element)``,
+      under another column name
+
+Element id values are written as integers. Missing parameters are written
+as ``null`` (NDJSON) or empty cells (CSV).
+
+"""  #
+
+import io
+import csv
+import json
+import time
+
+from rpw import DB
+from rpw.db.index import id_key
+from rpw.exceptions import RpwTypeError
+from rpw.utils.logger import logger
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+_ELEMENT_FIELDS = {
+    'id': lambda element: id_key(element.Id),
+    'unique_id': lambda element: element.UniqueId,
+    'category': lambda element: element.Category.Name if element.Category else None,
+    'type_id': lambda element: id_key(element.GetTypeId()),
+    }
+
+def _missing(element):
+    return None
+
+
+# {StorageType name: accessor}
+_READERS = {
+    'String': lambda parameter: parameter.AsString(),
+    'Double': lambda parameter: parameter.AsDouble(),
+    'Integer': lambda parameter: parameter.AsInteger(),
+    'ElementId': lambda parameter: id_key(parameter.AsElementId()),
+    'None': _missing,
+    }
+
+
+def _value_string(parameter):
+    return parameter.AsValueString() or parameter.AsString()
+
+
+def _read(parameter):
+    """ Accessor chosen per parameter, for fields of elements without a type """
+    return _READERS[parameter.StorageType.ToString()](parameter)
+
+
+def _plan_key(element):
+    type_id = id_key(element.GetTypeId())
+    if type_id != -1:
+        return (type(element), type_id)
+    category = element.Category
+    return (type(element), type_id, id_key(category.Id) if category else None)
+
+
+class Exporter(object):
+    """
+    Projects elements to rows of field values, in chunks.
+
+    >>> exporter = Exporter(['id', 'Mark', DB.BuiltInParameter.WALL_USER_HEIGHT_PARAM])
+    >>> for rows in exporter.iter_chunks(collector):
+    >>>     send(rows)
+
+    Attributes:
+        columns (list): Column names, in field order
+        types (int): Element types resolved so far
+    """
+
+    def __init__(self, fields, chunk_size=1000, value_strings=False):
+        """
+        Args:
+            fields (list): Field specs (see module docs)
+            chunk_size (int): Rows per chunk
+            value_strings (bool): Export parameters as displayed in Revit
+                (``AsValueString``, with units) instead of raw values
+        """
+        self.chunk_size = chunk_size
+        self.value_strings = value_strings
+        self.columns = []
+        self._fields = []
+        for field in fields:
+            column, spec = field if isinstance(field, tuple) else (field, field)
+            if isinstance(column, DB.BuiltInParameter):
+                column = str(column)
+            self.columns.append(column)
+            self._fields.append(spec)
+        # {(element class, type id[, category id]): [accessor per field]}
+        self._plans = {}
+
+    @property
+    def types(self):
+        return len(self._plans)
+
+    def _resolve(self, element, spec, typed=True):
+        """ Accessor of one field, for elements of the same type as ``element`` """
+        if callable(spec):
+            return spec
+        if isinstance(spec, str) and spec in _ELEMENT_FIELDS:
+            return _ELEMENT_FIELDS[spec]
+
+        if isinstance(spec, DB.BuiltInParameter):
+            parameter = element.get_Parameter(spec)
+            builtin = spec
+        elif isinstance(spec, str):
+            parameter = element.LookupParameter(spec)
+            builtin = parameter.Definition.BuiltInParameter if parameter else None
+        else:
+            raise RpwTypeError('parameter name, BuiltInParameter or function', type(spec))
+        if not parameter and typed:
+            return _missing
+
+        if self.value_strings:
+            read = _value_string
+        elif parameter:
+            read = _READERS[parameter.StorageType.ToString()]
+        else:
+            # Other elements without a type can have the parameter
+            read = _read
+        if builtin is not None and builtin != DB.BuiltInParameter.INVALID:
+            # Direct lookup by id instead of a search by name
+            def accessor(element):
+                parameter = element.get_Parameter(builtin)
+                return read(parameter) if parameter else None
+        else:
+            def accessor(element):
+                parameter = element.LookupParameter(spec)
+                return read(parameter) if parameter else None
+        return accessor
+
+    def _get_plan(self, element):
+        key = _plan_key(element)
+        plan = self._plans.get(key)
+        if plan is None:
+            typed = key[1] != -1
+            plan = self._plans[key] = [self._resolve(element, spec, typed) for spec in self._fields]
+        return plan
+
+    def iter_chunks(self, elements):
+        """
+        Yields lists of up to ``chunk_size`` rows, one list of field values
+        per element. ``elements`` can be a :any:`Collector` or any iterable
+        of elements; it is only iterated once.
+        """
+        chunk = []
+        size = self.chunk_size
+        plans = self._plans
+        for element in elements:
+            if hasattr(element, 'unwrap'):
+                element = element.unwrap()
+            plan = plans.get(_plan_key(element))
+            if plan is None:
+                plan = self._get_plan(element)
+            chunk.append([accessor(element) for accessor in plan])
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def iter_rows(self, elements):
+        """ Yields one ``{column: value}`` dictionary per element """
+        columns = self.columns
+        for chunk in self.iter_chunks(elements):
+            for row in chunk:
+                yield dict(zip(columns, row))
+
+    def write(self, elements, target, format='ndjson'):
+        """
+        Writes rows to ``target``, a file path or a stream, one chunk at a
+        time. Streams are flushed after each chunk and are not closed.
+
+        Args:
+            format (str): ``'ndjson'`` or ``'csv'`` (with a header row)
+
+        Returns:
+            (``dict``): ``rows``, ``chunks``, ``types``, ``seconds`` and
+            ``rows_per_second``
+        """
+        if format not in ('ndjson', 'csv'):
+            raise RpwTypeError("'ndjson' or 'csv'", format)
+        if isinstance(target, str):
+            with io.open(target, 'w', encoding='utf-8', newline='') as stream:
+                return self.write(elements, stream, format)
+
+        start = _clock()
+        rows = chunks = 0
+        columns = self.columns
+        if format == 'csv':
+            writer = csv.writer(target, lineterminator='\n')
+            writer.writerow(columns)
+        for chunk in self.iter_chunks(elements):
+            if format == 'csv':
+                writer.writerows(chunk)
+            else:
+                target.write(''.join(json.dumps(dict(zip(columns, row))) + '\n'
+                                     for row in chunk))
+            if hasattr(target, 'flush'):
+                target.flush()
+            rows += len(chunk)
+            chunks += 1
+
+        seconds = _clock() - start
+        report = {'rows': rows, 'chunks': chunks, 'types': self.types,
+                  'seconds': seconds,
+                  'rows_per_second': rows / seconds if seconds else 0.0}
+        logger.debug('Exported %s rows (%s) in %.3fs: %.0f rows/s', rows, format,
+                     seconds, report['rows_per_second'])
+        return report
+
+
+def to_ndjson(elements, fields, target, chunk_size=1000, value_strings=False):
+    """ Writes one JSON object per element (see :any:`Exporter.write`) """
+    exporter = Exporter(fields, chunk_size=chunk_size, value_strings=value_strings)
+    return exporter.write(elements, target, format='ndjson')
+
+
+def to_csv(elements, fields, target, chunk_size=1000, value_strings=False):
+    """ Writes a header and one CSV row per element (see :any:`Exporter.write`) """
+    exporter = Exporter(fields, chunk_size=chunk_size, value_strings=value_strings)
+    return exporter.write(elements, target, format='csv')
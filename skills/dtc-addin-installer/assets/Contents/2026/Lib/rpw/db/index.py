@@ -0,0 +1,361 @@
+"""
+Document Indexes
+
+Indexes group element ids of a document in a few collector passes, so
+lookups like "all instances of this family" or "all views of this
+ViewType" become dictionary lookups instead of collector passes.
+
+Indexes are built on first use and cached per document. The cache of a
+document is dropped whenever the document changes (the ``DocumentChanged``
+event of its application: rpw or raw transactions, the UI, other add-ins,
+undo) and when it closes. Indexes requested while a transaction is open are
+not cached: :any:`FamilyIndex` lookups then run targeted collectors, so they
+see pending changes without a full model pass per call.
+
+>>> from rpw.db.index import FamilyIndex
+>>> index = FamilyIndex.get(doc)
+>>> index.get_instance_ids(family.Id)
+[ DB.ElementId, ... ]
+
+:any:`NameIndex` resolves element names (levels, wall types, patterns)
+the same way.
+
+Note:
+    If the events cannot be subscribed to, indexes are not cached.
+
+"""  #
+
+import rpw
+from rpw import revit, DB
+from rpw.utils.logger import logger
+
+# {DB.Document: {IndexClass: index}}
+_INDEXES = {}
+# Applications whose document events drop cached indexes. Handlers are
+# removed once nothing is cached, so a handler left by a finished script
+# engine removes itself on the next change.
+_WATCHED = []
+
+
+def id_key(element_id):
+    """ Hashable key of an ElementId (``Value`` since Revit 2024) """
+    try:
+        return element_id.Value
+    except AttributeError:
+        return element_id.IntegerValue
+
+
+def invalidate_indexes(doc=None):
+    """ Drops cached indexes of ``doc``, or of all documents if ``None`` """
+    if doc is None:
+        _INDEXES.clear()
+    elif _INDEXES:
+        _INDEXES.pop(doc, None)
+    if not _INDEXES:
+        _unwatch()
+
+
+def _on_document_changed(sender, args):
+    invalidate_indexes(args.GetDocument())
+
+
+def _on_document_closing(sender, args):
+    invalidate_indexes(args.Document)
+
+
+def _watch(doc):
+    """ Subscribes to the document events of the application of ``doc``.
+    Returns ``False`` if they are not available. """
+    application = doc.Application
+    if application in _WATCHED:
+        return True
+    try:
+        application.DocumentChanged += _on_document_changed
+        try:
+            application.DocumentClosing += _on_document_closing
+        except Exception:
+            application.DocumentChanged -= _on_document_changed
+            raise
+    except Exception as errmsg:
+        logger.debug('Document indexes are not cached: {}'.format(errmsg))
+        return False
+    _WATCHED.append(application)
+    return True
+
+
+def _unwatch():
+    while _WATCHED:
+        application = _WATCHED.pop()
+        try:
+            application.DocumentChanged -= _on_document_changed
+            application.DocumentClosing -= _on_document_closing
+        except Exception as errmsg:
+            logger.debug('Could not remove document handlers: {}'.format(errmsg))
+
+
+def _store(doc, index):
+    """ Caches ``index``, dropping the indexes of closed documents """
+    for cached_doc in [cached_doc for cached_doc in _INDEXES if not cached_doc.IsValidObject]:
+        del _INDEXES[cached_doc]
+    if _watch(doc):
+        _INDEXES.setdefault(doc, {})[type(index)] = index
+
+
+class DocumentIndex(object):
+    """
+    Base class for indexes cached per document.
+    Subclasses implement ``_build()``, which runs once per cache entry.
+    ``_live_class``, if set, is used instead while the document is
+    modifiable.
+    """
+
+    _live_class = None
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._build()
+
+    def _build(self):
+        raise NotImplementedError
+
+    @classmethod
+    def get(cls, doc=None):
+        """ Cached index of ``doc`` [default: revit.doc]. While ``doc`` is
+        modifiable, returns an uncached (or live) index instead. """
+        doc = doc or revit.doc
+        if doc.IsModifiable:
+            return (cls._live_class or cls)(doc)
+        indexes = _INDEXES.get(doc)
+        if indexes is not None and cls in indexes:
+            return indexes[cls]
+        index = cls(doc)
+        _store(doc, index)
+        return index
+
+    def get_elements(self, element_ids, wrapped=True):
+        """ Resolves ``element_ids`` to (wrapped) elements """
+        get_element = self.doc.GetElement
+        elements = [get_element(element_id) for element_id in element_ids]
+        if wrapped:
+            return [rpw.db.Element(element) for element in elements]
+        return elements
+
+
+class FamilyIndex(DocumentIndex):
+    """
+    Groups ``family > symbols > instances`` and ``category > families``
+    with one ``FamilySymbol`` and one ``FamilyInstance`` collector pass.
+
+    Walls are grouped the same way (``wall kind > wall types > walls``)
+    with one ``WallType`` and one ``Wall`` pass, the first time a wall
+    lookup is made.
+
+    >>> index = FamilyIndex.get()
+    >>> index.get_symbol_ids(family_id)
+    >>> index.get_instance_ids(family_id)
+    >>> index.get_family_ids(category_id)
+    """
+
+    def _build(self):
+        doc = self.doc
+        self._family_symbols = {}
+        self._category_families = {}
+        self._symbol_instances = {}
+
+        family_symbols = self._family_symbols
+        category_families = self._category_families
+        symbols = DB.FilteredElementCollector(doc).OfClass(DB.FamilySymbol)
+        for symbol in symbols:
+            family = symbol.Family
+            family_key = id_key(family.Id)
+            symbol_ids = family_symbols.get(family_key)
+            if symbol_ids is None:
+                symbol_ids = family_symbols[family_key] = []
+                category = family.FamilyCategory
+                if category is not None:
+                    category_families.setdefault(id_key(category.Id), []).append(family.Id)
+            symbol_ids.append(symbol.Id)
+
+        symbol_instances = self._symbol_instances
+        instances = DB.FilteredElementCollector(doc).OfClass(DB.FamilyInstance)
+        for instance in instances:
+            symbol_key = id_key(instance.GetTypeId())
+            symbol_instances.setdefault(symbol_key, []).append(instance.Id)
+
+        self._kind_wall_types = None
+        self._wall_type_walls = None
+
+    def _build_walls(self):
+        doc = self.doc
+        self._kind_wall_types = kind_wall_types = {}
+        self._wall_type_walls = wall_type_walls = {}
+        for wall_type in DB.FilteredElementCollector(doc).OfClass(DB.WallType):
+            kind_wall_types.setdefault(wall_type.Kind.ToString(), []).append(wall_type.Id)
+        for wall in DB.FilteredElementCollector(doc).OfClass(DB.Wall):
+            wall_type_walls.setdefault(id_key(wall.GetTypeId()), []).append(wall.Id)
+
+    def get_symbol_ids(self, family_id):
+        """ Returns: [``DB.ElementId``] FamilySymbol ids of the Family """
+        return list(self._family_symbols.get(id_key(family_id), []))
+
+    def get_instance_ids(self, family_or_symbol_id):
+        """ Returns: [``DB.ElementId``] FamilyInstance ids of a Family or FamilySymbol """
+        key = id_key(family_or_symbol_id)
+        symbol_instances = self._symbol_instances
+        if key not in self._family_symbols:
+            return list(symbol_instances.get(key, []))
+        instance_ids = []
+        for symbol_id in self._family_symbols[key]:
+            instance_ids.extend(symbol_instances.get(id_key(symbol_id), []))
+        return instance_ids
+
+    def get_family_ids(self, category_id):
+        """ Returns: [``DB.ElementId``] Family ids of a Category """
+        return list(self._category_families.get(id_key(category_id), []))
+
+    def get_wall_type_ids(self, wall_kind):
+        """ Returns: [``DB.ElementId``] WallType ids of a ``DB.WallKind`` """
+        if self._kind_wall_types is None:
+            self._build_walls()
+        return list(self._kind_wall_types.get(wall_kind.ToString(), []))
+
+    def get_wall_ids(self, wall_type_id):
+        """ Returns: [``DB.ElementId``] Wall ids of a WallType """
+        if self._wall_type_walls is None:
+            self._build_walls()
+        return list(self._wall_type_walls.get(id_key(wall_type_id), []))
+
+
+class LiveFamilyIndex(FamilyIndex):
+    """
+    :any:`FamilyIndex` of a modifiable document: every lookup runs a
+    targeted collector, so it sees the changes of the open transaction.
+    """
+
+    def _build(self):
+        pass
+
+    def _collect(self, revit_class):
+        return DB.FilteredElementCollector(self.doc).OfClass(revit_class)
+
+    def get_symbol_ids(self, family_id):
+        family = self.doc.GetElement(family_id)
+        return list(family.GetFamilySymbolIds()) if family is not None else []
+
+    def get_instance_ids(self, family_or_symbol_id):
+        element = self.doc.GetElement(family_or_symbol_id)
+        if isinstance(element, DB.Family):
+            symbol_ids = element.GetFamilySymbolIds()
+        else:
+            symbol_ids = [family_or_symbol_id]
+        instance_ids = []
+        for symbol_id in symbol_ids:
+            instance_filter = DB.FamilyInstanceFilter(self.doc, symbol_id)
+            collector = DB.FilteredElementCollector(self.doc).WherePasses(instance_filter)
+            instance_ids.extend(collector.ToElementIds())
+        return instance_ids
+
+    def get_family_ids(self, category_id):
+        family_ids, seen = [], set()
+        symbols = self._collect(DB.FamilySymbol).OfCategoryId(category_id)
+        for symbol in symbols:
+            family_id = symbol.Family.Id
+            if id_key(family_id) not in seen:
+                seen.add(id_key(family_id))
+                family_ids.append(family_id)
+        return family_ids
+
+    def get_wall_type_ids(self, wall_kind):
+        kind = wall_kind.ToString()
+        return [wall_type.Id for wall_type in self._collect(DB.WallType)
+                if wall_type.Kind.ToString() == kind]
+
+    def get_wall_ids(self, wall_type_id):
+        key = id_key(wall_type_id)
+        return [wall.Id for wall in self._collect(DB.Wall) if id_key(wall.GetTypeId()) == key]
+
+
+FamilyIndex._live_class = LiveFamilyIndex
+
+
+class ViewIndex(DocumentIndex):
+    """
+    Groups view ids by ``DB.ViewType``, ``DB.ViewFamily`` and
+    ``ViewFamilyType`` with one ``View`` and one ``ViewFamilyType``
+    collector pass.
+
+    >>> index = ViewIndex.get()
+    >>> index.get_view_ids_by_view_type(DB.ViewType.FloorPlan)
+    >>> index.get_view_ids_by_view_family(DB.ViewFamily.Section)
+    >>> index.get_view_ids_by_family_type(view_family_type_id)
+    """
+
+    def _build(self):
+        doc = self.doc
+        self._by_view_type = by_view_type = {}
+        self._by_family_type = by_family_type = {}
+        self._by_view_family = by_view_family = {}
+
+        family_type_families = {}
+        for view_family_type in DB.FilteredElementCollector(doc).OfClass(DB.ViewFamilyType):
+            family_type_families[id_key(view_family_type.Id)] = view_family_type.ViewFamily.ToString()
+
+        for view in DB.FilteredElementCollector(doc).OfClass(DB.View):
+            view_id = view.Id
+            by_view_type.setdefault(view.ViewType.ToString(), []).append(view_id)
+            # Some views (SystemBrowser, ProjectBrowser) have no ViewFamilyType
+            family_type_key = id_key(view.GetTypeId())
+            view_family = family_type_families.get(family_type_key)
+            if view_family is not None:
+                by_family_type.setdefault(family_type_key, []).append(view_id)
+                by_view_family.setdefault(view_family, []).append(view_id)
+
+    def get_view_ids_by_view_type(self, view_type):
+        """ Returns: [``DB.ElementId``] View ids of a ``DB.ViewType`` """
+        return list(self._by_view_type.get(view_type.ToString(), []))
+
+    def get_view_ids_by_view_family(self, view_family):
+        """ Returns: [``DB.ElementId``] View ids of a ``DB.ViewFamily`` """
+        return list(self._by_view_family.get(view_family.ToString(), []))
+
+    def get_view_ids_by_family_type(self, view_family_type_id):
+        """ Returns: [``DB.ElementId``] View ids of a ViewFamilyType """
+        return list(self._by_family_type.get(id_key(view_family_type_id), []))
+
+
+class NameIndex(DocumentIndex):
+    """
+    Maps element names to ids, per class. The first lookup of a class
+    collects its elements once; later lookups are dictionary lookups.
+    Used to resolve level, wall type and pattern names.
+
+    When several elements share a name, the first one collected is used.
+
+    >>> index = NameIndex.get()
+    >>> index.get_id(DB.Level, 'Level 1')
+    >>> index.get_id(DB.LinePatternElement, 'dash', case_sensitive=False)
+    """
+
+    def _build(self):
+        # {class: ({name: id}, {lower case name: id})}
+        self._names = {}
+
+    def _get_names(self, revit_class):
+        names = self._names.get(revit_class)
+        if names is None:
+            exact, lower = {}, {}
+            for element in DB.FilteredElementCollector(self.doc).OfClass(revit_class):
+                name = element.Name
+                if name not in exact:
+                    exact[name] = element.Id
+                lower.setdefault(name.lower(), element.Id)
+            names = self._names[revit_class] = (exact, lower)
+        return names
+
+    def get_id(self, revit_class, name, case_sensitive=True):
+        """ Returns: (``DB.ElementId``) Id of the element of ``revit_class``
+        named ``name``, or ``None`` """
+        exact, lower = self._get_names(revit_class)
+        if case_sensitive:
+            return exact.get(name)
+        return lower.get(name.lower())
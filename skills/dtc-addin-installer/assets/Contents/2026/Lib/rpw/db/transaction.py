@@ -1,8 +1,15 @@
+import time
 import traceback
 from rpw import revit, DB
 from rpw.base import BaseObjectWrapper
 from rpw.exceptions import RpwException
 from rpw.utils.logger import logger
+from rpw.db.index import invalidate_indexes
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+# {DB.Document: TransactionBatch} of the batches in progress
+_BATCHES = {}
 
 
 class Transaction(BaseObjectWrapper):
@@ -20,6 +27,15 @@ class Transaction(BaseObjectWrapper):
     >>>     assert t.HasStarted() is True
     >>> assert t.HasEnded() is True
 
+    If the document already has an open transaction, the context joins it
+    instead of starting a new one (``t.joined`` is ``True``): nested
+    contexts and decorated functions called from a transaction work, and
+    the outer transaction commits or rolls back everything.
+    Inside a :any:`TransactionBatch`, the context is one operation of the
+    batch.
+
+    After commit, ``t.commit_time`` holds the seconds spent in ``Commit()``.
+
     Wrapped Element:
         self._revit_object = `Revit.DB.Transaction`
 
@@ -27,25 +43,47 @@ class Transaction(BaseObjectWrapper):
 
     _revit_object_class = DB.Transaction
 
-    def __init__(self, name=None, doc=revit.doc):
+    def __init__(self, name=None, doc=None):
         if name is None:
             name = 'RPW Transaction'
+        doc = doc or revit.doc
         super(Transaction, self).__init__(DB.Transaction(doc, name))
         self.transaction = self._revit_object
+        self.doc = doc
+        self.joined = False
+        self.batch = None
+        self.commit_time = None
 
     def __enter__(self):
-        self.transaction.Start()
+        invalidate_indexes(self.doc)
+        batch = _BATCHES.get(self.doc)
+        if batch is not None:
+            self.batch = batch
+            batch._begin_operation()
+        elif self.doc.IsModifiable:
+            self.joined = True
+        else:
+            self.transaction.Start()
         return self
 
     def __exit__(self, exception, exception_msg, tb):
-        if exception:
+        invalidate_indexes(self.doc)
+        if self.batch is not None:
+            self.batch._end_operation(failed=bool(exception))
+        elif self.joined:
+            # Outer transaction commits or rolls back
+            return
+        elif exception:
             self.transaction.RollBack()
             logger.error('Error in Transaction Context: has rolled back.')
             # traceback.print_tb(tb)
             # raise exception # Let exception through
         else:
             try:
+                start = _clock()
                 self.transaction.Commit()
+                self.commit_time = _clock() - start
+                logger.debug('Transaction committed in %.3fs', self.commit_time)
             except Exception as exc:
                 self.transaction.RollBack()
                 logger.error('Error in Transaction Commit: has rolled back.')
@@ -59,6 +97,9 @@ class Transaction(BaseObjectWrapper):
         Decorate any function with ``@Transaction.ensure('Transaction Name')``
         and the funciton will run within a Transaction Context.
 
+        Calls made while a transaction is open join it, and calls made in a
+        :any:`TransactionBatch` share the batch transactions.
+
         Args:
             name (str): Name of the Transaction
 
@@ -82,7 +123,6 @@ class Transaction(BaseObjectWrapper):
 
     # TODO: Add  __repr__ with Transaction Status
     # TODO: Merge Transaction Status
-    # TODO: add check for if transaction is in progress, especially for ensure
     # TODO: add ensure to TransactionGroup
 
 
@@ -103,7 +143,7 @@ class TransactionGroup(BaseObjectWrapper):
 
     _revit_object_class = DB.TransactionGroup
 
-    def __init__(self, name=None, assimilate=True, doc=revit.doc):
+    def __init__(self, name=None, assimilate=True, doc=None):
         """
             Args:
                 name (str): Name of the Transaction
@@ -112,15 +152,18 @@ class TransactionGroup(BaseObjectWrapper):
         """
         if name is None:
             name = 'RPW Transaction Group'
+        doc = doc or revit.doc
         super(TransactionGroup, self).__init__(DB.TransactionGroup(doc, name))
         self.transaction_group = self._revit_object
         self.assimilate = assimilate
+        self.doc = doc
 
     def __enter__(self):
         self.transaction_group.Start()
         return self.transaction_group
 
     def __exit__(self, exception, exception_msg, tb):
+        invalidate_indexes(self.doc)
         if exception:
             self.transaction_group.RollBack()
             logger.error('Error in TransactionGroup Context: has rolled back.')
@@ -138,6 +181,183 @@ class TransactionGroup(BaseObjectWrapper):
                 raise exc
 
 
+class TransactionBatch(BaseObjectWrapper):
+    """
+    Coalesces many small transactions into a few larger ones.
+
+    Inside the context, every :any:`Transaction` context on the document,
+    including functions decorated with :func:`Transaction.ensure`, is one
+    operation of the batch. Operations share a transaction, which is
+    committed every ``size`` operations or when it has been open for
+    ``window`` seconds. Transactions run in a ``DB.TransactionGroup``,
+    assimilated on exit.
+
+    Each operation runs in a ``DB.SubTransaction``: an operation that
+    raises is rolled back alone, and the batch goes on if the exception is
+    caught. If the context raises, only the current transaction is rolled
+    back: operations of committed transactions are kept.
+
+    >>> from rpw import db
+    >>> @db.Transaction.ensure('Set Mark')
+    >>> def set_mark(element, mark):
+    >>>     element.parameters['Mark'] = mark
+    >>>
+    >>> with db.TransactionBatch('Renumber', size=500) as batch:
+    >>>     for n, element in enumerate(elements):
+    >>>         set_mark(element, str(n))
+    >>> batch.report
+    {'operations': 20000, 'commits': 40, 'failed': 0, 'commit_time': 1.2, ...}
+
+    Writes that are not in a Transaction context can be counted as
+    operations with :func:`run`.
+
+    If the document already has an open transaction, or another batch is in
+    progress, the batch joins it and ``joined`` is ``True``.
+
+    Wrapped Element:
+        self._revit_object = `Revit.DB.TransactionGroup`
+
+    """
+
+    _revit_object_class = DB.TransactionGroup
+
+    def __init__(self, name=None, size=1000, window=None, assimilate=True, doc=None):
+        """
+        Args:
+            name (str): Name of the Transaction Group. Sub-transactions are
+                numbered after it.
+            size (int): Operations per sub-transaction.
+            window (float): Maximum seconds a sub-transaction stays open.
+                Checked after each operation. Default: ``None`` (no limit)
+            assimilate (bool): If ``True``, the sub-transactions are merged
+                into a single undo entry.
+        """
+        if name is None:
+            name = 'RPW Transaction Batch'
+        doc = doc or revit.doc
+        super(TransactionBatch, self).__init__(DB.TransactionGroup(doc, name))
+        self.transaction_group = self._revit_object
+        self.name = name
+        self.size = size
+        self.window = window
+        self.assimilate = assimilate
+        self.doc = doc
+        self.joined = False
+        self.operations = 0
+        self.failed = 0
+        self.commit_times = []
+        self._transaction = None
+        self._operations = []  # Open DB.SubTransaction, innermost last
+        self._chunk_operations = 0
+        self._chunk_start = None
+
+    def __enter__(self):
+        if self.doc in _BATCHES or self.doc.IsModifiable:
+            self.joined = True
+            return self
+        self.transaction_group.Start()
+        _BATCHES[self.doc] = self
+        return self
+
+    def __exit__(self, exception, exception_msg, tb):
+        if self.joined:
+            return
+        del _BATCHES[self.doc]
+        try:
+            if self._transaction is None:
+                pass
+            elif exception:
+                self._transaction.RollBack()
+                self._transaction = None
+                self.failed += self._chunk_operations
+                logger.error('Error in TransactionBatch Context: '
+                             '{} operations rolled back.'.format(self._chunk_operations))
+            else:
+                self._commit()
+        finally:
+            if self.assimilate:
+                self.transaction_group.Assimilate()
+            else:
+                self.transaction_group.Commit()
+            invalidate_indexes(self.doc)
+            logger.debug('TransactionBatch %s: %s', self.name, self.report)
+
+    def _begin_operation(self):
+        if self._transaction is None and not self.doc.IsModifiable:
+            name = '{} {}'.format(self.name, len(self.commit_times) + 1)
+            self._transaction = DB.Transaction(self.doc, name)
+            self._transaction.Start()
+            self._chunk_operations = 0
+            self._chunk_start = _clock()
+        if self._transaction is not None:
+            operation = DB.SubTransaction(self.doc)
+            operation.Start()
+            self._operations.append(operation)
+
+    def _end_operation(self, failed=False):
+        self.operations += 1
+        if not self._operations:
+            return
+        operation = self._operations.pop()
+        if failed:
+            self.failed += 1
+            operation.RollBack()
+            logger.error('Error in TransactionBatch operation: has rolled back.')
+            return
+        operation.Commit()
+        self._chunk_operations += 1
+        # Nested operations are committed with the outermost one
+        if self._operations:
+            return
+        if (self._chunk_operations >= self.size or
+                (self.window is not None and _clock() - self._chunk_start >= self.window)):
+            self._commit()
+
+    def _commit(self):
+        transaction, self._transaction = self._transaction, None
+        start = _clock()
+        try:
+            transaction.Commit()
+        except Exception as exc:
+            transaction.RollBack()
+            self.failed += self._chunk_operations
+            logger.error('Error in TransactionBatch Commit: has rolled back.')
+            logger.error(exc)
+            raise
+        self.commit_times.append(_clock() - start)
+
+    def run(self, func, *args, **kwargs):
+        """ Calls ``func(*args, **kwargs)`` as one operation of the batch """
+        if self.joined:
+            return func(*args, **kwargs)
+        self._begin_operation()
+        try:
+            return_value = func(*args, **kwargs)
+        except Exception:
+            self._end_operation(failed=True)
+            raise
+        self._end_operation()
+        return return_value
+
+    def commit(self):
+        """ Commits the current sub-transaction now, if one is open """
+        if self._transaction is not None:
+            self._commit()
+
+    @property
+    def report(self):
+        """ Returns: (``dict``) Operation counts and commit timings (seconds) """
+        commit_times = self.commit_times
+        return {'operations': self.operations,
+                'failed': self.failed,
+                'commits': len(commit_times),
+                'commit_time': sum(commit_times),
+                'slowest_commit': max(commit_times) if commit_times else 0.0}
+
+    def __repr__(self):
+        return super(TransactionBatch, self).__repr__(data=self.report)
+
+
 class DynamoTransaction(object):
 
     # TODO: Use Dynamo Transaction when HOST is 'Dynamo'
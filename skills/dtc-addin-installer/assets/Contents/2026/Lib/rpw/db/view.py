@@ -3,16 +3,19 @@ View Wrappers
 
 """  #
 
+import time
+
 import rpw
 from rpw import revit, DB
 from rpw.db.element import Element
 from rpw.db.pattern import LinePatternElement, FillPatternElement
-from rpw.db.collector import Collector
+from rpw.db.index import ViewIndex, id_key
 from rpw.base import BaseObjectWrapper
 from rpw.utils.coerce import to_element_ids, to_element_id, to_element
-from rpw.utils.coerce import to_category_id, to_iterable
 from rpw.exceptions import RpwTypeError, RpwCoerceError
 from rpw.utils.logger import logger
+from rpw.db.builtins import BicEnum
+from rpw.db.transaction import Transaction
 
 
 class View(Element):
@@ -82,7 +85,9 @@ class View(Element):
     @property
     def siblings(self):
         """ Collect all views of the same ``ViewType`` """
-        return self.view_type.views
+        index = ViewIndex.get(self.doc)
+        view_ids = index.get_view_ids_by_view_type(self._revit_object.ViewType)
+        return index.get_elements(view_ids)
 
     @property
     def override(self):
@@ -164,9 +169,9 @@ class ViewFamilyType(Element):
     @property
     def views(self):
         """ Collect All Views of the same ViewFamilyType """
-        views = Collector(of_class='View').get_elements(wrapped=True)
-        return [view for view in views if
-                getattr(view.view_family_type, '_revit_object', None) == self.unwrap()]
+        index = ViewIndex.get(self.doc)
+        view_ids = index.get_view_ids_by_family_type(self._revit_object.Id)
+        return index.get_elements(view_ids)
 
     def __repr__(self):
         return super(ViewFamilyType, self).__repr__(data={'name': self.name,
@@ -197,9 +202,9 @@ class ViewFamily(BaseObjectWrapper):
     @property
     def views(self):
         """ Collect All Views of the same ViewFamily """
-        views = Collector(of_class='View').get_elements(wrapped=True)
-        return [view for view in views if
-                getattr(view.view_family, '_revit_object', None) == self.unwrap()]
+        index = ViewIndex.get()
+        view_ids = index.get_view_ids_by_view_family(self._revit_object)
+        return index.get_elements(view_ids)
 
     def __repr__(self):
         return super(ViewFamily, self).__repr__(data={'family': self.name})
@@ -229,8 +234,9 @@ class ViewType(BaseObjectWrapper):
     @property
     def views(self):
         """ Collect All Views of the same ViewType """
-        views = Collector(of_class='View').get_elements(wrapped=True)
-        return [view for view in views if view.view_type.unwrap() == self.unwrap()]
+        index = ViewIndex.get()
+        view_ids = index.get_view_ids_by_view_type(self._revit_object)
+        return index.get_elements(view_ids)
 
     def __repr__(self):
         return super(ViewType, self).__repr__(data={'view_type': self.name})
@@ -270,6 +276,9 @@ class OverrideGraphicSettings(BaseObjectWrapper):
         * Category_id
         * An iterable containing any of the above types
 
+    Many targets with different settings can be overridden at once with
+    :func:`apply_many`.
+
     """
 
     # TODO: Pattern: Add pattern_id from name. None sets InvalidElementId
@@ -284,16 +293,217 @@ class OverrideGraphicSettings(BaseObjectWrapper):
         super(OverrideGraphicSettings, self).__init__(DB.OverrideGraphicSettings())
         self.view = wrapped_view.unwrap()
 
+    # Settings accepted in apply_many() specs
+    SETTINGS = ('projection_line', 'cut_line', 'projection_fill', 'cut_fill',
+                'transparency', 'halftone', 'detail_level')
+
+    # DB.OverrideGraphicSettings properties compared by apply_many(), before
+    # (ProjectionFill, CutFill) and since Revit 2019 (Surface/Cut patterns)
+    PROPERTIES = ('ProjectionLineColor', 'ProjectionLinePatternId', 'ProjectionLineWeight',
+                  'CutLineColor', 'CutLinePatternId', 'CutLineWeight',
+                  'ProjectionFillColor', 'ProjectionFillPatternId',
+                  'IsProjectionFillPatternVisible',
+                  'CutFillColor', 'CutFillPatternId', 'IsCutFillPatternVisible',
+                  'SurfaceForegroundPatternColor', 'SurfaceForegroundPatternId',
+                  'IsSurfaceForegroundPatternVisible',
+                  'SurfaceBackgroundPatternColor', 'SurfaceBackgroundPatternId',
+                  'IsSurfaceBackgroundPatternVisible',
+                  'CutForegroundPatternColor', 'CutForegroundPatternId',
+                  'IsCutForegroundPatternVisible',
+                  'CutBackgroundPatternColor', 'CutBackgroundPatternId',
+                  'IsCutBackgroundPatternVisible',
+                  'Transparency', 'Halftone', 'DetailLevel')
+
     def _set_overrides(self, target):
-        targets = to_iterable(target)
-        for target in targets:
-            try:
-                category_id = to_category_id(target)
-                self._set_category_overrides(category_id)
-            except (RpwTypeError, RpwCoerceError) as errmsg:
-                logger.debug('Not Category, Trying Element Override')
-                element_id = to_element_id(target)
-                self._set_element_overrides(element_id)
+        category_ids, element_ids = self._classify_targets(target)
+        for category_id in category_ids:
+            self._set_category_overrides(category_id)
+        for element_id in element_ids:
+            self._set_element_overrides(element_id)
+
+    @staticmethod
+    def _classify_targets(target, category_names=None):
+        """
+        Splits target(s) into category ids and element ids by type,
+        without coercion attempts.
+
+        ``ElementId`` (and ``int``) targets are categories if they are
+        BuiltInCategory ids (< -1), else elements.
+
+        Args:
+            category_names (``dict``): Optional cache of resolved fuzzy names
+
+        Returns:
+            ([``DB.ElementId``], [``DB.ElementId``]): category_ids, element_ids
+        """
+        category_names = {} if category_names is None else category_names
+        category_ids, element_ids = [], []
+        pending = [target]
+        while pending:
+            target = pending.pop()
+            if hasattr(target, 'unwrap'):
+                target = target.unwrap()
+            if isinstance(target, DB.ElementId):
+                element_id = target
+            elif isinstance(target, DB.Element):
+                element_ids.append(target.Id)
+                continue
+            elif isinstance(target, DB.BuiltInCategory):
+                category_ids.append(DB.ElementId(target))
+                continue
+            elif isinstance(target, DB.Category):
+                category_ids.append(target.Id)
+                continue
+            elif isinstance(target, str):
+                category_id = category_names.get(target)
+                if category_id is None:
+                    category_id = DB.ElementId(BicEnum.fuzzy_get(target))
+                    category_names[target] = category_id
+                category_ids.append(category_id)
+                continue
+            elif isinstance(target, int):
+                element_id = DB.ElementId(target)
+            elif hasattr(target, '__iter__'):
+                pending.extend(reversed(list(target)))
+                continue
+            else:
+                raise RpwTypeError('Element, ElementId, Category or Category Name',
+                                   type(target))
+            if id_key(element_id) < -1:
+                category_ids.append(element_id)
+            else:
+                element_ids.append(element_id)
+        return category_ids, element_ids
+
+    @staticmethod
+    def _spec_key(spec):
+        """ Hashable key of a settings spec, used to share identical settings """
+        if isinstance(spec, dict):
+            return tuple(sorted((key, OverrideGraphicSettings._spec_key(value))
+                                for key, value in spec.items()))
+        if isinstance(spec, (list, tuple)):
+            return tuple(OverrideGraphicSettings._spec_key(value) for value in spec)
+        if hasattr(spec, 'unwrap'):
+            spec = spec.unwrap()
+        if isinstance(spec, DB.OverrideGraphicSettings):
+            # Compared by content: equal settings built separately are shared
+            return ('OverrideGraphicSettings',) + tuple(
+                OverrideGraphicSettings._value_key(getattr(spec, name, None))
+                for name in OverrideGraphicSettings.PROPERTIES)
+        return spec
+
+    @staticmethod
+    def _value_key(value):
+        if isinstance(value, DB.ElementId):
+            return ('ElementId', id_key(value))
+        if isinstance(value, DB.Color):
+            if not getattr(value, 'IsValid', True):
+                return ('Color', None)
+            return ('Color', value.Red, value.Green, value.Blue)
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        # Enums (DetailLevel)
+        return str(value)
+
+    def _build_settings(self, spec):
+        """ ``DB.OverrideGraphicSettings`` from a spec (see :func:`apply_many`) """
+        if isinstance(spec, DB.OverrideGraphicSettings):
+            return spec
+        if hasattr(spec, 'unwrap'):
+            return spec.unwrap()
+        builder = OverrideGraphicSettings(rpw.db.Element(self.view))
+        for setting, value in spec.items():
+            if setting not in OverrideGraphicSettings.SETTINGS:
+                raise RpwCoerceError('override setting: {}'.format(setting),
+                                     OverrideGraphicSettings)
+            apply_setting = getattr(builder, setting)
+            # Empty target: only the settings are set
+            if isinstance(value, dict):
+                apply_setting([], **value)
+            else:
+                apply_setting([], value)
+        return builder.unwrap()
+
+    def apply_many(self, overrides, name='Apply Overrides'):
+        """
+        Applies different overrides to many targets in a single transaction.
+
+        Targets are classified by type up front, and targets with identical
+        settings share one ``DB.OverrideGraphicSettings``. If the document
+        is already in a transaction, that transaction is used.
+
+        >>> overrides = {}
+        >>> for wall in walls:
+        >>>     color = colors[wall.parameters['Fire Rating'].value]
+        >>>     overrides[wall] = {'projection_line': {'color': color},
+        >>>                        'halftone': False}
+        >>> overrides['Doors'] = {'transparency': 50}
+        >>> wrapped_view.override.apply_many(overrides)
+        {'elements': 20000, 'categories': 1, 'settings': 4, 'classify': 0.02, ...}
+
+        Args:
+            overrides (``dict``): ``{target: spec}``. Targets are the same as
+                the single override methods (tuples for groups). Specs are a
+                ``DB.OverrideGraphicSettings`` or a dict of settings, named
+                after the override methods: ``projection_line``,
+                ``cut_line``, ``projection_fill``, ``cut_fill`` take a dict
+                of arguments, ``transparency``, ``halftone`` and
+                ``detail_level`` a value.
+            name (``str``): Transaction Name
+
+        Returns:
+            (``dict``): Counts and time (seconds) spent per phase:
+                ``classify``, ``build``, ``apply`` and ``total``
+        """
+        clock = getattr(time, 'perf_counter', time.time)
+        start = clock()
+
+        category_names = {}
+        spec_keys = {}
+        # Specs are often the same object: {id: (spec, key)}, keeping the
+        # spec alive so its id cannot be reused during the call
+        keys_by_spec_id = {}
+        category_overrides = []
+        element_overrides = []
+        for target, spec in overrides.items():
+            known = keys_by_spec_id.get(id(spec))
+            if known is None:
+                known = keys_by_spec_id[id(spec)] = (spec, self._spec_key(spec))
+                spec_keys.setdefault(known[1], spec)
+            key = known[1]
+            category_ids, element_ids = self._classify_targets(target, category_names)
+            category_overrides.extend((category_id, key) for category_id in category_ids)
+            element_overrides.extend((element_id, key) for element_id in element_ids)
+        classified = clock()
+
+        settings = dict((key, self._build_settings(spec)) for key, spec in spec_keys.items())
+        built = clock()
+
+        view = self.view
+        doc = view.Document
+
+        def apply():
+            for category_id, key in category_overrides:
+                view.SetCategoryOverrides(category_id, settings[key])
+            for element_id, key in element_overrides:
+                view.SetElementOverrides(element_id, settings[key])
+
+        if doc.IsModifiable:
+            apply()
+        else:
+            with Transaction(name, doc=doc):
+                apply()
+        applied = clock()
+
+        report = {'elements': len(element_overrides),
+                  'categories': len(category_overrides),
+                  'settings': len(settings),
+                  'classify': classified - start,
+                  'build': built - classified,
+                  'apply': applied - built,
+                  'total': applied - start}
+        logger.debug('apply_many: %s', report)
+        return report
 
     def _set_element_overrides(self, element_id):
         self.view.SetElementOverrides(element_id, self._revit_object)
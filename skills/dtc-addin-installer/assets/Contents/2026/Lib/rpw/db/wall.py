@@ -3,16 +3,15 @@ Wall Wrappers
 
 """  #
 
-import rpw
 from rpw import revit, DB
 from rpw.db import Element
 from rpw.db import FamilyInstance, FamilySymbol, Family, Category
 from rpw.base import BaseObjectWrapper
 from rpw.utils.logger import logger, deprecate_warning
 from rpw.utils.coerce import to_element_id
-from rpw.db.builtins import BipEnum
 from rpw.exceptions import RpwTypeError, RpwCoerceError
 from rpw.utils.mixins import ByNameCollectMixin
+from rpw.db.index import FamilyIndex
 
 
 class Wall(FamilyInstance):
@@ -116,10 +115,9 @@ class WallType(FamilySymbol, ByNameCollectMixin):
 
     def get_instances(self, wrapped=True):
         """ Returns all Instances of this Wall Types """
-        bip = BipEnum.get_id('SYMBOL_NAME_PARAM')
-        param_filter = rpw.db.ParameterFilter(bip, equals=self.name)
-        return rpw.db.Collector(parameter_filter=param_filter,
-                                **Wall._collector_params).wrapped_elements
+        index = FamilyIndex.get(self.doc)
+        wall_ids = index.get_wall_ids(self._revit_object.Id)
+        return index.get_elements(wall_ids, wrapped=wrapped)
 
     @property
     def instances(self):
@@ -180,10 +178,9 @@ class WallKind(BaseObjectWrapper):
 
     def get_wall_types(self, wrapped=True):
         """ Get Wall Types Alias """
-        type_collector = rpw.db.WallType.collect()
-        wall_types = type_collector.get_elements(wrapped=wrapped)
-        return [wall_type for wall_type in wall_types
-                if wall_type.Kind == self._revit_object]
+        index = FamilyIndex.get()
+        wall_type_ids = index.get_wall_type_ids(self._revit_object)
+        return index.get_elements(wall_type_ids, wrapped=wrapped)
 
     @property
     def wall_types(self):
@@ -192,10 +189,11 @@ class WallKind(BaseObjectWrapper):
 
     def get_instances(self, wrapped=True):
         """ Returns all Wall instances of this given Wall Kind"""
-        instances = []
-        for wall_type in self.get_wall_types(wrapped=True):
-            instances.extend(wall_type.get_instances(wrapped=wrapped))
-        return instances
+        index = FamilyIndex.get()
+        wall_ids = []
+        for wall_type_id in index.get_wall_type_ids(self._revit_object):
+            wall_ids.extend(index.get_wall_ids(wall_type_id))
+        return index.get_elements(wall_ids, wrapped=wrapped)
 
     @property
     def instances(self):
@@ -0,0 +1,222 @@
+"""
+Write Queue
+
+Records parameter writes and applies them later, in one pass.
+
+Writing through ``element.parameters['Mark'] = value`` sets the parameter
+right away, so scripts that mix reads and writes pay for each write inside
+the open transaction. A :any:`WriteQueue` only records ``(element, parameter,
+value)``. Writes to the same parameter of the same element collapse to the
+last value. On :func:`WriteQueue.flush` the writes are sorted by element, each
+element and parameter is looked up once, and values that would not change
+are skipped.
+
+>>> from rpw import db
+>>> queue = db.WriteQueue()
+>>> for wall in walls:
+>>>     queue.set(wall, 'Mark', wall.Id.Value)
+>>>     queue[wall, 'Comments'] = 'Renumbered'
+>>> queue.flush(dry_run=True)['changed']
+12500
+>>> queue.flush('Renumber Walls')
+
+Used as a context, the queue is flushed when the context exits without
+an exception:
+
+>>> with db.WriteQueue('Renumber Walls') as queue:
+>>>     queue[wall, 'Mark'] = 'W-01'
+
+"""  #
+
+import time
+
+from rpw import revit, DB
+from rpw.db.parameter import Parameter
+from rpw.db.index import id_key
+from rpw.db.transaction import Transaction
+from rpw.exceptions import RpwParameterNotFound
+from rpw.utils.coerce import to_element_id
+from rpw.utils.logger import logger
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+class WriteQueue(object):
+    """
+    Deferred parameter writes.
+
+    Elements can be ``DB.Element``, wrapped elements, ``DB.ElementId`` or
+    ``int``. Parameters can be a parameter name, looked up with
+    ``LookupParameter``, or a ``DB.BuiltInParameter``.
+
+    Attributes:
+        recorded (int): Writes recorded since the last flush, before
+            duplicates are collapsed. ``len(queue)`` is the number of
+            distinct ``(element, parameter)`` slots.
+    """
+
+    def __init__(self, name=None, doc=None):
+        """
+        Args:
+            name (str): Transaction name used by :func:`flush`.
+            doc (DB.Document): Default: ``revit.doc``
+        """
+        self.name = name or 'RPW Write Queue'
+        self.doc = doc or revit.doc
+        self.recorded = 0
+        # {element key: (DB.ElementId, {parameter: value}, {parameter: recorded})}
+        self._writes = {}
+
+    def set(self, element, parameter, value):
+        """ Records a write. Replaces a previous write to the same slot. """
+        element_id = to_element_id(element)
+        key = id_key(element_id)
+        element_writes = self._writes.get(key)
+        if element_writes is None:
+            element_writes = self._writes[key] = (element_id, {}, {})
+        element_writes[1][parameter] = value
+        element_writes[2][parameter] = element_writes[2].get(parameter, 0) + 1
+        self.recorded += 1
+
+    def __setitem__(self, element_parameter, value):
+        """ ``queue[element, 'Mark'] = value`` is the same as ``queue.set()`` """
+        element, parameter = element_parameter
+        self.set(element, parameter, value)
+
+    def __getitem__(self, element_parameter):
+        """ Value queued for ``(element, parameter)`` """
+        element, parameter = element_parameter
+        element_writes = self._writes.get(id_key(to_element_id(element)))
+        if element_writes is None or parameter not in element_writes[1]:
+            raise KeyError(element_parameter)
+        return element_writes[1][parameter]
+
+    def discard(self, element, parameter=None):
+        """ Drops queued writes of ``element``, or only of one of its parameters """
+        key = id_key(to_element_id(element))
+        element_writes = self._writes.get(key)
+        if element_writes is None:
+            return
+        if parameter is None:
+            del self._writes[key]
+            self.recorded -= sum(element_writes[2].values())
+        elif parameter in element_writes[1]:
+            del element_writes[1][parameter]
+            self.recorded -= element_writes[2].pop(parameter)
+            if not element_writes[1]:
+                del self._writes[key]
+
+    def clear(self):
+        """ Drops all queued writes """
+        self._writes.clear()
+        self.recorded = 0
+
+    def __len__(self):
+        return sum(len(element_writes[1]) for element_writes in self._writes.values())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception, exception_msg, tb):
+        if exception:
+            self.clear()
+        else:
+            self.flush()
+
+    def _lookup_parameter(self, element, parameter):
+        if isinstance(parameter, str):
+            return element.LookupParameter(parameter)
+        return element.get_Parameter(parameter)
+
+    def _apply(self, dry_run):
+        """ Applies (or compares) all queued writes, sorted by element """
+        get_element = self.doc.GetElement
+        report = {'elements': 0, 'changed': 0, 'unchanged': 0,
+                  'missing': 0, 'read_only': 0}
+        changes = []
+        for key in sorted(self._writes):
+            element_id, element_writes, _ = self._writes[key]
+            element = get_element(element_id)
+            report['elements'] += 1
+            for parameter_key, value in element_writes.items():
+                revit_parameter = None
+                if element is not None:
+                    revit_parameter = self._lookup_parameter(element, parameter_key)
+                if not revit_parameter:
+                    if not dry_run:
+                        raise RpwParameterNotFound(element or element_id, parameter_key)
+                    report['missing'] += 1
+                    changes.append({'element_id': key, 'parameter': parameter_key,
+                                    'old': None, 'new': value, 'error': 'not found'})
+                    continue
+
+                parameter = Parameter(revit_parameter)
+                new_value = parameter.cast_value(value)
+                old_value = parameter.value
+                if isinstance(new_value, DB.ElementId):
+                    unchanged = id_key(new_value) == id_key(old_value)
+                elif new_value == '':
+                    # Empty string parameters read back as None
+                    unchanged = not old_value
+                else:
+                    unchanged = new_value == old_value
+                if unchanged:
+                    report['unchanged'] += 1
+                    continue
+
+                if revit_parameter.IsReadOnly:
+                    if not dry_run:
+                        # Raises RpwException
+                        parameter.value = new_value
+                    report['read_only'] += 1
+                    changes.append({'element_id': key, 'parameter': parameter_key,
+                                    'old': old_value, 'new': new_value, 'error': 'read only'})
+                    continue
+
+                report['changed'] += 1
+                if dry_run:
+                    changes.append({'element_id': key, 'parameter': parameter_key,
+                                    'old': old_value, 'new': new_value})
+                else:
+                    revit_parameter.Set(new_value)
+        if dry_run:
+            report['changes'] = changes
+        return report
+
+    def flush(self, name=None, dry_run=False):
+        """
+        Applies queued writes in a single transaction, or in the transaction
+        already open on the document, and clears the queue.
+
+        With ``dry_run=True`` nothing is written and the queue is kept:
+        the report lists every write that would change the model under
+        ``changes`` as ``{'element_id', 'parameter', 'old', 'new'}``, plus
+        writes that would fail, with an ``error`` key.
+
+        Returns:
+            (``dict``): ``recorded``, ``slots``, ``elements``, ``changed``,
+            ``unchanged``, ``missing``, ``read_only`` counts and ``seconds``
+
+        Raises:
+            :class:`RpwParameterNotFound`: An element or parameter does
+                not exist
+        """
+        start = _clock()
+        recorded, slots = self.recorded, len(self)
+        if dry_run:
+            report = self._apply(dry_run=True)
+        else:
+            with Transaction(name or self.name, doc=self.doc):
+                report = self._apply(dry_run=False)
+            self.clear()
+        report['recorded'] = recorded
+        report['slots'] = slots
+        report['seconds'] = _clock() - start
+        logger.debug('WriteQueue %s: %s of %s writes changed in %.3fs',
+                     'dry run' if dry_run else 'flush', report['changed'], recorded,
+                     report['seconds'])
+        return report
+
+    def __repr__(self):
+        return '<rpw:{} | recorded:{} slots:{}>'.format(
+            self.__class__.__name__, self.recorded, len(self))
@@ -1,7 +1,20 @@
-""" Additional Classes that do not wrap API Objects """
+""" Additional Classes that do not wrap API Objects
+
+``rpw.extras.rhino`` adds the Rhino3dmIO reference, so it is only imported
+when accessed.
+"""
 
 import sys
 import os
+import importlib
 
 binary_path = os.path.join(os.path.dirname(__file__), 'bin')
 sys.path.append(binary_path)
+
+_LAZY_SUBMODULES = ('rhino',)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('rpw.extras.{}'.format(name))
+    raise AttributeError("module 'rpw.extras' has no attribute '{}'".format(name))
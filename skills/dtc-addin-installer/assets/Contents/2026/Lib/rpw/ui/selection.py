@@ -2,6 +2,7 @@
 `uidoc.Selection` Wrapper
 """
 import sys
+from contextlib import contextmanager
 
 import rpw
 from rpw import revit, DB, UI
@@ -15,14 +16,14 @@ from rpw.db.reference import Reference
 from rpw.db.xyz import XYZ
 from rpw.db.element import Element
 
-if revit.host and revit.doc:
-    ObjectType = UI.Selection.ObjectType
-    ObjectSnapTypes = UI.Selection.ObjectSnapTypes
-    PickObjects = revit.uidoc.Selection.PickObjects
-    PickObject = revit.uidoc.Selection.PickObject
-    PickElementsByRectangle = revit.uidoc.Selection.PickElementsByRectangle
-    PickBox = revit.uidoc.Selection.PickBox
-    PickPoint = revit.uidoc.Selection.PickPoint
+ObjectType = UI.Selection.ObjectType
+ObjectSnapTypes = UI.Selection.ObjectSnapTypes
+
+
+def _ui_selection():
+    """ ``uidoc.Selection`` of the active document, looked up when picking
+    so importing this module does not require a Revit host """
+    return revit.uidoc.Selection
 
 
 class Selection(BaseObjectWrapper, ElementSet):
@@ -38,13 +39,19 @@ class Selection(BaseObjectWrapper, ElementSet):
     >>> len(selection)
     2
 
+    Changes made in a :func:`batch` context are pushed to the UI once:
+
+    >>> with selection.batch():
+    >>>     for element in elements:
+    >>>         selection.add(element)
+
     Wrapped Element:
         _revit_object = `Revit.UI.Selection`
     """
 
     _revit_object_class = UI.Selection.Selection
 
-    def __init__(self, elements_or_ids=None, uidoc=revit.uidoc):
+    def __init__(self, elements_or_ids=None, uidoc=None):
         """
         Initializes Selection. Elements or ElementIds are optional.
         If no elements are provided on intiialization,
@@ -58,9 +65,11 @@ class Selection(BaseObjectWrapper, ElementSet):
         >>> selection = Selection([Element, Element, Element, ...])
 
         """
-
+        uidoc = uidoc or revit.uidoc
         BaseObjectWrapper.__init__(self, uidoc.Selection)
         self.uidoc = uidoc
+        self._batch_depth = 0
+        self._batch_changed = False
 
         if not elements_or_ids:
             # Is List of elements is not provided, uses uidoc selection
@@ -85,9 +94,35 @@ class Selection(BaseObjectWrapper, ElementSet):
             self.update()
 
     def update(self):
-        """ Forces UI selection to match the Selection() object """
+        """ Forces UI selection to match the Selection() object.
+        In a :func:`batch` context, the update is deferred to its exit. """
+        if self._batch_depth:
+            self._batch_changed = True
+            return
         self._revit_object.SetElementIds(self.get_element_ids(as_list=True))
 
+    @contextmanager
+    def batch(self):
+        """
+        Suspends UI updates of :func:`add` and :func:`clear`, and selects
+        the result with a single ``SetElementIds`` call on exit, if anything
+        changed. Batches can be nested: the outermost one updates the UI.
+
+        >>> selection = ui.Selection()
+        >>> with selection.batch():
+        >>>     selection.clear()
+        >>>     for wall in walls:
+        >>>         selection.add(wall)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                self._batch_changed = False
+                self.update()
+
     def clear(self):
         """ Clears Selection
 
@@ -106,11 +141,11 @@ class Selection(BaseObjectWrapper, ElementSet):
         based on index.
         """
         # https://github.com/gtalarico/revitpythonwrapper/issues/32
-        for n, element in enumerate(self.__iter__()):
-            if n ==index:
-                return element
-        else:
+        try:
+            element_id = self._element_id_set[index]
+        except IndexError:
             raise IndexError('Index is out of range')
+        return Element.from_id(element_id, doc=self.doc)
 
     def __bool__(self):
         """
@@ -122,7 +157,7 @@ class Selection(BaseObjectWrapper, ElementSet):
         >>> Selection() is True
         True
         """
-        return super(Selection, obj).__bool__()
+        return super(Selection, self).__bool__()
 
     def __repr__(self):
         return super(Selection, self).__repr__(data={'count': len(self)})
@@ -146,9 +181,9 @@ class Pick(BaseObject):
 
         try:
             if multiple:
-                references = PickObjects(obj_type, msg)
+                references = _ui_selection().PickObjects(obj_type, msg)
             else:
-                reference = PickObject(obj_type, msg)
+                reference = _ui_selection().PickObject(obj_type, msg)
         except RevitExceptions.OperationCanceledException:
             logger.debug('ui.Pick aborted by user')
             sys.exit(0)
@@ -172,7 +207,7 @@ class Pick(BaseObject):
                       'directional': UI.Selection.PickBoxStyle.Directional,
                       }
 
-        pick_box = PickBox(PICK_STYLE[style])
+        pick_box = _ui_selection().PickBox(PICK_STYLE[style])
         return (XYZ(pick_box.Min), XYZ(pick_box.Max))
 
     @classmethod
@@ -185,7 +220,7 @@ class Pick(BaseObject):
         """
         # TODO: Implement ISelectFilter overload
         # NOTE: This is the only method that returns elements
-        refs = PickElementsByRectangle(msg)
+        refs = _ui_selection().PickElementsByRectangle(msg)
         return [Element(ref) for ref in refs]
 
     @classmethod
@@ -289,9 +324,9 @@ class Pick(BaseObject):
                  }
 
         if snap:
-            return XYZ(PickPoint(SNAPS[snap], msg))
+            return XYZ(_ui_selection().PickPoint(SNAPS[snap], msg))
         else:
-            return XYZ(PickPoint(msg))
+            return XYZ(_ui_selection().PickPoint(msg))
 
 
 class SelectionFilter(UI.Selection.ISelectionFilter):
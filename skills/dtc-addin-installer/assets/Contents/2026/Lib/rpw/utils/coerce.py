@@ -60,8 +60,9 @@ def to_element_ids(element_references):
     return [to_element_id(e_ref) for e_ref in element_references]
 
 # TODO: Add case to unwrap rpw elements
-def to_element(element_reference, doc=revit.doc):
+def to_element(element_reference, doc=None):
     """ Same as to_elements but for a single object """
+    doc = doc or revit.doc
     if isinstance(element_reference, DB.Element):
         element = element_reference
     elif isinstance(element_reference, DB.ElementId):
@@ -77,7 +78,7 @@ def to_element(element_reference, doc=revit.doc):
     return element
 
 
-def to_elements(element_references, doc=revit.doc):
+def to_elements(element_references, doc=None):
     """
     Coerces element reference (``int``, or ``ElementId``) into ``DB.Element``.
     Remains unchanged if it's already ``DB.Element``.
@@ -99,7 +100,11 @@ def to_elements(element_references, doc=revit.doc):
         [``DB.Element``]: Elements
     """
     element_references = to_iterable(element_references)
-    return [to_element(e_ref) for e_ref in element_references]
+    return [to_element(e_ref, doc=doc) for e_ref in element_references]
+
+
+# {class name: DB class}
+_CLASSES = {}
 
 
 def to_class(class_reference):
@@ -118,7 +123,10 @@ def to_class(class_reference):
         [``type``]: Class
     """
     if isinstance(class_reference, str):
-        return getattr(DB, class_reference)
+        class_ = _CLASSES.get(class_reference)
+        if class_ is None:
+            class_ = _CLASSES[class_reference] = getattr(DB, class_reference)
+        return class_
     if isinstance(class_reference, type):
         return class_reference
     raise RpwTypeError('Class Type, Class Type Name', type(class_reference))
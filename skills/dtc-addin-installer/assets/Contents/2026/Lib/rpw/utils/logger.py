@@ -7,9 +7,21 @@ Usage:
     >>> logger.info('My logger message')
     >>> logger.error('My error message')
 
+Arguments are formatted with ``%`` only if the message is logged, so
+debug messages cost a method call when debug logging is off:
+
+    >>> logger.debug('Applying Filter: %s:%s', filter_class, filter_value)
+
 """
 
 import sys
+import copy
+import json
+import atexit
+
+# logging levels, also available when logging is not
+DEBUG = 10
+INFO = 20
 
 
 class mockLoggerWrapper():
@@ -52,6 +64,23 @@ class LoggerWrapper():
     >>> print(logger.errors)
     ['Message']
 
+    Deferred arguments: the message is only formatted with ``msg % args``
+    if the level is enabled. Use ``isEnabledFor`` to skip building
+    expensive arguments.
+
+    >>> logger.debug('Rule: %s', rule)
+    >>> from rpw.utils.logger import logger, DEBUG
+    >>> if logger.isEnabledFor(DEBUG):
+    >>>     logger.debug('Members: %s', dir(rule))
+
+    Structured logging: one JSON object per record, written by a
+    background thread (buffered where threads are not available).
+
+    >>> logger.structured(open('rpw.log', 'a'))
+    >>> logger.info('Exported %s rows', 500, extra={'data': {'rows': 500}})
+    {"time": 1700000000.0, "level": "INFO", "message": "Exported 500 rows", ..., "data": {"rows": 500}}
+    >>> logger.structured(False)
+
     """
 
     def __init__(self):
@@ -76,6 +105,8 @@ class LoggerWrapper():
 
         self._logger = logger
         self._logger_title = logger_title
+        self._handler = handler
+        self._listener = None
         self.errors = []
 
     def disable(self):
@@ -104,30 +135,136 @@ class LoggerWrapper():
         self._logger_title.info(msg)
         print('=' * 100)
 
-    def info(self, msg):
+    def isEnabledFor(self, level):
+        """ Returns ``True`` if messages of ``level`` are logged """
+        return self._logger.isEnabledFor(level)
+
+    def info(self, msg, *args, **kwargs):
         """ Log Message on logging.INFO level """
-        self._logger.info(msg)
+        if self._logger.isEnabledFor(INFO):
+            self._logger.info(msg, *args, **kwargs)
 
-    def debug(self, msg):
+    def debug(self, msg, *args, **kwargs):
         """ Log Message on logging.DEBUG level """
-        self._logger.debug(msg)
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(msg, *args, **kwargs)
 
-    def warning(self, msg):
+    def warning(self, msg, *args, **kwargs):
         """ Log Message on logging.WARNING level """
-        self._logger.warning(msg)
+        self._logger.warning(msg, *args, **kwargs)
 
-    def error(self, msg):
+    def error(self, msg, *args, **kwargs):
         """ Log Message on logging.ERROR level """
-        self._logger.error(msg)
-        self.errors.append(msg)
+        self._logger.error(msg, *args, **kwargs)
+        self.errors.append(msg % args if args else msg)
 
-    def critical(self, msg):
+    def critical(self, msg, *args, **kwargs):
         """ Log Message on logging.CRITICAL level """
-        self._logger.critical(msg)
+        self._logger.critical(msg, *args, **kwargs)
 
     def setLevel(self, level):
         self._logger.setLevel(level)
 
+    def structured(self, stream=None, capacity=1000):
+        """
+        Switches output to JSON lines, or back to plain text.
+
+        Records are queued and written by a background thread. Where
+        ``logging.handlers.QueueListener`` is not available, they are
+        buffered and written every ``capacity`` records, on errors, and on
+        :func:`flush`.
+
+        Args:
+            stream (file): Output stream. Default: ``sys.stdout``.
+                ``False`` switches back to plain text.
+            capacity (int): Records buffered before writing, if there is
+                no background thread.
+        """
+        self._stop_structured()
+        self._logger.removeHandler(self._handler)
+        if stream is False:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+            self._handler = handler
+            self._logger.addHandler(handler)
+            return
+
+        target = logging.StreamHandler(stream or sys.stdout)
+        target.setFormatter(JsonFormatter())
+        try:
+            from logging.handlers import QueueHandler, QueueListener
+            try:
+                import queue
+            except ImportError:
+                import Queue as queue
+        except ImportError:
+            from logging.handlers import MemoryHandler
+            handler = MemoryHandler(capacity, logging.ERROR, target)
+        else:
+            records = queue.Queue(-1)
+            handler = QueueHandler(records)
+            # The default prepare() drops exc_info before JsonFormatter runs
+            handler.prepare = _prepare_record
+            self._listener = QueueListener(records, target)
+            self._listener.start()
+        self._handler = handler
+        self._logger.addHandler(handler)
+
+    def flush(self):
+        """ Writes queued or buffered records """
+        if self._listener is not None:
+            # Stopping waits for the queue to drain
+            self._listener.stop()
+            self._listener.start()
+        else:
+            self._handler.flush()
+
+    def _stop_structured(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        elif getattr(self._handler, 'buffer', None):
+            self._handler.flush()
+
+
+def _prepare_record(record):
+    """ Copy of ``record`` to queue: message and exception formatted as text,
+    since arguments can change and tracebacks keep frames alive """
+    record = copy.copy(record)
+    record.msg = record.getMessage()
+    record.args = None
+    if record.exc_info:
+        record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+    return record
+
+
+class JsonFormatter(object):
+    """
+    Formats log records as one JSON object per line, with ``time``,
+    ``level``, ``logger``, ``message``, ``module`` and ``line``.
+    Values passed as ``extra={'data': ...}`` are added under ``data``.
+    """
+
+    def format(self, record):
+        entry = {
+            'time': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'line': record.lineno,
+            }
+        data = getattr(record, 'data', None)
+        if data is not None:
+            entry['data'] = data
+        if record.exc_info:
+            entry['exception'] = logging.Formatter().formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=repr)
+
+
 def deprecate_warning(depracated, replaced_by=None):
     msg = '{} has been deprecated and will be removed soon.'.format(depracated)
     if replaced_by:
@@ -142,3 +279,4 @@ except ImportError:
 else:
     # In PyRevit, Use Logger
     logger = LoggerWrapper()
+    atexit.register(logger._stop_structured)
@@ -3,6 +3,7 @@
 import rpw
 # from rpw import revit, db, DB # Fixes Circular Import
 from rpw.exceptions import RpwCoerceError
+from rpw.db.index import NameIndex
 from rpw.utils.logger import deprecate_warning
 
 
@@ -18,13 +19,13 @@ class ByNameCollectMixin():
         return self._revit_object.Name
 
     @classmethod
-    def by_name(cls, name):
+    def by_name(cls, name, doc=None):
         """
         Mixin to provide instantiating by a name for classes that are
         collectible. This is a mixin so specifi usage will vary for each for.
-        This method will call the :any:`rpw.db.Element.collect`
-        method of the class, and return the first element with a
-        matching ``.name`` property.
+        Returns the first element of the class collector (``of_class``
+        of :any:`rpw.db.Element.collect`) with a matching name, ignoring
+        case. Names are resolved with :any:`NameIndex`, cached per document.
 
         >>> LinePatternElement.by_name('Dash')
         <rpw:LinePatternElement name:Dash>
@@ -33,9 +34,11 @@ class ByNameCollectMixin():
         <rpw:FillPatternElement name:Solid>
 
         """
-        e = cls.collect(where=lambda e: e.name.lower() == name.lower()).get_first()
-        if e:
-            return e
+        doc = doc or rpw.revit.doc
+        revit_class = cls._collector_params['of_class']
+        element_id = NameIndex.get(doc).get_id(revit_class, name, case_sensitive=False)
+        if element_id is not None:
+            return rpw.db.Element(doc.GetElement(element_id))
         raise RpwCoerceError('by_name({})'.format(name), cls)
 
     @classmethod
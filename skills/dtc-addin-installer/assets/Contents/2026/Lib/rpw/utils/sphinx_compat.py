@@ -1,5 +1,4 @@
 import sys
-import imp
 
 from rpw.utils.logger import logger
 
@@ -28,7 +27,10 @@ class MockObject(object):
         self.fullname = kwargs.get('fullname', '<Unamed Import>')
 
     def __getattr__(self, attr):
-        logger.debug("Getting Atts:{} from {}')".format(attr, self.fullname))
+        if attr.startswith('__') and attr.endswith('__'):
+            # Let the import machinery and copy/pickle probes fail normally
+            raise AttributeError(attr)
+        logger.debug("Getting Atts:%s from %s')", attr, self.fullname)
         path_and_attr = '.'.join([self.fullname, attr])
         # print(path_and_attr)
         if path_and_attr in MockObject.MOCK_OVERRIDE:
@@ -39,7 +41,7 @@ class MockObject(object):
         yield iter(self)
 
     def AddReference(self, namespace):
-        logger.debug("Mock.clr.AddReference('{}')".format(namespace))
+        logger.debug("Mock.clr.AddReference('%s')", namespace)
 
     def __call__(self, *args, **kwargs):
         return MockObject(*args, **kwargs)
@@ -66,12 +68,28 @@ class MockImporter(object):
                       ]
 
     def find_module(self, fullname, path=None):
-        logger.debug('Loading : {}'.format(fullname))
+        logger.debug('Loading : %s', fullname)
         for module in self.dotnet_modules:
             if fullname.startswith(module):
                 return self
         return None
 
+    # PEP 451 Finder/Loader protocol. find_module/load_module were removed
+    # from the import system in Python 3.12 (bundled CPython 3.13 runtime)
+
+    def find_spec(self, fullname, path=None, target=None):
+        if self.find_module(fullname, path) is None:
+            return None
+        from importlib.machinery import ModuleSpec
+        return ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        logger.debug('Importing Mock Module: %s', spec.name)
+        return MockObject(fullname=spec.name)
+
+    def exec_module(self, module):
+        pass
+
     def load_module(self, fullname):
         """This method is called by Python if CustomImporter.find_module
            does not return None. fullname is the fully-qualified name
@@ -79,7 +97,7 @@ class MockImporter(object):
         if fullname in sys.modules:
             return sys.modules[fullname]
         else:
-            logger.debug('Importing Mock Module: {}'.format(fullname))
+            logger.debug('Importing Mock Module: %s', fullname)
             # mod = imp.new_module(fullname)
             # import pdb; pdb.set_trace()
             mod = MockObject(fullname=fullname)
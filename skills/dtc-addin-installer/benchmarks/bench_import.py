@@ -0,0 +1,115 @@
+"""Measure rpw import cost with ``python -X importtime``.
+
+Each scenario runs in a fresh interpreter against the mock ``DB`` namespace
+(no ``clr``), so it works on Linux and on the bundled CPython 3.13 runtime:
+
+    python bench_import.py
+    python bench_import.py --python ..\\assets\\Contents\\2026\\Python\\python.exe
+    python bench_import.py --json
+
+``full`` loads every wrapper, selection and extras module, which is what
+``import rpw`` used to do before the subpackages became lazy (the WPF forms
+are left out: they only compile under IronPython).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_LIB = SKILL_DIR / "assets" / "Contents" / "2026" / "Lib"
+
+SCENARIOS = {
+    "baseline": "pass",
+    "import rpw": "import rpw",
+    "from rpw import revit, DB": "from rpw import revit, DB",
+    "from rpw.db import Collector": "from rpw.db import Collector",
+    "full": (
+        "import rpw; rpw.db.get_wrapper_classes(); "
+        "import rpw.ui.selection; rpw.extras.__name__"
+    ),
+}
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """Return total top-level import time (us) and rpw module stats."""
+    total_us = 0
+    rpw_self_us = 0
+    rpw_modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name.rstrip()[1:]
+        if not module.startswith(" "):
+            # Top-level entry: cumulative already includes its children
+            total_us += int(cumulative_us)
+        if module.strip().split(".")[0] == "rpw":
+            rpw_self_us += int(self_us)
+            rpw_modules += 1
+    return {"total_us": total_us, "rpw_self_us": rpw_self_us, "rpw_modules": rpw_modules}
+
+
+def run_scenario(python: str, lib: Path, statement: str) -> Dict[str, float]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(lib)
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr}")
+    return parse_importtime(proc.stderr)
+
+
+def benchmark(python: str, lib: Path, repeat: int) -> List[Dict[str, object]]:
+    results = []
+    for name, statement in SCENARIOS.items():
+        runs = [run_scenario(python, lib, statement) for _ in range(repeat)]
+        results.append({
+            "scenario": name,
+            "statement": statement,
+            "median_total_ms": statistics.median(r["total_us"] for r in runs) / 1000.0,
+            "median_rpw_self_ms": statistics.median(r["rpw_self_us"] for r in runs) / 1000.0,
+            "rpw_modules": runs[0]["rpw_modules"],
+        })
+
+    baseline = results[0]["median_total_ms"]
+    full = results[-1]["median_total_ms"] - baseline
+    for result in results:
+        result["import_ms"] = result["median_total_ms"] - baseline
+        result["saved_vs_full_ms"] = full - result["import_ms"]
+    return results[1:]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to measure")
+    parser.add_argument("--lib", type=Path, default=DEFAULT_LIB, help="Folder containing rpw")
+    parser.add_argument("--repeat", type=int, default=7, help="Runs per scenario (median is reported)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = benchmark(args.python, args.lib, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'scenario':<32}{'import ms':>11}{'rpw self ms':>13}{'modules':>9}{'saved ms':>10}")
+    for r in results:
+        print(f"{r['scenario']:<32}{r['import_ms']:>11.2f}{r['median_rpw_self_ms']:>13.2f}"
+              f"{r['rpw_modules']:>9}{r['saved_vs_full_ms']:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""pytest-benchmark suite for rpw hot paths, run against ``tools/fake_revit``.
+
+    pip install pytest pytest-benchmark
+
+    # Record a baseline (JSON, under benchmarks/.benchmarks/<machine>/)
+    python -m pytest skills/dtc-addin-installer/benchmarks --benchmark-autosave
+
+    # Compare with the latest baseline, fail if any median is 10% slower
+    python -m pytest skills/dtc-addin-installer/benchmarks --rpw-max-regression=10
+
+    # Quick run on the small model only
+    python -m pytest skills/dtc-addin-installer/benchmarks --rpw-sizes=10000
+
+``--rpw-max-regression`` is a shortcut for ``--benchmark-compare
+--benchmark-compare-fail=median:<N>%``; any pytest-benchmark expression
+(``mean:5%``, ``min:0.001``) can be passed instead of a number. Saved runs
+can also be compared offline with ``pytest-benchmark compare``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent
+SKILL_DIR = BENCH_DIR.parent
+TOOLS_DIR = SKILL_DIR / "tools"
+DEFAULT_LIB = SKILL_DIR / "assets" / "Contents" / "2026" / "Lib"
+DEFAULT_SIZES = "10000,100000,1000000"
+# Seed of every generated model, so element ids match between runs
+SEED = 7
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("rpw", "rpw benchmarks")
+    group.addoption("--rpw-lib", default=os.environ.get("RPW_BENCH_LIB", str(DEFAULT_LIB)),
+                    help="Folder containing the rpw package to benchmark (default: Contents/2026/Lib)")
+    group.addoption("--rpw-sizes", default=os.environ.get("RPW_BENCH_SIZES", DEFAULT_SIZES),
+                    help="Comma separated model sizes (elements) for the scaling benchmarks")
+    group.addoption("--rpw-max-regression", default=os.environ.get("RPW_BENCH_MAX_REGRESSION"),
+                    metavar="PCT|EXPR",
+                    help="Compare against the latest saved run and fail on regressions larger "
+                         "than PCT percent of the median (or a pytest-benchmark EXPR)")
+
+
+def pytest_configure(config):
+    # Must run before the test modules import rpw
+    lib = Path(config.getoption("rpw_lib"))
+    for path in (TOOLS_DIR, lib):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    import fake_revit
+    # The fake emulates the release of the bundle: Contents/<release>/Lib
+    release = lib.resolve().parent.name
+    fake_revit.install(int(release) if release.isdigit() else 2026)
+
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = "file://{}".format(BENCH_DIR / ".benchmarks")
+
+    max_regression = config.getoption("rpw_max_regression")
+    if max_regression:
+        import argparse
+        from pytest_benchmark.utils import parse_compare_fail
+
+        expression = max_regression if ":" in max_regression else "median:{}%".format(max_regression)
+        try:
+            check = parse_compare_fail(expression)
+        except argparse.ArgumentTypeError as error:
+            raise pytest.UsageError("--rpw-max-regression: {}".format(error))
+        config.option.benchmark_compare = config.option.benchmark_compare or True
+        config.option.benchmark_compare_fail = (config.option.benchmark_compare_fail or []) + [check]
+
+
+def _sizes(config):
+    return [int(size) for size in config.getoption("rpw_sizes").split(",") if size.strip()]
+
+
+def pytest_generate_tests(metafunc):
+    # Session scoped, so each model is built once and freed before the next size
+    if "model" in metafunc.fixturenames:
+        sizes = _sizes(metafunc.config)
+        metafunc.parametrize("model_size", sizes, scope="session",
+                             ids=["{}k".format(size // 1000) for size in sizes])
+
+
+def build(size, **kwargs):
+    """Fake document with ``size`` elements, half walls and half family instances."""
+    from fake_revit.model import build_model
+
+    kwargs.setdefault("levels", 10)
+    kwargs.setdefault("views", 50)
+    return build_model(walls=size // 2, instances=size - size // 2, seed=SEED, **kwargs)
+
+
+def activate(doc):
+    import fake_revit
+
+    return fake_revit.activate(doc)
+
+
+@pytest.fixture(scope="session")
+def _sized_model(model_size):
+    return build(model_size)
+
+
+@pytest.fixture
+def model(_sized_model):
+    """Model of each ``--rpw-sizes`` size, made active."""
+    return activate(_sized_model)
+
+
+@pytest.fixture(scope="session")
+def _small_model(request):
+    return build(_sizes(request.config)[0])
+
+
+@pytest.fixture
+def doc(_small_model):
+    """The smallest model, made active, for benchmarks of per-element operations."""
+    return activate(_small_model)
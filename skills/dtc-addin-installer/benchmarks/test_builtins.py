@@ -0,0 +1,32 @@
+"""BuiltIn enumeration lookups."""
+
+import pytest
+
+from rpw import db
+
+NAMES = ["Walls", "walls", "OST_Rooms", "furniture", "Generic Model", "Structural Framing",
+         "ost_levels", "Views"]
+
+
+def test_fuzzy_get(benchmark):
+    categories = benchmark(lambda: [db.BicEnum.fuzzy_get(name) for name in NAMES])
+    assert categories[0] == categories[1]
+
+
+def test_fuzzy_get_miss(benchmark):
+    def miss():
+        try:
+            db.BicEnum.fuzzy_get("NotACategory")
+        except Exception:
+            return True
+
+    assert benchmark(miss)
+
+
+@pytest.mark.parametrize("name", ["OST_Walls", "OST_ProjectInformation"])
+def test_category_get_id(benchmark, name):
+    assert benchmark(db.BicEnum.get_id, name)
+
+
+def test_parameter_get_id(benchmark):
+    assert benchmark(db.BipEnum.get_id, "WALL_LOCATION_LINE")
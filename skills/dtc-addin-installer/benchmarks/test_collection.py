@@ -0,0 +1,78 @@
+"""ElementSet benchmarks, on the smallest model."""
+
+import pytest
+
+from rpw import db
+
+
+@pytest.fixture
+def wall_ids(doc):
+    return db.Collector(of_class="Wall").get_element_ids()
+
+
+def test_element_set_add(benchmark, wall_ids):
+    element_set = benchmark(db.ElementSet, wall_ids)
+    assert len(element_set) == len(wall_ids)
+
+
+def test_element_set_contains(benchmark, wall_ids):
+    element_set = db.ElementSet(wall_ids)
+    probes = wall_ids[::max(len(wall_ids) // 500, 1)]
+    found = benchmark(lambda: sum(1 for element_id in probes if element_id in element_set))
+    assert found == len(probes)
+
+
+def test_element_set_getitem(benchmark, wall_ids):
+    element_set = db.ElementSet(wall_ids)
+    probes = wall_ids[::max(len(wall_ids) // 50, 1)]
+    found = benchmark(lambda: [element_set[element_id] for element_id in probes])
+    assert len(found) == len(probes)
+
+
+def test_element_set_pop_and_clear(benchmark, wall_ids):
+    def pop_half():
+        element_set = db.ElementSet(wall_ids)
+        for element_id in wall_ids[:len(wall_ids) // 2:max(len(wall_ids) // 200, 1)]:
+            element_set.pop(element_id, wrapped=False)
+        element_set.clear()
+        return element_set
+
+    assert not benchmark(pop_half)
+
+
+def test_element_set_elements(benchmark, wall_ids):
+    element_set = db.ElementSet(wall_ids)
+    elements = benchmark(element_set.get_elements, wrapped=False)
+    assert len(elements) == len(wall_ids)
+
+
+def test_selection_add_one_by_one(benchmark, wall_ids):
+    from rpw import ui
+    probes = wall_ids[:500]
+
+    def grow():
+        selection = ui.Selection(probes[:1])
+        for element_id in probes:
+            selection.add(element_id)
+
+    benchmark(grow)
+
+
+def test_selection_add_batched(benchmark, wall_ids):
+    from rpw import ui
+    probes = wall_ids[:500]
+
+    def grow():
+        selection = ui.Selection(probes[:1])
+        with selection.batch():
+            for element_id in probes:
+                selection.add(element_id)
+
+    benchmark(grow)
+
+
+def test_selection_index(benchmark, wall_ids):
+    from rpw import ui
+    selection = ui.Selection(wall_ids)
+    found = benchmark(lambda: [selection[n] for n in range(0, len(wall_ids), max(len(wall_ids) // 50, 1))])
+    assert found
@@ -0,0 +1,84 @@
+"""Collector benchmarks. Every benchmark here scales with ``--rpw-sizes``."""
+
+from rpw import DB, db
+
+
+def test_collect_by_class(benchmark, model):
+    elements = benchmark(lambda: db.Collector(of_class="Wall").get_elements(wrapped=False))
+    assert elements
+
+
+def test_collect_by_class_name_and_type(benchmark, model):
+    elements = benchmark(lambda: db.Collector(of_class=DB.FamilyInstance, is_not_type=True)
+                         .get_elements(wrapped=False))
+    assert elements
+
+
+def test_collect_by_category(benchmark, model):
+    elements = benchmark(lambda: db.Collector(of_category="OST_Walls", is_not_type=True)
+                         .get_elements(wrapped=False))
+    assert elements
+
+
+def test_collect_element_ids(benchmark, model):
+    ids = benchmark(lambda: db.Collector(of_category=DB.BuiltInCategory.OST_Furniture)
+                    .get_element_ids())
+    assert ids
+
+
+def test_collect_where(benchmark, model):
+    def collect():
+        return db.Collector(of_class="Wall",
+                            where=lambda wall: wall.parameters["Comments"].value is not None)
+
+    assert len(benchmark(collect))
+
+
+def test_collect_parameter_filter(benchmark, model):
+    parameter_filter = db.ParameterFilter("ALL_MODEL_MARK", begins="W-1")
+    elements = benchmark(lambda: db.Collector(of_class="Wall", parameter_filter=parameter_filter)
+                         .get_elements(wrapped=False))
+    assert elements
+
+
+def test_collect_level(benchmark, model):
+    level = db.Collector(of_class="Level").get_first(wrapped=False)
+    elements = benchmark(lambda: db.Collector(of_class="Wall", level=level)
+                         .get_elements(wrapped=False))
+    assert elements
+
+
+def test_collect_wrapped(benchmark, model):
+    elements = benchmark(lambda: db.Collector(of_class="Wall").get_elements(wrapped=True))
+    assert isinstance(elements[0], db.Wall)
+
+
+def test_collector_level_name_repeated(benchmark, doc):
+    """Building level-name collectors in a loop: one NameIndex lookup each."""
+    benchmark(lambda: [db.Collector(of_class="Wall", level="Level 3") for _ in range(100)])
+
+
+CATEGORIES = ["OST_Walls", "OST_Doors", "OST_Windows"]
+
+
+def test_collect_categories_separately(benchmark, model):
+    def collect():
+        return [element for category in CATEGORIES
+                for element in db.Collector(of_category=category, is_not_type=True)
+                .get_elements(wrapped=False)]
+
+    assert benchmark(collect)
+
+
+def test_collect_multicategory(benchmark, model):
+    elements = benchmark(lambda: db.Collector(of_category=CATEGORIES, is_not_type=True)
+                         .get_elements(wrapped=False))
+    assert elements
+
+
+def test_collect_or_collector(benchmark, model):
+    def collect():
+        doors = db.Collector(of_category="OST_Doors", is_not_type=True)
+        return db.Collector(of_class="Wall", or_collector=doors).get_elements(wrapped=False)
+
+    assert benchmark(collect)
@@ -0,0 +1,63 @@
+"""Wrapping and parameter access benchmarks, on the smallest model."""
+
+import pytest
+
+from rpw import db
+
+
+@pytest.fixture
+def walls(doc):
+    return db.Collector(of_class="Wall").get_elements(wrapped=False)
+
+
+@pytest.fixture
+def instances(doc):
+    return db.Collector(of_class="FamilyInstance").get_elements(wrapped=False)
+
+
+def test_wrap_elements(benchmark, walls):
+    wrapped = benchmark(lambda: [db.Element(wall) for wall in walls])
+    assert isinstance(wrapped[0], db.Wall)
+
+
+def test_wrap_from_ids(benchmark, instances):
+    ids = [instance.Id for instance in instances]
+    wrapped = benchmark(db.Element.from_list, ids)
+    assert isinstance(wrapped[0], db.FamilyInstance)
+
+
+def test_parameter_read_by_name(benchmark, walls):
+    wrapped = [db.Element(wall) for wall in walls]
+    values = benchmark(lambda: [wall.parameters["Mark"].value for wall in wrapped])
+    assert values[0]
+
+
+def test_parameter_read_builtin(benchmark, walls):
+    wrapped = [db.Element(wall) for wall in walls]
+    values = benchmark(lambda: [wall.parameters.builtins["CURVE_ELEM_LENGTH"].value
+                                for wall in wrapped])
+    assert values[0] > 0
+
+
+def test_parameter_read_value_string(benchmark, walls):
+    wrapped = [db.Element(wall) for wall in walls]
+    values = benchmark(lambda: [wall.parameters["Base Constraint"].value_string for wall in wrapped])
+    assert values[0].startswith("Level")
+
+
+def test_parameter_to_dict(benchmark, walls):
+    wrapped = [db.Element(wall) for wall in walls[:1000]]
+    rows = benchmark(lambda: [wall.parameters.to_dict() for wall in wrapped])
+    assert rows[0]
+
+
+def test_parameter_write(benchmark, walls):
+    wrapped = [db.Element(wall) for wall in walls]
+
+    def write():
+        with db.Transaction("Benchmark Write"):
+            for wall in wrapped:
+                wall.parameters["Comments"] = "Checked"
+
+    benchmark(write)
+    assert wrapped[0].parameters["Comments"].value == "Checked"
@@ -0,0 +1,36 @@
+"""Element export: wrapped parameter reads per element vs rpw.db.export chunked rows."""
+
+import io
+import json
+
+from rpw import db
+from rpw.db import export
+
+FIELDS = ["id", "Mark", "Comments", "Length"]
+
+
+def test_export_wrapped_parameters(benchmark, model):
+    def write():
+        stream = io.StringIO()
+        for element in db.Collector(of_class="Wall").get_elements(wrapped=True):
+            row = {"id": element.Id.Value}
+            for name in FIELDS[1:]:
+                row[name] = element.parameters.get_value(name)
+            stream.write(json.dumps(row) + "\n")
+        return stream
+
+    benchmark(write)
+
+
+def test_export_ndjson(benchmark, model):
+    def write():
+        return export.to_ndjson(db.Collector(of_class="Wall"), FIELDS, io.StringIO())
+
+    assert benchmark(write)["rows"]
+
+
+def test_export_csv(benchmark, model):
+    def write():
+        return export.to_csv(db.Collector(of_class="Wall"), FIELDS, io.StringIO())
+
+    assert benchmark(write)["rows"]
@@ -0,0 +1,33 @@
+"""Family, Category and WallKind lookups, which go through FamilyIndex."""
+
+import pytest
+
+from rpw import DB, db
+from rpw.db.index import invalidate_indexes
+
+
+@pytest.fixture
+def family(model):
+    return db.Collector(of_class="Family").get_first(wrapped=True)
+
+
+def test_family_instances_cold(benchmark, family):
+    def cold():
+        invalidate_indexes()
+        return family.get_instances(wrapped=False)
+
+    assert benchmark(cold)
+
+
+def test_family_instances_cached(benchmark, family):
+    assert benchmark(family.get_instances, wrapped=False)
+
+
+def test_category_families(benchmark, family):
+    category = family.get_category()
+    assert benchmark(category.get_families, wrapped=False)
+
+
+def test_wall_kind_instances(benchmark, model):
+    wall_kind = db.WallKind(DB.WallKind.Basic)
+    assert benchmark(wall_kind.get_instances, wrapped=False)
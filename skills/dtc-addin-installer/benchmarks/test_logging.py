@@ -0,0 +1,45 @@
+"""Debug logging in hot paths costs a method call when debug is off."""
+
+import pytest
+
+from rpw import db
+from rpw.utils.logger import logger
+
+CALLS = 10000
+
+
+class Expensive(object):
+    """Argument that is slow to format."""
+
+    def __str__(self):
+        return str(dir(self))
+
+
+def no_log(*args):
+    pass
+
+
+@pytest.fixture
+def quiet_logger():
+    logger.verbose(False)
+    yield logger
+
+
+def test_debug_baseline_call(benchmark):
+    value = Expensive()
+    benchmark(lambda: [no_log("Rule: %s", value) for _ in range(CALLS)])
+
+
+def test_debug_disabled_deferred(benchmark, quiet_logger):
+    value = Expensive()
+    benchmark(lambda: [logger.debug("Rule: %s", value) for _ in range(CALLS)])
+
+
+def test_debug_disabled_eager_format(benchmark, quiet_logger):
+    """What the hot paths did before: format, then drop the message."""
+    value = Expensive()
+    benchmark(lambda: [logger.debug("Rule: {}".format(value)) for _ in range(CALLS)])
+
+
+def test_collector_debug_disabled(benchmark, doc, quiet_logger):
+    benchmark(lambda: db.Collector(of_class="Wall", is_not_type=True, view=doc.ActiveView))
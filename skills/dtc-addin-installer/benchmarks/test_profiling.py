@@ -0,0 +1,28 @@
+"""Cost of rpw.utils.profiling: hot paths with the instrumentation off, on, and never loaded."""
+
+import pytest
+
+from rpw import db
+from rpw.utils import profiling
+
+
+@pytest.fixture
+def walls(doc):
+    return db.Collector(of_class="Wall").get_elements(wrapped=False)[:5000]
+
+
+def read_marks(walls):
+    return [db.Element(wall).parameters["Mark"].value for wall in walls]
+
+
+def test_hot_path_profiling_disabled(benchmark, walls):
+    profiling.enable()
+    profiling.disable()
+    benchmark(read_marks, walls)
+
+
+def test_hot_path_profiling_enabled(benchmark, walls):
+    with profiling.profile(reset=True):
+        benchmark(read_marks, walls)
+    operations = {row["operation"] for row in profiling.report(by_call_site=False)}
+    assert {"Element.__new__", "ParameterSet.__getitem__", "Parameter.value.get"} <= operations
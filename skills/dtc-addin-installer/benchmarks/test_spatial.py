@@ -0,0 +1,64 @@
+"""Proximity queries over 100k boxes: RTree build, box and nearest queries vs a linear scan."""
+
+import random
+
+import pytest
+
+from rpw import db
+from rpw.db.spatial import RTree
+
+BOXES = 100000
+
+
+@pytest.fixture(scope="module")
+def items():
+    rng = random.Random(7)
+    items = []
+    for n in range(BOXES):
+        x, y, z = rng.uniform(0, 5000), rng.uniform(0, 5000), rng.uniform(0, 100)
+        items.append(((x, y, z, x + rng.uniform(0.5, 20), y + rng.uniform(0.5, 20),
+                       z + rng.uniform(1, 10)), n))
+    return items
+
+
+@pytest.fixture(scope="module")
+def tree(items):
+    return RTree(items)
+
+
+def queries():
+    rng = random.Random(11)
+    return [(x, y, 0, x + 50, y + 50, 100)
+            for x, y in ((rng.uniform(0, 5000), rng.uniform(0, 5000)) for _ in range(100))]
+
+
+def test_rtree_build(benchmark, items):
+    tree = benchmark.pedantic(RTree, args=(items,), rounds=3)
+    assert len(tree) == BOXES
+
+
+def test_rtree_intersection(benchmark, tree):
+    boxes = queries()
+    benchmark(lambda: [tree.intersection(box) for box in boxes])
+
+
+def test_linear_scan_intersection(benchmark, items):
+    boxes = queries()
+
+    def scan():
+        return [[n for b, n in items
+                 if b[0] <= q[3] and b[3] >= q[0] and b[1] <= q[4] and b[4] >= q[1] and
+                 b[2] <= q[5] and b[5] >= q[2]] for q in boxes[:5]]
+    benchmark(scan)
+
+
+def test_rtree_nearest(benchmark, tree):
+    points = [box[:3] for box in queries()]
+    benchmark(lambda: [tree.nearest(point, count=10) for point in points])
+
+
+def test_spatial_index_build(benchmark, doc):
+    def build():
+        index = db.SpatialIndex(doc)
+        return len(index)
+    assert benchmark(build) > 0
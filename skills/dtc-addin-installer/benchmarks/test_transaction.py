@@ -0,0 +1,36 @@
+"""Many small ``Transaction.ensure`` writes, one transaction each vs coalesced by TransactionBatch."""
+
+import pytest
+
+from rpw import db
+
+
+@db.Transaction.ensure("Set Comments")
+def set_comments(element, value):
+    element.parameters["Comments"] = value
+
+
+@pytest.fixture
+def walls(doc):
+    return db.Collector(of_class="Wall").get_elements()[:2000]
+
+
+def test_ensure_one_transaction_each(benchmark, walls):
+    def write():
+        for wall in walls:
+            set_comments(wall, "x")
+
+    benchmark(write)
+
+
+@pytest.mark.parametrize("size", [100, 1000])
+def test_ensure_batched(benchmark, walls, size):
+    def write():
+        with db.TransactionBatch("Set Comments", size=size) as batch:
+            for wall in walls:
+                set_comments(wall, "x")
+        return batch.report
+
+    report = benchmark(write)
+    assert report["operations"] == len(walls)
+    assert report["commits"] == -(-len(walls) // size)
@@ -0,0 +1,73 @@
+"""View grouping lookups, which go through ViewIndex, on a model with 5,000 views."""
+
+import pytest
+
+from conftest import activate, build
+from rpw import DB, db
+from rpw.db.index import invalidate_indexes
+
+
+@pytest.fixture(scope="module")
+def _view_model():
+    return build(1000, views=5000)
+
+
+@pytest.fixture
+def view(_view_model):
+    activate(_view_model)
+    return db.Collector(of_class="ViewPlan").get_first(wrapped=True)
+
+
+def test_view_siblings_cold(benchmark, view):
+    def cold():
+        invalidate_indexes()
+        return view.siblings
+
+    assert benchmark(cold)
+
+
+def test_view_siblings_cached(benchmark, view):
+    assert benchmark(lambda: view.siblings)
+
+
+def test_view_type_views(benchmark, view):
+    view_type = db.ViewType(DB.ViewType.Section)
+    assert benchmark(lambda: view_type.views)
+
+
+def test_view_family_views(benchmark, view):
+    view_family = db.ViewFamily(DB.ViewFamily.FloorPlan)
+    assert benchmark(lambda: view_family.views)
+
+
+def test_view_family_type_views(benchmark, view):
+    view_family_type = view.view_family_type
+    assert benchmark(lambda: view_family_type.views)
+
+
+@pytest.fixture
+def color_overrides(doc):
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0)]
+    specs = [{"projection_line": {"color": color}, "halftone": False} for color in colors]
+    walls = db.Collector(of_class="Wall").get_elements(wrapped=False)
+    return {wall: specs[i % len(specs)] for i, wall in enumerate(walls)}
+
+
+def test_override_apply_many(benchmark, color_overrides):
+    view = db.Element(DB.FilteredElementCollector(next(iter(color_overrides)).Document)
+                      .OfClass(DB.ViewPlan).FirstElement())
+    report = benchmark(view.override.apply_many, color_overrides)
+    assert report["settings"] == 4
+
+
+def test_override_one_by_one(benchmark, color_overrides):
+    view = db.Element(DB.FilteredElementCollector(next(iter(color_overrides)).Document)
+                      .OfClass(DB.ViewPlan).FirstElement())
+
+    def one_by_one():
+        with db.Transaction("Overrides"):
+            for wall, spec in color_overrides.items():
+                view.override.projection_line(wall, **spec["projection_line"])
+                view.override.halftone(wall, spec["halftone"])
+
+    benchmark(one_by_one)
@@ -0,0 +1,45 @@
+"""Interleaved parameter writes, set one by one vs recorded in a WriteQueue and flushed once."""
+
+import pytest
+
+from rpw import db
+
+
+@pytest.fixture
+def walls(doc):
+    return db.Collector(of_class="Wall").get_elements()[:5000]
+
+
+def test_parameters_set_directly(benchmark, walls):
+    def write():
+        with db.Transaction("Renumber"):
+            for n, wall in enumerate(walls):
+                wall.parameters["Comments"] = "draft"
+                wall.parameters["Mark"] = str(n)
+                wall.parameters["Comments"] = "final"
+
+    benchmark(write)
+
+
+def test_write_queue_flush(benchmark, walls):
+    def write():
+        queue = db.WriteQueue("Renumber")
+        for n, wall in enumerate(walls):
+            queue[wall, "Comments"] = "draft"
+            queue[wall, "Mark"] = str(n)
+            queue[wall, "Comments"] = "final"
+        return queue.flush()
+
+    report = benchmark(write)
+    assert (report["recorded"], report["slots"]) == (3 * len(walls), 2 * len(walls))
+    assert walls[-1].parameters["Mark"].value == str(len(walls) - 1)
+    assert walls[-1].parameters["Comments"].value == "final"
+
+
+def test_write_queue_dry_run(benchmark, walls):
+    queue = db.WriteQueue()
+    for n, wall in enumerate(walls):
+        queue[wall, "Mark"] = "M-{}".format(n)
+    report = benchmark(queue.flush, dry_run=True)
+    assert report["slots"] == len(walls)
+    assert report["changed"] == len(report["changes"])
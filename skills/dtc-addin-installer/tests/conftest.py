@@ -0,0 +1,50 @@
+"""Tests of the bundled rpw, run against ``tools/fake_revit``.
+
+    python -m pytest skills/dtc-addin-installer/tests
+
+``--rpw-lib`` (or ``RPW_TEST_LIB``) selects the rpw copy under test;
+the default is the Revit 2026 bundle. The fake emulates the API of that
+release, so the 2026 run fails on ``ElementId.Value``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+TOOLS_DIR = SKILL_DIR / "tools"
+DEFAULT_LIB = SKILL_DIR / "assets" / "Contents" / "2026" / "Lib"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--rpw-lib", default=os.environ.get("RPW_TEST_LIB", str(DEFAULT_LIB)),
+                     help="Folder containing the rpw package to test (default: Contents/2026/Lib)")
+
+
+def pytest_configure(config):
+    # Must run before the test modules import rpw
+    lib = Path(config.getoption("rpw_lib"))
+    for path in (TOOLS_DIR, lib):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    import fake_revit
+    # The fake emulates the release of the bundle: Contents/<release>/Lib
+    release = lib.resolve().parent.name
+    fake_revit.install(int(release) if release.isdigit() else 2026)
+
+
+@pytest.fixture(scope="session")
+def _model():
+    from fake_revit.model import build_model
+    return build_model(walls=200, instances=50, levels=3, views=5, seed=7)
+
+
+@pytest.fixture
+def doc(_model):
+    """Small fake model, made active with a fresh UI selection."""
+    import fake_revit
+    return fake_revit.activate(_model)
@@ -0,0 +1,59 @@
+"""Multi-category / multi-class filters and logical collector combinations."""
+
+from rpw import DB, db
+
+
+def ids(collector):
+    return {element_id.Value for element_id in collector.get_element_ids()}
+
+
+def test_of_class_list(doc):
+    walls = ids(db.Collector(of_class="Wall"))
+    instances = ids(db.Collector(of_class=DB.FamilyInstance))
+    collector = db.Collector(of_class=["Wall", DB.FamilyInstance])
+    assert isinstance(collector.get_element_filter(), DB.ElementMulticlassFilter)
+    assert ids(collector) == walls | instances
+    assert isinstance(db.Collector(of_class=["Wall"]).get_element_filter(), DB.ElementClassFilter)
+
+
+def test_of_category_list(doc):
+    categories = ["OST_Walls", "Doors", DB.BuiltInCategory.OST_Windows]
+    expected = set()
+    for category in categories:
+        expected |= ids(db.Collector(of_category=category, is_not_type=True))
+    collector = db.Collector(of_category=categories, is_not_type=True)
+    assert ids(collector) == expected
+    assert isinstance(collector.get_element_filter(), DB.LogicalAndFilter)
+
+
+def test_or_collector_builds_logical_filter(doc):
+    walls = db.Collector(of_class="Wall")
+    doors = db.Collector(of_category="OST_Doors", is_not_type=True)
+    union = db.Collector(of_category="OST_Doors", is_not_type=True, or_collector=walls)
+    assert isinstance(union.get_element_filter(), DB.LogicalOrFilter)
+    assert ids(union) == ids(walls) | ids(doors)
+
+    level = db.Collector(of_class="Level").get_first(wrapped=False)
+    on_level = db.Collector(level=level)
+    both = db.Collector(of_class="Wall", and_collector=on_level)
+    assert isinstance(both.get_element_filter(), DB.LogicalAndFilter)
+    assert ids(both) == ids(walls) & ids(on_level)
+
+    # Combined collectors combine again
+    nested = db.Collector(of_class="FamilyInstance", or_collector=both)
+    assert ids(nested) == ids(db.Collector(of_class="FamilyInstance")) | ids(both)
+
+
+def test_logical_collectors_fall_back_to_chaining(doc):
+    walls = db.Collector(of_class="Wall")
+    marked = db.Collector(of_class="Wall", where=lambda wall: wall.Id.Value % 2 == 0)
+    assert marked.get_element_filter() is None
+    union = db.Collector(of_category="OST_Doors", is_not_type=True, or_collector=marked)
+    assert union.get_element_filter() is None
+    assert ids(union) == ids(marked) | ids(db.Collector(of_category="OST_Doors", is_not_type=True))
+
+    some_walls = walls.get_element_ids()[:10]
+    scoped = db.Collector(element_ids=some_walls, of_class="Wall")
+    union = db.Collector(of_category="OST_Doors", is_not_type=True, or_collector=scoped)
+    assert ids(union) == {element_id.Value for element_id in some_walls} | ids(
+        db.Collector(of_category="OST_Doors", is_not_type=True))
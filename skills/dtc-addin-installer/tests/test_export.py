@@ -0,0 +1,84 @@
+"""Chunked NDJSON / CSV export through rpw.db.export."""
+
+import csv
+import io
+import json
+
+from rpw import DB, db
+from rpw.db import export
+
+FIELDS = ["id", "category", "Mark", "Comments", DB.BuiltInParameter.ELEM_TYPE_PARAM,
+          ("double", lambda element: 2)]
+
+
+def expected_row(element):
+    wrapped = db.Element(element)
+    return {"id": element.Id.Value,
+            "category": element.Category.Name if element.Category else None,
+            "Mark": wrapped.parameters.get_value("Mark"),
+            "Comments": wrapped.parameters.get_value("Comments"),
+            "ELEM_TYPE_PARAM": element.GetTypeId().Value
+            if element.get_Parameter(DB.BuiltInParameter.ELEM_TYPE_PARAM) else None,
+            "double": 2}
+
+
+def test_ndjson_matches_parameter_values(doc):
+    collector = db.Collector(is_not_type=True)
+    stream = io.StringIO()
+    report = export.to_ndjson(collector, FIELDS, stream, chunk_size=64)
+    rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+    elements = collector.get_elements(wrapped=False)
+    assert rows == [expected_row(element) for element in elements]
+    assert report["rows"] == len(elements)
+    assert report["chunks"] == -(-len(elements) // 64)
+    assert 0 < report["types"] < len(elements)
+
+
+def test_csv_to_path(doc, tmp_path):
+    path = tmp_path / "walls.csv"
+    walls = db.Collector(of_class="Wall")
+    report = export.to_csv(walls, ["id", "Mark", "Length", "No Such Parameter"], str(path))
+    with open(str(path)) as fp:
+        rows = list(csv.reader(fp))
+    assert rows[0] == ["id", "Mark", "Length", "No Such Parameter"]
+    assert len(rows) - 1 == report["rows"] == len(walls)
+    wall = walls.get_first()
+    assert rows[1] == [str(wall.Id.Value), wall.parameters["Mark"].value,
+                       repr(wall.parameters["Length"].value), ""]
+
+
+def test_iter_chunks_is_bounded(doc):
+    exporter = db.Exporter(["id"], chunk_size=10)
+    sizes = [len(chunk) for chunk in exporter.iter_chunks(db.Collector(of_class="Wall"))]
+    assert max(sizes) == 10 and sum(sizes) == 200
+    rows = list(exporter.iter_rows(db.Collector(of_class="Wall").get_elements()[:3]))
+    assert list(rows[0]) == ["id"]
+
+
+def test_parameter_to_dict(doc):
+    wall = db.Collector(of_class="Wall").get_first()
+    data = wall.parameters["Type"].to_dict()
+    assert data["value"] == wall.GetTypeId().Value
+    assert data["type"] == "ElementId"
+
+
+def test_elements_without_type():
+    import fake_revit
+    from fake_revit import db as fake_db
+    from fake_revit.model import build_model
+    doc = fake_revit.activate(build_model(walls=1, instances=1, levels=1, views=1, seed=2))
+    odd = fake_db.Definition("Odd", getattr(DB.StorageType, "None"))
+    elements = [
+        DB.Element(name="a", category=DB.BuiltInCategory.OST_Doors),
+        DB.Element(name="b", category=DB.BuiltInCategory.OST_Doors, parameters={fake_db.MARK: "M-2"}),
+        DB.Element(name="c", category=DB.BuiltInCategory.OST_Walls,
+                   parameters={fake_db.UNCONNECTED_HEIGHT: 3.0, odd: 1}),
+        DB.Element(name="d", category=DB.BuiltInCategory.OST_Walls, parameters={fake_db.MARK: "M-4"}),
+    ]
+    for element in elements:
+        doc.add(element)
+    exporter = db.Exporter(["Mark", DB.BuiltInParameter.WALL_USER_HEIGHT_PARAM, "Odd"])
+    rows = [row for chunk in exporter.iter_chunks(elements) for row in chunk]
+    # A field missing from the first element of a category is read from the others
+    assert rows == [[None, None, None], ["M-2", None, None], [None, 3.0, None], ["M-4", None, None]]
+    assert exporter.types == 2
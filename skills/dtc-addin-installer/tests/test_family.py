@@ -0,0 +1,106 @@
+"""Family, Category and WallKind lookups through FamilyIndex, and its cache."""
+
+import pytest
+
+from rpw import DB, db
+from rpw.db import index as document_index
+from rpw.db.index import FamilyIndex, LiveFamilyIndex, invalidate_indexes
+
+
+@pytest.fixture
+def doc():
+    """Model of its own: these tests change it."""
+    import fake_revit
+    from fake_revit.model import build_model
+    doc = fake_revit.activate(build_model(walls=30, instances=40, levels=2, views=7, seed=3))
+    yield doc
+    invalidate_indexes()
+
+
+def instances_of(doc, symbol_ids):
+    keys = [symbol_id.Value for symbol_id in symbol_ids]
+    instances = db.Collector(doc=doc, of_class="FamilyInstance").get_elements(wrapped=False)
+    return sorted((instance for instance in instances if instance.GetTypeId().Value in keys),
+                  key=lambda instance: (keys.index(instance.GetTypeId().Value), instance.Id.Value))
+
+
+def get_family(doc, name):
+    return db.Element(next(family for family in db.Collector(doc=doc, of_class="Family").get_elements(wrapped=False)
+                           if family.Name == name))
+
+
+def test_family_instances_are_flat(doc):
+    family = get_family(doc, "Desk")
+    symbol_ids = list(family.unwrap().GetFamilySymbolIds())
+    instances = family.get_instances(wrapped=False)
+    assert [i.Id for i in instances] == [i.Id for i in instances_of(doc, symbol_ids)]
+    assert all(isinstance(instance, db.FamilyInstance) for instance in family.get_instances())
+
+    symbol = db.Element(doc.GetElement(symbol_ids[1]))
+    assert [i.Id for i in symbol.get_instances(wrapped=False)] == [i.Id for i in instances_of(doc, symbol_ids[1:])]
+
+
+def test_category_families_and_walls(doc):
+    doors = db.Category(get_family(doc, "Single-Flush").unwrap().FamilyCategory)
+    families = doors.get_families(wrapped=False)
+    assert sorted(family.Name for family in families) == ["Double-Glass", "Single-Flush"]
+
+    walls = db.Collector(doc=doc, of_class="Wall").get_elements(wrapped=False)
+    curtain = db.WallKind(DB.WallKind.Curtain)
+    assert sorted(wall_type.Name for wall_type in curtain.get_wall_types(wrapped=False)) == [
+        "Curtain Wall 1", "Storefront"]
+    assert sorted(wall.Id.Value for wall in curtain.get_instances(wrapped=False)) == sorted(
+        wall.Id.Value for wall in walls if wall.WallType.Kind == DB.WallKind.Curtain)
+    wall_type = db.Element(walls[0].WallType)
+    assert all(wall.GetTypeId() == wall_type.Id for wall in wall_type.get_instances(wrapped=False))
+
+
+def test_index_is_cached_until_the_document_changes(doc):
+    index = FamilyIndex.get(doc)
+    assert FamilyIndex.get(doc) is index
+    family = get_family(doc, "Box")
+    instance = family.get_instances(wrapped=False)[0]
+
+    # Raw API transaction, as made by the UI or another add-in
+    transaction = DB.Transaction(doc, "delete")
+    transaction.Start()
+    doc.Delete(instance.Id)
+    transaction.Commit()
+    assert FamilyIndex.get(doc) is not index
+    assert instance.Id not in [i.Id for i in family.get_instances(wrapped=False)]
+
+
+def test_live_index_while_modifiable(doc):
+    family = get_family(doc, "Box")
+    before = family.get_instances(wrapped=False)
+    with db.Transaction("delete", doc=doc):
+        index = FamilyIndex.get(doc)
+        assert type(index) is LiveFamilyIndex
+        doc.Delete(before[0].Id)
+        assert [i.Id for i in family.get_instances(wrapped=False)] == [i.Id for i in before[1:]]
+        category = family.get_category()
+        assert family.Id in [f.Id for f in category.get_families(wrapped=False)]
+        assert index.get_wall_ids(doc.GetElement(index.get_wall_type_ids(DB.WallKind.Basic)[0]).Id)
+    assert document_index._INDEXES == {}
+
+
+def test_closed_documents_are_dropped(doc):
+    import fake_revit
+    from fake_revit.model import build_model
+    application = doc.Application
+    FamilyIndex.get(doc)
+    assert application.DocumentChanged.handlers
+
+    other = build_model(walls=2, instances=2, levels=1, views=1, seed=1, title="Other")
+    FamilyIndex.get(other)
+    other.Close(False)
+    assert other not in document_index._INDEXES and doc in document_index._INDEXES
+
+    # A document closed without its event is dropped on the next store
+    doc.IsValidObject = False
+    third = build_model(walls=2, instances=2, levels=1, views=1, seed=2, title="Third")
+    FamilyIndex.get(fake_revit.activate(third))
+    assert doc not in document_index._INDEXES
+
+    invalidate_indexes()
+    assert application.DocumentChanged.handlers == [] and application.DocumentClosing.handlers == []
@@ -0,0 +1,67 @@
+"""Deferred formatting and structured output of the rpw logger."""
+
+import io
+import json
+
+import pytest
+
+from rpw.utils.logger import DEBUG, logger
+
+
+class Counted(object):
+    """Argument that counts how often it is formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "counted"
+
+
+@pytest.fixture
+def stream():
+    stream = io.StringIO()
+    logger.structured(stream)
+    yield stream
+    logger.structured(False)
+    logger.verbose(False)
+
+
+def records(stream):
+    logger.flush()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_arguments_formatted_only_when_logged(stream):
+    value = Counted()
+    logger.verbose(False)
+    assert not logger.isEnabledFor(DEBUG)
+    logger.debug("Rule: %s", value)
+    assert value.formatted == 0 and records(stream) == []
+
+    logger.verbose(True)
+    logger.debug("Rule: %s", value)
+    assert [record["message"] for record in records(stream)] == ["Rule: counted"]
+    assert value.formatted > 0
+
+
+def test_queued_message_formatted_when_logged(stream):
+    # Later changes to an argument do not change the queued message
+    data = {"rows": 1}
+    logger.info("Exported %s", data, extra={"data": {"rows": 500}})
+    data["rows"] = 2
+    [record] = records(stream)
+    assert record["message"] == "Exported {'rows': 1}"
+    assert record["level"] == "INFO" and record["data"] == {"rows": 500}
+
+
+def test_structured_exception(stream):
+    try:
+        raise ValueError("bad value")
+    except ValueError:
+        logger.error("Export failed", exc_info=True)
+    [record] = records(stream)
+    assert record["message"] == "Export failed" and record["level"] == "ERROR"
+    assert "Traceback" in record["exception"] and "ValueError: bad value" in record["exception"]
+    assert logger.errors[-1] == "Export failed"
@@ -0,0 +1,59 @@
+"""Name resolution through NameIndex: level filters, by_name() and to_class()."""
+
+import pytest
+
+from rpw import DB, db
+from rpw.exceptions import RpwCoerceError
+from rpw.utils.coerce import to_class
+
+
+def level_named(doc, name):
+    return next(level for level in DB.FilteredElementCollector(doc).OfClass(DB.Level)
+                if level.Name == name)
+
+
+def test_level_filter_by_name(doc):
+    level = level_named(doc, "Level 2")
+    walls = db.Collector(of_class="Wall", level="Level 2").get_elements(wrapped=False)
+    assert walls
+    assert all(wall.LevelId == level.Id for wall in walls)
+
+    others = db.Collector(of_class="Wall", not_level="Level 2").get_elements(wrapped=False)
+    assert not {wall.Id for wall in walls} & {wall.Id for wall in others}
+
+
+def test_level_filter_unknown_name_raises(doc):
+    with pytest.raises(RpwCoerceError):
+        db.Collector(of_class="Wall", level="No Such Level")
+
+
+def test_level_names_follow_transactions(doc):
+    level = level_named(doc, "Level 1")
+    assert db.Collector(of_class="Wall", level="Level 1").get_element_ids()
+    with db.Transaction("Rename Level"):
+        level.Name = "Ground"
+    try:
+        assert db.Collector(of_class="Wall", level="Ground").get_element_ids()
+        with pytest.raises(RpwCoerceError):
+            db.Collector(of_class="Wall", level="Level 1")
+    finally:
+        with db.Transaction("Rename Level"):
+            level.Name = "Level 1"
+
+
+def test_by_name_ignores_case(doc):
+    pattern = db.LinePatternElement.collect().get_first()
+    found = db.LinePatternElement.by_name(pattern.name.upper())
+    assert isinstance(found, db.LinePatternElement)
+    assert found.Id == pattern.Id
+
+    wall_type = db.WallType.collect().get_first()
+    assert db.WallType.by_name(wall_type.name).Id == wall_type.Id
+
+    with pytest.raises(RpwCoerceError):
+        db.FillPatternElement.by_name("No Such Pattern")
+
+
+def test_to_class_by_name():
+    assert to_class("Wall") is DB.Wall
+    assert to_class("Wall") is to_class(DB.Wall)
@@ -0,0 +1,51 @@
+"""Operations recorded by rpw.utils.profiling."""
+
+import pytest
+
+from rpw import db
+from rpw.db.collector import Collector
+from rpw.utils import profiling
+
+
+@pytest.fixture
+def profile():
+    profiling.reset()
+    profiling.enable()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def counts():
+    return dict((row["operation"], row["count"]) for row in profiling.report(by_call_site=False))
+
+
+def test_collector_operations(doc, profile):
+    walls = db.Collector(doc=doc, of_class="Wall", is_type=False)
+    elements = walls.get_elements()
+    ids = walls.get_element_ids()
+    walls.get_elements(wrapped=False)
+    recorded = counts()
+    assert recorded["Collector.get_elements"] == 2
+    assert recorded["Collector.get_element_ids"] == 1
+    # One step per element, and the last one that ends the iteration
+    assert recorded["Collector.__iter__"] == 2 * (len(elements) + 1)
+    assert recorded["Element.__new__"] == len(elements) == len(ids)
+    assert any(operation.startswith("Collector._collect[") for operation in recorded)
+
+    # Element wrapping is nested in get_elements
+    stacks = profiling.to_collapsed().split("\n")
+    assert any("Collector.get_elements;Element.__new__ " in stack for stack in stacks)
+    # Recorded against the lines of the script
+    call_sites = [row["call_site"] for row in profiling.report() if row["operation"] == "Collector.get_elements"]
+    assert len(call_sites) == 2
+    assert all(call_site.startswith("test_profiling.py:") for call_site in call_sites)
+
+
+def test_disable_restores_collector(doc, profile):
+    profiling.disable()
+    assert not any(hasattr(getattr(Collector, name), "__wrapped__")
+                   for name in ("get_elements", "get_element_ids", "__iter__"))
+    profiling.reset()
+    db.Collector(doc=doc, of_class="Wall").get_elements()
+    assert counts() == {}
@@ -0,0 +1,108 @@
+"""ui.Selection against the fake ``uidoc.Selection``, which counts SetElementIds calls."""
+
+import pytest
+
+from rpw import DB, db, revit, ui
+
+
+@pytest.fixture
+def walls(doc):
+    return db.Collector(of_class="Wall").get_elements(wrapped=False)
+
+
+@pytest.fixture
+def ui_selection(doc):
+    return revit.uidoc.Selection
+
+
+def make_selection(elements, ui_selection):
+    """Selection of ``elements``, not counting the update made by the constructor."""
+    selection = ui.Selection(elements)
+    ui_selection.set_calls = 0
+    return selection
+
+
+def test_add_updates_ui_each_call(walls, ui_selection):
+    selection = make_selection(walls[:1], ui_selection)
+    for wall in walls[1:10]:
+        selection.add(wall)
+    assert ui_selection.set_calls == 9
+    assert len(ui_selection.GetElementIds()) == 10
+
+
+def test_batch_updates_ui_once(walls, ui_selection):
+    selection = make_selection(walls[:1], ui_selection)
+    with selection.batch():
+        selection.clear()
+        for wall in walls:
+            selection.add(wall)
+            selection.add(wall.Id)
+    assert ui_selection.set_calls == 1
+    assert ui_selection.GetElementIds() == [wall.Id for wall in walls]
+
+
+def test_nested_batch_updates_on_outermost_exit(walls, ui_selection):
+    selection = make_selection(walls[:1], ui_selection)
+    with selection.batch():
+        with selection.batch():
+            selection.add(walls[1])
+        assert ui_selection.set_calls == 0
+        selection.add(walls[2])
+    assert ui_selection.set_calls == 1
+    assert len(ui_selection.GetElementIds()) == 3
+
+
+def test_batch_without_changes_does_not_update(walls, ui_selection):
+    selection = make_selection(walls[:3], ui_selection)
+    with selection.batch():
+        selection.add(walls[0], select=False)
+    assert ui_selection.set_calls == 0
+
+
+def test_batch_updates_ui_on_error(walls, ui_selection):
+    selection = make_selection(walls[:1], ui_selection)
+    with pytest.raises(ValueError):
+        with selection.batch():
+            selection.add(walls[1])
+            raise ValueError
+    assert ui_selection.set_calls == 1
+    assert len(ui_selection.GetElementIds()) == 2
+
+
+def test_index_and_membership(walls):
+    selection = ui.Selection(walls[:5])
+    assert selection[0].Id == walls[0].Id
+    assert selection[-1].Id == walls[4].Id
+    assert walls[3] in selection
+    assert walls[3].Id.Value in selection
+    assert walls[5] not in selection
+    with pytest.raises(IndexError):
+        selection[5]
+
+
+def test_uses_current_ui_selection(walls, ui_selection):
+    ui_selection.SetElementIds([wall.Id for wall in walls[:4]])
+    selection = ui.Selection()
+    assert len(selection) == 4
+    assert bool(selection)
+
+
+def test_element_set_pop(walls):
+    element_set = db.ElementSet(walls[:3])
+    element = element_set.pop(walls[1], wrapped=False)
+    assert element.Id == walls[1].Id
+    assert walls[1] not in element_set
+    assert len(element_set) == 2
+    with pytest.raises(KeyError):
+        element_set[walls[1]]
+
+
+def test_element_set_of_another_document(doc):
+    from fake_revit.model import build_model
+    other = build_model(walls=5, instances=2, levels=1, views=1, seed=8, title="Other")
+    walls = list(DB.FilteredElementCollector(other).OfClass(DB.Wall))
+    element_set = db.ElementSet([wall.Id for wall in walls], doc=other)
+    assert element_set[walls[0].Id].unwrap() is walls[0]
+    assert [element.unwrap() for element in element_set] == walls
+    assert [element.unwrap() for element in element_set.get_elements()] == walls
+    assert element_set.pop(walls[1].Id).unwrap() is walls[1]
@@ -0,0 +1,105 @@
+"""Bounding box collector filters and SpatialIndex queries, checked against brute force."""
+
+import random
+
+import pytest
+
+from rpw import DB, db
+from rpw.db.spatial import RTree
+
+
+def model_bounds(doc):
+    bounds = {}
+    for element in DB.FilteredElementCollector(doc).WhereElementIsNotElementType():
+        box = element.get_BoundingBox(None)
+        if box is not None:
+            bounds[element.Id.Value] = (box.Min.X, box.Min.Y, box.Min.Z,
+                                               box.Max.X, box.Max.Y, box.Max.Z)
+    return bounds
+
+
+def overlaps(a, b):
+    return all(a[i] <= b[i + 3] and b[i] <= a[i + 3] for i in range(3))
+
+
+def inside(a, b):
+    return all(b[i] <= a[i] and a[i + 3] <= b[i + 3] for i in range(3))
+
+
+def distance(box, point):
+    return sum(max(box[i] - point[i], 0, point[i] - box[i + 3]) ** 2 for i in range(3)) ** 0.5
+
+
+def ids(element_ids):
+    return {element_id.Value for element_id in element_ids}
+
+
+QUERY = ((-150, -150, 0), (150, 150, 5))
+QUERY_BOUNDS = (-150, -150, 0, 150, 150, 5)
+
+
+def test_collector_bounding_box_filters(doc):
+    bounds = model_bounds(doc)
+    found = ids(db.Collector(bbox_intersects=QUERY).get_element_ids())
+    assert found and found == {key for key, box in bounds.items() if overlaps(box, QUERY_BOUNDS)}
+
+    found = ids(db.Collector(bbox_inside=QUERY).get_element_ids())
+    assert found == {key for key, box in bounds.items() if inside(box, QUERY_BOUNDS)}
+    low = [min(box[i] for box in bounds.values()) for i in range(3)]
+    high = [max(box[i + 3] for box in bounds.values()) for i in range(3)]
+    assert ids(db.Collector(bbox_inside=(low, high)).get_element_ids()) == set(bounds)
+
+    wall = db.Collector(of_class="Wall").get_first()
+    center = db.BoundingBox.from_element(wall).center
+    assert wall.Id.Value in ids(db.Collector(bbox_contains=center).get_element_ids())
+    assert wall.Id.Value in ids(db.Collector(bbox_contains=center.as_tuple,
+                                                    of_class="Wall").get_element_ids())
+
+
+def test_spatial_index_matches_brute_force(doc):
+    bounds = model_bounds(doc)
+    index = db.SpatialIndex.get()
+    assert len(index) == len(bounds)
+
+    assert ids(index.get_intersecting_ids(QUERY)) == {
+        key for key, box in bounds.items() if overlaps(box, QUERY_BOUNDS)}
+    assert ids(index.get_inside_ids(QUERY)) == {
+        key for key, box in bounds.items() if inside(box, QUERY_BOUNDS)}
+
+    wall = db.Collector(of_class="Wall").get_first()
+    wall_bounds = bounds[wall.Id.Value]
+    assert ids(index.get_intersecting_ids(wall)) == {
+        key for key, box in bounds.items()
+        if key != wall.Id.Value and overlaps(box, wall_bounds)}
+
+    point = (10.0, -20.0, 1.0)
+    assert ids(index.get_ids_within_distance(point, 60)) == {
+        key for key, box in bounds.items() if distance(box, point) <= 60}
+    nearest = [element_id.Value for element_id in index.get_nearest_ids(point, count=10)]
+    expected = sorted(bounds, key=lambda key: distance(bounds[key], point))[:10]
+    assert [distance(bounds[key], point) for key in nearest] == pytest.approx(
+        [distance(bounds[key], point) for key in expected])
+
+
+@pytest.mark.parametrize("count", [0, 1, 15, 16, 17, 1000])
+def test_rtree_random_boxes(count):
+    rng = random.Random(count)
+    items = []
+    for n in range(count):
+        x, y, z = rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0, 10)
+        items.append(((x, y, z, x + rng.uniform(0, 5), y + rng.uniform(0, 5), z + 1), n))
+    tree = RTree(items, node_size=4)
+    assert len(tree) == count
+    for _ in range(20):
+        x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+        query = (x, y, 0, x + 20, y + 20, 5)
+        assert sorted(tree.intersection(query)) == sorted(
+            n for box, n in items if overlaps(box, query))
+        assert sorted(tree.contained(query)) == sorted(
+            n for box, n in items if inside(box, query))
+        point = (x, y, 2)
+        assert sorted(tree.within_distance(point, 8)) == sorted(
+            n for box, n in items if distance(box, point) <= 8)
+        nearest = tree.nearest(point, count=5)
+        expected = sorted(distance(box, point) for box, _ in items)[:5]
+        assert [distance(items[n][0], point) for n in nearest] == pytest.approx(expected)
@@ -0,0 +1,74 @@
+"""TransactionBatch commits, rollbacks and counts."""
+
+import pytest
+
+from rpw import db
+
+
+@pytest.fixture
+def walls():
+    """Model of its own: these tests change it."""
+    import fake_revit
+    from fake_revit.model import build_model
+    doc = fake_revit.activate(build_model(walls=25, instances=2, levels=1, views=1, seed=4))
+    return db.Collector(doc=doc, of_class="Wall").get_elements()
+
+
+@db.Transaction.ensure("Set Comments")
+def set_comments(wall, value, fail=False):
+    wall.parameters["Comments"] = value
+    if fail:
+        raise ValueError(value)
+
+
+def comments(walls):
+    return [wall.parameters["Comments"].value for wall in walls]
+
+
+def test_batch_commits(walls):
+    with db.TransactionBatch("Set Comments", size=10) as batch:
+        for n, wall in enumerate(walls):
+            set_comments(wall, str(n))
+    assert comments(walls) == [str(n) for n in range(25)]
+    assert (batch.report["operations"], batch.report["commits"], batch.report["failed"]) == (25, 3, 0)
+    assert walls[0].doc.commit_count == 3
+
+
+def test_failed_operation_is_rolled_back_alone(walls):
+    before = comments(walls)
+    with db.TransactionBatch("Set Comments", size=10) as batch:
+        for n, wall in enumerate(walls):
+            try:
+                set_comments(wall, str(n), fail=n in (4, 12))
+            except ValueError:
+                pass
+    expected = [before[n] if n in (4, 12) else str(n) for n in range(25)]
+    assert comments(walls) == expected
+    assert (batch.report["operations"], batch.report["commits"], batch.report["failed"]) == (25, 3, 2)
+
+
+def test_error_rolls_back_the_open_transaction(walls):
+    before = comments(walls)
+    with pytest.raises(ValueError):
+        with db.TransactionBatch("Set Comments", size=10) as batch:
+            for n, wall in enumerate(walls):
+                set_comments(wall, str(n), fail=n == 13)
+    # 0-9 were committed, 10-12 rolled back with 13
+    assert comments(walls) == [str(n) for n in range(10)] + before[10:]
+    assert (batch.report["operations"], batch.report["commits"], batch.report["failed"]) == (14, 1, 4)
+
+
+def test_nested_operations(walls):
+    @db.Transaction.ensure("Set Both")
+    def set_both(first, second, fail):
+        set_comments(first, "a")
+        set_comments(second, "b", fail)
+
+    before = comments(walls[:6])
+    with db.TransactionBatch("Set Both", size=2) as batch:
+        set_both(walls[0], walls[1], False)
+        with pytest.raises(ValueError):
+            set_both(walls[2], walls[3], True)
+        set_both(walls[4], walls[5], False)
+    assert comments(walls[:6]) == ["a", "b"] + before[2:4] + ["a", "b"]
+    assert batch.report["failed"] == 2
@@ -0,0 +1,105 @@
+"""View overrides applied in bulk."""
+
+import pytest
+
+from rpw import DB, db
+from rpw.db.index import invalidate_indexes
+
+
+@pytest.fixture
+def view(doc):
+    return db.Element(DB.FilteredElementCollector(doc).OfClass(DB.ViewPlan).FirstElement())
+
+
+def line_color(settings):
+    color = settings.ProjectionLineColor
+    return color and (color.Red, color.Green, color.Blue)
+
+
+def test_apply_many_overrides_targets(doc, view):
+    walls = db.Collector(doc=doc, of_class="Wall").get_elements(wrapped=False)
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    overrides = {wall: {"projection_line": {"color": list(colors[i % 3])}, "halftone": i % 2 == 0}
+                 for i, wall in enumerate(walls[:30])}
+    overrides["Doors"] = {"transparency": 40}
+    report = view.override.apply_many(overrides)
+    assert (report["elements"], report["categories"], report["settings"]) == (30, 1, 7)
+
+    revit_view = view.unwrap()
+    for i, wall in enumerate(walls[:30]):
+        settings = revit_view.GetElementOverrides(wall.Id)
+        assert line_color(settings) == colors[i % 3]
+        assert settings.Halftone is (i % 2 == 0)
+    doors = revit_view.GetCategoryOverrides(DB.ElementId(DB.BuiltInCategory.OST_Doors))
+    assert doors.Transparency == 40 and line_color(doors) is None
+    assert revit_view.GetElementOverrides(walls[30].Id) == DB.OverrideGraphicSettings()
+
+
+def test_apply_many_shares_equal_settings(doc, view):
+    def red():
+        settings = DB.OverrideGraphicSettings()
+        settings.SetProjectionLineColor(DB.Color(255, 0, 0))
+        return settings
+
+    walls = db.Collector(doc=doc, of_class="Wall").get_elements(wrapped=False)[:20]
+    # Equal settings, built separately
+    overrides = dict((wall, red()) for wall in walls)
+    blue = DB.OverrideGraphicSettings()
+    blue.SetProjectionLineColor(DB.Color(0, 0, 255))
+    overrides[walls[0]] = blue
+    report = view.override.apply_many(overrides)
+    assert report["settings"] == 2
+
+    revit_view = view.unwrap()
+    assert line_color(revit_view.GetElementOverrides(walls[0].Id)) == (0, 0, 255)
+    assert [line_color(revit_view.GetElementOverrides(wall.Id)) for wall in walls[1:]] == [(255, 0, 0)] * 19
+
+
+def test_apply_many_id_targets(doc, view):
+    def dashed():
+        settings = DB.OverrideGraphicSettings()
+        settings.SetProjectionLinePatternId(DB.ElementId(7))
+        return settings
+
+    walls = db.Collector(doc=doc, of_class="Wall").get_elements(wrapped=False)[:4]
+    doors = DB.ElementId(DB.BuiltInCategory.OST_Doors)
+    overrides = {walls[0].Id: dashed(), walls[1].Id.Value: dashed(), (walls[2].Id, walls[3]): dashed(),
+                 doors: dashed()}
+    report = view.override.apply_many(overrides)
+    # ElementId values of settings are compared by value too
+    assert (report["elements"], report["categories"], report["settings"]) == (4, 1, 1)
+
+    revit_view = view.unwrap()
+    assert all(revit_view.GetElementOverrides(wall.Id).ProjectionLinePatternId == DB.ElementId(7)
+               for wall in walls)
+    assert revit_view.GetCategoryOverrides(doors).ProjectionLinePatternId == DB.ElementId(7)
+
+
+def ids(elements):
+    return sorted(element.Id.Value for element in elements)
+
+
+@pytest.fixture
+def views_doc():
+    """Several views of each type."""
+    import fake_revit
+    from fake_revit.model import build_model
+    yield fake_revit.activate(build_model(walls=2, instances=2, levels=2, views=30, seed=5))
+    invalidate_indexes()
+
+
+def test_view_groups(views_doc):
+    doc = views_doc
+    view = db.Element(DB.FilteredElementCollector(doc).OfClass(DB.ViewPlan).FirstElement())
+    views = DB.FilteredElementCollector(doc).OfClass(DB.View).ToElements()
+    assert len(view.siblings) > 1 and all(isinstance(v, db.View) for v in view.siblings)
+    assert ids(view.siblings) == ids(v for v in views if v.ViewType == DB.ViewType.FloorPlan)
+    assert ids(db.ViewType(DB.ViewType.Section).views) == ids(
+        v for v in views if v.ViewType == DB.ViewType.Section)
+
+    family_type = view.view_family_type
+    assert family_type.name == "Floor Plan"
+    assert ids(family_type.views) == ids(v for v in views if v.GetTypeId() == family_type.Id)
+    plans = ids(v for v in views if doc.GetElement(v.GetTypeId()).ViewFamily == DB.ViewFamily.FloorPlan)
+    assert ids(db.ViewFamily(DB.ViewFamily.FloorPlan).views) == plans and plans
+    assert db.ViewFamily(DB.ViewFamily.Walkthrough).views == []
@@ -0,0 +1,94 @@
+"""WriteQueue deduplication, dry runs and discards."""
+
+import pytest
+
+from rpw import db
+from rpw.exceptions import RpwParameterNotFound
+
+
+@pytest.fixture
+def walls():
+    """Model of its own: these tests change it."""
+    import fake_revit
+    from fake_revit.model import build_model
+    doc = fake_revit.activate(build_model(walls=10, instances=2, levels=1, views=1, seed=6))
+    return db.Collector(doc=doc, of_class="Wall").get_elements()
+
+
+def marks(walls):
+    return [wall.parameters["Mark"].value for wall in walls]
+
+
+def test_writes_collapse_to_the_last_value(walls):
+    doc = walls[0].doc
+    commits = doc.commit_count
+    queue = db.WriteQueue("Renumber")
+    for n, wall in enumerate(walls):
+        queue[wall, "Mark"] = "draft"
+        queue.set(wall.Id, "Mark", "M-{}".format(n))
+    queue[walls[0].Id.Value, "Mark"] = "first"
+    assert (queue.recorded, len(queue)) == (21, 10)
+    assert queue[walls[0], "Mark"] == "first"
+
+    report = queue.flush()
+    assert (report["recorded"], report["slots"], report["elements"], report["changed"]) == (21, 10, 10, 10)
+    assert marks(walls) == ["first"] + ["M-{}".format(n) for n in range(1, 10)]
+    assert doc.commit_count == commits + 1
+    assert (queue.recorded, len(queue)) == (0, 0)
+
+    queue[walls[1], "Mark"] = "M-1"
+    assert queue.flush()["unchanged"] == 1
+
+
+def test_dry_run(walls):
+    before = marks(walls)
+    queue = db.WriteQueue()
+    queue[walls[0], "Mark"] = "new"
+    queue[walls[1], "Mark"] = before[1]
+    queue[walls[2], "No Such Parameter"] = 1
+    report = queue.flush(dry_run=True)
+    assert (report["changed"], report["unchanged"], report["missing"]) == (1, 1, 1)
+    assert report["changes"] == [
+        {"element_id": walls[0].Id.Value, "parameter": "Mark", "old": before[0], "new": "new"},
+        {"element_id": walls[2].Id.Value, "parameter": "No Such Parameter", "old": None, "new": 1,
+         "error": "not found"}]
+    # Nothing written, queue kept
+    assert marks(walls) == before and len(queue) == 3
+    with pytest.raises(RpwParameterNotFound):
+        queue.flush()
+    assert marks(walls) == before
+
+
+def test_discard(walls):
+    queue = db.WriteQueue()
+    for wall in walls[:3]:
+        queue[wall, "Mark"] = "a"
+        queue[wall, "Mark"] = "b"
+        queue[wall, "Comments"] = "c"
+    assert (queue.recorded, len(queue)) == (9, 6)
+
+    queue.discard(walls[0], "Mark")
+    assert (queue.recorded, len(queue)) == (7, 5)
+    queue.discard(walls[1])
+    assert (queue.recorded, len(queue)) == (4, 3)
+    queue.discard(walls[0], "Comments")
+    queue.discard(walls[5])
+    assert (queue.recorded, len(queue)) == (3, 2)
+    with pytest.raises(KeyError):
+        queue[walls[0], "Comments"]
+
+    report = queue.flush(dry_run=True)
+    assert (report["recorded"], report["elements"], report["changed"]) == (3, 1, 2)
+
+
+def test_context(walls):
+    before = marks(walls)
+    with pytest.raises(ValueError):
+        with db.WriteQueue() as queue:
+            queue[walls[0], "Mark"] = "lost"
+            raise ValueError
+    assert len(queue) == 0 and marks(walls) == before
+
+    with db.WriteQueue() as queue:
+        queue[walls[0], "Mark"] = "kept"
+    assert marks(walls)[0] == "kept"
@@ -0,0 +1,66 @@
+"""In-memory fake of the Revit API, for running rpw outside of Revit.
+
+``install()`` registers ``clr``, ``System`` and ``Autodesk.Revit.*`` stand-ins
+in ``sys.modules``; it must run before rpw is first imported. ``release``
+selects the API of that Revit version (``ElementId.IntegerValue`` is gone
+from 2026). ``activate()`` then points ``rpw.revit`` at a document:
+
+    import fake_revit
+    fake_revit.install()
+
+    from fake_revit.model import build_model
+    doc = fake_revit.activate(build_model(walls=10000, instances=10000))
+
+    from rpw import db
+    walls = db.Collector(of_class='Wall').get_elements()
+
+Only the API surface rpw uses is implemented. Quick filters are served from
+per-class and per-category indexes, slow filters check each candidate,
+mirroring how Revit's collectors scale.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+
+from . import db, exceptions, system, ui, ui_selection
+
+__all__ = ["install", "activate", "db", "ui"]
+
+
+def install(release=2026):
+    """Register the fake .NET and Revit API modules. Safe to call more than once."""
+    db.set_release(release)
+    modules = system.make_modules()
+
+    autodesk = types.ModuleType("Autodesk")
+    revit = types.ModuleType("Autodesk.Revit")
+    autodesk.Revit = revit
+    revit.DB = db
+    revit.UI = ui
+    revit.Exceptions = exceptions
+
+    modules.update({
+        "Autodesk": autodesk,
+        "Autodesk.Revit": revit,
+        "Autodesk.Revit.DB": db,
+        "Autodesk.Revit.DB.Architecture": db.Architecture,
+        "Autodesk.Revit.UI": ui,
+        "Autodesk.Revit.UI.Selection": ui_selection,
+        "Autodesk.Revit.Exceptions": exceptions,
+    })
+    for name, module in modules.items():
+        sys.modules.setdefault(name, module)
+
+    if "rpw" in sys.modules and type(sys.modules["rpw"].DB).__name__ == "MockObject":
+        raise RuntimeError("rpw was imported before fake_revit.install(): "
+                           "it is bound to mock objects")
+
+
+def activate(doc):
+    """Makes ``doc`` the active document of ``rpw.revit`` and returns it."""
+    from rpw import revit
+
+    revit.uiapp = ui.UIApplication(doc)
+    return doc
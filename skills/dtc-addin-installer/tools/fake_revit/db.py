@@ -0,0 +1,1975 @@
+"""In-memory implementation of the ``Autodesk.Revit.DB`` subset used by ``rpw.db``.
+
+Elements live in a :class:`Document` keyed by integer id, with per-class and
+per-category indexes so quick filters don't scan the whole model, while slow
+filters (level, symbol, parameter) test every candidate, as in Revit.
+Parameter writes, deletes and type changes must happen inside a
+:class:`Transaction` and are undone on ``RollBack``.
+
+Names that are not implemented raise ``AttributeError``, as a typo would in
+Revit, so tests cannot pass on API the fake does not have.
+"""
+
+from __future__ import annotations
+
+import types
+
+from . import exceptions as Exceptions
+
+
+###############
+# ENUMERATIONS #
+###############
+
+
+class _EnumMember:
+    """Base for enumeration types. Members are instances set as class attributes."""
+
+    __slots__ = ("_name", "_value")
+
+    _by_value = None
+    _by_name = None
+
+    def __init__(self, name, value):
+        self._name = name
+        self._value = value
+
+    @classmethod
+    def members(cls):
+        return list(cls._by_name.values())
+
+    @classmethod
+    def from_value(cls, value):
+        member = cls._by_value.get(value)
+        return member if member is not None else cls(str(value), value)
+
+    def ToString(self):
+        return self._name
+
+    def __str__(self):
+        return self._name
+
+    def __repr__(self):
+        return "<{}.{}>".format(type(self).__name__, self._name)
+
+    def __int__(self):
+        return self._value
+
+    __index__ = __int__
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._value == self._value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((type(self).__name__, self._value))
+
+
+def _populate(enum_type, members):
+    enum_type._by_value = {}
+    enum_type._by_name = {}
+    for name, value in members:
+        member = enum_type(name, value)
+        setattr(enum_type, name, member)
+        enum_type._by_value.setdefault(value, member)
+        enum_type._by_name[name] = member
+    return enum_type
+
+
+class BuiltInCategory(_EnumMember):
+    __slots__ = ()
+
+
+class BuiltInParameter(_EnumMember):
+    __slots__ = ()
+
+
+class StorageType(_EnumMember):
+    __slots__ = ()
+
+
+class WallKind(_EnumMember):
+    __slots__ = ()
+
+
+class ViewType(_EnumMember):
+    __slots__ = ()
+
+
+class ViewFamily(_EnumMember):
+    __slots__ = ()
+
+
+class ViewDetailLevel(_EnumMember):
+    __slots__ = ()
+
+
+class TransactionStatus(_EnumMember):
+    __slots__ = ()
+
+
+class CategoryType(_EnumMember):
+    __slots__ = ()
+
+
+# (name, id, UI name). A representative subset of the ~1,500 Revit members.
+CATEGORIES = [
+    ("OST_Walls", -2000011, "Walls"),
+    ("OST_Doors", -2000023, "Doors"),
+    ("OST_Windows", -2000014, "Windows"),
+    ("OST_Floors", -2000032, "Floors"),
+    ("OST_Roofs", -2000035, "Roofs"),
+    ("OST_Ceilings", -2000038, "Ceilings"),
+    ("OST_Columns", -2000100, "Columns"),
+    ("OST_Stairs", -2000120, "Stairs"),
+    ("OST_StairsRailing", -2000126, "Railings"),
+    ("OST_Ramps", -2000180, "Ramps"),
+    ("OST_Furniture", -2000080, "Furniture"),
+    ("OST_FurnitureSystems", -2001100, "Furniture Systems"),
+    ("OST_Casework", -2001000, "Casework"),
+    ("OST_GenericModel", -2000151, "Generic Models"),
+    ("OST_SpecialityEquipment", -2001350, "Specialty Equipment"),
+    ("OST_PlumbingFixtures", -2001160, "Plumbing Fixtures"),
+    ("OST_LightingFixtures", -2001120, "Lighting Fixtures"),
+    ("OST_ElectricalFixtures", -2001060, "Electrical Fixtures"),
+    ("OST_ElectricalEquipment", -2001040, "Electrical Equipment"),
+    ("OST_MechanicalEquipment", -2001140, "Mechanical Equipment"),
+    ("OST_DuctCurves", -2008000, "Ducts"),
+    ("OST_PipeCurves", -2008044, "Pipes"),
+    ("OST_CableTray", -2008130, "Cable Trays"),
+    ("OST_Conduit", -2008132, "Conduits"),
+    ("OST_StructuralColumns", -2001330, "Structural Columns"),
+    ("OST_StructuralFraming", -2001320, "Structural Framing"),
+    ("OST_StructuralFoundation", -2001300, "Structural Foundations"),
+    ("OST_Rebar", -2009000, "Structural Rebar"),
+    ("OST_CurtainWallPanels", -2000170, "Curtain Panels"),
+    ("OST_CurtainWallMullions", -2000171, "Curtain Wall Mullions"),
+    ("OST_Entourage", -2001370, "Entourage"),
+    ("OST_Planting", -2001360, "Planting"),
+    ("OST_Parking", -2001180, "Parking"),
+    ("OST_Site", -2001260, "Site"),
+    ("OST_Topography", -2001340, "Topography"),
+    ("OST_Mass", -2003400, "Mass"),
+    ("OST_Parts", -2002221, "Parts"),
+    ("OST_Assemblies", -2000267, "Assemblies"),
+    ("OST_Rooms", -2000160, "Rooms"),
+    ("OST_Areas", -2003200, "Areas"),
+    ("OST_AreaSchemes", -2000485, "Area Schemes"),
+    ("OST_Levels", -2000240, "Levels"),
+    ("OST_Grids", -2000220, "Grids"),
+    ("OST_Views", -2000279, "Views"),
+    ("OST_Sheets", -2003100, "Sheets"),
+    ("OST_Viewports", -2000510, "Viewports"),
+    ("OST_Lines", -2000051, "Lines"),
+    ("OST_DetailComponents", -2002000, "Detail Items"),
+    ("OST_GenericAnnotation", -2000150, "Generic Annotations"),
+    ("OST_TextNotes", -2000300, "Text Notes"),
+    ("OST_Dimensions", -2000260, "Dimensions"),
+    ("OST_Materials", -2000700, "Materials"),
+    ("OST_ProjectInformation", -2003101, "Project Information"),
+]
+
+_populate(BuiltInCategory, [("INVALID", -1)] + [(name, value) for name, value, _ in CATEGORIES])
+
+# Values are unique but do not match the Revit enumeration
+_populate(BuiltInParameter, [
+    ("INVALID", -1),
+    ("ALL_MODEL_MARK", -1001203),
+    ("ALL_MODEL_INSTANCE_COMMENTS", -1010106),
+    ("ALL_MODEL_TYPE_MARK", -1010105),
+    ("ALL_MODEL_TYPE_NAME", -1002001),
+    ("SYMBOL_NAME_PARAM", -1002002),
+    ("SYMBOL_FAMILY_NAME_PARAM", -1002003),
+    ("ELEM_TYPE_PARAM", -1002051),
+    ("ELEM_FAMILY_PARAM", -1002052),
+    ("ELEM_CATEGORY_PARAM", -1140362),
+    ("CURVE_ELEM_LENGTH", -1004005),
+    ("WALL_USER_HEIGHT_PARAM", -1001300),
+    ("WALL_BASE_CONSTRAINT", -1001107),
+    ("WALL_BASE_OFFSET", -1001108),
+    ("WALL_LOCATION_LINE", -1001307),
+    ("WALL_ATTR_WIDTH_PARAM", -1001000),
+    ("FAMILY_LEVEL_PARAM", -1001352),
+    ("INSTANCE_ELEVATION_PARAM", -1001364),
+    ("FAMILY_WIDTH_PARAM", -1001401),
+    ("LEVEL_ELEV", -1007000),
+    ("DATUM_TEXT", -1007010),
+    ("VIEW_NAME", -1005100),
+    ("VIEW_PHASE", -1012101),
+    ("PHASE_CREATED", -1012200),
+    ("TYPE_NAME", -1002004),
+])
+
+_populate(StorageType, [
+    ("None", 0), ("Integer", 1), ("Double", 2), ("String", 3), ("ElementId", 4),
+])
+
+_populate(WallKind, [("Unknown", -1), ("Basic", 0), ("Curtain", 1), ("Stacked", 2)])
+
+_populate(ViewType, [
+    ("Undefined", 0), ("FloorPlan", 1), ("CeilingPlan", 2), ("Elevation", 3),
+    ("ThreeD", 4), ("Schedule", 5), ("DrawingSheet", 6), ("ProjectBrowser", 7),
+    ("Report", 8), ("DraftingView", 10), ("Legend", 11), ("SystemBrowser", 12),
+    ("EngineeringPlan", 115), ("AreaPlan", 116), ("Section", 117),
+    ("Detail", 118), ("CostReport", 119), ("LoadsReport", 120),
+    ("PresureLossReport", 121), ("ColumnSchedule", 122), ("PanelSchedule", 123),
+    ("Walkthrough", 124), ("Rendering", 125), ("Internal", 214),
+])
+
+_populate(ViewFamily, [
+    ("Invalid", 0), ("ThreeDimensional", 102), ("Walkthrough", 103),
+    ("ImageView", 104), ("Schedule", 105), ("CostReport", 106),
+    ("LoadsReport", 107), ("PressureLossReport", 108), ("PanelSchedule", 109),
+    ("GraphicalColumnSchedule", 110), ("StructuralPlan", 111), ("Elevation", 112),
+    ("Section", 113), ("Detail", 114), ("CeilingPlan", 115), ("FloorPlan", 116),
+    ("AreaPlan", 117), ("Drafting", 118), ("Legend", 119), ("Sheet", 120),
+])
+
+_populate(ViewDetailLevel, [("Undefined", 0), ("Coarse", 1), ("Medium", 2), ("Fine", 3)])
+
+_populate(TransactionStatus, [
+    ("Uninitialized", 0), ("Started", 1), ("RolledBack", 2), ("Committed", 3),
+    ("Pending", 4), ("Error", 5), ("Proceed", 6),
+])
+
+_populate(CategoryType, [("Invalid", 0), ("Model", 1), ("Annotation", 2), ("Internal", 3)])
+
+
+##############
+# PRIMITIVES #
+##############
+
+
+class ElementId:
+    __slots__ = ("Value",)
+
+    def __init__(self, value):
+        self.Value = int(value)
+
+    def Compare(self, other):
+        return (self.Value > other.Value) - (self.Value < other.Value)
+
+    def ToString(self):
+        return str(self.Value)
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other.Value == self.Value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __lt__(self, other):
+        return self.Value < other.Value
+
+    def __hash__(self):
+        return hash(self.Value)
+
+    def __repr__(self):
+        return "<ElementId {}>".format(self.Value)
+
+
+def _integer_value(self):
+    return self.Value
+
+
+# Release of Revit emulated, see set_release()
+RELEASE = 2026
+
+
+def set_release(release):
+    """Emulates ``release``: ``ElementId.IntegerValue`` only exists before 2026,
+    so code run against the 2026 fake cannot read it."""
+    global RELEASE
+    RELEASE = int(release)
+    if RELEASE < 2026:
+        ElementId.IntegerValue = property(_integer_value)
+    elif "IntegerValue" in ElementId.__dict__:
+        del ElementId.IntegerValue
+
+
+ElementId.InvalidElementId = ElementId(-1)
+_INVALID = ElementId.InvalidElementId
+
+
+class XYZ:
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.X = float(x)
+        self.Y = float(y)
+        self.Z = float(z)
+
+    def Add(self, other):
+        return XYZ(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+
+    def Subtract(self, other):
+        return XYZ(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+
+    def Multiply(self, value):
+        return XYZ(self.X * value, self.Y * value, self.Z * value)
+
+    def Divide(self, value):
+        return XYZ(self.X / value, self.Y / value, self.Z / value)
+
+    def DotProduct(self, other):
+        return self.X * other.X + self.Y * other.Y + self.Z * other.Z
+
+    def GetLength(self):
+        return (self.X ** 2 + self.Y ** 2 + self.Z ** 2) ** 0.5
+
+    def DistanceTo(self, other):
+        return self.Subtract(other).GetLength()
+
+    def Normalize(self):
+        length = self.GetLength()
+        return self.Divide(length) if length else XYZ()
+
+    def IsAlmostEqualTo(self, other, tolerance=1e-9):
+        return self.DistanceTo(other) <= tolerance
+
+    def ToString(self):
+        return "({:.9f}, {:.9f}, {:.9f})".format(self.X, self.Y, self.Z)
+
+    def __eq__(self, other):
+        return isinstance(other, XYZ) and (self.X, self.Y, self.Z) == (other.X, other.Y, other.Z)
+
+    def __hash__(self):
+        return hash((self.X, self.Y, self.Z))
+
+    def __repr__(self):
+        return "<XYZ {}>".format(self.ToString())
+
+
+XYZ.Zero = XYZ(0, 0, 0)
+XYZ.BasisX = XYZ(1, 0, 0)
+XYZ.BasisY = XYZ(0, 1, 0)
+XYZ.BasisZ = XYZ(0, 0, 1)
+
+
+class Color:
+    __slots__ = ("Red", "Green", "Blue")
+
+    def __init__(self, red, green, blue):
+        self.Red, self.Green, self.Blue = red, green, blue
+
+    def __eq__(self, other):
+        return isinstance(other, Color) and (self.Red, self.Green, self.Blue) == (other.Red, other.Green, other.Blue)
+
+    def __hash__(self):
+        return hash((self.Red, self.Green, self.Blue))
+
+
+class Curve:
+    pass
+
+
+class Line(Curve):
+    __slots__ = ("_start", "_end")
+
+    def __init__(self, start, end):
+        self._start, self._end = start, end
+
+    @classmethod
+    def CreateBound(cls, start, end):
+        return cls(start, end)
+
+    def GetEndPoint(self, index):
+        return self._start if index == 0 else self._end
+
+    @property
+    def Length(self):
+        return self._start.DistanceTo(self._end)
+
+
+class Arc(Curve):
+    pass
+
+
+class Ellipse(Curve):
+    pass
+
+
+class Transform:
+    pass
+
+
+class LocationCurve:
+    __slots__ = ("Curve",)
+
+    def __init__(self, curve):
+        self.Curve = curve
+
+
+class LocationPoint:
+    __slots__ = ("Point",)
+
+    def __init__(self, point):
+        self.Point = point
+
+
+class BoundingBoxXYZ:
+    def __init__(self, minimum=None, maximum=None):
+        self.Min = minimum if minimum is not None else XYZ()
+        self.Max = maximum if maximum is not None else XYZ()
+        self.Enabled = True
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.BoundingBoxXYZ"
+
+
+class Outline:
+    def __init__(self, minimum, maximum):
+        self.MinimumPoint = minimum
+        self.MaximumPoint = maximum
+
+    @property
+    def IsEmpty(self):
+        low, high = self.MinimumPoint, self.MaximumPoint
+        return low.X > high.X or low.Y > high.Y or low.Z > high.Z
+
+    def _bounds(self):
+        low, high = self.MinimumPoint, self.MaximumPoint
+        return low.X, low.Y, low.Z, high.X, high.Y, high.Z
+
+    def Intersects(self, other, tolerance=0.0):
+        a, b = self._bounds(), other._bounds()
+        return all(a[i] <= b[i + 3] + tolerance and b[i] <= a[i + 3] + tolerance for i in range(3))
+
+    def Contains(self, point, tolerance=0.0):
+        low, high = self.MinimumPoint, self.MaximumPoint
+        return (low.X - tolerance <= point.X <= high.X + tolerance
+                and low.Y - tolerance <= point.Y <= high.Y + tolerance
+                and low.Z - tolerance <= point.Z <= high.Z + tolerance)
+
+    def ContainsOtherOutline(self, other, tolerance=0.0):
+        return self.Contains(other.MinimumPoint, tolerance) and self.Contains(other.MaximumPoint, tolerance)
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.Outline"
+
+
+class Reference:
+    def __init__(self, element):
+        self.ElementId = element.Id
+
+
+##############
+# PARAMETERS #
+##############
+
+
+class Definition:
+    """Parameter definition shared by every element carrying the parameter.
+
+    ``getter`` makes the parameter computed (read-only) from the element,
+    e.g. ``Length`` from the location curve.
+    """
+
+    __slots__ = ("Name", "BuiltInParameter", "StorageType", "IsReadOnly", "Id", "getter")
+
+    def __init__(self, name, storage_type, builtin=None, read_only=False, getter=None, id_=None):
+        self.Name = name
+        self.StorageType = storage_type
+        self.BuiltInParameter = builtin if builtin is not None else BuiltInParameter.INVALID
+        self.IsReadOnly = read_only or getter is not None
+        self.getter = getter
+        self.Id = ElementId(id_ if id_ is not None else int(self.BuiltInParameter))
+
+    def __repr__(self):
+        return "<Definition {}>".format(self.Name)
+
+
+_DEFAULTS = {
+    "String": None,
+    "Double": 0.0,
+    "Integer": 0,
+    "ElementId": _INVALID,
+}
+
+
+class Parameter:
+    __slots__ = ("_element", "Definition")
+
+    def __init__(self, element, definition):
+        self._element = element
+        self.Definition = definition
+
+    @property
+    def Element(self):
+        return self._element
+
+    @property
+    def Id(self):
+        return self.Definition.Id
+
+    @property
+    def StorageType(self):
+        return self.Definition.StorageType
+
+    @property
+    def IsReadOnly(self):
+        return self.Definition.IsReadOnly
+
+    @property
+    def HasValue(self):
+        return self._raw() is not None
+
+    def _raw(self):
+        definition = self.Definition
+        if definition.getter is not None:
+            return definition.getter(self._element)
+        values = self._element._values
+        return values.get(definition) if values else None
+
+    def _as(self, storage_name):
+        if self.Definition.StorageType._name != storage_name:
+            return _DEFAULTS[storage_name]
+        value = self._raw()
+        return _DEFAULTS[storage_name] if value is None else value
+
+    def AsString(self):
+        return self._as("String")
+
+    def AsDouble(self):
+        return self._as("Double")
+
+    def AsInteger(self):
+        return self._as("Integer")
+
+    def AsElementId(self):
+        return self._as("ElementId")
+
+    def AsValueString(self):
+        value = self._raw()
+        storage = self.Definition.StorageType._name
+        if value is None or storage == "String":
+            return None
+        if storage == "ElementId":
+            element = self._element._doc.GetElement(value)
+            return element.Name if element is not None else None
+        if storage == "Double":
+            return "{:.2f}".format(value)
+        return str(value)
+
+    def Set(self, value):
+        definition = self.Definition
+        if definition.IsReadOnly:
+            raise Exceptions.InvalidOperationException("The parameter is read-only.")
+        storage = definition.StorageType._name
+        if storage == "Double" and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        expected = {"String": str, "Double": float, "Integer": int, "ElementId": ElementId}[storage]
+        if not isinstance(value, expected):
+            return False
+        self._element._set_value(definition, value)
+        return True
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.Parameter"
+
+    def __repr__(self):
+        return "<Parameter {}>".format(self.Definition.Name)
+
+
+def _level_id(element):
+    return ElementId(element._level_id) if element._level_id is not None else None
+
+
+def _curve_length(element):
+    return element._curve.Length if element._curve is not None else None
+
+
+def _type_id(element):
+    return ElementId(element._type_id) if element._type_id is not None else None
+
+
+def _type_name(element):
+    element_type = element._doc._elements.get(element._type_id) if element._type_id is not None else element
+    return element_type._name if element_type is not None else None
+
+
+def _family_name(element):
+    return element.FamilyName
+
+
+def _level_elevation(element):
+    return element._elevation
+
+
+def _own_name(element):
+    return element._name
+
+
+_S, _D, _I, _E = StorageType.String, StorageType.Double, StorageType.Integer, StorageType.ElementId
+_B = BuiltInParameter
+
+MARK = Definition("Mark", _S, _B.ALL_MODEL_MARK)
+COMMENTS = Definition("Comments", _S, _B.ALL_MODEL_INSTANCE_COMMENTS)
+TYPE_MARK = Definition("Type Mark", _S, _B.ALL_MODEL_TYPE_MARK)
+TYPE_COMMENTS = Definition("Type Comments", _S, _B.ALL_MODEL_TYPE_NAME)
+TYPE_NAME = Definition("Type Name", _S, _B.SYMBOL_NAME_PARAM, getter=_type_name)
+FAMILY_NAME = Definition("Family Name", _S, _B.SYMBOL_FAMILY_NAME_PARAM, getter=_family_name)
+ELEM_TYPE = Definition("Type", _E, _B.ELEM_TYPE_PARAM, getter=_type_id)
+LENGTH = Definition("Length", _D, _B.CURVE_ELEM_LENGTH, getter=_curve_length)
+UNCONNECTED_HEIGHT = Definition("Unconnected Height", _D, _B.WALL_USER_HEIGHT_PARAM)
+BASE_CONSTRAINT = Definition("Base Constraint", _E, _B.WALL_BASE_CONSTRAINT, getter=_level_id)
+BASE_OFFSET = Definition("Base Offset", _D, _B.WALL_BASE_OFFSET)
+LOCATION_LINE = Definition("Location Line", _I, _B.WALL_LOCATION_LINE)
+WIDTH = Definition("Width", _D, _B.WALL_ATTR_WIDTH_PARAM)
+FAMILY_WIDTH = Definition("Width", _D, _B.FAMILY_WIDTH_PARAM)
+LEVEL = Definition("Level", _E, _B.FAMILY_LEVEL_PARAM, getter=_level_id)
+ELEVATION_FROM_LEVEL = Definition("Elevation from Level", _D, _B.INSTANCE_ELEVATION_PARAM)
+ELEVATION = Definition("Elevation", _D, _B.LEVEL_ELEV, getter=_level_elevation)
+VIEW_NAME = Definition("View Name", _S, _B.VIEW_NAME, getter=_own_name)
+
+
+############
+# ELEMENTS #
+############
+
+
+class Element:
+    """Base element. Values for stored parameters live in ``_values``."""
+
+    __slots__ = ("_id", "_doc", "_name", "_category_id", "_type_id", "_level_id",
+                 "_owner_view_id", "_values", "_curve", "Pinned")
+
+    # Parameters every element of the class exposes, computed or stored. ``_values`` only holds
+    # the stored values that were set.
+    _parameters = ()
+    _is_curve_driven = False
+
+    def __init__(self, name=None, category=None, type_id=None, level_id=None,
+                 owner_view_id=None, parameters=None, curve=None):
+        self._id = None
+        self._doc = None
+        self._name = name
+        self._category_id = _int_id(category) if category is not None else None
+        self._type_id = _int_id(type_id) if type_id is not None else None
+        self._level_id = _int_id(level_id) if level_id is not None else None
+        self._owner_view_id = _int_id(owner_view_id) if owner_view_id is not None else None
+        self._values = dict(parameters) if parameters else None
+        self._curve = curve
+        self.Pinned = False
+
+    # Name is virtual so DB.Element.Name.__get__(wall) returns the wall type name
+    Name = property(lambda self: self._get_name(), lambda self, value: self._set_name(value))
+
+    def _get_name(self):
+        return self._name
+
+    def _set_name(self, value):
+        self._doc._record(("attr", self, "_name", self._name))
+        self._name = value
+
+    @property
+    def Id(self):
+        return self._id
+
+    @property
+    def UniqueId(self):
+        return "fake-{:012d}".format(self._id.Value)
+
+    @property
+    def Document(self):
+        return self._doc
+
+    @property
+    def IsValidObject(self):
+        return self._doc is not None and self._id.Value in self._doc._elements
+
+    @property
+    def Category(self):
+        if self._category_id is None:
+            return None
+        return self._doc._categories.get(self._category_id)
+
+    @property
+    def LevelId(self):
+        return ElementId(self._level_id) if self._level_id is not None else _INVALID
+
+    @property
+    def OwnerViewId(self):
+        return ElementId(self._owner_view_id) if self._owner_view_id is not None else _INVALID
+
+    @property
+    def ViewSpecific(self):
+        return self._owner_view_id is not None
+
+    @property
+    def Location(self):
+        return LocationCurve(self._curve) if self._curve is not None else None
+
+    def GetTypeId(self):
+        return ElementId(self._type_id) if self._type_id is not None else _INVALID
+
+    def _bounds(self):
+        """``(min x, min y, min z, max x, max y, max z)`` in model space, or None."""
+        return None
+
+    def get_BoundingBox(self, view):
+        bounds = self._bounds()
+        if bounds is None:
+            return None
+        return BoundingBoxXYZ(XYZ(*bounds[:3]), XYZ(*bounds[3:]))
+
+    def ChangeTypeId(self, type_id):
+        self._doc._record(("attr", self, "_type_id", self._type_id))
+        self._type_id = type_id.Value
+        return type_id
+
+    def _definitions(self):
+        class_parameters = self._parameters
+        for definition in class_parameters:
+            yield definition
+        if self._values:
+            for definition in self._values:
+                if definition not in class_parameters:
+                    yield definition
+
+    def LookupParameter(self, name):
+        for definition in self._definitions():
+            if definition.Name == name:
+                return Parameter(self, definition)
+        return None
+
+    def GetParameters(self, name):
+        return [Parameter(self, d) for d in self._definitions() if d.Name == name]
+
+    def get_Parameter(self, builtin_parameter):
+        value = int(builtin_parameter)
+        for definition in self._definitions():
+            if definition.BuiltInParameter._value == value:
+                return Parameter(self, definition)
+        return None
+
+    def _parameter_by_id(self, parameter_id):
+        """Parameter by definition id. Type parameters are visible to filter rules, as in Revit."""
+        for definition in self._definitions():
+            if definition.Id.Value == parameter_id:
+                return Parameter(self, definition)
+        if self._type_id is not None:
+            element_type = self._doc._elements.get(self._type_id)
+            if element_type is not None and element_type is not self:
+                return element_type._parameter_by_id(parameter_id)
+        return None
+
+    @property
+    def Parameters(self):
+        return [Parameter(self, definition) for definition in self._definitions()]
+
+    def _set_value(self, definition, value):
+        values = self._values
+        had_value = bool(values) and definition in values
+        self._doc._record(("set", self, definition, had_value, values.get(definition) if had_value else None))
+        if values is None:
+            self._values = values = {}
+        values[definition] = value
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.{}".format(type(self).__name__)
+
+    def __repr__(self):
+        element_id = self._id.Value if self._id is not None else None
+        return "<{} {} {!r}>".format(type(self).__name__, element_id, self.Name)
+
+
+class ElementType(Element):
+    __slots__ = ()
+
+    _parameters = (TYPE_NAME, FAMILY_NAME, TYPE_MARK, TYPE_COMMENTS)
+
+    @property
+    def FamilyName(self):
+        return type(self).__name__
+
+    def GetSimilarTypes(self):
+        return [e.Id for e in self._doc._iter_class(type(self))]
+
+
+class Category:
+    __slots__ = ("Id", "Name", "CategoryType", "_doc")
+
+    def __init__(self, doc, builtin_category, name):
+        self._doc = doc
+        self.Id = ElementId(builtin_category)
+        self.Name = name
+        self.CategoryType = CategoryType.Model
+
+    @property
+    def BuiltInCategory(self):
+        return BuiltInCategory.from_value(self.Id.Value)
+
+    @staticmethod
+    def GetCategory(doc, category):
+        category_id = category.Value if isinstance(category, ElementId) else int(category)
+        return doc._categories.get(category_id)
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.Category"
+
+    def __repr__(self):
+        return "<Category {}>".format(self.Name)
+
+
+class Level(Element):
+    __slots__ = ("_elevation",)
+
+    _parameters = (ELEVATION,)
+
+    def __init__(self, name, elevation=0.0, **kwargs):
+        super().__init__(name=name, category=BuiltInCategory.OST_Levels, **kwargs)
+        self._elevation = float(elevation)
+
+    @property
+    def Elevation(self):
+        return self._elevation
+
+
+class Family(Element):
+    __slots__ = ()
+
+    @property
+    def FamilyCategory(self):
+        return self.Category
+
+    @property
+    def FamilyCategoryId(self):
+        return ElementId(self._category_id)
+
+    def GetFamilySymbolIds(self):
+        family_id = self._id.Value
+        return [s.Id for s in self._doc._iter_class(FamilySymbol) if s._family_id == family_id]
+
+
+class FamilySymbol(ElementType):
+    __slots__ = ("_family_id",)
+
+    _parameters = ElementType._parameters + (FAMILY_WIDTH,)
+
+    def __init__(self, name, family, **kwargs):
+        kwargs.setdefault("category", family._category_id)
+        super().__init__(name=name, **kwargs)
+        self._family_id = family._id.Value
+
+    @property
+    def Family(self):
+        return self._doc._elements.get(self._family_id)
+
+    @property
+    def FamilyName(self):
+        return self.Family._name
+
+    @property
+    def IsActive(self):
+        return True
+
+    def Activate(self):
+        pass
+
+    def GetSimilarTypes(self):
+        return self.Family.GetFamilySymbolIds()
+
+
+class Instance(Element):
+    __slots__ = ()
+
+
+class FamilyInstance(Instance):
+    __slots__ = ("_point",)
+
+    _parameters = (ELEM_TYPE, LEVEL, MARK, COMMENTS, ELEVATION_FROM_LEVEL)
+
+    def __init__(self, symbol, point=None, **kwargs):
+        kwargs.setdefault("category", symbol._category_id)
+        super().__init__(type_id=symbol._id.Value, **kwargs)
+        self._point = point
+
+    def _get_name(self):
+        return _type_name(self)
+
+    @property
+    def Symbol(self):
+        return self._doc._elements.get(self._type_id)
+
+    @property
+    def Host(self):
+        return None
+
+    @property
+    def AssemblyInstanceId(self):
+        return _INVALID
+
+    @property
+    def Location(self):
+        return LocationPoint(self._point) if self._point is not None else None
+
+    def _bounds(self):
+        point = self._point
+        if point is None:
+            return None
+        symbol = self._doc._elements.get(self._type_id)
+        half = (symbol._values or {}).get(FAMILY_WIDTH, 3.0) / 2.0 if symbol is not None else 1.5
+        return point.X - half, point.Y - half, point.Z, point.X + half, point.Y + half, point.Z + 3.0
+
+
+class HostObjAttributes(ElementType):
+    __slots__ = ()
+
+
+class WallType(HostObjAttributes):
+    __slots__ = ("_kind",)
+
+    _parameters = ElementType._parameters + (WIDTH,)
+
+    def __init__(self, name, kind=None, **kwargs):
+        kwargs.setdefault("category", BuiltInCategory.OST_Walls)
+        super().__init__(name=name, **kwargs)
+        self._kind = kind if kind is not None else WallKind.Basic
+
+    @property
+    def Kind(self):
+        return self._kind
+
+    @property
+    def FamilyName(self):
+        return "{} Wall".format(self._kind.ToString())
+
+
+class HostObject(Element):
+    __slots__ = ()
+
+
+class Wall(HostObject):
+    __slots__ = ()
+
+    _parameters = (ELEM_TYPE, LENGTH, BASE_CONSTRAINT, MARK, COMMENTS,
+                   UNCONNECTED_HEIGHT, BASE_OFFSET, LOCATION_LINE)
+    _is_curve_driven = True
+
+    def __init__(self, wall_type, curve, **kwargs):
+        kwargs.setdefault("category", BuiltInCategory.OST_Walls)
+        super().__init__(type_id=wall_type._id.Value, curve=curve, **kwargs)
+
+    def _get_name(self):
+        return _type_name(self)
+
+    @property
+    def WallType(self):
+        return self._doc._elements.get(self._type_id)
+
+    @property
+    def Width(self):
+        return self.WallType._values.get(WIDTH, 0.0) if self.WallType._values else 0.0
+
+    def _bounds(self):
+        start, end = self._curve.GetEndPoint(0), self._curve.GetEndPoint(1)
+        half = self.Width / 2.0
+        height = (self._values or {}).get(UNCONNECTED_HEIGHT, 10.0)
+        return (min(start.X, end.X) - half, min(start.Y, end.Y) - half, min(start.Z, end.Z),
+                max(start.X, end.X) + half, max(start.Y, end.Y) + half, max(start.Z, end.Z) + height)
+
+
+class CurveElement(Element):
+    __slots__ = ()
+
+    _is_curve_driven = True
+
+
+class LinePatternElement(Element):
+    __slots__ = ()
+
+
+class FillPatternElement(Element):
+    __slots__ = ()
+
+
+class ViewFamilyType(ElementType):
+    __slots__ = ("_view_family",)
+
+    def __init__(self, name, view_family, **kwargs):
+        super().__init__(name=name, **kwargs)
+        self._view_family = view_family
+
+    @property
+    def ViewFamily(self):
+        return self._view_family
+
+    @property
+    def FamilyName(self):
+        return self._view_family.ToString()
+
+
+class View(Element):
+    __slots__ = ("_view_type", "_element_overrides", "_category_overrides")
+
+    _parameters = (VIEW_NAME,)
+
+    def __init__(self, name, view_type, **kwargs):
+        kwargs.setdefault("category", BuiltInCategory.OST_Views)
+        super().__init__(name=name, **kwargs)
+        self._view_type = view_type
+        self._element_overrides = {}
+        self._category_overrides = {}
+
+    @property
+    def ViewType(self):
+        return self._view_type
+
+    @property
+    def Title(self):
+        return self._name
+
+    @property
+    def IsTemplate(self):
+        return False
+
+    def _set_override(self, store, key, settings):
+        self._doc._record(("override", store, key, store.get(key)))
+        store[key] = settings
+
+    def SetElementOverrides(self, element_id, settings):
+        self._set_override(self._element_overrides, element_id.Value, settings)
+
+    def GetElementOverrides(self, element_id):
+        return self._element_overrides.get(element_id.Value) or OverrideGraphicSettings()
+
+    def SetCategoryOverrides(self, category_id, settings):
+        self._set_override(self._category_overrides, category_id.Value, settings)
+
+    def GetCategoryOverrides(self, category_id):
+        return self._category_overrides.get(category_id.Value) or OverrideGraphicSettings()
+
+
+class ViewPlan(View):
+    __slots__ = ()
+
+    @property
+    def GenLevel(self):
+        return self._doc._elements.get(self._level_id) if self._level_id is not None else None
+
+
+class ViewSection(View):
+    __slots__ = ()
+
+
+class View3D(View):
+    __slots__ = ()
+
+
+class ViewSheet(View):
+    __slots__ = ()
+
+
+class ViewSchedule(View):
+    __slots__ = ()
+
+
+class ViewDrafting(View):
+    __slots__ = ()
+
+
+class SpatialElement(Element):
+    __slots__ = ()
+
+
+class Area(SpatialElement):
+    __slots__ = ()
+
+
+class AreaScheme(Element):
+    __slots__ = ()
+
+
+class AssemblyInstance(Element):
+    __slots__ = ()
+
+
+class AssemblyType(FamilySymbol):
+    __slots__ = ()
+
+
+Architecture = types.ModuleType("Autodesk.Revit.DB.Architecture")
+Architecture.Room = type("Room", (SpatialElement,), {"__slots__": (), "__module__": __name__})
+Architecture.Room.ToString = lambda self: "Autodesk.Revit.DB.Architecture.Room"
+
+
+class OverrideGraphicSettings:
+    """Records every ``Set*`` call. Two instances are equal when their settings are.
+    Getter properties read the value of their ``Set*`` method (``None`` if unset)."""
+
+    # Property > key of its Set* method
+    _PROPERTIES = dict(
+        [(name, name) for name in (
+            "ProjectionLineColor", "ProjectionLinePatternId", "ProjectionLineWeight",
+            "CutLineColor", "CutLinePatternId", "CutLineWeight",
+            "ProjectionFillColor", "ProjectionFillPatternId", "CutFillColor", "CutFillPatternId",
+            "Halftone", "DetailLevel")]
+        + [("IsProjectionFillPatternVisible", "ProjectionFillPatternVisible"),
+           ("IsCutFillPatternVisible", "CutFillPatternVisible"),
+           ("Transparency", "SurfaceTransparency")])
+
+    def __init__(self, other=None):
+        self._settings = dict(other._settings) if other is not None else {}
+
+    def __getattr__(self, name):
+        if name.startswith("Set"):
+            key = name[3:]
+
+            def setter(value, _key=key, _settings=self._settings):
+                _settings[_key] = value
+                return self
+            return setter
+        if name.startswith("get_") or name.startswith("Get"):
+            return lambda: self._settings.get(name.split("_", 1)[-1].replace("Get", "", 1))
+        if name in OverrideGraphicSettings._PROPERTIES:
+            return self._settings.get(OverrideGraphicSettings._PROPERTIES[name])
+        raise AttributeError(name)
+
+    def __eq__(self, other):
+        return isinstance(other, OverrideGraphicSettings) and other._settings == self._settings
+
+    def __hash__(self):
+        return hash(tuple(sorted((k, repr(v)) for k, v in self._settings.items())))
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.OverrideGraphicSettings"
+
+
+###########
+# FILTERS #
+###########
+
+
+def _int_id(reference):
+    return reference.Value if isinstance(reference, ElementId) else int(reference)
+
+
+class ElementFilter:
+    _quick = True
+
+    def __init__(self, inverted=False):
+        self.Inverted = bool(inverted)
+
+    def _passes(self, element):
+        raise NotImplementedError
+
+    def _index(self, doc):
+        """Candidate ids from a document index, or None if the filter can't narrow the scan."""
+        return None
+
+    def PassesFilter(self, element_or_doc, element_id=None):
+        element = element_or_doc if element_id is None else element_or_doc.GetElement(element_id)
+        return self._passes(element)
+
+    @property
+    def IsElementQuickFilter(self):
+        return self._quick
+
+
+class ElementQuickFilter(ElementFilter):
+    pass
+
+
+class ElementSlowFilter(ElementFilter):
+    _quick = False
+
+
+class ElementClassFilter(ElementQuickFilter):
+    def __init__(self, type_, inverted=False):
+        super().__init__(inverted)
+        self.ElementClass = type_
+
+    def _passes(self, element):
+        return isinstance(element, self.ElementClass) != self.Inverted
+
+    def _index(self, doc):
+        return None if self.Inverted else doc._class_index((self.ElementClass,))
+
+
+class ElementMulticlassFilter(ElementQuickFilter):
+    def __init__(self, types_, inverted=False):
+        super().__init__(inverted)
+        self._types = tuple(types_)
+        if not self._types:
+            raise Exceptions.ArgumentException("The input type list is empty.")
+
+    def _passes(self, element):
+        return isinstance(element, self._types) != self.Inverted
+
+    def _index(self, doc):
+        return None if self.Inverted else doc._class_index(self._types)
+
+
+class ElementCategoryFilter(ElementQuickFilter):
+    def __init__(self, category, inverted=False):
+        super().__init__(inverted)
+        self.CategoryId = ElementId(_int_id(category))
+        self._category = self.CategoryId.Value
+
+    def _passes(self, element):
+        return (element._category_id == self._category) != self.Inverted
+
+    def _index(self, doc):
+        return None if self.Inverted else doc._category_index((self._category,))
+
+
+class ElementMulticategoryFilter(ElementQuickFilter):
+    def __init__(self, categories, inverted=False):
+        super().__init__(inverted)
+        self._categories = frozenset(_int_id(c) for c in categories)
+        if not self._categories:
+            raise Exceptions.ArgumentException("The input category list is empty.")
+
+    def GetCategoryIds(self):
+        return [ElementId(c) for c in sorted(self._categories)]
+
+    def _passes(self, element):
+        return (element._category_id in self._categories) != self.Inverted
+
+    def _index(self, doc):
+        return None if self.Inverted else doc._category_index(self._categories)
+
+
+class ElementIsElementTypeFilter(ElementQuickFilter):
+    def _passes(self, element):
+        return isinstance(element, ElementType) != self.Inverted
+
+
+class ElementIsCurveDrivenFilter(ElementQuickFilter):
+    def _passes(self, element):
+        return element._is_curve_driven != self.Inverted
+
+
+class ElementOwnerViewFilter(ElementQuickFilter):
+    def __init__(self, view_id, inverted=False):
+        super().__init__(inverted)
+        self._view = _int_id(view_id)
+
+    def _passes(self, element):
+        owner = element._owner_view_id if element._owner_view_id is not None else -1
+        return (owner == self._view) != self.Inverted
+
+
+class FamilySymbolFilter(ElementQuickFilter):
+    def __init__(self, family_id):
+        super().__init__()
+        self._family = _int_id(family_id)
+
+    def _passes(self, element):
+        return isinstance(element, FamilySymbol) and element._family_id == self._family
+
+    def _index(self, doc):
+        return doc._class_index((FamilySymbol,))
+
+
+class ExclusionFilter(ElementQuickFilter):
+    def __init__(self, element_ids):
+        super().__init__()
+        self._excluded = frozenset(_int_id(i) for i in element_ids)
+        if not self._excluded:
+            raise Exceptions.ArgumentException("The input element id collection is empty.")
+
+    def _passes(self, element):
+        return element._id.Value not in self._excluded
+
+
+class _BoundingBoxFilter(ElementQuickFilter):
+    """Tests the element bounding box, as ``get_BoundingBox(None)`` returns it."""
+
+    def __init__(self, shape, tolerance=0.0, inverted=False):
+        super().__init__(inverted)
+        self._shape = shape
+        self.Tolerance = float(tolerance)
+
+    def _passes(self, element):
+        bounds = element._bounds()
+        if bounds is None:
+            return self.Inverted
+        return self._test(Outline(XYZ(*bounds[:3]), XYZ(*bounds[3:]))) != self.Inverted
+
+    def GetTolerance(self):
+        return self.Tolerance
+
+
+class BoundingBoxIntersectsFilter(_BoundingBoxFilter):
+    def _test(self, outline):
+        return self._shape.Intersects(outline, self.Tolerance)
+
+    def GetBoundingBox(self):
+        return self._shape
+
+
+class BoundingBoxIsInsideFilter(_BoundingBoxFilter):
+    def _test(self, outline):
+        return self._shape.ContainsOtherOutline(outline, self.Tolerance)
+
+    def GetBoundingBox(self):
+        return self._shape
+
+
+class BoundingBoxContainsPointFilter(_BoundingBoxFilter):
+    def _test(self, outline):
+        return outline.Contains(self._shape, self.Tolerance)
+
+    def GetPoint(self):
+        return self._shape
+
+
+class ElementLevelFilter(ElementSlowFilter):
+    def __init__(self, level_id, inverted=False):
+        super().__init__(inverted)
+        self._level = _int_id(level_id)
+
+    def _passes(self, element):
+        return (element._level_id == self._level) != self.Inverted
+
+
+class FamilyInstanceFilter(ElementSlowFilter):
+    def __init__(self, doc, symbol_id):
+        super().__init__()
+        self._symbol = _int_id(symbol_id)
+
+    def _passes(self, element):
+        return isinstance(element, FamilyInstance) and element._type_id == self._symbol
+
+    def _index(self, doc):
+        return doc._class_index((FamilyInstance,))
+
+
+class FilterRule:
+    def ElementPasses(self, element):
+        raise NotImplementedError
+
+
+class FilterInverseRule(FilterRule):
+    def __init__(self, rule):
+        self._rule = rule
+
+    def GetInnerRule(self):
+        return self._rule
+
+    def ElementPasses(self, element):
+        return not self._rule.ElementPasses(element)
+
+
+class _ValueRule(FilterRule):
+    """Compares a parameter value. Elements without the parameter never pass."""
+
+    def __init__(self, parameter_id, operator, value, option=None):
+        self._parameter = _int_id(parameter_id)
+        self._operator = operator
+        self._value = value
+        self._option = option
+
+    def ElementPasses(self, element):
+        parameter = element._parameter_by_id(self._parameter)
+        if parameter is None:
+            return False
+        storage = parameter.StorageType._name
+        value = self._value
+        if storage == "String":
+            actual = parameter.AsString() or ""
+            if self._option is False:
+                actual, value = actual.lower(), value.lower()
+            return _STRING_OPERATORS[self._operator](actual, value)
+        if storage == "ElementId":
+            actual = parameter.AsElementId().Value
+            value = _int_id(value)
+        elif storage == "Double":
+            actual = parameter.AsDouble()
+            epsilon = self._option or 1e-9
+            if abs(actual - value) <= epsilon:
+                return self._operator in ("equals", "greater_equal", "less_equal")
+            if self._operator == "equals":
+                return False
+        else:
+            actual = parameter.AsInteger()
+        return _NUMBER_OPERATORS[self._operator](actual, value)
+
+
+_STRING_OPERATORS = {
+    "equals": lambda a, b: a == b,
+    "not_equals": lambda a, b: a != b,
+    "contains": lambda a, b: b in a,
+    "begins": lambda a, b: a.startswith(b),
+    "ends": lambda a, b: a.endswith(b),
+    "greater": lambda a, b: a > b,
+    "greater_equal": lambda a, b: a >= b,
+    "less": lambda a, b: a < b,
+    "less_equal": lambda a, b: a <= b,
+}
+
+_NUMBER_OPERATORS = {
+    "equals": lambda a, b: a == b,
+    "not_equals": lambda a, b: a != b,
+    "greater": lambda a, b: a > b,
+    "greater_equal": lambda a, b: a >= b,
+    "less": lambda a, b: a < b,
+    "less_equal": lambda a, b: a <= b,
+}
+
+
+def _rule_factory(operator):
+    return staticmethod(lambda parameter_id, value, option=None: _ValueRule(parameter_id, operator, value, option))
+
+
+class ParameterFilterRuleFactory:
+    CreateEqualsRule = _rule_factory("equals")
+    CreateNotEqualsRule = _rule_factory("not_equals")
+    CreateContainsRule = _rule_factory("contains")
+    CreateBeginsWithRule = _rule_factory("begins")
+    CreateEndsWithRule = _rule_factory("ends")
+    CreateGreaterRule = _rule_factory("greater")
+    CreateGreaterOrEqualRule = _rule_factory("greater_equal")
+    CreateLessRule = _rule_factory("less")
+    CreateLessOrEqualRule = _rule_factory("less_equal")
+
+
+class ElementParameterFilter(ElementSlowFilter):
+    def __init__(self, rules, inverted=False):
+        super().__init__(inverted)
+        self._rules = list(rules) if not isinstance(rules, FilterRule) else [rules]
+
+    def GetRules(self):
+        return list(self._rules)
+
+    def _passes(self, element):
+        return all(rule.ElementPasses(element) for rule in self._rules) != self.Inverted
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.ElementParameterFilter"
+
+
+class ElementLogicalFilter(ElementFilter):
+    def __init__(self, *filters):
+        super().__init__()
+        if len(filters) == 1:
+            filters = tuple(filters[0])
+        self._filters = list(filters)
+        self._quick = all(f._quick for f in self._filters)
+
+    def GetFilters(self):
+        return list(self._filters)
+
+
+class LogicalAndFilter(ElementLogicalFilter):
+    def _passes(self, element):
+        return all(f._passes(element) for f in self._filters)
+
+    def _index(self, doc):
+        for element_filter in self._filters:
+            candidates = element_filter._index(doc)
+            if candidates is not None:
+                return candidates
+        return None
+
+
+class LogicalOrFilter(ElementLogicalFilter):
+    def _passes(self, element):
+        return any(f._passes(element) for f in self._filters)
+
+    def _index(self, doc):
+        indexes = [f._index(doc) for f in self._filters]
+        if any(index is None for index in indexes):
+            return None
+        return _merge_unique(indexes)
+
+
+def _merge_unique(sorted_id_lists):
+    return sorted(set().union(*sorted_id_lists))
+
+
+#############
+# COLLECTOR #
+#############
+
+
+class FilteredElementCollector:
+    """Filters are applied lazily, when the collector is iterated.
+
+    As in Revit, iterating a collector without any filter raises
+    ``InvalidOperationException``.
+    """
+
+    def __init__(self, doc, scope=None):
+        self._doc = doc
+        self._scope = None
+        self._view = None
+        self._filters = []
+        if isinstance(scope, ElementId):
+            self._view = scope.Value
+        elif scope is not None:
+            self._scope = sorted({_int_id(i) for i in scope})
+
+    def _add(self, element_filter):
+        self._filters.append(element_filter)
+        return self
+
+    def OfClass(self, type_):
+        return self._add(ElementClassFilter(type_))
+
+    def OfCategory(self, category):
+        return self._add(ElementCategoryFilter(category))
+
+    def OfCategoryId(self, category_id):
+        return self._add(ElementCategoryFilter(category_id))
+
+    def WhereElementIsElementType(self):
+        return self._add(ElementIsElementTypeFilter())
+
+    def WhereElementIsNotElementType(self):
+        return self._add(ElementIsElementTypeFilter(True))
+
+    def WhereElementIsViewIndependent(self):
+        return self._add(ElementOwnerViewFilter(_INVALID))
+
+    def WhereElementIsCurveDriven(self):
+        return self._add(ElementIsCurveDrivenFilter())
+
+    def OwnedByView(self, view_id):
+        return self._add(ElementOwnerViewFilter(view_id))
+
+    def WherePasses(self, element_filter):
+        return self._add(element_filter)
+
+    def Excluding(self, element_ids):
+        return self._add(ExclusionFilter(element_ids))
+
+    def IntersectWith(self, other):
+        other_ids = {e._id.Value for e in other._iter_elements()}
+        self._scope = [e._id.Value for e in self._iter_elements() if e._id.Value in other_ids]
+        self._filters = [_PassAll()]
+        return self
+
+    def UnionWith(self, other):
+        ids = {e._id.Value for e in self._iter_elements()}
+        ids.update(e._id.Value for e in other._iter_elements())
+        self._scope = sorted(ids)
+        self._filters = [_PassAll()]
+        return self
+
+    def _candidates(self):
+        doc = self._doc
+        if self._scope is not None:
+            return self._scope
+        for element_filter in self._filters:
+            candidates = element_filter._index(doc)
+            if candidates is not None:
+                return candidates
+        return list(doc._elements)
+
+    def _iter_elements(self):
+        if not self._filters:
+            raise Exceptions.InvalidOperationException(
+                "The collector does not have a filter applied. Extraction or "
+                "iteration of elements is not permitted without a filter.")
+        elements = self._doc._elements
+        # Quick filters first, as Revit does
+        filters = sorted(self._filters, key=lambda f: not f._quick)
+        view = self._view
+        for element_id in self._candidates():
+            element = elements.get(element_id)
+            if element is None:
+                continue
+            if view is not None and not self._doc._visible_in_view(element, view):
+                continue
+            for element_filter in filters:
+                if not element_filter._passes(element):
+                    break
+            else:
+                yield element
+
+    def __iter__(self):
+        return self._iter_elements()
+
+    def GetElementIterator(self):
+        return self._iter_elements()
+
+    def ToElements(self):
+        return list(self._iter_elements())
+
+    def ToElementIds(self):
+        return [element._id for element in self._iter_elements()]
+
+    def GetElementCount(self):
+        return sum(1 for _ in self._iter_elements())
+
+    def FirstElement(self):
+        return next(self._iter_elements(), None)
+
+    def FirstElementId(self):
+        element = self.FirstElement()
+        return element._id if element is not None else _INVALID
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.FilteredElementCollector"
+
+
+class _PassAll(ElementQuickFilter):
+    def _passes(self, element):
+        return True
+
+
+################
+# TRANSACTIONS #
+################
+
+
+class Transaction:
+    def __init__(self, doc, name=None):
+        self._doc = doc
+        self._name = name
+        self._status = TransactionStatus.Uninitialized
+        self._changes = []
+
+    def Start(self, name=None):
+        if name is not None:
+            self._name = name
+        if self._status is not TransactionStatus.Uninitialized:
+            raise Exceptions.InvalidOperationException("The transaction has already been started.")
+        if self._doc._transaction is not None:
+            raise Exceptions.InvalidOperationException(
+                "Starting a new transaction is not permitted. It could be because "
+                "another transaction already started and has not been completed yet.")
+        self._doc._transaction = self
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def _end(self, status):
+        if self._status is not TransactionStatus.Started:
+            raise Exceptions.InvalidOperationException("The transaction has not been started.")
+        if self._doc._sub_transactions:
+            raise Exceptions.InvalidOperationException("A sub-transaction is still open inside the transaction.")
+        self._doc._transaction = None
+        self._status = status
+
+    def Commit(self):
+        self._end(TransactionStatus.Committed)
+        doc = self._doc
+        if doc._groups:
+            doc._groups[-1]._changes.extend(self._changes)
+        self._changes = []
+        doc.commit_count += 1
+        doc._changed()
+        return self._status
+
+    def RollBack(self):
+        self._end(TransactionStatus.RolledBack)
+        self._doc._undo(self._changes)
+        self._changes = []
+        return self._status
+
+    def GetStatus(self):
+        return self._status
+
+    def HasStarted(self):
+        return self._status is not TransactionStatus.Uninitialized
+
+    def HasEnded(self):
+        return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def GetName(self):
+        return self._name
+
+    def SetName(self, name):
+        self._name = name
+
+    def Dispose(self):
+        if self._status is TransactionStatus.Started:
+            self.RollBack()
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.Transaction"
+
+
+class SubTransaction:
+    """Marks the changes of the open transaction made since ``Start``, undone on ``RollBack``."""
+
+    def __init__(self, doc):
+        self._doc = doc
+        self._status = TransactionStatus.Uninitialized
+        self._start = None
+
+    def Start(self):
+        doc = self._doc
+        if doc._transaction is None:
+            raise Exceptions.InvalidOperationException("A sub-transaction can only be started in a transaction.")
+        if self._status is not TransactionStatus.Uninitialized:
+            raise Exceptions.InvalidOperationException("The sub-transaction has already been started.")
+        doc._sub_transactions.append(self)
+        self._start = len(doc._transaction._changes)
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def _end(self, status):
+        if self._status is not TransactionStatus.Started or self._doc._sub_transactions[-1] is not self:
+            raise Exceptions.InvalidOperationException("The sub-transaction is not the innermost open one.")
+        self._doc._sub_transactions.pop()
+        self._status = status
+
+    def Commit(self):
+        self._end(TransactionStatus.Committed)
+        return self._status
+
+    def RollBack(self):
+        self._end(TransactionStatus.RolledBack)
+        changes = self._doc._transaction._changes
+        self._doc._undo(changes[self._start:])
+        del changes[self._start:]
+        return self._status
+
+    def GetStatus(self):
+        return self._status
+
+    def HasStarted(self):
+        return self._status is not TransactionStatus.Uninitialized
+
+    def HasEnded(self):
+        return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.SubTransaction"
+
+
+class TransactionGroup:
+    def __init__(self, doc, name=None):
+        self._doc = doc
+        self._name = name
+        self._status = TransactionStatus.Uninitialized
+        self._changes = []
+
+    def Start(self, name=None):
+        if self._doc._transaction is not None:
+            raise Exceptions.InvalidOperationException(
+                "A transaction group cannot be started while a transaction is open.")
+        self._doc._groups.append(self)
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def _end(self, status):
+        if self._status is not TransactionStatus.Started or self._doc._groups[-1] is not self:
+            raise Exceptions.InvalidOperationException("The transaction group is not the innermost open group.")
+        if self._doc._transaction is not None:
+            raise Exceptions.InvalidOperationException("A transaction is still open inside the group.")
+        self._doc._groups.pop()
+        self._status = status
+
+    def Commit(self):
+        self._end(TransactionStatus.Committed)
+        if self._doc._groups:
+            self._doc._groups[-1]._changes.extend(self._changes)
+        return self._status
+
+    Assimilate = Commit
+
+    def RollBack(self):
+        self._end(TransactionStatus.RolledBack)
+        self._doc._undo(self._changes)
+        if self._changes:
+            self._doc._changed()
+        return self._status
+
+    def GetStatus(self):
+        return self._status
+
+    def HasStarted(self):
+        return self._status is not TransactionStatus.Uninitialized
+
+    def HasEnded(self):
+        return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.TransactionGroup"
+
+
+###############
+# APPLICATION #
+###############
+
+
+class _Event:
+    """A .NET event: handlers are added with ``+=`` and removed with ``-=``."""
+
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+        return self
+
+    def _raise(self, sender, args):
+        for handler in list(self.handlers):
+            handler(sender, args)
+
+
+class DocumentChangedEventArgs:
+    def __init__(self, doc):
+        self._doc = doc
+
+    def GetDocument(self):
+        return self._doc
+
+
+class DocumentClosingEventArgs:
+    def __init__(self, doc):
+        self.Document = doc
+
+
+class Application:
+    """``Autodesk.Revit.ApplicationServices.Application``: document events.
+
+    ``DocumentChanged`` is raised when a transaction commits (or a group
+    rollback undoes changes) and ``DocumentClosing`` by ``Document.Close``.
+    """
+
+    def __init__(self):
+        self.DocumentChanged = _Event()
+        self.DocumentClosing = _Event()
+
+    def ToString(self):
+        return "Autodesk.Revit.ApplicationServices.Application"
+
+
+_application = Application()
+
+
+############
+# DOCUMENT #
+############
+
+
+class Document:
+    def __init__(self, title="Project1", first_id=100000, application=None):
+        self.Title = title
+        self.Application = application or _application
+        self.IsValidObject = True
+        self.PathName = ""
+        self.IsFamilyDocument = False
+        self.IsLinked = False
+        self.IsWorkshared = False
+        self.ActiveView = None
+        self.commit_count = 0
+        self._elements = {}
+        self._by_class = {}
+        self._by_category = {}
+        self._next_id = first_id
+        self._transaction = None
+        self._sub_transactions = []
+        self._groups = []
+        self._categories = {}
+        for name, value, ui_name in CATEGORIES:
+            self._categories[value] = Category(self, getattr(BuiltInCategory, name), ui_name)
+
+    @property
+    def IsModifiable(self):
+        return self._transaction is not None
+
+    def add(self, element):
+        """Adds an element to the model (generator API, no transaction needed)."""
+        element._id = ElementId(self._next_id)
+        element._doc = self
+        self._next_id += 1
+        self._register(element)
+        return element
+
+    def _register(self, element):
+        element_id = element._id.Value
+        self._elements[element_id] = element
+        self._by_class.setdefault(type(element), []).append(element_id)
+        if element._category_id is not None:
+            self._by_category.setdefault(element._category_id, []).append(element_id)
+
+    def _class_index(self, types_):
+        lists = [ids for cls, ids in self._by_class.items() if issubclass(cls, types_)]
+        return lists[0] if len(lists) == 1 else _merge_unique(lists)
+
+    def _category_index(self, categories):
+        lists = [self._by_category[c] for c in categories if c in self._by_category]
+        return lists[0] if len(lists) == 1 else _merge_unique(lists)
+
+    def _iter_class(self, type_):
+        elements = self._elements
+        for element_id in self._class_index((type_,)):
+            element = elements.get(element_id)
+            if element is not None:
+                yield element
+
+    def _visible_in_view(self, element, view_id):
+        if isinstance(element, ElementType):
+            return False
+        return element._owner_view_id is None or element._owner_view_id == view_id
+
+    def GetElement(self, reference):
+        if isinstance(reference, ElementId):
+            return self._elements.get(reference.Value)
+        if isinstance(reference, Reference):
+            return self._elements.get(reference.ElementId.Value)
+        if isinstance(reference, str) and reference.startswith("fake-"):
+            return self._elements.get(int(reference[5:]))
+        raise Exceptions.ArgumentException("Invalid element reference: {!r}".format(reference))
+
+    def Delete(self, element_ids):
+        if isinstance(element_ids, ElementId):
+            element_ids = [element_ids]
+        deleted = []
+        for element_id in element_ids:
+            element = self._elements.get(element_id.Value)
+            if element is None:
+                continue
+            self._record(("delete", element))
+            del self._elements[element_id.Value]
+            deleted.append(element_id)
+        return deleted
+
+    def Regenerate(self):
+        pass
+
+    def _record(self, change):
+        if self._transaction is None:
+            raise Exceptions.ModificationOutsideTransactionException(
+                "Attempt to modify the model outside of transaction.")
+        self._transaction._changes.append(change)
+
+    def _undo(self, changes):
+        for change in reversed(changes):
+            kind = change[0]
+            if kind == "set":
+                _, element, definition, had_value, old = change
+                if had_value:
+                    element._values[definition] = old
+                else:
+                    del element._values[definition]
+            elif kind == "attr":
+                _, element, slot, old = change
+                setattr(element, slot, old)
+            elif kind == "delete":
+                element = change[1]
+                self._elements[element._id.Value] = element
+            elif kind == "override":
+                _, store, key, old = change
+                if old is None:
+                    store.pop(key, None)
+                else:
+                    store[key] = old
+
+    def _changed(self):
+        self.Application.DocumentChanged._raise(self.Application, DocumentChangedEventArgs(self))
+
+    def Close(self, saveModified=True):
+        self.Application.DocumentClosing._raise(self.Application, DocumentClosingEventArgs(self))
+        self.IsValidObject = False
+        return True
+
+    def ToString(self):
+        return "Autodesk.Revit.DB.Document"
+
+    def __repr__(self):
+        return "<Document {!r} elements:{}>".format(self.Title, len(self._elements))
@@ -0,0 +1,37 @@
+"""``Autodesk.Revit.Exceptions`` raised by the fake API."""
+
+
+class ApplicationException(Exception):
+    pass
+
+
+class InvalidOperationException(ApplicationException):
+    pass
+
+
+class ModificationOutsideTransactionException(InvalidOperationException):
+    pass
+
+
+class ModificationForbiddenException(InvalidOperationException):
+    pass
+
+
+class InvalidObjectException(InvalidOperationException):
+    pass
+
+
+class ArgumentException(ApplicationException):
+    pass
+
+
+class ArgumentNullException(ArgumentException):
+    pass
+
+
+class ArgumentOutOfRangeException(ArgumentException):
+    pass
+
+
+class OperationCanceledException(ApplicationException):
+    pass
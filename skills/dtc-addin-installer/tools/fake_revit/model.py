@@ -0,0 +1,144 @@
+"""Seeded generator for fake Revit models.
+
+The same arguments and seed always produce the same document, element ids
+included, so benchmark runs are comparable:
+
+    doc = build_model(walls=10000, instances=10000, seed=7)
+"""
+
+from __future__ import annotations
+
+import random
+
+from . import db as DB
+
+WALL_TYPES = [
+    ("Generic - 8\"", DB.WallKind.Basic, 8 / 12.0),
+    ("Generic - 12\"", DB.WallKind.Basic, 1.0),
+    ("Exterior - Brick on CMU", DB.WallKind.Basic, 1.25),
+    ("Interior - 4 7/8\" Partition", DB.WallKind.Basic, 4.875 / 12),
+    ("Curtain Wall 1", DB.WallKind.Curtain, 0.0),
+    ("Storefront", DB.WallKind.Curtain, 0.0),
+    ("Exterior - Brick Over CMU w Metal Stud", DB.WallKind.Stacked, 1.5),
+]
+
+# Category > [(family name, [symbol names])]
+FAMILIES = {
+    "OST_Furniture": [
+        ("Desk", ["1525 x 762mm", "1830 x 915mm"]),
+        ("Chair-Task", ["Chair-Task"]),
+        ("Table-Round", ["915mm Diameter", "1220mm Diameter"]),
+    ],
+    "OST_Doors": [
+        ("Single-Flush", ["0813 x 2134mm", "0915 x 2134mm"]),
+        ("Double-Glass", ["1830 x 2134mm"]),
+    ],
+    "OST_Windows": [
+        ("Fixed", ["0406 x 1220mm", "0610 x 1830mm"]),
+    ],
+    "OST_GenericModel": [
+        ("Box", ["Small", "Medium", "Large"]),
+    ],
+    "OST_LightingFixtures": [
+        ("Troffer", ["0600 x 1200mm"]),
+    ],
+}
+
+VIEW_KINDS = [
+    # (view family type name, view family, view type, view class)
+    ("Floor Plan", DB.ViewFamily.FloorPlan, DB.ViewType.FloorPlan, DB.ViewPlan),
+    ("Ceiling Plan", DB.ViewFamily.CeilingPlan, DB.ViewType.CeilingPlan, DB.ViewPlan),
+    ("Building Section", DB.ViewFamily.Section, DB.ViewType.Section, DB.ViewSection),
+    ("Elevation", DB.ViewFamily.Elevation, DB.ViewType.Elevation, DB.ViewSection),
+    ("3D View", DB.ViewFamily.ThreeDimensional, DB.ViewType.ThreeD, DB.View3D),
+    ("Schedule", DB.ViewFamily.Schedule, DB.ViewType.Schedule, DB.ViewSchedule),
+    ("Sheet", DB.ViewFamily.Sheet, DB.ViewType.DrawingSheet, DB.ViewSheet),
+]
+
+LINE_PATTERNS = ["Dash", "Dot", "Center", "Hidden", "Dash dot", "Long dash"]
+FILL_PATTERNS = ["<Solid fill>", "Diagonal crosshatch", "Crosshatch", "Sand", "Brick"]
+
+
+def build_model(walls=1000, instances=1000, levels=5, views=20,
+                seed=0, title="Project1", comment_ratio=0.25):
+    """Return a :class:`~fake_revit.db.Document` with the requested element counts.
+
+    Args:
+        walls: Number of walls, spread over the levels and wall types.
+        instances: Number of family instances, over every family symbol.
+        levels: Number of levels, 10 ft apart.
+        views: Number of views, cycling through :data:`VIEW_KINDS`. Plans
+            are associated to a level.
+        seed: Random seed.
+        comment_ratio: Fraction of walls and instances with a ``Comments`` value.
+    """
+    rng = random.Random(seed)
+    doc = DB.Document(title)
+    add = doc.add
+
+    level_elements = [add(DB.Level("Level {}".format(i + 1), elevation=10.0 * i))
+                      for i in range(max(levels, 1))]
+    level_ids = [level._id.Value for level in level_elements]
+
+    wall_types = []
+    for name, kind, width in WALL_TYPES:
+        wall_type = add(DB.WallType(name, kind=kind, parameters={
+            DB.WIDTH: width, DB.TYPE_MARK: "W{}".format(len(wall_types) + 1)}))
+        wall_types.append(wall_type)
+
+    symbols = []
+    for category_name, families in FAMILIES.items():
+        category = getattr(DB.BuiltInCategory, category_name)
+        for family_name, symbol_names in families:
+            family = add(DB.Family(name=family_name, category=category))
+            for symbol_name in symbol_names:
+                symbols.append(add(DB.FamilySymbol(symbol_name, family, parameters={
+                    DB.FAMILY_WIDTH: round(rng.uniform(1.0, 6.0), 3),
+                    DB.TYPE_MARK: "{}-{}".format(family_name[:2].upper(), len(symbols) + 1)})))
+
+    for name in LINE_PATTERNS:
+        add(DB.LinePatternElement(name=name))
+    for name in FILL_PATTERNS:
+        add(DB.FillPatternElement(name=name))
+
+    view_family_types = {}
+    for vft_name, view_family, _, _ in VIEW_KINDS:
+        view_family_types[vft_name] = add(DB.ViewFamilyType(vft_name, view_family))
+
+    for i in range(views):
+        vft_name, _, view_type, view_class = VIEW_KINDS[i % len(VIEW_KINDS)]
+        level_id = level_ids[(i // len(VIEW_KINDS)) % len(level_ids)]
+        is_plan = view_class is DB.ViewPlan
+        view = add(view_class(
+            "{} {}".format(vft_name, i + 1), view_type,
+            type_id=view_family_types[vft_name]._id,
+            level_id=level_id if is_plan else None))
+        if doc.ActiveView is None and is_plan:
+            doc.ActiveView = view
+
+    uniform = rng.uniform
+    random_ = rng.random
+    for i in range(walls):
+        x, y = uniform(-500, 500), uniform(-500, 500)
+        length = uniform(2.0, 40.0)
+        if random_() < 0.5:
+            end = DB.XYZ(x + length, y, 0.0)
+        else:
+            end = DB.XYZ(x, y + length, 0.0)
+        values = {DB.MARK: "W-{}".format(i + 1),
+                  DB.UNCONNECTED_HEIGHT: 10.0,
+                  DB.LOCATION_LINE: 0}
+        if random_() < comment_ratio:
+            values[DB.COMMENTS] = "Comment {}".format(i % 97)
+        add(DB.Wall(wall_types[i % len(wall_types)], DB.Line(DB.XYZ(x, y, 0.0), end),
+                    level_id=level_ids[i % len(level_ids)], parameters=values))
+
+    for i in range(instances):
+        values = {DB.MARK: "FI-{}".format(i + 1), DB.ELEVATION_FROM_LEVEL: 0.0}
+        if random_() < comment_ratio:
+            values[DB.COMMENTS] = "Comment {}".format(i % 97)
+        point = DB.XYZ(uniform(-500, 500), uniform(-500, 500), 0.0)
+        add(DB.FamilyInstance(symbols[i % len(symbols)], point=point,
+                              level_id=level_ids[i % len(level_ids)], parameters=values))
+
+    return doc
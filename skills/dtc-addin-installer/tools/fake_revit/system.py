@@ -0,0 +1,110 @@
+"""Stand-ins for the ``clr`` and ``System`` modules rpw imports through pythonnet."""
+
+from __future__ import annotations
+
+import os
+import types
+
+
+def _make_clr() -> types.ModuleType:
+    clr = types.ModuleType("clr")
+    clr.references = []
+
+    def AddReference(name):
+        clr.references.append(name)
+
+    clr.AddReference = AddReference
+    # Fake API classes are plain python types
+    clr.GetClrType = lambda python_type: python_type
+    clr.AddReferenceByPartialName = AddReference
+    clr.AddReferenceToFileAndPath = AddReference
+    return clr
+
+
+class _TypedList(list):
+    """``System.Collections.Generic.List[T]``: a python list with the .NET members rpw uses."""
+
+    item_type = object
+
+    @property
+    def Count(self):
+        return len(self)
+
+    def Add(self, item):
+        self.append(item)
+
+    def AddRange(self, items):
+        self.extend(items)
+
+    def Contains(self, item):
+        return item in self
+
+    def Clear(self):
+        del self[:]
+
+
+class _GenericList:
+    """``List`` is subscripted with the item type before being called: ``List[DB.ElementId](ids)``."""
+
+    def __init__(self):
+        self._types = {}
+
+    def __getitem__(self, item_type):
+        if item_type not in self._types:
+            name = "List[{}]".format(getattr(item_type, "__name__", item_type))
+            self._types[item_type] = type(name, (_TypedList,), {"item_type": item_type})
+        return self._types[item_type]
+
+    def __call__(self, items=()):
+        return _TypedList(items)
+
+
+class Enum:
+    @staticmethod
+    def ToObject(enum_type, value):
+        return enum_type.from_value(int(value))
+
+    @staticmethod
+    def GetNames(enum_type):
+        return [member.ToString() for member in enum_type.members()]
+
+    @staticmethod
+    def GetValues(enum_type):
+        return list(enum_type.members())
+
+
+class _Process:
+    ProcessName = "Revit"
+
+    def __init__(self):
+        self.Id = os.getpid()
+
+    @classmethod
+    def GetCurrentProcess(cls):
+        return cls()
+
+
+def make_modules() -> dict:
+    """Return ``{module name: module}`` for ``clr`` and the ``System`` namespaces."""
+    system = types.ModuleType("System")
+    system.Enum = Enum
+    system.Exception = Exception
+    system.Type = type
+
+    collections = types.ModuleType("System.Collections")
+    generic = types.ModuleType("System.Collections.Generic")
+    generic.List = _GenericList()
+    collections.Generic = generic
+    system.Collections = collections
+
+    diagnostics = types.ModuleType("System.Diagnostics")
+    diagnostics.Process = _Process
+    system.Diagnostics = diagnostics
+
+    return {
+        "clr": _make_clr(),
+        "System": system,
+        "System.Collections": collections,
+        "System.Collections.Generic": generic,
+        "System.Diagnostics": diagnostics,
+    }
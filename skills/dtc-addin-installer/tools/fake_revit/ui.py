@@ -0,0 +1,52 @@
+"""``Autodesk.Revit.UI``: application, document and selection handles."""
+
+from __future__ import annotations
+
+import getpass
+
+from . import ui_selection as Selection
+
+
+class ControlledApplication:
+    VersionNumber = "2026"
+    VersionName = "Autodesk Revit 2026"
+    VersionBuild = "26.0.0.0"
+
+    def __init__(self, documents):
+        self.Documents = documents
+        try:
+            self.Username = getpass.getuser()
+        except Exception:
+            self.Username = "fake"
+
+
+class UIApplication:
+    def __init__(self, doc):
+        self.ActiveUIDocument = UIDocument(doc)
+        self.Application = ControlledApplication([doc])
+
+    def ToString(self):
+        return "Autodesk.Revit.UI.UIApplication"
+
+
+class UIDocument:
+    def __init__(self, doc):
+        self.Document = doc
+        self.Selection = Selection.Selection(doc)
+
+    @property
+    def ActiveView(self):
+        return self.Document.ActiveView
+
+    @ActiveView.setter
+    def ActiveView(self, view):
+        self.Document.ActiveView = view
+
+    def ToString(self):
+        return "Autodesk.Revit.UI.UIDocument"
+
+
+class TaskDialog:
+    @staticmethod
+    def Show(title, message, *args):
+        print("[{}] {}".format(title, message))
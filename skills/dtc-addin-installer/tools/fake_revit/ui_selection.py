@@ -0,0 +1,51 @@
+"""``Autodesk.Revit.UI.Selection``."""
+
+from __future__ import annotations
+
+from . import db as DB
+from .exceptions import OperationCanceledException
+
+
+class Selection:
+    """``UI.Selection.Selection``. Counts ``SetElementIds`` calls, which repaint the UI in Revit."""
+
+    def __init__(self, doc=None):
+        self._doc = doc
+        self._ids = []
+        self.set_calls = 0
+
+    def GetElementIds(self):
+        return list(self._ids)
+
+    def SetElementIds(self, element_ids):
+        self.set_calls += 1
+        self._ids = list(element_ids)
+
+    def PickObject(self, *args):
+        raise OperationCanceledException("Picking is not available in the fake UI.")
+
+    PickObjects = PickElementsByRectangle = PickBox = PickPoint = PickObject
+
+    def ToString(self):
+        return "Autodesk.Revit.UI.Selection.Selection"
+
+
+def _enum(name, members):
+    enum_type = type(name, (DB._EnumMember,), {"__slots__": (), "__module__": __name__})
+    return DB._populate(enum_type, [(member, value) for value, member in enumerate(members)])
+
+
+class ISelectionFilter:
+    def AllowElement(self, element):
+        return True
+
+    def AllowReference(self, reference, point):
+        return True
+
+
+ObjectType = _enum("ObjectType", [
+    "Nothing", "Element", "PointOnElement", "Edge", "Face", "LinkedElement", "Subelement"])
+ObjectSnapTypes = _enum("ObjectSnapTypes", [
+    "None", "Endpoints", "Midpoints", "Nearest", "WorkPlaneGrid", "Intersections",
+    "Centers", "Perpendicular", "Tangents", "Quadrants", "Points"])
+PickBoxStyle = _enum("PickBoxStyle", ["Crossing", "Enclosing", "Directional"])
@@ -0,0 +1,257 @@
+"""Attribute Revit startup time and RAM to add-in manifests, with load budgets.
+
+Reads the ``.addin`` manifests (by default the DTCAI bundle in
+``dtc-addin-installer/assets`` and ``assets/Dynamo.addin``), matches their
+applications to the add-in load segments of each journal, and prints every
+add-in the journal loaded, slowest first:
+
+    python addin_report.py ../assets/journal.0004.txt
+    python addin_report.py journal.0042.txt --budget DTCAI.Addin=500
+    python addin_report.py journal.0042.txt --manifest MyAddin.addin --json
+
+Times are the interpolated estimates of ``revit_journal.AddinLoad``: an
+add-in is matched to its manifest by class name, then by name. A manifest
+with several applications is charged for all of them.
+
+``--budget NAME=MS`` checks that the add-in loaded within MS milliseconds,
+to gate an install. NAME is the add-in name (manifest or journal) or the
+manifest file name. The journal only bounds a load by the timestamp
+intervals it falls in (``resolution``), so a budget is:
+
+- ``ok`` when those intervals fit in it,
+- ``over`` when the estimate exceeds it,
+- ``inconclusive`` otherwise: the estimate is within the budget, but the
+  intervals are too long to show the load was,
+- ``missing`` when the add-in did not load.
+
+Exit codes: 0 when every budget is ``ok`` or ``inconclusive``, 1 when one is
+``over`` or ``missing`` (or ``inconclusive``, with ``--strict``), 2 when a
+manifest cannot be read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import xml.etree.ElementTree as ElementTree
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from revit_journal import Journal, parse_journal
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_MANIFESTS = (
+    SKILLS_DIR / "dtc-addin-installer" / "assets",
+    SKILLS_DIR / "revit-dynamo-start" / "assets" / "Dynamo.addin",
+)
+
+Manifest = namedtuple("Manifest", "path name class_name assembly addin_id")
+
+
+def read_manifests(paths: Iterable) -> List[Manifest]:
+    """The ``<AddIn>`` entries of .addin files; folders are searched
+    recursively. Entries repeated with the same AddInId are kept once."""
+    manifests = []
+    seen = set()
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob("*.addin")) if path.is_dir() else [path]
+        for file in files:
+            # ElementTree skips the byte order mark of the DTCAI manifest
+            for addin in ElementTree.parse(file).getroot().iter("AddIn"):
+                manifest = Manifest(file, addin.findtext("Name", "").strip(),
+                                    addin.findtext("FullClassName", "").strip(),
+                                    addin.findtext("Assembly", "").strip(),
+                                    addin.findtext("AddInId", "").strip().lower())
+                key = manifest.addin_id or (manifest.name, manifest.class_name)
+                if key not in seen:
+                    seen.add(key)
+                    manifests.append(manifest)
+    return manifests
+
+
+def _find_manifest(load, manifests: List[Manifest]) -> Optional[Manifest]:
+    for manifest in manifests:
+        if manifest.class_name and manifest.class_name == load.class_name:
+            return manifest
+    name = load.name.lower()
+    for manifest in manifests:
+        if manifest.name.lower() == name:
+            return manifest
+    return None
+
+
+def attribute(journal: Journal, manifests: List[Manifest]) -> List[dict]:
+    """One row per add-in: loads of the same manifest (or, without one, the
+    same name) are added up. ``resolution`` is the total length of the
+    distinct timestamp intervals they fall in. Slowest first; manifests that
+    did not load last."""
+    rows = {}
+    intervals = {}
+    for load in journal.addins:
+        manifest = _find_manifest(load, manifests)
+        key = manifest if manifest is not None else load.name
+        row = rows.get(key)
+        if row is None:
+            row = rows[key] = {
+                "name": manifest.name if manifest else load.name,
+                "manifest": str(manifest.path) if manifest else None,
+                "loaded": True,
+                "applications": [],
+                "seconds": 0.0,
+                "resolution": 0.0,
+                "ram_delta_mb": None,
+                "lines": [],
+            }
+        row["applications"].append(load.name)
+        row["seconds"] += load.seconds
+        # Loads of one interval share it: a DB and a UI application can be
+        # timed between the same two timestamps, or between different ones
+        if load.interval not in intervals.setdefault(key, set()):
+            intervals[key].add(load.interval)
+            row["resolution"] += load.resolution
+        if load.ram_delta is not None:
+            row["ram_delta_mb"] = (row["ram_delta_mb"] or 0) + load.ram_delta
+        row["lines"].append([load.start_line, load.line])
+
+    ranked = sorted(rows.values(), key=lambda row: -row["seconds"])
+    for row in ranked:
+        row["seconds"] = round(row["seconds"], 3)
+        row["resolution"] = round(row["resolution"], 3)
+    for manifest in manifests:
+        if manifest not in rows:
+            ranked.append({"name": manifest.name, "manifest": str(manifest.path), "loaded": False,
+                           "applications": [], "seconds": None, "resolution": None,
+                           "ram_delta_mb": None, "lines": []})
+    return ranked
+
+
+def parse_budget(text: str) -> tuple:
+    """``NAME=MS`` -> (NAME, MS)."""
+    name, sep, limit = text.rpartition("=")
+    try:
+        if not sep or not name:
+            raise ValueError(text)
+        return name.strip(), float(limit)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=MS, got {text!r}")
+
+
+def _matches(row: dict, name: str) -> bool:
+    name = name.lower()
+    if row["name"].lower() == name or name in (app.lower() for app in row["applications"]):
+        return True
+    if row["manifest"] is not None:
+        manifest = Path(row["manifest"])
+        return name in (manifest.name.lower(), manifest.stem.lower())
+    return False
+
+
+def check_budgets(rows: List[dict], budgets: Dict[str, float]) -> List[dict]:
+    """One result per budget: ``ok`` (the timestamp intervals of the load
+    fit in the budget), ``over`` (the estimate exceeds it), ``inconclusive``
+    (neither: the estimate is an interpolation, not a measurement) or
+    ``missing`` (never loaded). ``estimated_ms`` is the interpolated time and
+    ``max_ms`` the timestamp intervals that bound it.
+    """
+    results = []
+    for name, limit_ms in budgets.items():
+        row = next((row for row in rows if _matches(row, name)), None)
+        if row is None or not row["loaded"]:
+            results.append({"name": name, "budget_ms": limit_ms, "estimated_ms": None, "max_ms": None,
+                            "status": "missing"})
+            continue
+        estimated_ms = round(row["seconds"] * 1000)
+        max_ms = round(row["resolution"] * 1000)
+        if max_ms <= limit_ms:
+            status = "ok"
+        elif estimated_ms > limit_ms:
+            status = "over"
+        else:
+            status = "inconclusive"
+        results.append({"name": name, "budget_ms": limit_ms, "estimated_ms": estimated_ms,
+                        "max_ms": max_ms, "status": status})
+    return results
+
+
+def format_report(journal: Journal, rows: List[dict], results: List[dict]) -> str:
+    loaded = [row for row in rows if row["loaded"]]
+    ram = sum(row["ram_delta_mb"] or 0 for row in loaded)
+    lines = [
+        f"{journal.path.name}  {len(journal.addins)} add-in applications  "
+        f"~{sum(row['seconds'] for row in loaded):.3f}s (estimated)  {ram:+d} MB",
+        "",
+        f"  {'rank':>4}  {'~seconds':>9}  {'+/-':>6}  {'RAM':>8}  {'add-in':<36}  manifest",
+    ]
+    for rank, row in enumerate(rows, 1):
+        manifest = Path(row["manifest"]).name if row["manifest"] else "-"
+        if not row["loaded"]:
+            lines.append(f"  {'-':>4}  {'-':>9}  {'':>6}  {'':>8}  {row['name']:<36}  {manifest} (not loaded)")
+            continue
+        ram = "" if row["ram_delta_mb"] is None else f"{row['ram_delta_mb']:+d} MB"
+        lines.append(f"  {rank:>4}  {row['seconds']:8.3f}s  {row['resolution']:5.1f}s  {ram:>8}  "
+                     f"{row['name'][:36]:<36}  {manifest}")
+    if results:
+        lines += ["", "Budgets:"]
+        for result in results:
+            budget = f"(budget {result['budget_ms']:g} ms)"
+            if result["status"] == "missing":
+                lines.append(f"  FAIL  {result['name']}: not loaded {budget}")
+            elif result["status"] == "ok":
+                lines.append(f"  OK    {result['name']}: at most {result['max_ms']} ms, "
+                             f"~{result['estimated_ms']} ms estimated {budget}")
+            elif result["status"] == "over":
+                lines.append(f"  FAIL  {result['name']}: ~{result['estimated_ms']} ms estimated, "
+                             f"at most {result['max_ms']} ms {budget}")
+            else:
+                lines.append(f"  ?     {result['name']}: inconclusive, ~{result['estimated_ms']} ms estimated "
+                             f"within {result['max_ms']} ms of timestamp intervals {budget}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Attribute Revit startup time and RAM to add-in manifests.")
+    parser.add_argument("journals", nargs="+", type=Path, help="Journal files (journal.NNNN.txt)")
+    parser.add_argument("--manifest", action="append", type=Path, default=None,
+                        help=".addin file or folder (repeatable; default: the DTCAI bundle and Dynamo.addin)")
+    parser.add_argument("--budget", action="append", type=parse_budget, default=[], metavar="NAME=MS",
+                        help="Fail when NAME loads slower than MS milliseconds (estimated), or not at all "
+                             "(repeatable)")
+    parser.add_argument("--strict", action="store_true",
+                        help="Also fail budgets the journal cannot show were met (inconclusive)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    try:
+        manifests = read_manifests(args.manifest or [path for path in DEFAULT_MANIFESTS if path.exists()])
+    except (OSError, ElementTree.ParseError) as exc:
+        print(f"error: cannot read manifest: {exc}", file=sys.stderr)
+        return 2
+    budgets = dict(args.budget)
+    failing = ("over", "missing", "inconclusive") if args.strict else ("over", "missing")
+
+    failed = False
+    reports = []
+    for path in args.journals:
+        journal = parse_journal(path)
+        rows = attribute(journal, manifests)
+        results = check_budgets(rows, budgets)
+        failed = failed or any(result["status"] in failing for result in results)
+        reports.append((journal, rows, results))
+
+    if args.json:
+        data = [{"journal": str(journal.path), "addins": rows, "budgets": results}
+                for journal, rows, results in reports]
+        print(json.dumps(data[0] if len(data) == 1 else data, indent=2))
+    else:
+        print("\n\n".join(format_report(*report) for report in reports))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        sys.exit(1)
@@ -0,0 +1,273 @@
+"""Render journal scripts for batches of models and Dynamo graphs, run them on
+concurrent Revit workers and collect the timings of each run.
+
+Every run is ``assets/journal_template.txt`` rendered for one model (the
+bundled template by default) and, optionally, one Dynamo graph that Dynamo
+opens and runs once it has started:
+
+    python journal_batch.py --model C:\\Models --workers 3
+    python journal_batch.py --graph C:\\Graphs\\a.dyn C:\\Graphs\\b.dyn --version 2024
+    python journal_batch.py --model a.rvt b.rvt --graph c.dyn --dry-run
+
+Runs are queued and each of the ``--workers`` slots starts the next one
+when its Revit exits, through ``launch-revit-<version>.cmd <script>``
+(``--launcher`` replaces it, e.g. with a stub outside Windows). Afterwards the
+journals Revit wrote since the batch started are matched to the runs by the
+script they played back, and their startup and playback times are reported.
+
+Scripts end by quitting Revit (``--keep-open`` to stay): a run whose model
+or graph leaves a dialog open (e.g. unsaved changes) waits for ``--timeout``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import ntpath
+import os
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+from revit_journal import parse_journal
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+ASSETS_DIR = SKILL_DIR / "assets"
+SCRIPTS_DIR = SKILL_DIR / "scripts"
+JOURNAL_TEMPLATE = ASSETS_DIR / "journal_template.txt"
+DEFAULT_MODEL = ASSETS_DIR / "2024templaterevitskill.rte"
+
+PLACEHOLDER = "{{TEMPLATE_PATH}}"
+DYNAMO_LAUNCH = "ID_VISUAL_PROGRAMMING_DYNAMO"
+TEMPLATE_DIALOG = "TaskDialog_Template_File"
+MODEL_SUFFIXES = (".rvt", ".rte")
+GRAPH_SUFFIXES = (".dyn",)
+# Journal keys read by Dynamo for Revit when it is launched from a journal
+DYNAMO_GRAPH_DATA = ('Jrn.Data "APIStringStringMapJournalData" , 5 , "dynPath" , {path} , '
+                     '"dynShowUI" , "false" , "dynAutomation" , "true" , "dynPathExecute" , "true" , '
+                     '"dynModelShutDown" , "true"')
+QUIT_LINES = ('Jrn.Command "SystemMenu" , "Quit the application; prompts to save projects , ID_APP_EXIT"',)
+
+Run = namedtuple("Run", "index model graph script")
+
+
+def _journal_string(value) -> str:
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def render(template: str, model, graph=None, quit: bool = True) -> str:
+    """The journal script of one run: opens ``model``, launches Dynamo and runs
+    ``graph`` (if any), then quits Revit unless ``quit`` is False."""
+    lines = []
+    for line in template.split("\n"):
+        if TEMPLATE_DIALOG in line and Path(str(model)).suffix.lower() != ".rte":
+            # Only templates ask whether to create a project; drop its comment too
+            if lines and lines[-1].startswith("'") and "BLOCK" not in lines[-1]:
+                lines.pop()
+            continue
+        lines.append(line.replace(PLACEHOLDER, str(model)))
+        if graph is not None and DYNAMO_LAUNCH in line:
+            lines.append(DYNAMO_GRAPH_DATA.format(path=_journal_string(graph)))
+    if graph is not None and not any(DYNAMO_LAUNCH in line for line in lines):
+        raise ValueError("the journal template does not launch Dynamo: cannot run a graph")
+
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if quit:
+        lines += [""] + list(QUIT_LINES)
+    text = "\n".join(lines) + "\n"
+    try:
+        text.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(f"journal scripts are ASCII: cannot reference {model} / {graph}")
+    return text
+
+
+def expand(paths: Iterable, suffixes: Sequence[str]) -> List[Path]:
+    """Absolute paths of ``paths``; folders are replaced by the files in them
+    with one of ``suffixes``. Revit journals need absolute paths."""
+    files = []
+    for path in paths:
+        path = Path(path).resolve()
+        if path.is_dir():
+            files += sorted(file for file in path.iterdir() if file.suffix.lower() in suffixes)
+        else:
+            files.append(path)
+    return files
+
+
+def plan(models: Sequence, graphs: Sequence, out_dir, template: Optional[str] = None,
+         quit: bool = True) -> List[Run]:
+    """Writes one ``journal_run.NNNN.txt`` to ``out_dir`` per model and graph
+    pair. Without graphs, every model is opened once."""
+    if template is None:
+        template = JOURNAL_TEMPLATE.read_text(encoding="ascii")
+    out_dir = Path(out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    runs = []
+    for model in models or [DEFAULT_MODEL]:
+        for graph in graphs or [None]:
+            index = len(runs) + 1
+            script = out_dir / f"journal_run.{index:04d}.txt"
+            with open(script, "w", encoding="ascii", newline="\n") as f:
+                f.write(render(template, model, graph, quit))
+            runs.append(Run(index, str(model), None if graph is None else str(graph), str(script)))
+    return runs
+
+
+def default_launcher(version: str) -> List[str]:
+    return launcher_command(SCRIPTS_DIR / f"launch-revit-{version}.cmd")
+
+
+def launcher_command(program) -> List[str]:
+    """Command line prefix that runs ``program`` with the script as last argument."""
+    program = str(program)
+    suffix = Path(program).suffix.lower()
+    if suffix in (".cmd", ".bat"):
+        return ["cmd", "/c", program]
+    if suffix == ".py":
+        return [sys.executable, program]
+    return [program]
+
+
+def default_journals_dir(version: str) -> Path:
+    local = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    return Path(local) / "Autodesk" / "Revit" / f"Autodesk Revit {version}" / "Journals"
+
+
+def launch(command: Sequence[str], run: Run, timeout: Optional[float] = None) -> dict:
+    """Runs one script through the launcher and waits for it."""
+    result = {"run": run.index, "model": run.model, "graph": run.graph, "script": run.script,
+              "status": "ok", "returncode": None, "wall": None, "output": ""}
+    start = time.monotonic()
+    try:
+        completed = subprocess.run(list(command) + [run.script], stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, timeout=timeout)
+    except subprocess.TimeoutExpired as exc:
+        result["status"] = "timeout"
+        output = exc.output or b""
+    except OSError as exc:
+        result["status"] = "failed"
+        output = str(exc).encode()
+    else:
+        result["returncode"] = completed.returncode
+        if completed.returncode != 0:
+            result["status"] = "failed"
+        output = completed.stdout
+    result["wall"] = round(time.monotonic() - start, 3)
+    result["output"] = output.decode("latin-1").strip()[-500:]
+    return result
+
+
+def run_batch(runs: Sequence[Run], command: Sequence[str], workers: int = 1,
+              timeout: Optional[float] = None) -> List[dict]:
+    """Runs the scripts with at most ``workers`` at a time; results in run order."""
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        return list(pool.map(lambda run: launch(command, run, timeout), runs))
+
+
+def _script_key(path) -> str:
+    return ntpath.normcase(ntpath.normpath(str(path)))
+
+
+def collect_timings(results: List[dict], journals_dir, since: float = 0.0) -> List[dict]:
+    """Adds the timings of the journal that played back each run's script,
+    among the journals of ``journals_dir`` modified after ``since`` (epoch
+    seconds). Runs without a journal keep ``journal`` None."""
+    by_script = {_script_key(result["script"]): result for result in results}
+    for result in results:
+        result.update(journal=None, startup=None, playback=None, duration=None, peak_ram_mb=None, errors=None)
+    journals_dir = Path(journals_dir)
+    if not journals_dir.is_dir():
+        return results
+    for path in sorted(journals_dir.glob("journal.[0-9]*.txt")):
+        if path.stat().st_mtime < since:
+            continue
+        journal = parse_journal(path)
+        result = by_script.get(_script_key(journal.playback_script or ""))
+        if result is None:
+            continue
+        result.update(journal=str(path), startup=_round(journal.startup), playback=_round(journal.playback),
+                      duration=round(journal.duration, 3), peak_ram_mb=journal.peak_ram,
+                      errors=len(journal.errors))
+    return results
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
+def _seconds(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}s"
+
+
+def format_results(results: List[dict], wall: float) -> str:
+    busy = sum(result["wall"] or 0 for result in results)
+    failed = sum(result["status"] != "ok" for result in results)
+    lines = [f"{len(results)} runs in {wall:.3f}s ({busy:.3f}s of Revit time)  {failed} failed", "",
+             f"  {'run':>4}  {'status':<8}  {'wall':>9}  {'startup':>9}  {'playback':>9}  {'RAM':>8}  model / graph"]
+    for result in results:
+        ram = "" if result.get("peak_ram_mb") is None else f"{result['peak_ram_mb']} MB"
+        target = Path(result["model"]).name + ("" if result["graph"] is None else f" / {Path(result['graph']).name}")
+        lines.append(f"  {result['run']:>4}  {result['status']:<8}  {_seconds(result['wall']):>9}  "
+                     f"{_seconds(result.get('startup')):>9}  {_seconds(result.get('playback')):>9}  {ram:>8}  {target}")
+    missing = [result["run"] for result in results if result["status"] == "ok" and result.get("journal") is None]
+    if missing:
+        lines += ["", f"No journal found for runs {', '.join(map(str, missing))}"]
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render and run Revit journals for batches of models and graphs.")
+    parser.add_argument("--model", nargs="+", action="extend", default=[], type=Path,
+                        help=".rvt/.rte files or folders (default: the bundled template)")
+    parser.add_argument("--graph", nargs="+", action="extend", default=[], type=Path,
+                        help=".dyn files or folders, each run on every model")
+    parser.add_argument("--workers", type=int, default=1, help="Revit instances run at the same time (default: 1)")
+    parser.add_argument("--version", default="2024", help="Revit version to launch (default: 2024)")
+    parser.add_argument("--launcher", help="Program run with each script (default: launch-revit-<version>.cmd)")
+    parser.add_argument("--journals", type=Path,
+                        help="Folder where Revit writes its journals (default: the one of --version)")
+    parser.add_argument("--out", type=Path, help="Folder for the scripts (default: assets/runs/<date-time>)")
+    parser.add_argument("--timeout", type=float, help="Seconds to wait for one run")
+    parser.add_argument("--keep-open", action="store_true", help="Do not quit Revit at the end of each script")
+    parser.add_argument("--dry-run", action="store_true", help="Only write the scripts")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    out_dir = args.out or ASSETS_DIR / "runs" / datetime.now().strftime("%Y%m%d-%H%M%S")
+    try:
+        runs = plan(expand(args.model, MODEL_SUFFIXES), expand(args.graph, GRAPH_SUFFIXES), out_dir,
+                    quit=not args.keep_open)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    if args.dry_run:
+        for run in runs:
+            print(run.script)
+        return 0
+
+    command = launcher_command(args.launcher) if args.launcher else default_launcher(args.version)
+    since = time.time()
+    start = time.monotonic()
+    results = run_batch(runs, command, args.workers, args.timeout)
+    wall = time.monotonic() - start
+    collect_timings(results, args.journals or default_journals_dir(args.version), since)
+
+    report = {"wall": round(wall, 3), "workers": args.workers, "runs": results}
+    with open(Path(out_dir) / "results.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2) if args.json else format_results(results, wall))
+    return 1 if any(result["status"] != "ok" for result in results) else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        sys.exit(1)
@@ -0,0 +1,322 @@
+"""Index Revit journals into SQLite and report regressions between runs.
+
+Every launch leaves a journal; this keeps a compact summary of each one
+(startup and playback time, phase durations, peak RAM, add-in load times,
+API errors) in a local SQLite database, so launches can be compared:
+
+    python journal_index.py index "%LOCALAPPDATA%\\Autodesk\\Revit\\Autodesk Revit 2024\\Journals"
+    python journal_index.py runs
+    python journal_index.py regressions
+    python journal_index.py regressions --threshold 40 --baseline 10 --json
+
+``index`` only parses files that are new or changed since they were last
+indexed (by size and modification time), in a process pool. Runs stay in
+the database when Revit deletes old journals.
+
+``regressions`` compares the latest run with the median of the runs
+before it and lists every metric (``startup``, ``phase:loadAllDB``,
+``addin:Dynamo For Revit``, ...) that got slower by more than the
+threshold. It exits with 1 if it finds any.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from revit_journal import parse_journal
+
+DEFAULT_DB = Path(os.environ.get("LOCALAPPDATA") or Path.home() / ".cache") / "revit-dynamo-start" / "journals.sqlite"
+JOURNAL_PATTERNS = ("journal.*.txt", "journal.*.log")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    started TEXT,
+    release TEXT,
+    build TEXT,
+    duration REAL,
+    startup REAL,
+    playback REAL,
+    peak_ram_mb INTEGER,
+    lines INTEGER,
+    errors INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (kind, started);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE TABLE IF NOT EXISTS addins (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    resolution REAL,
+    ram_delta_mb INTEGER,
+    PRIMARY KEY (run_id, name)
+);
+CREATE TABLE IF NOT EXISTS errors (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    text TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, text)
+);
+"""
+
+# Metrics where a higher value is a regression, besides phases and add-ins
+RUN_METRICS = ("startup", "playback", "peak_ram_mb")
+
+
+def connect(path) -> sqlite3.Connection:
+    path = Path(path)
+    if str(path) != ":memory:":
+        path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path))
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def summarize_run(path) -> dict:
+    """Compact summary of one journal. Runs in the pool workers."""
+    journal = parse_journal(path)
+    phases = journal.phase_durations()
+    addins = {}
+    intervals = {}
+    for load in journal.addins:
+        # An add-in can start a DB and a UI application under the same name,
+        # timed within the same or different timestamp intervals
+        seconds, resolution, ram = addins.get(load.name, (0.0, 0.0, 0))
+        if load.interval not in intervals.setdefault(load.name, set()):
+            intervals[load.name].add(load.interval)
+            resolution += load.resolution
+        addins[load.name] = (seconds + load.seconds, resolution, ram + (load.ram_delta or 0))
+    errors = {}
+    for error in journal.errors:
+        errors[error.text] = errors.get(error.text, 0) + 1
+    return {
+        "kind": "worker" if ".worker" in Path(path).name else "journal",
+        "started": journal.started.isoformat(sep=" ", timespec="milliseconds") if journal.started else None,
+        "release": journal.info.get("Release"),
+        "build": journal.info.get("Build"),
+        "duration": journal.duration,
+        "startup": journal.startup,
+        "playback": journal.playback,
+        "peak_ram_mb": journal.peak_ram,
+        "lines": journal.lines,
+        "errors": errors,
+        "phases": phases,
+        "addins": addins,
+    }
+
+
+def find_journals(paths: Iterable) -> List[Path]:
+    """Journal files among ``paths``; folders are searched (not recursively)."""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            for pattern in JOURNAL_PATTERNS:
+                found.extend(path.glob(pattern))
+        elif path.is_file():
+            found.append(path)
+    return sorted({path.resolve() for path in found})
+
+
+def _store(connection: sqlite3.Connection, path: str, stat: os.stat_result, summary: dict):
+    connection.execute("DELETE FROM runs WHERE path = ?", (path,))
+    cursor = connection.execute(
+        "INSERT INTO runs (path, size, mtime_ns, kind, started, release, build, duration, startup, playback,"
+        " peak_ram_mb, lines, errors) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (path, stat.st_size, stat.st_mtime_ns, summary["kind"], summary["started"], summary["release"],
+         summary["build"], summary["duration"], summary["startup"], summary["playback"],
+         summary["peak_ram_mb"], summary["lines"], sum(summary["errors"].values())))
+    run_id = cursor.lastrowid
+    connection.executemany("INSERT INTO phases VALUES (?, ?, ?)",
+                           [(run_id, name, seconds) for name, seconds in summary["phases"].items()])
+    connection.executemany("INSERT INTO addins VALUES (?, ?, ?, ?, ?)",
+                           [(run_id, name, *values) for name, values in summary["addins"].items()])
+    connection.executemany("INSERT INTO errors VALUES (?, ?, ?)",
+                           [(run_id, text, count) for text, count in summary["errors"].items()])
+
+
+def index(connection: sqlite3.Connection, paths: Iterable, jobs: Optional[int] = None) -> dict:
+    """Parses the new and changed journals among ``paths`` and stores their summaries.
+
+    Returns counts of ``indexed`` and ``unchanged`` files.
+    """
+    known = {path: (size, mtime_ns) for path, size, mtime_ns in
+             connection.execute("SELECT path, size, mtime_ns FROM runs")}
+    todo = []
+    unchanged = 0
+    for path in find_journals(paths):
+        stat = path.stat()
+        if known.get(str(path)) == (stat.st_size, stat.st_mtime_ns):
+            unchanged += 1
+        else:
+            todo.append((path, stat))
+
+    if len(todo) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            summaries = list(executor.map(summarize_run, [path for path, _ in todo]))
+    else:
+        summaries = [summarize_run(path) for path, _ in todo]
+
+    with connection:
+        for (path, stat), summary in zip(todo, summaries):
+            _store(connection, str(path), stat, summary)
+    return {"indexed": len(todo), "unchanged": unchanged}
+
+
+def list_runs(connection: sqlite3.Connection, kind: str = "journal") -> List[dict]:
+    """Indexed runs of one kind (``journal`` or ``worker``), oldest first."""
+    cursor = connection.execute(
+        "SELECT id, path, started, release, startup, playback, peak_ram_mb, errors FROM runs"
+        " WHERE kind = ? ORDER BY started, path", (kind,))
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+def run_metrics(connection: sqlite3.Connection, run_id: int) -> Dict[str, float]:
+    """{metric: value} of one run: run totals, ``phase:<name>`` and ``addin:<name>``."""
+    row = connection.execute(f"SELECT {', '.join(RUN_METRICS)} FROM runs WHERE id = ?", (run_id,)).fetchone()
+    metrics = {name: value for name, value in zip(RUN_METRICS, row) if value is not None}
+    for name, seconds in connection.execute("SELECT name, seconds FROM phases WHERE run_id = ?", (run_id,)):
+        metrics["phase:" + name] = seconds
+    for name, seconds in connection.execute("SELECT name, seconds FROM addins WHERE run_id = ?", (run_id,)):
+        metrics["addin:" + name] = seconds
+    return metrics
+
+
+def _resolutions(connection: sqlite3.Connection, run_ids: List[int]) -> Dict[str, float]:
+    """{``addin:<name>``: widest timestamp interval} over the runs: add-in times are
+    interpolated within it, so smaller differences are not measured.
+    """
+    rows = connection.execute(
+        f"SELECT name, MAX(resolution) FROM addins WHERE run_id IN ({', '.join('?' * len(run_ids))})"
+        " GROUP BY name", run_ids)
+    return {"addin:" + name: resolution or 0.0 for name, resolution in rows}
+
+
+def regressions(connection: sqlite3.Connection, run: Optional[str] = None, kind: str = "journal",
+                baseline: int = 5, threshold: float = 20.0, min_delta: float = 0.1) -> dict:
+    """Metrics of a run (default: the latest) that are more than ``threshold``
+    percent and ``min_delta`` above the median of the ``baseline`` runs before it.
+    Add-ins are only compared when the difference exceeds their timestamp
+    interval (``resolution``).
+    """
+    runs = list_runs(connection, kind)
+    if run is None:
+        position = len(runs) - 1
+    else:
+        matches = [i for i, item in enumerate(runs) if str(item["id"]) == run or Path(item["path"]).name == run]
+        if not matches:
+            raise ValueError(f"Run not found: {run}")
+        position = matches[-1]
+    if position < 1:
+        raise ValueError("Need at least two indexed runs to compare")
+
+    current = runs[position]
+    previous = runs[max(0, position - baseline):position]
+    history = [run_metrics(connection, item["id"]) for item in previous]
+    resolutions = _resolutions(connection, [item["id"] for item in previous + [current]])
+    found = []
+    for metric, value in run_metrics(connection, current["id"]).items():
+        values = [metrics[metric] for metrics in history if metric in metrics]
+        if not values:
+            continue
+        median = statistics.median(values)
+        delta = value - median
+        if delta > max(min_delta, resolutions.get(metric, 0.0)) and delta > median * threshold / 100:
+            found.append({"metric": metric, "baseline": round(median, 3), "value": round(value, 3),
+                          "change_percent": round(100 * delta / median, 1) if median else None})
+    found.sort(key=lambda item: -(item["change_percent"] or float("inf")))
+    return {
+        "run": current,
+        "baseline_runs": [item["id"] for item in previous],
+        "threshold_percent": threshold,
+        "regressions": found,
+    }
+
+
+def _seconds(value: Optional[float]) -> str:
+    return f"{'-':>9}" if value is None else f"{value:8.3f}s"
+
+
+def format_regressions(report: dict) -> str:
+    run = report["run"]
+    lines = [f"Run {run['id']} ({Path(run['path']).name}, {run['started']}) vs median of "
+             f"{len(report['baseline_runs'])} previous runs:"]
+    if not report["regressions"]:
+        lines.append(f"  no metric more than {report['threshold_percent']:g}% slower")
+    for item in report["regressions"]:
+        change = "new" if item["change_percent"] is None else f"{item['change_percent']:+.1f}%"
+        lines.append(f"  {item['metric']:<50} {item['baseline']:>10} -> {item['value']:<10} {change}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Index Revit journals and report regressions between runs.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help=f"SQLite database (default: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = commands.add_parser("index", help="Index new and changed journal files")
+    index_parser.add_argument("paths", nargs="+", help="Journal files or folders")
+    index_parser.add_argument("--jobs", type=int, default=None,
+                              help="Parser processes (default: one per CPU; 1 parses in this process)")
+
+    runs_parser = commands.add_parser("runs", help="List indexed runs, oldest first")
+    runs_parser.add_argument("--kind", choices=("journal", "worker"), default="journal")
+    runs_parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    regressions_parser = commands.add_parser("regressions", help="Compare a run with the runs before it")
+    regressions_parser.add_argument("--run", help="Run id or journal file name (default: latest run)")
+    regressions_parser.add_argument("--kind", choices=("journal", "worker"), default="journal")
+    regressions_parser.add_argument("--baseline", type=int, default=5,
+                                    help="Previous runs the median is taken over (default: 5)")
+    regressions_parser.add_argument("--threshold", type=float, default=20.0,
+                                    help="Percent slower that counts as a regression (default: 20)")
+    regressions_parser.add_argument("--min-delta", type=float, default=0.1,
+                                    help="Ignore changes smaller than this, in seconds or MB (default: 0.1)")
+    regressions_parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
+
+    connection = connect(args.db)
+    try:
+        if args.command == "index":
+            print(json.dumps(index(connection, args.paths, args.jobs)))
+            return 0
+        if args.command == "runs":
+            runs = list_runs(connection, args.kind)
+            if args.json:
+                print(json.dumps(runs, indent=2))
+            for run in [] if args.json else runs:
+                print(f"{run['id']:>5}  {run['started']}  {Path(run['path']).name:<28} "
+                      f"startup {_seconds(run['startup'])}  playback {_seconds(run['playback'])}  "
+                      f"peak RAM {run['peak_ram_mb']} MB  {run['errors']} errors")
+            return 0
+        try:
+            report = regressions(connection, args.run, args.kind, args.baseline, args.threshold, args.min_delta)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 2
+        print(json.dumps(report, indent=2) if args.json else format_regressions(report))
+        return 1 if report["regressions"] else 0
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
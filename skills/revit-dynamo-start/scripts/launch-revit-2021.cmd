@@ -1,3 +1,3 @@
 @echo off
-call "%~dp0launch-revit.cmd" 2021
+call "%~dp0launch-revit.cmd" 2021 %*
 exit /b %errorlevel%
@@ -1,3 +1,3 @@
 @echo off
-call "%~dp0launch-revit.cmd" 2023
+call "%~dp0launch-revit.cmd" 2023 %*
 exit /b %errorlevel%
@@ -1,3 +1,3 @@
 @echo off
-call "%~dp0launch-revit.cmd" 2024
+call "%~dp0launch-revit.cmd" 2024 %*
 exit /b %errorlevel%
@@ -1,3 +1,3 @@
 @echo off
-call "%~dp0launch-revit.cmd" 2026
+call "%~dp0launch-revit.cmd" 2026 %*
 exit /b %errorlevel%
@@ -2,14 +2,19 @@
 setlocal enabledelayedexpansion
 
 if "%~1"=="" (
-  echo Usage: launch-revit.cmd ^<2021^|2023^|2024^|2026^>
+  echo Usage: launch-revit.cmd ^<2021^|2023^|2024^|2026^> [journal]
   exit /b 1
 )
 
 set "VERSION=%~1"
+set "JOURNAL=%~f2"
 set "EXE="
 set "TEMPLATE="
 
+rem A journal runs as one batch worker: other Revit instances may be running,
+rem settings are left alone and the call returns when Revit exits
+if defined JOURNAL goto :settings_done
+
 rem Ensure Revit is not running before editing settings
 tasklist /fi "IMAGENAME eq Revit.exe" | find /i "Revit.exe" >nul 2>&1
 if not errorlevel 1 (
@@ -54,6 +59,7 @@ if exist "%INI%" (
   )
 )
 
+:settings_done
 if not exist "%EXE%" (
   for /f "delims=" %%F in ('dir /b /s "C:\Program Files\Autodesk\Revit %VERSION%\Revit.exe" 2^>nul') do (
     set "EXE=%%F"
@@ -67,6 +73,16 @@ if not exist "%EXE%" (
   exit /b 1
 )
 
+if defined JOURNAL (
+  if not exist "%JOURNAL%" (
+    echo Journal not found: "%JOURNAL%"
+    exit /b 1
+  )
+  echo Running journal with Revit %VERSION%: "%EXE%" "%JOURNAL%" /nosplash
+  start "" /WAIT "%EXE%" "%JOURNAL%" /nosplash
+  exit /b !errorlevel!
+)
+
 if defined TEMPLATE (
   if not exist "%TEMPLATE%" (
     echo Revit %VERSION% template not found: "%TEMPLATE%"
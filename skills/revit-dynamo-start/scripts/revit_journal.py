@@ -0,0 +1,489 @@
+"""Stream-parse Revit journals and report where startup time goes.
+
+Reads ``journal.NNNN.txt`` and ``*.worker1.log`` files one line at a time
+through mmap, without loading them whole, and extracts:
+
+- ``'C dd-Mon-yyyy hh:mm:ss.mmm;`` timestamp markers
+- ``->name`` / ``<-name`` enter and exit markers, paired into a span tree
+- ``Delta VM ... RAM`` lines, as a memory timeline
+- ``<<<`` wait timings and ``API_ERROR`` messages
+- ``Starting External [DB] Application`` lines, as add-in load segments
+- milestones: Revit idle after startup (``appPriv idle``), journal playback
+  and the journal script it played back
+
+    python revit_journal.py ../assets/journal.0004.txt
+    python revit_journal.py ../assets/journal.0004.txt --tree
+    python revit_journal.py ../assets/journal.000?.txt --compare
+    python revit_journal.py ../assets/journal.0001.txt --json
+
+Times are seconds from the first timestamp of the journal. Lines without a
+timestamp (memory, waits, errors) take the time of the last one before them.
+Startup lasts until Revit first goes idle; the gaps between timestamps are
+only reported within it (later gaps are mostly the user working or idle).
+
+Revit logs ``Starting External Application: <name>`` once an add-in's
+startup has run, so an add-in loads between the previous add-in line (or
+the last timestamp) and its own line. Its RAM growth is read from the
+memory samples around these lines. Add-in loading has few timestamps, so
+its time is interpolated by line position between the timestamps around
+it: ``interval`` is that pair of timestamps and ``resolution`` its length.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import re
+import sys
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MONTHS = {name: number for number, name in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1)}
+
+MARKER_RE = re.compile(rb"^'C (\d\d)-([A-Za-z]{3})-(\d{4}) (\d\d):(\d\d):(\d\d)\.(\d{3});\s*(.*?)\s*$")
+SPAN_RE = re.compile(r"^(?:\d+:< )?(->|<-)\s*(.+?)(?:\s*\(this=[0-9A-Fa-f]+\))?$")
+RAM_RE = re.compile(rb"RAM: Avail (?:[-+]\d+ -> )?\d+ MB, Used (?:[-+]\d+ -> )?(\d+) MB"
+                    rb"(?:, Peak (?:[-+]\d+ -> )?(\d+))?")
+VM_RE = re.compile(rb"VM: Avail (?:[-+]\d+ -> )?\d+ MB, Used (?:[-+]\d+ -> )?(\d+) MB")
+WAIT_RE = re.compile(rb"^'\s+(\d+\.\d+)\s+\d+:<<<\s*(.*?)\s*$")
+ERROR_RE = re.compile(rb"API_ERROR \{\s*:?\s*(.*?)\s*\}?\s*$")
+INFO_RE = re.compile(rb"^' (Build|Branch|Release): (.*?)\s*$")
+ADDIN_RE = re.compile(rb"Starting External (DB )?Application: (.*?), Class: ([^,]*), Vendor : .*?, "
+                      rb"Assembly: (.*?),\s+Assembly Version: ([^\s}]*)")
+THREAD_PREFIX_RE = re.compile(r"^\d+:< ")
+PLAYBACK_RE = re.compile(r'^started journal file playback of "(.*)"')
+
+# Timestamp texts recorded as milestones (first occurrence)
+MILESTONES = (
+    ("idle", "appPriv idle"),
+    ("playback_start", "started journal file playback"),
+    ("playback_end", "finished journal file playback"),
+)
+
+MemorySample = namedtuple("MemorySample", "time line ram_used ram_peak vm_used")
+Gap = namedtuple("Gap", "duration start line end_line text end_text")
+Wait = namedtuple("Wait", "duration time line text")
+Error = namedtuple("Error", "time line text")
+
+
+class AddinLoad:
+    """Load segment of one add-in application, from ``start_line`` to its
+    ``Starting External Application`` line. Times are interpolated."""
+
+    __slots__ = ("name", "class_name", "assembly", "version", "db", "start_line", "line",
+                 "start", "end", "interval", "resolution", "ram_start", "ram_end")
+
+    def __init__(self, name, class_name, assembly, version, db, start_line, line, ram_start, ram_end):
+        self.name = name
+        self.class_name = class_name
+        self.assembly = assembly
+        self.version = version
+        self.db = db
+        self.start_line = start_line
+        self.line = line
+        self.start = self.end = self.interval = self.resolution = None
+        self.ram_start = ram_start
+        self.ram_end = ram_end
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+    @property
+    def ram_delta(self) -> Optional[int]:
+        if self.ram_start is None or self.ram_end is None:
+            return None
+        return self.ram_end - self.ram_start
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "class": self.class_name,
+            "assembly": self.assembly,
+            "version": self.version,
+            "db": self.db,
+            "lines": [self.start_line, self.line],
+            "seconds": round(self.seconds, 3),
+            "resolution": round(self.resolution, 3),
+            "ram_delta_mb": self.ram_delta,
+        }
+
+    def __repr__(self):
+        return f"<AddinLoad {self.name} {self.seconds}>"
+
+
+class Span:
+    """A ``->name`` ... ``<-name`` pair. ``end`` is None if the exit was never logged."""
+
+    __slots__ = ("name", "start", "end", "line", "end_line", "ram_start", "ram_end", "children")
+
+    def __init__(self, name: str, start: float, line: int, ram: Optional[int]):
+        self.name = name
+        self.start = start
+        self.end = None
+        self.line = line
+        self.end_line = None
+        self.ram_start = ram
+        self.ram_end = None
+        self.children = []
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.end is None else self.end - self.start
+
+    @property
+    def ram_delta(self) -> Optional[int]:
+        if self.ram_start is None or self.ram_end is None:
+            return None
+        return self.ram_end - self.ram_start
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "start": round(self.start, 3),
+            "duration": None if self.end is None else round(self.duration, 3),
+            "line": self.line,
+            "ram_delta_mb": self.ram_delta,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    def __repr__(self):
+        return f"<Span {self.name} {self.duration}>"
+
+
+class Journal:
+    """Parsed journal: metadata, span tree, memory timeline, waits and errors."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.info = {}
+        self.started = None
+        self.duration = 0.0
+        self.lines = 0
+        self.spans = []
+        self.milestones = {}
+        self.memory = []
+        self.gaps = []
+        self.waits = []
+        self.errors = []
+        self.addins = []
+        self.playback_script = None
+
+    def iter_spans(self) -> Iterator[Tuple[int, Span]]:
+        """Yields (depth, span) for every span, depth first."""
+        stack = [(0, span) for span in reversed(self.spans)]
+        while stack:
+            depth, span = stack.pop()
+            yield depth, span
+            stack.extend((depth + 1, child) for child in reversed(span.children))
+
+    def slowest_spans(self, count: int = 10) -> List[Span]:
+        spans = [span for _, span in self.iter_spans() if span.end is not None]
+        return sorted(spans, key=lambda span: -span.duration)[:count]
+
+    @property
+    def startup(self) -> Optional[float]:
+        """Seconds until Revit went idle after starting. Worker logs have no
+        idle marker: their startup ends with the last ``Init...Instance`` span."""
+        if "idle" in self.milestones:
+            return self.milestones["idle"]
+        ends = [span.end for span in self.spans
+                if span.end is not None and span.name.endswith("Instance") and "Init" in span.name]
+        return max(ends) if ends else None
+
+    @property
+    def playback(self) -> Optional[float]:
+        """Seconds spent playing back the journal script (``journal_run.txt``)."""
+        if "playback_start" in self.milestones and "playback_end" in self.milestones:
+            return self.milestones["playback_end"] - self.milestones["playback_start"]
+        return None
+
+    def slowest_gaps(self, count: int = 10, startup_only: bool = True) -> List[Gap]:
+        """Longest intervals between two consecutive timestamps, during startup
+        unless ``startup_only`` is False."""
+        gaps = self.gaps
+        end = self.startup
+        if startup_only and end is not None:
+            gaps = [gap for gap in gaps if gap.start < end]
+        return sorted(gaps, key=lambda gap: -gap.duration)[:count]
+
+    def phase_durations(self) -> Dict[str, float]:
+        """Total seconds per span name, over the closed spans."""
+        totals = {}
+        for _, span in self.iter_spans():
+            if span.end is not None:
+                totals[span.name] = totals.get(span.name, 0.0) + span.duration
+        return totals
+
+    def slowest_addins(self, count: int = 10) -> List[AddinLoad]:
+        return sorted(self.addins, key=lambda load: -load.seconds)[:count]
+
+    @property
+    def peak_ram(self) -> Optional[int]:
+        return max((sample.ram_peak for sample in self.memory), default=None)
+
+    def summary(self, top: int = 10) -> dict:
+        return {
+            "journal": str(self.path),
+            "release": self.info.get("Release"),
+            "build": self.info.get("Build"),
+            "started": self.started.isoformat(sep=" ", timespec="milliseconds") if self.started else None,
+            "duration": round(self.duration, 3),
+            "startup": _round(self.startup),
+            "playback": _round(self.playback),
+            "lines": self.lines,
+            "peak_ram_mb": self.peak_ram,
+            "slowest_spans": [
+                {"name": span.name, "duration": round(span.duration, 3), "start": round(span.start, 3),
+                 "line": span.line, "ram_delta_mb": span.ram_delta}
+                for span in self.slowest_spans(top)],
+            "slowest_gaps": [
+                {"duration": round(gap.duration, 3), "start": round(gap.start, 3), "lines": [gap.line, gap.end_line],
+                 "after": gap.text, "before": gap.end_text}
+                for gap in self.slowest_gaps(top)],
+            "waits": [{"duration": wait.duration, "time": round(wait.time, 3), "line": wait.line, "text": wait.text}
+                      for wait in sorted(self.waits, key=lambda wait: -wait.duration)[:top]],
+            "errors": len(self.errors),
+            "slowest_addins": [load.to_dict() for load in self.slowest_addins(top)],
+        }
+
+
+def iter_lines(path) -> Iterator[bytes]:
+    """Yields the raw lines of a file through mmap (plain reads for empty files)."""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file: cannot be mapped
+            yield from iter(f.readline, b"")
+            return
+        with mapped:
+            yield from iter(mapped.readline, b"")
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
+def _text(value: bytes) -> str:
+    return value.decode("latin-1")
+
+
+def parse_journal(path) -> Journal:
+    """Parses one journal file in a single streaming pass."""
+    journal = Journal(path)
+    stack = []
+    now = 0.0
+    ram = None
+    ram_peak = 0
+    previous = None  # (time, line, text) of the last timestamp
+    segment = (0, None)  # (line, RAM) where the next add-in load starts
+    pending = []  # add-in loads since the last timestamp, to be timed by the next one
+
+    def time_pending(end_time, end_line):
+        start_time, start_line = (previous[0], previous[1]) if previous else (0.0, 0)
+        rate = (end_time - start_time) / max(end_line - start_line, 1)
+        for load in pending:
+            load.start = start_time + (load.start_line - start_line) * rate
+            load.end = start_time + (load.line - start_line) * rate
+            load.interval = (start_time, end_time)
+            load.resolution = end_time - start_time
+        del pending[:]
+
+    number = 0
+    for number, line in enumerate(iter_lines(path), 1):
+        if line.startswith(b"'C "):
+            match = MARKER_RE.match(line)
+            if match is None:
+                continue
+            day, month, year, hour, minute, second, millisecond, raw = match.groups()
+            stamp = datetime(int(year), MONTHS.get(_text(month), 1), int(day), int(hour), int(minute),
+                             int(second), int(millisecond) * 1000)
+            if journal.started is None:
+                journal.started = stamp
+            now = (stamp - journal.started).total_seconds()
+            text = _text(raw)
+            if pending:
+                time_pending(now, number)
+            segment = (number, ram)
+            if previous is not None:
+                journal.gaps.append(Gap(now - previous[0], previous[0], previous[1], number, previous[2], text))
+            previous = (now, number, text)
+
+            event = THREAD_PREFIX_RE.sub("", text)
+            for key, prefix in MILESTONES:
+                if event.startswith(prefix) and key not in journal.milestones:
+                    journal.milestones[key] = now
+                    if key == "playback_start":
+                        script = PLAYBACK_RE.match(event)
+                        journal.playback_script = script.group(1) if script else None
+
+            span = SPAN_RE.match(text)
+            if span is None:
+                continue
+            direction, name = span.groups()
+            if direction == "->":
+                node = Span(name, now, number, ram)
+                (stack[-1].children if stack else journal.spans).append(node)
+                stack.append(node)
+            else:
+                for index in range(len(stack) - 1, -1, -1):
+                    if stack[index].name == name:
+                        node = stack[index]
+                        node.end, node.end_line, node.ram_end = now, number, ram
+                        # Spans entered inside it and never exited stay open
+                        del stack[index:]
+                        break
+
+        elif b"VM: " in line:
+            match = RAM_RE.search(line)
+            if match is None:
+                continue
+            ram = int(match.group(1))
+            ram_peak = max(ram_peak, ram, int(match.group(2) or 0))
+            vm = VM_RE.search(line)
+            journal.memory.append(MemorySample(now, number, ram, ram_peak, int(vm.group(1)) if vm else None))
+            if pending and pending[-1].line == number - 1:
+                # Sample logged right after an add-in started: its RAM growth
+                pending[-1].ram_end = ram
+                segment = (segment[0], ram)
+
+        elif b"Starting External" in line:
+            match = ADDIN_RE.search(line)
+            if match is not None:
+                db, name, class_name, assembly, version = match.groups()
+                load = AddinLoad(_text(name), _text(class_name), _text(assembly), _text(version), bool(db),
+                                 segment[0], number, segment[1], ram)
+                journal.addins.append(load)
+                pending.append(load)
+                segment = (number, ram)
+
+        elif b"<<<" in line:
+            match = WAIT_RE.match(line)
+            if match is not None:
+                journal.waits.append(Wait(float(match.group(1)), now, number, _text(match.group(2))))
+
+        elif b"API_ERROR" in line:
+            match = ERROR_RE.search(line)
+            journal.errors.append(Error(now, number, _text(match.group(1)) if match else _text(line.strip())))
+
+        elif number < 20 and line.startswith(b"' "):
+            match = INFO_RE.match(line)
+            if match is not None:
+                journal.info[_text(match.group(1))] = _text(match.group(2))
+
+    if pending:
+        time_pending(now, number)
+    journal.lines = number
+    journal.duration = now
+    return journal
+
+
+def _seconds(value: Optional[float]) -> str:
+    return "?" if value is None else f"{value:.3f}s"
+
+
+def format_report(journal: Journal, top: int = 10, tree: bool = False) -> str:
+    summary = journal.summary(top)
+    lines = [
+        f"{journal.path.name}  Revit {summary['release'] or '?'}  started {summary['started'] or '?'}  "
+        f"startup {_seconds(summary['startup'])}  playback {_seconds(summary['playback'])}  "
+        f"duration {summary['duration']:.3f}s  peak RAM {summary['peak_ram_mb'] or '?'} MB  "
+        f"{summary['lines']} lines  {summary['errors']} API errors",
+        "",
+        "Slowest phases:",
+    ]
+    for span in summary["slowest_spans"]:
+        ram = "" if span["ram_delta_mb"] is None else f"  {span['ram_delta_mb']:+d} MB"
+        lines.append(f"  {span['duration']:9.3f}s  {span['name']}  (line {span['line']}){ram}")
+    lines += ["", "Longest gaps between timestamps during startup:"]
+    for gap in summary["slowest_gaps"]:
+        lines.append(f"  {gap['duration']:9.3f}s  lines {gap['lines'][0]}-{gap['lines'][1]}  "
+                     f"after: {gap['after'][:60]}")
+    if summary["slowest_addins"]:
+        lines += ["", "Slowest add-ins (estimated):"]
+        for load in summary["slowest_addins"]:
+            ram = "" if load["ram_delta_mb"] is None else f"  {load['ram_delta_mb']:+d} MB"
+            lines.append(f"  {load['seconds']:9.3f}s  {load['name']}  (lines {load['lines'][0]}-{load['lines'][1]}, "
+                         f"+/- {load['resolution']:.1f}s){ram}")
+    if summary["waits"]:
+        lines += ["", "Waits:"]
+        for wait in summary["waits"]:
+            lines.append(f"  {wait['duration']:9.3f}s  {wait['text']}  (line {wait['line']})")
+    if tree:
+        lines += ["", "Span tree:"]
+        for depth, span in journal.iter_spans():
+            duration = "      open" if span.end is None else f"{span.duration:9.3f}s"
+            lines.append(f"  {duration}  {'  ' * depth}{span.name}")
+    return "\n".join(lines)
+
+
+def compare(journals: List[Journal]) -> dict:
+    """Phase durations, total duration and peak RAM of several journals, side by side."""
+    phases = {}
+    for index, journal in enumerate(journals):
+        for name, seconds in journal.phase_durations().items():
+            phases.setdefault(name, [None] * len(journals))[index] = round(seconds, 3)
+    return {
+        "journals": [journal.path.name for journal in journals],
+        "duration": [round(journal.duration, 3) for journal in journals],
+        "startup": [_round(journal.startup) for journal in journals],
+        "playback": [_round(journal.playback) for journal in journals],
+        "peak_ram_mb": [journal.peak_ram for journal in journals],
+        "phases": dict(sorted(phases.items(), key=lambda item: -max(v or 0 for v in item[1]))),
+    }
+
+
+def format_comparison(table: dict) -> str:
+    width = max([len(name) for name in table["phases"]] + [12])
+    header = "".join(f"{name[-16:]:>18}" for name in table["journals"])
+    lines = [f"{'':{width}}{header}"]
+
+    def row(label, values, unit):
+        cells = "".join(f"{'-' if value is None else format(value, unit):>18}" for value in values)
+        lines.append(f"{label:{width}}{cells}")
+
+    row("startup (s)", table["startup"], ".3f")
+    row("playback (s)", table["playback"], ".3f")
+    row("duration (s)", table["duration"], ".3f")
+    row("peak RAM (MB)", table["peak_ram_mb"], "d")
+    for name, values in table["phases"].items():
+        row(name, values, ".3f")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report where Revit startup time goes, from journal files.")
+    parser.add_argument("journals", nargs="+", type=Path, help="Journal files (journal.NNNN.txt, *.worker1.log)")
+    parser.add_argument("--top", type=int, default=10, help="Phases, gaps and waits listed per journal (default: 10)")
+    parser.add_argument("--tree", action="store_true", help="Also print the span tree")
+    parser.add_argument("--compare", action="store_true", help="Print phase durations of all journals side by side")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    journals = [parse_journal(path) for path in args.journals]
+    if args.compare:
+        table = compare(journals)
+        print(json.dumps(table, indent=2) if args.json else format_comparison(table))
+    elif args.json:
+        reports = []
+        for journal in journals:
+            report = journal.summary(args.top)
+            if args.tree:
+                report["spans"] = [span.to_dict() for span in journal.spans]
+            reports.append(report)
+        print(json.dumps(reports[0] if len(reports) == 1 else reports, indent=2))
+    else:
+        print("\n\n".join(format_report(journal, args.top, args.tree) for journal in journals))
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        sys.exit(1)
@@ -0,0 +1,29 @@
+"""Tests of the journal tools, run against the journals in ``assets``.
+
+    python -m pytest skills/revit-dynamo-start/tests
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = SKILL_DIR / "scripts"
+ASSETS_DIR = SKILL_DIR / "assets"
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture(scope="session")
+def assets() -> Path:
+    return ASSETS_DIR
+
+
+@pytest.fixture(scope="session")
+def journal_paths(assets):
+    """The checked-in Revit journals, oldest first."""
+    return sorted(assets.glob("journal.[0-9]*.txt"))
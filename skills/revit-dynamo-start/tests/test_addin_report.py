@@ -0,0 +1,101 @@
+"""Add-in attribution to manifests and load budgets."""
+
+import json
+
+import pytest
+
+from addin_report import DEFAULT_MANIFESTS, attribute, check_budgets, main, read_manifests
+from revit_journal import parse_journal
+
+DTCAI_JOURNAL = (
+    "'C 01-Feb-2026 10:00:00.000;  ->loadAllDB \n"
+    "' 0:< Initial VM: Avail 10 MB, Used 5 MB, Peak 5; RAM: Avail 100 MB, Used 500 MB, Peak 500 \n"
+    "' 0:< API_SUCCESS { Starting External Application: Other, Class: Other.App, Vendor : X(), "
+    "Assembly: C:\\Other.dll, Assembly Version: 1.0 } \n"
+    "' 0:< ::9:: Delta VM: Avail -1 -> 9 MB, Used +1 -> 6 MB; RAM: Avail -10 -> 90 MB, Used +10 -> 510 MB \n"
+    "' 0:< registering DTCAI ribbon \n"
+    "' 0:< API_SUCCESS { Starting External Application: DTCAI.Addin, Class: Common.Startup, Vendor : DTC(), "
+    "Assembly: C:\\DTCAI.Addin.dll, Assembly Version: 0.0.1 } \n"
+    "' 0:< ::9:: Delta VM: Avail -1 -> 8 MB, Used +1 -> 7 MB; RAM: Avail -40 -> 50 MB, Used +40 -> 550 MB \n"
+    "'C 01-Feb-2026 10:00:07.000;  <-loadAllDB \n"
+)
+
+
+@pytest.fixture
+def dtcai_journal(tmp_path):
+    path = tmp_path / "journal.0100.txt"
+    path.write_text(DTCAI_JOURNAL, encoding="ascii")
+    return path
+
+
+def test_default_manifests():
+    manifests = read_manifests(DEFAULT_MANIFESTS)
+    # The three identical DTC.addin copies are listed once
+    assert [(m.name, m.class_name) for m in manifests] == [
+        ("DTCAI.Addin", "Common.Startup"), ("Dynamo For Revit", "Dynamo.Applications.VersionLoader")]
+
+
+def test_dynamo_attributed(assets):
+    journal = parse_journal(assets / "journal.0004.txt")
+    rows = attribute(journal, read_manifests(DEFAULT_MANIFESTS))
+    loaded = [row for row in rows if row["loaded"]]
+    assert sum(len(row["applications"]) for row in loaded) == len(journal.addins)
+    assert [row["seconds"] for row in loaded] == sorted((row["seconds"] for row in loaded), reverse=True)
+
+    dynamo = next(row for row in rows if row["name"] == "Dynamo For Revit")
+    assert dynamo["manifest"].endswith("Dynamo.addin") and dynamo["seconds"] > 0
+    # DTCAI is not installed on the machine that wrote the sample journals
+    assert rows[-1]["name"] == "DTCAI.Addin" and not rows[-1]["loaded"]
+    assert check_budgets(rows, {"DTC.addin": 500})[0]["status"] == "missing"
+
+
+def test_dtcai_budget(dtcai_journal, capsys):
+    journal = parse_journal(dtcai_journal)
+    rows = attribute(journal, read_manifests(DEFAULT_MANIFESTS))
+    dtcai = rows[0]
+    assert dtcai["name"] == "DTCAI.Addin" and dtcai["lines"] == [[3, 6]]
+    assert dtcai["seconds"] == pytest.approx(3.0)
+    assert dtcai["ram_delta_mb"] == 40
+
+    # 3000 ms is the line ratio of the 7 s between the two timestamps: the
+    # journal only shows that the add-in loaded within those 7 s
+    assert dtcai["resolution"] == pytest.approx(7.0)
+    results = check_budgets(rows, {"DTCAI.Addin": 3500, "dtc": 8000, "DTC.addin": 2500, "Missing.Addin": 8000})
+    assert [(r["estimated_ms"], r["max_ms"], r["status"]) for r in results] == [
+        (3000, 7000, "inconclusive"), (3000, 7000, "ok"), (3000, 7000, "over"), (None, None, "missing")]
+
+    assert main([str(dtcai_journal), "--budget", "DTCAI.Addin=3500"]) == 0
+    out = capsys.readouterr().out
+    assert "?     DTCAI.Addin: inconclusive, ~3000 ms estimated within 7000 ms of timestamp intervals" in out
+    assert main([str(dtcai_journal), "--budget", "DTCAI.Addin=3500", "--strict"]) == 1
+    capsys.readouterr()
+    assert main([str(dtcai_journal), "--budget", "DTCAI.Addin=7000", "--strict"]) == 0
+    assert "OK    DTCAI.Addin: at most 7000 ms, ~3000 ms estimated" in capsys.readouterr().out
+    assert main([str(dtcai_journal), "--budget", "DTCAI.Addin=2500"]) == 1
+    assert "FAIL  DTCAI.Addin: ~3000 ms estimated, at most 7000 ms" in capsys.readouterr().out
+    assert main([str(dtcai_journal), "--budget", "Missing.Addin=1", "--json"]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert [result["status"] for result in report["budgets"]] == ["missing"]
+
+    with pytest.raises(SystemExit):
+        main([str(dtcai_journal), "--budget", "DTCAI.Addin"])
+
+
+
+def test_intervals_add_up(tmp_path):
+    # The DB and UI applications of DTCAI load between different timestamps
+    path = tmp_path / "journal.0101.txt"
+    path.write_text(
+        "'C 01-Feb-2026 10:00:00.000;  ->loadAllDB \n"
+        "' 0:< API_SUCCESS { Starting External DB Application: DTCAI.Addin, Class: Common.Startup, "
+        "Vendor : DTC(), Assembly: C:\\DTCAI.Addin.dll, Assembly Version: 0.0.1 } \n"
+        "'C 01-Feb-2026 10:00:01.000;  ->loadAllUI \n"
+        "' 0:< API_SUCCESS { Starting External Application: DTCAI.Addin, Class: Common.UIStartup, "
+        "Vendor : DTC(), Assembly: C:\\DTCAI.Addin.dll, Assembly Version: 0.0.1 } \n"
+        "'C 01-Feb-2026 10:00:03.000;  <-loadAllUI \n", encoding="ascii")
+    rows = attribute(parse_journal(path), read_manifests(DEFAULT_MANIFESTS))
+    dtcai = rows[0]
+    assert dtcai["applications"] == ["DTCAI.Addin", "DTCAI.Addin"]
+    assert dtcai["resolution"] == pytest.approx(3.0)
+    # Within the widest interval (2 s), but not within both
+    assert check_budgets(rows, {"DTCAI.Addin": 2500})[0]["status"] == "inconclusive"
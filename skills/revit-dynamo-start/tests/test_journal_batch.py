@@ -0,0 +1,121 @@
+"""Journal rendering and batch runs, with a stub in place of Revit."""
+
+import json
+import textwrap
+
+import pytest
+
+from journal_batch import (
+    JOURNAL_TEMPLATE,
+    collect_timings,
+    launcher_command,
+    main,
+    plan,
+    render,
+    run_batch,
+)
+
+# Stands in for launch-revit-<version>.cmd: "runs" the script by writing the
+# journal Revit would, and records when it ran to check the worker count
+STUB = textwrap.dedent('''
+    import os, sys, time
+    from pathlib import Path
+
+    script = Path(sys.argv[1])
+    journals = Path(os.environ["STUB_JOURNALS"])
+    index = int(script.name.split(".")[1])
+    start = time.time()
+    time.sleep(0.3)
+    if "fail.dyn" in script.read_text():
+        sys.exit(3)
+    (journals / f"journal.{index:04d}.txt").write_text(
+        "' Release: 2024.3.4\\n"
+        "'C 01-Feb-2026 10:00:00.000;  ->desktop InitApplication \\n"
+        f"'C 01-Feb-2026 10:00:0{index}.000;  <-desktop InitApplication \\n"
+        f"'C 01-Feb-2026 10:00:0{index}.500;  appPriv idle \\n"
+        f"'C 01-Feb-2026 10:00:1{index}.000;  started journal file playback of \\"{script}\\" \\n"
+        f"'C 01-Feb-2026 10:00:1{index}.250;  finished journal file playback \\n")
+    with open(journals / "spans.txt", "a") as f:
+        f.write(f"{start} {time.time()}\\n")
+''')
+
+
+@pytest.fixture
+def template():
+    return JOURNAL_TEMPLATE.read_text(encoding="ascii")
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    journals = tmp_path / "journals"
+    journals.mkdir()
+    monkeypatch.setenv("STUB_JOURNALS", str(journals))
+    path = tmp_path / "stub_launcher.py"
+    path.write_text(STUB)
+    return launcher_command(path), journals
+
+
+def test_render(template, assets):
+    # Same script as start.ps1 writes, plus quitting Revit at the end
+    text = render(template, r"C:\Skills\2024templaterevitskill.rte")
+    expected = (assets / "journal_run.txt").read_text(encoding="ascii").replace(
+        r"C:\Users\darick\.config\opencode\skills\revit-dynamo-start\assets", r"C:\Skills")
+    assert text.startswith(expected.rstrip("\n") + "\n")
+    assert text.rstrip().endswith("ID_APP_EXIT\"")
+    assert render(template, "model.rte", quit=False) == template.replace("{{TEMPLATE_PATH}}", "model.rte")
+
+    text = render(template, r"C:\Models\tower.rvt", r'C:\Graphs\odd "name".dyn')
+    assert "TaskDialog_Template_File" not in text and "Template vs Project" not in text
+    lines = text.split("\n")
+    launch = next(i for i, line in enumerate(lines) if "ID_VISUAL_PROGRAMMING_DYNAMO" in line)
+    assert lines[launch + 1].startswith('Jrn.Data "APIStringStringMapJournalData" , 5 , "dynPath" , '
+                                        r'"C:\Graphs\odd ""name"".dyn" ,')
+
+    with pytest.raises(ValueError):
+        render("Dim Jrn\n", "model.rte", "graph.dyn")
+    with pytest.raises(ValueError):
+        render(template, "C:\\Modèles\\a.rvt")
+
+
+def test_plan(tmp_path, template):
+    runs = plan(["a.rvt", "b.rte"], ["x.dyn", "y.dyn"], tmp_path / "out", template)
+    assert [(run.index, run.model, run.graph) for run in runs] == [
+        (1, "a.rvt", "x.dyn"), (2, "a.rvt", "y.dyn"), (3, "b.rte", "x.dyn"), (4, "b.rte", "y.dyn")]
+    assert [run.script for run in runs] == [str(tmp_path / "out" / f"journal_run.000{i}.txt") for i in range(1, 5)]
+    assert '"b.rte"' in (tmp_path / "out" / "journal_run.0004.txt").read_text()
+    assert [run.graph for run in plan([], [], tmp_path / "default", template)] == [None]
+
+
+def test_batch_with_stub_launcher(tmp_path, template, stub):
+    command, journals = stub
+    (journals / "journal.0099.txt").write_text("'C 01-Feb-2026 10:00:00.000;  old run \n")
+    runs = plan(["a.rvt"], ["one.dyn", "two.dyn", "fail.dyn", "four.dyn"], tmp_path / "out", template)
+
+    results = collect_timings(run_batch(runs, command, workers=2), journals)
+    assert [result["status"] for result in results] == ["ok", "ok", "failed", "ok"]
+    assert results[2]["returncode"] == 3 and results[2]["journal"] is None
+    for result in (results[0], results[1], results[3]):
+        index = result["run"]
+        assert result["journal"] == str(journals / f"journal.{index:04d}.txt")
+        assert result["startup"] == pytest.approx(index + 0.5)
+        assert result["playback"] == pytest.approx(0.25)
+        assert result["wall"] >= 0.3
+
+    # Never more than two stubs at the same time, and some overlap
+    spans = [tuple(map(float, line.split())) for line in (journals / "spans.txt").read_text().split("\n") if line]
+    overlaps = [sum(start <= moment < end for start, end in spans) for moment, _ in spans]
+    assert max(overlaps) == 2
+
+
+def test_cli(tmp_path, stub, capsys):
+    command, journals = stub
+    out = tmp_path / "out"
+    argv = ["--model", str(tmp_path / "a.rvt"), "--graph", str(tmp_path / "one.dyn"), "--out", str(out),
+            "--launcher", command[-1], "--journals", str(journals), "--workers", "2"]
+    assert main(argv) == 0
+    assert "1 runs in" in capsys.readouterr().out
+    report = json.loads((out / "results.json").read_text())
+    assert report["runs"][0]["playback"] == pytest.approx(0.25)
+
+    assert main(argv + ["--dry-run"]) == 0
+    assert capsys.readouterr().out.strip() == str(out / "journal_run.0001.txt")
@@ -0,0 +1,114 @@
+"""Journal index: incremental ingest into SQLite and cross-run regressions."""
+
+import os
+import shutil
+
+import pytest
+
+from journal_index import connect, index, list_runs, main, regressions, run_metrics, summarize_run
+
+
+@pytest.fixture
+def journals(tmp_path, assets):
+    """Copy of the checked-in journals and worker logs."""
+    folder = tmp_path / "Journals"
+    folder.mkdir()
+    for path in assets.glob("journal.[0-9]*"):
+        shutil.copy2(path, folder)
+    return folder
+
+
+@pytest.fixture
+def connection(tmp_path):
+    connection = connect(tmp_path / "index.sqlite")
+    yield connection
+    connection.close()
+
+
+def test_index_summaries(connection, journals):
+    assert index(connection, [journals], jobs=2) == {"indexed": 10, "unchanged": 0}
+
+    runs = list_runs(connection)
+    assert [run["path"].rsplit(os.sep, 1)[-1] for run in runs] == [
+        f"journal.000{n}.txt" for n in range(1, 6)]
+    assert len(list_runs(connection, "worker")) == 5
+    assert all(run["release"] == "2024.3.4" and run["startup"] > 0 for run in runs)
+
+    metrics = run_metrics(connection, runs[0]["id"])
+    assert metrics["phase:loadAllDB"] == pytest.approx(2.061)
+    assert metrics["peak_ram_mb"] == 1231
+    assert "addin:Dynamo For Revit" in metrics
+    errors = connection.execute("SELECT SUM(count) FROM errors WHERE run_id = ?", (runs[0]["id"],)).fetchone()[0]
+    assert errors == runs[0]["errors"] == 18
+
+
+def test_index_is_incremental(connection, journals):
+    index(connection, [journals], jobs=1)
+    assert index(connection, [journals]) == {"indexed": 0, "unchanged": 10}
+
+    changed = journals / "journal.0005.txt"
+    with open(changed, "a", encoding="ascii") as f:
+        f.write("'C 23-Jan-2026 18:00:00.000;  finished recording journal file \n")
+    assert index(connection, [journals]) == {"indexed": 1, "unchanged": 9}
+    assert len(list_runs(connection)) == 5
+    # Child rows of the replaced run are not duplicated
+    assert connection.execute("SELECT COUNT(*) FROM phases WHERE run_id NOT IN (SELECT id FROM runs)").fetchone()[0] == 0
+
+    # Runs are kept when the journal is deleted
+    changed.unlink()
+    index(connection, [journals])
+    assert len(list_runs(connection)) == 5
+
+
+def test_regressions(connection, journals, capsys):
+    # Make loadAllDB of the latest run 40% slower than in the runs before it
+    latest = journals / "journal.0005.txt"
+    text = latest.read_text(encoding="latin-1")
+    latest.write_text(text.replace("'C 23-Jan-2026 16:18:21.429;  <-loadAllDB",
+                                   "'C 23-Jan-2026 16:18:22.276;  <-loadAllDB"), encoding="latin-1")
+    index(connection, [journals])
+
+    report = regressions(connection, threshold=30)
+    assert report["run"]["path"].endswith("journal.0005.txt")
+    assert len(report["baseline_runs"]) == 4
+    found = {item["metric"]: item for item in report["regressions"]}
+    assert found["phase:loadAllDB"]["value"] == pytest.approx(3.2)
+    assert found["phase:loadAllDB"]["change_percent"] > 30
+
+    with pytest.raises(ValueError):
+        regressions(connection, run="journal.0001.txt")
+
+    database = str(journals.parent / "index.sqlite")  # the connection fixture
+    assert main(["--db", database, "regressions", "--threshold", "30"]) == 1
+    assert "phase:loadAllDB" in capsys.readouterr().out
+    assert main(["--db", database, "regressions", "--threshold", "1000"]) == 0
+
+
+def test_addin_regressions_need_resolution(connection, journals):
+    index(connection, [journals])
+    latest = list_runs(connection)[-1]["id"]
+    with connection:
+        connection.execute("UPDATE addins SET seconds = seconds + 2 WHERE run_id = ? AND name = ?",
+                           (latest, "Dynamo For Revit"))
+    # Interpolated within intervals of about 20s: 2s is not measured
+    assert not any(item["metric"].startswith("addin:") for item in regressions(connection)["regressions"])
+
+    with connection:
+        connection.execute("UPDATE addins SET resolution = 0.5 WHERE name = ?", ("Dynamo For Revit",))
+    found = {item["metric"]: item for item in regressions(connection)["regressions"]}
+    assert found["addin:Dynamo For Revit"]["value"] == pytest.approx(2.447, abs=0.001)
+
+
+def test_addin_resolution_adds_up_intervals(tmp_path):
+    # One add-in name, a DB and a UI application between different timestamps
+    path = tmp_path / "journal.0101.txt"
+    path.write_text(
+        "'C 01-Feb-2026 10:00:00.000;  ->loadAllDB \n"
+        "' 0:< API_SUCCESS { Starting External DB Application: Tools, Class: Tools.Db, "
+        "Vendor : X(), Assembly: C:\\Tools.dll, Assembly Version: 1.0 } \n"
+        "'C 01-Feb-2026 10:00:01.000;  ->loadAllUI \n"
+        "' 0:< API_SUCCESS { Starting External Application: Tools, Class: Tools.Ui, "
+        "Vendor : X(), Assembly: C:\\Tools.dll, Assembly Version: 1.0 } \n"
+        "'C 01-Feb-2026 10:00:03.000;  <-loadAllUI \n", encoding="ascii")
+    seconds, resolution, _ = summarize_run(path)["addins"]["Tools"]
+    assert resolution == pytest.approx(3.0) and seconds <= resolution
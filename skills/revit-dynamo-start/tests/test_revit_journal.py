@@ -0,0 +1,91 @@
+"""Journal parsing: span pairing, memory timeline and milestones."""
+
+import re
+
+import pytest
+
+from revit_journal import compare, main, parse_journal
+
+
+def test_span_tree(assets):
+    journal = parse_journal(assets / "journal.0001.txt")
+    roots = [span.name for span in journal.spans]
+    assert roots == ["desktop InitApplication", "desktop InitNativeInstance", "desktop InitManagedInstance"]
+
+    native = journal.spans[1]
+    assert [child.name for child in native.children] == [
+        "loadAllDB", "processShellCommand", "DesktopMFCApp::doStartupWarnings"]
+    load = native.children[0]
+    assert load.duration == pytest.approx(2.061)
+    assert (load.line, load.end_line) == (30, 33)
+    assert native.start <= load.start and load.end <= native.end
+    assert journal.slowest_spans(1) == [native]
+
+
+def test_memory_and_errors_match_a_full_scan(assets):
+    path = assets / "journal.0004.txt"
+    journal = parse_journal(path)
+    text = path.read_text(encoding="latin-1")
+
+    ram_lines = [line for line in text.split("\n") if "VM: " in line and "RAM: " in line]
+    assert len(journal.memory) == len(ram_lines)
+    used = [int(re.search(r"RAM: .*?Used (?:[-+]\d+ -> )?(\d+) MB", line).group(1)) for line in ram_lines]
+    assert [sample.ram_used for sample in journal.memory] == used
+    assert journal.peak_ram >= max(used)
+    times = [sample.time for sample in journal.memory]
+    assert times == sorted(times)
+
+    assert len(journal.errors) == text.count("API_ERROR")
+    assert journal.lines == text.count("\n")
+
+
+def test_milestones(journal_paths):
+    for path in journal_paths:
+        journal = parse_journal(path)
+        assert journal.info["Release"] == "2024.3.4"
+        assert 0 < journal.startup < journal.duration
+        assert 0 < journal.playback < journal.duration
+        assert journal.playback_script.endswith("journal_run.txt")
+        # Startup covers the Init spans
+        assert all(span.end <= journal.startup for span in journal.spans if "Init" in span.name)
+        assert all(gap.start < journal.startup for gap in journal.slowest_gaps())
+
+
+def test_worker_log_startup(assets):
+    journal = parse_journal(assets / "journal.0001.worker1.log")
+    assert "idle" not in journal.milestones
+    assert journal.startup == max(span.end for span in journal.spans if "Init" in span.name)
+
+
+def test_unbalanced_markers(tmp_path):
+    path = tmp_path / "journal.9999.txt"
+    path.write_text(
+        "'C 01-Feb-2026 10:00:00.000;  ->outer \n"
+        "'C 01-Feb-2026 10:00:01.000;  ->never closed \n"
+        "' 0:< Initial VM: Avail 10 MB, Used 5 MB, Peak 5; RAM: Avail 100 MB, Used 50 MB, Peak 50 \n"
+        "'C 01-Feb-2026 10:00:03.500;  <-outer \n"
+        "'C 01-Feb-2026 10:00:04.000;  <-unknown \n"
+        "'C 01-Feb-2026 10:00:04.000;   0:< ->processShellCommand \n",
+        encoding="ascii")
+    journal = parse_journal(path)
+    outer = journal.spans[0]
+    assert outer.duration == 3.5
+    assert outer.children[0].end is None
+    assert journal.spans[1].name == "processShellCommand" and journal.spans[1].end is None
+    assert journal.duration == 4.0
+    assert journal.memory[0].ram_used == 50
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert parse_journal(empty).lines == 0
+
+
+def test_compare_and_cli(journal_paths, capsys):
+    journals = [parse_journal(path) for path in journal_paths]
+    table = compare(journals)
+    assert table["journals"] == [path.name for path in journal_paths]
+    assert len(table["phases"]["loadAllDB"]) == len(journals)
+
+    assert main([str(journal_paths[0]), "--top", "3", "--tree"]) == 0
+    output = capsys.readouterr().out
+    assert "Slowest phases:" in output and "loadAllDB" in output
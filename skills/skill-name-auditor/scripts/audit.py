@@ -1,17 +1,31 @@
 #!/usr/bin/env python3
 """
 ASIS Skill Auditor - Scans skills and verifies naming compliance.
+
+Results are cached by SKILL.md path, mtime and size, so skills that did not
+change since the last run are not parsed or tested again.
 """
 
 import os
 import sys
 import json
 import re
+import time
+import select
+import struct
+import argparse
 import importlib.util
+from collections import deque
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 SKILLS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 NAMER_SCRIPT = os.path.join(SKILLS_DIR, "skill-name-creator", "scripts", "name_skill.py")
+CACHE_FILE = os.path.join(SKILLS_DIR, ".skill-audit-cache.json")
+# Bump when the result format or the checks below change
+CACHE_VERSION = 1
+DIR_KEBAB_RE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
 
 def load_namer_module():
     """Dynamically load the skill-name-creator module."""
@@ -28,6 +42,18 @@ def load_namer_module():
 
 namer = load_namer_module()
 
+def read_frontmatter(md_path):
+    """Return the frontmatter lines of a markdown file, reading only up to the closing `---`."""
+    lines = []
+    with open(md_path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            return None
+        for line in f:
+            if line.strip() == "---":
+                return lines
+            lines.append(line)
+    return None
+
 def parse_skill_md(skill_path):
     """Extract name and description from SKILL.md."""
     md_path = os.path.join(skill_path, "SKILL.md")
@@ -36,84 +62,466 @@ def parse_skill_md(skill_path):
 
     data = {"name": None, "description": ""}
     try:
-        with open(md_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            
         # simple frontmatter parse
-        match = re.search(r"^---\s+(.*?)\s+---", content, re.DOTALL)
-        if match:
-            fm = match.group(1)
-            for line in fm.split("\n"):
-                if ":" in line:
-                    key, val = line.split(":", 1)
-                    key = key.strip()
-                    val = val.strip()
-                    if key == "name":
-                        data["name"] = val
-                    elif key == "description":
-                        data["description"] = val
+        for line in read_frontmatter(md_path) or []:
+            if ":" in line:
+                key, val = line.split(":", 1)
+                key = key.strip()
+                val = val.strip()
+                if key == "name":
+                    data["name"] = val
+                elif key == "description":
+                    data["description"] = val
     except Exception as e:
         print(f"Error parsing {md_path}: {e}", file=sys.stderr)
-    
+
     return data
 
-def audit_skills():
-    results = []
-    
-    if not os.path.exists(SKILLS_DIR):
-        print(f"Skills directory not found: {SKILLS_DIR}")
-        return
+def audit_skill(item, item_path):
+    """Audit one skill directory. Returns its result record."""
+    skill_data = parse_skill_md(item_path)
+    if not skill_data:
+        return {
+            "directory": item,
+            "status": "ERROR",
+            "message": "Missing SKILL.md"
+        }
+
+    current_name = skill_data["name"]
+    description = skill_data["description"]
 
-    for item in os.listdir(SKILLS_DIR):
-        item_path = os.path.join(SKILLS_DIR, item)
-        if not os.path.isdir(item_path) or item.startswith("."):
-            continue
+    # Check 1: Directory Kebab-Case
+    dir_kebab_ok = bool(DIR_KEBAB_RE.match(item))
 
-        skill_data = parse_skill_md(item_path)
-        if not skill_data:
-            results.append({
-                "directory": item,
-                "status": "ERROR",
-                "message": "Missing SKILL.md"
-            })
-            continue
+    # Check 2: ASIS Compliance (using Namer logic if available)
+    compliance = "UNKNOWN"
+    errors = []
+    suggestion = None
 
-        current_name = skill_data["name"]
-        description = skill_data["description"]
-        
-        # Check 1: Directory Kebab-Case
-        dir_kebab_ok = bool(re.match(r"^[a-z0-9]+(-[a-z0-9]+)*$", item))
-        
-        # Check 2: ASIS Compliance (using Namer logic if available)
-        compliance = "UNKNOWN"
-        errors = []
-        suggestion = None
-
-        if namer:
-            # Check current name compliance
-            pass_status, errs, _ = namer.run_compliance_test(current_name)
-            compliance = pass_status
-            errors = errs
-
-            # If fail, generate suggestion from description
-            if compliance == "FAIL":
-                # Try to generate a name from the description
-                try:
-                    gen = namer.generate_name(description or item)
-                    suggestion = gen["asis_identifier"]
-                except Exception:
-                    suggestion = "Could not generate"
-        
-        results.append({
-            "directory": item,
-            "current_name": current_name,
-            "dir_kebab_compliant": dir_kebab_ok,
-            "asis_compliant": compliance,
-            "errors": errors,
-            "suggested_rename": suggestion
+    if namer:
+        # Check current name compliance
+        pass_status, errs, _ = namer.run_compliance_test(current_name)
+        compliance = pass_status
+        errors = errs
+
+        # If fail, generate suggestion from description
+        if compliance == "FAIL":
+            # Try to generate a name from the description
+            try:
+                gen = namer.generate_name(description or item)
+                suggestion = gen["asis_identifier"]
+            except Exception:
+                suggestion = "Could not generate"
+
+    return {
+        "directory": item,
+        "current_name": current_name,
+        "dir_kebab_compliant": dir_kebab_ok,
+        "asis_compliant": compliance,
+        "errors": errors,
+        "suggested_rename": suggestion
+    }
+
+def _file_stamp(path):
+    """[mtime_ns, size] of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def load_cache(path, skills_dir):
+    """Load cached results, or an empty cache if missing, unreadable or stale."""
+    empty = {"version": CACHE_VERSION, "namer": _file_stamp(NAMER_SCRIPT),
+             "skills_dir": os.path.abspath(skills_dir), "skills": {}}
+    if not path:
+        return empty
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    # Results depend on the namer rules as well as on SKILL.md
+    if any(cache.get(key) != empty[key] for key in ("version", "namer", "skills_dir")):
+        return empty
+    return cache
+
+def save_cache(cache, path):
+    """Write the cache atomically."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+def list_skill_dirs(skills_dir):
+    """Sorted (name, path) of the skill directories, without descending into them."""
+    with os.scandir(skills_dir) as entries:
+        return sorted((entry.name, entry.path) for entry in entries
+                      if not entry.name.startswith(".") and entry.is_dir())
+
+def _audit_cached(item, item_path, cached):
+    """Returns (result, stamp, changed). Reuses the cached result if SKILL.md is unchanged."""
+    stamp = _file_stamp(os.path.join(item_path, "SKILL.md"))
+    if cached and cached["stamp"] == stamp:
+        return cached["result"], stamp, False
+    return audit_skill(item, item_path), stamp, True
+
+def iter_audit(skills_dir, cache, jobs=None, stats=None):
+    """
+    Audit every skill directory across a thread pool, updating ``cache`` in place.
+
+    Yields (directory, result, changed) in directory order, as soon as each
+    skill is audited. Only a small window of audits is in flight, so memory
+    does not grow with the number of skills (apart from the cache itself).
+    When the generator is exhausted, ``stats`` is filled in and the cache
+    lists the removed directories under ``removed``.
+    """
+    start = time.perf_counter()
+    cached_skills = cache["skills"]
+    items = list_skill_dirs(skills_dir)
+    skills = {}
+    changed = 0
+
+    # ThreadPoolExecutor's default worker count
+    workers = jobs or min(32, (os.cpu_count() or 1) + 4)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        def audited():
+            pending = deque()
+            for item, item_path in items:
+                pending.append(executor.submit(_audit_cached, item, item_path, cached_skills.get(item)))
+                if len(pending) >= 4 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+        for (item, _), (result, stamp, is_changed) in zip(items, audited()):
+            changed += is_changed
+            skills[item] = {"stamp": stamp, "result": result}
+            yield item, result, is_changed
+
+    removed = sorted(set(cached_skills) - set(skills))
+    cache["skills"] = skills
+    cache["removed"] = removed
+    if stats is not None:
+        stats.update({
+            "skills": len(skills),
+            "cached": len(skills) - changed,
+            "changed": changed,
+            "removed": len(removed),
+            "seconds": time.perf_counter() - start,
         })
 
-    print(json.dumps(results, indent=2))
+def scan(skills_dir, cache, jobs=None):
+    """
+    Audit every skill directory (see iter_audit).
+
+    Returns (results, changed directories, removed directories, stats).
+    Results are in directory order.
+    """
+    stats = {}
+    results, changed = [], []
+    for item, result, is_changed in iter_audit(skills_dir, cache, jobs, stats):
+        results.append(result)
+        if is_changed:
+            changed.append(item)
+    return results, changed, cache.pop("removed"), stats
+
+def summarize(results):
+    """Counts of skills by compliance status and by error code."""
+    summary = {"skills": 0, "status": {}, "errors": {}}
+    for result in results:
+        summary["skills"] += 1
+        status = result.get("asis_compliant") or result.get("status")
+        summary["status"][status] = summary["status"].get(status, 0) + 1
+        for error in result.get("errors", []):
+            summary["errors"][error] = summary["errors"].get(error, 0) + 1
+        if result.get("dir_kebab_compliant") is False:
+            summary["errors"]["ERR_DIR_NOT_KEBAB"] = summary["errors"].get("ERR_DIR_NOT_KEBAB", 0) + 1
+    summary["errors"] = dict(sorted(summary["errors"].items(), key=lambda item: (-item[1], item[0])))
+    return summary
+
+# inotify(7) event masks
+IN_MODIFY = 0x2
+IN_ATTRIB = 0x4
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_IGNORED = 0x8000
+IN_ONLYDIR = 0x1000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")
+_SKILLS_DIR_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+_SKILL_MASK = (IN_CLOSE_WRITE | IN_MODIFY | IN_ATTRIB | IN_CREATE | IN_DELETE |
+               IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR)
+
+class InotifyWatcher:
+    """Reports skill directories whose SKILL.md changed, from Linux inotify events.
+
+    Falls back to polling every ``interval`` seconds if a new skill directory
+    cannot be watched (out of inotify watches).
+    """
+
+    def __init__(self, skills_dir, interval=1.0):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._get_errno = ctypes.get_errno
+        self.skills_dir = skills_dir
+        self.interval = interval
+        self._poller = None
+        # {watch descriptor: skill directory name, or None for the skills directory}
+        self._watches = {}
+        self._watch(skills_dir, None, _SKILLS_DIR_MASK)
+        for item, item_path in list_skill_dirs(skills_dir):
+            self._watch(item_path, item, _SKILL_MASK)
+
+    def _watch(self, path, item, mask):
+        wd = self._add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = self._get_errno()
+            # ENOSPC: out of watches (fs.inotify.max_user_watches)
+            raise OSError(errno, f"inotify_add_watch failed for {path}: {os.strerror(errno)}")
+        self._watches[wd] = item
+
+    def changes(self, timeout=None):
+        """Names of the skill directories changed, waiting up to ``timeout`` seconds (forever if None)."""
+        if self._poller is not None:
+            return self._poller.changes(timeout)
+        changed = set()
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return changed
+        data = os.read(self._fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if wd not in self._watches:
+                continue
+            item = self._watches[wd]
+            if mask & IN_IGNORED:
+                # Watched directory removed
+                del self._watches[wd]
+                continue
+            if item is None:
+                if mask & IN_ISDIR and not name.startswith("."):
+                    changed.add(name)
+                    item_path = os.path.join(self.skills_dir, name)
+                    if mask & (IN_CREATE | IN_MOVED_TO) and os.path.isdir(item_path) and self._poller is None:
+                        try:
+                            self._watch(item_path, name, _SKILL_MASK)
+                        except OSError as e:
+                            print(f"{e}, polling every {self.interval}s", file=sys.stderr)
+                            self._poller = PollingWatcher(self.skills_dir, self.interval)
+            elif name == "SKILL.md" or mask & IN_DELETE_SELF:
+                changed.add(item)
+        if self._poller is not None:
+            self.close()
+        return changed
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+class PollingWatcher:
+    """Reports skill directories whose SKILL.md changed, by comparing mtime and size."""
+
+    def __init__(self, skills_dir, interval=1.0):
+        self.skills_dir = skills_dir
+        self.interval = interval
+        self._stamps = self._read_stamps()
+
+    def _read_stamps(self):
+        return {item: _file_stamp(os.path.join(item_path, "SKILL.md"))
+                for item, item_path in list_skill_dirs(self.skills_dir)}
+
+    def changes(self, timeout=None):
+        """Names of the skill directories changed, waiting up to ``timeout`` seconds (forever if None)."""
+        while True:
+            time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+            stamps = self._read_stamps()
+            changed = {item for item in set(stamps) | set(self._stamps)
+                       if stamps.get(item, False) != self._stamps.get(item, False)}
+            self._stamps = stamps
+            if changed or timeout is not None:
+                return changed
+
+    def close(self):
+        pass
+
+def open_watcher(skills_dir, poll=False, interval=1.0):
+    """inotify watcher on Linux, polling otherwise or if inotify is unavailable."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(skills_dir, interval)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}), polling every {interval}s", file=sys.stderr)
+    return PollingWatcher(skills_dir, interval)
+
+def reaudit(skills_dir, items, state, cache):
+    """
+    Audit ``items`` again, updating ``state`` ({directory: result}) and ``cache``.
+
+    Returns the diff: {"added": [result], "removed": [directory],
+    "changed": [{"directory", "before", "after"}]}.
+    """
+    diff = {"added": [], "removed": [], "changed": []}
+    for item in sorted(items):
+        item_path = os.path.join(skills_dir, item)
+        before = state.get(item)
+        if not os.path.isdir(item_path):
+            if before is not None:
+                del state[item]
+                cache["skills"].pop(item, None)
+                diff["removed"].append(item)
+            continue
+        result, stamp, _ = _audit_cached(item, item_path, cache["skills"].get(item))
+        cache["skills"][item] = {"stamp": stamp, "result": result}
+        state[item] = result
+        if before is None:
+            diff["added"].append(result)
+        elif before != result:
+            diff["changed"].append({"directory": item, "before": before, "after": result})
+    return diff
+
+def emit(record, out=None):
+    out = out or sys.stdout
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+
+def watch(skills_dir, cache, cache_path=None, jobs=None, debounce=0.3, poll=False, interval=1.0):
+    """
+    Audit once, then re-audit skills as their SKILL.md changes, until interrupted.
+
+    Prints one compact JSON diff per line: the first one adds every skill,
+    the next ones list skills added, removed or with a changed result.
+    Bursts of writes are merged until no change is seen for ``debounce`` seconds.
+    """
+    # Start watching before the scan, so changes made during it are not missed
+    watcher = open_watcher(skills_dir, poll, interval)
+    results, _, _, stats = scan(skills_dir, cache, jobs)
+    if cache_path:
+        save_cache(cache, cache_path)
+    state = {result["directory"]: result for result in results}
+    emit({"added": results, "removed": [], "changed": [], "seconds": round(stats["seconds"], 4)})
+    try:
+        while True:
+            dirty = watcher.changes()
+            while True:
+                more = watcher.changes(debounce)
+                if not more:
+                    break
+                dirty |= more
+            start = time.perf_counter()
+            diff = reaudit(skills_dir, dirty, state, cache)
+            if cache_path:
+                save_cache(cache, cache_path)
+            if diff["added"] or diff["removed"] or diff["changed"]:
+                diff["seconds"] = round(time.perf_counter() - start, 4)
+                emit(diff)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Audit skills for ASIS naming compliance.")
+    parser.add_argument("--skills-dir", default=SKILLS_DIR, help="Skills directory to scan")
+    parser.add_argument("--cache", default=CACHE_FILE, help="Result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Audit every skill, do not read or write the cache")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="Report only skills added, changed or removed since the cached run; "
+                             "exit with 1 if any of them is not compliant")
+    parser.add_argument("--jobs", type=int, default=None, help="Scan threads (default: Python's default)")
+    parser.add_argument("--timing", action="store_true", help="Print scan statistics to stderr")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--ndjson", action="store_true",
+                        help="Print one compact JSON record per skill as soon as it is audited")
+    output.add_argument("--summary", action="store_true",
+                        help="Print only counts by compliance status and error code")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and print a JSON diff line whenever skills change")
+    parser.add_argument("--poll", action="store_true", help="Watch by polling instead of inotify")
+    parser.add_argument("--interval", type=float, default=1.0, help="Polling interval in seconds")
+    parser.add_argument("--debounce", type=float, default=0.3,
+                        help="Seconds without changes before re-auditing (watch mode)")
+    return parser.parse_args(argv)
+
+def is_failure(result):
+    return result.get("status") == "ERROR" or result.get("asis_compliant") == "FAIL"
+
+def audit_skills(argv=None):
+    args = parse_args(argv)
+
+    if not os.path.exists(args.skills_dir):
+        print(f"Skills directory not found: {args.skills_dir}")
+        return 1
+
+    cache_path = None if args.no_cache else args.cache
+    cache = load_cache(cache_path, args.skills_dir)
+    if args.watch:
+        return watch(args.skills_dir, cache, cache_path, args.jobs, args.debounce,
+                     args.poll, args.interval)
+
+    stats = {}
+    records = (result for _, result, is_changed in iter_audit(args.skills_dir, cache, args.jobs, stats)
+               if is_changed or not args.changed_only)
+    failures = 0
+
+    def removed_records():
+        # Only known once the scan is complete
+        if args.changed_only:
+            for item in cache.pop("removed"):
+                yield {"directory": item, "status": "REMOVED"}
+        else:
+            cache.pop("removed")
+
+    if args.ndjson:
+        for result in records:
+            failures += is_failure(result)
+            emit(result)
+        for result in removed_records():
+            emit(result)
+    elif args.summary:
+        summary = summarize(chain(records, removed_records()))
+        failures = summary["status"].get("FAIL", 0) + summary["status"].get("ERROR", 0)
+        print(json.dumps(summary, indent=2))
+    else:
+        results = list(records)
+        results += list(removed_records())
+        failures = sum(is_failure(result) for result in results)
+        print(json.dumps(results, indent=2))
+
+    if cache_path:
+        save_cache(cache, cache_path)
+
+    exit_code = 1 if args.changed_only and failures else 0
+    if args.timing:
+        print(f"Audited {stats['skills']} skills in {stats['seconds']:.3f}s: "
+              f"{stats['changed']} changed, {stats['cached']} cached, {stats['removed']} removed",
+              file=sys.stderr)
+    return exit_code
 
 if __name__ == "__main__":
-    audit_skills()
+    try:
+        sys.exit(audit_skills())
+    except BrokenPipeError:
+        # Output consumer exited early (`--ndjson | head`)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,36 @@
+"""Tests of the skill auditor, run against skills written to a temporary directory.
+
+    python -m pytest skills/skill-name-auditor/tests
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = SKILL_DIR / "scripts"
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def write_skill(skills_dir: Path, directory: str, name: str, description: str = "Read a file") -> Path:
+    path = skills_dir / directory
+    path.mkdir(exist_ok=True)
+    (path / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n",
+                                   encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def skills_dir(tmp_path) -> Path:
+    """Two compliant skills and one that is not."""
+    skills = tmp_path / "skills"
+    skills.mkdir()
+    write_skill(skills, "file-read-file", "File_Read_File")
+    write_skill(skills, "git-sync-repo", "Git_Sync_Repo", "Push a branch")
+    write_skill(skills, "bad-name", "bad-name", "Delete the temp folder")
+    return skills
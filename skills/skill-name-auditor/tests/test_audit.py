@@ -0,0 +1,115 @@
+"""Cached, incremental audits, --changed-only exit codes and output formats."""
+
+import json
+
+import audit
+from conftest import write_skill
+
+
+def run(capsys, skills_dir, cache_path, *args):
+    code = audit.audit_skills(["--skills-dir", str(skills_dir), "--cache", str(cache_path)] + list(args))
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_scan_reuses_unchanged_skills(skills_dir, tmp_path):
+    cache_path = str(tmp_path / "cache.json")
+    cache = audit.load_cache(cache_path, skills_dir)
+    results, changed, removed, stats = audit.scan(skills_dir, cache, jobs=2)
+    assert [result["directory"] for result in results] == ["bad-name", "file-read-file", "git-sync-repo"]
+    assert [result["asis_compliant"] for result in results] == ["FAIL", "PASS", "PASS"]
+    assert (changed, removed, stats["cached"]) == (["bad-name", "file-read-file", "git-sync-repo"], [], 0)
+    audit.save_cache(cache, cache_path)
+
+    write_skill(skills_dir, "bad-name", "Shell_Execute_Command")
+    (skills_dir / "git-sync-repo" / "SKILL.md").unlink()
+    (skills_dir / "git-sync-repo").rmdir()
+    cache = audit.load_cache(cache_path, skills_dir)
+    again, changed, removed, stats = audit.scan(skills_dir, cache)
+    assert (changed, removed) == (["bad-name"], ["git-sync-repo"])
+    assert (stats["skills"], stats["cached"], stats["changed"], stats["removed"]) == (2, 1, 1, 1)
+    assert again[0]["asis_compliant"] == "PASS" and again[1] == results[1]
+
+
+def test_stale_cache_is_dropped(skills_dir, tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "cache.json")
+    cache = audit.load_cache(cache_path, skills_dir)
+    audit.scan(skills_dir, cache)
+    audit.save_cache(cache, cache_path)
+    assert len(audit.load_cache(cache_path, skills_dir)["skills"]) == 3
+
+    # Other skills directory, result format or namer rules
+    assert audit.load_cache(cache_path, tmp_path)["skills"] == {}
+    monkeypatch.setattr(audit, "CACHE_VERSION", audit.CACHE_VERSION + 1)
+    assert audit.load_cache(cache_path, skills_dir)["skills"] == {}
+    monkeypatch.undo()
+    namer = tmp_path / "name_skill.py"
+    namer.write_text("# other rules\n")
+    monkeypatch.setattr(audit, "NAMER_SCRIPT", str(namer))
+    assert audit.load_cache(cache_path, skills_dir)["skills"] == {}
+    monkeypatch.undo()
+
+    (tmp_path / "cache.json").write_text("{not json")
+    assert audit.load_cache(cache_path, skills_dir)["skills"] == {}
+    assert audit.load_cache(None, skills_dir)["skills"] == {}
+
+
+def test_changed_only_exit_code(skills_dir, tmp_path, capsys):
+    cache_path = tmp_path / "cache.json"
+    code, results = run(capsys, skills_dir, cache_path, "--changed-only")
+    assert code == 1 and len(results) == 3
+
+    # Nothing changed: nothing reported, the known failure does not fail again
+    assert run(capsys, skills_dir, cache_path, "--changed-only") == (0, [])
+
+    write_skill(skills_dir, "bad-name", "Shell_Execute_Command")
+    code, results = run(capsys, skills_dir, cache_path, "--changed-only")
+    assert code == 0 and [(r["directory"], r["asis_compliant"]) for r in results] == [("bad-name", "PASS")]
+
+    write_skill(skills_dir, "new-skill", "new skill")
+    (skills_dir / "file-read-file" / "SKILL.md").unlink()
+    (skills_dir / "file-read-file").rmdir()
+    code, results = run(capsys, skills_dir, cache_path, "--changed-only")
+    assert code == 1
+    assert [(r["directory"], r.get("status")) for r in results] == [("new-skill", None), ("file-read-file", "REMOVED")]
+
+    # Without --changed-only every skill is listed and the exit code is 0
+    code, results = run(capsys, skills_dir, cache_path)
+    assert code == 0 and [r["directory"] for r in results] == ["bad-name", "git-sync-repo", "new-skill"]
+
+
+def test_missing_skill_md(skills_dir, tmp_path, capsys):
+    (skills_dir / "empty").mkdir()
+    code, results = run(capsys, skills_dir, tmp_path / "cache.json", "--no-cache", "--changed-only")
+    assert code == 1
+    assert {"directory": "empty", "status": "ERROR", "message": "Missing SKILL.md"} in results
+    assert not (tmp_path / "cache.json").exists()
+
+
+def test_ndjson(skills_dir, capsys):
+    code = audit.audit_skills(["--skills-dir", str(skills_dir), "--no-cache", "--ndjson"])
+    lines = capsys.readouterr().out.splitlines()
+    assert code == 0
+    assert [json.loads(line)["directory"] for line in lines] == ["bad-name", "file-read-file", "git-sync-repo"]
+    # One compact record per line
+    assert all(json.dumps(json.loads(line)) == line for line in lines)
+
+
+def test_summary(skills_dir, tmp_path, capsys):
+    write_skill(skills_dir, "Not_Kebab", "File_Read_File")
+    (skills_dir / "empty").mkdir()
+    cache_path = tmp_path / "cache.json"
+    code, summary = run(capsys, skills_dir, cache_path, "--summary")
+    assert code == 0
+    assert summary == {
+        "skills": 5,
+        "status": {"FAIL": 1, "PASS": 3, "ERROR": 1},
+        "errors": {"ERR_DIR_NOT_KEBAB": 1, "ERR_NAMESPACE_INVALID": 1, "ERR_SEGMENT_COUNT": 1,
+                   "ERR_SYNTAX_CASE": 1},
+    }
+
+    # Changed skills only, removed ones counted as REMOVED
+    write_skill(skills_dir, "bad-name", "Shell_Execute_Command")
+    (skills_dir / "empty").rmdir()
+    code, summary = run(capsys, skills_dir, cache_path, "--summary", "--changed-only")
+    assert code == 0
+    assert summary == {"skills": 2, "status": {"PASS": 1, "REMOVED": 1}, "errors": {}}
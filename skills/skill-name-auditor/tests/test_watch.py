@@ -0,0 +1,94 @@
+"""Watchers and the re-audit diffs of --watch."""
+
+import errno
+import shutil
+import sys
+
+import pytest
+
+import audit
+from conftest import write_skill
+
+
+def open_inotify(skills_dir):
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux only")
+    try:
+        return audit.InotifyWatcher(str(skills_dir), interval=0.01)
+    except (OSError, AttributeError) as exc:
+        pytest.skip(f"inotify unavailable: {exc}")
+
+
+@pytest.fixture(params=["poll", "inotify"])
+def watcher(request, skills_dir):
+    if request.param == "poll":
+        watcher = audit.PollingWatcher(str(skills_dir), interval=0.01)
+    else:
+        watcher = open_inotify(skills_dir)
+    yield watcher
+    watcher.close()
+
+
+def changes(watcher, timeout=0.5):
+    """Changes seen until none arrive for a short while."""
+    changed = watcher.changes(timeout)
+    while True:
+        more = watcher.changes(0.05)
+        if not more:
+            return changed
+        changed |= more
+
+
+def test_watcher_reports_changed_skills(watcher, skills_dir):
+    assert watcher.changes(0.05) == set()
+
+    write_skill(skills_dir, "bad-name", "Shell_Execute_Command")
+    assert changes(watcher) == {"bad-name"}
+
+    write_skill(skills_dir, "new-skill", "Data_Read_File")
+    assert changes(watcher) == {"new-skill"}
+    # New directories are watched too
+    write_skill(skills_dir, "new-skill", "Data_Search_File")
+    assert changes(watcher) == {"new-skill"}
+
+    shutil.rmtree(skills_dir / "git-sync-repo")
+    assert changes(watcher) == {"git-sync-repo"}
+
+    # Other files and hidden directories are ignored
+    (skills_dir / "file-read-file" / "notes.txt").write_text("x")
+    (skills_dir / ".git").mkdir()
+    assert changes(watcher, 0.2) == set()
+
+
+def test_inotify_falls_back_to_polling(skills_dir, monkeypatch):
+    watcher = open_inotify(skills_dir)
+    # Out of inotify watches for new skill directories
+    monkeypatch.setattr(watcher, "_add_watch", lambda fd, path, mask: -1)
+    monkeypatch.setattr(watcher, "_get_errno", lambda: errno.ENOSPC)
+    try:
+        write_skill(skills_dir, "new-skill", "Data_Read_File")
+        assert "new-skill" in changes(watcher)
+        assert watcher._fd is None
+
+        write_skill(skills_dir, "new-skill", "Data_Search_File")
+        assert changes(watcher) == {"new-skill"}
+    finally:
+        watcher.close()
+
+
+def test_reaudit_diff(skills_dir):
+    cache = audit.load_cache(None, skills_dir)
+    results, _, _, _ = audit.scan(skills_dir, cache)
+    state = {result["directory"]: result for result in results}
+
+    write_skill(skills_dir, "bad-name", "Shell_Execute_Command")
+    write_skill(skills_dir, "new-skill", "Data_Read_File")
+    shutil.rmtree(skills_dir / "git-sync-repo")
+    diff = audit.reaudit(str(skills_dir), {"bad-name", "new-skill", "git-sync-repo", "file-read-file"},
+                         state, cache)
+    assert [result["directory"] for result in diff["added"]] == ["new-skill"]
+    assert diff["removed"] == ["git-sync-repo"]
+    [changed] = diff["changed"]
+    assert changed["directory"] == "bad-name"
+    assert (changed["before"]["asis_compliant"], changed["after"]["asis_compliant"]) == ("FAIL", "PASS")
+    assert sorted(state) == sorted(cache["skills"]) == ["bad-name", "file-read-file", "new-skill"]
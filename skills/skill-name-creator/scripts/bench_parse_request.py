@@ -0,0 +1,119 @@
+"""Benchmark parse_request over synthetic skill descriptions.
+
+Compares the compiled keyword classifiers in name_skill.py with the previous
+substring scan (one ``any(w in text ...)`` chain per label), and counts the
+descriptions where the two disagree:
+
+    python bench_parse_request.py
+    python bench_parse_request.py --count 100000 --repeat 5 --json
+
+Disagreements are expected: the classifiers match keywords at the start of
+words, and short ones ("pr", "git") only as whole words, so "pr" no longer
+matches inside "project" and "file" no longer matches "profile".
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from collections import Counter
+
+from name_skill import (
+    ACTION_KEYWORDS,
+    NAMESPACE_KEYWORDS,
+    QUALIFIER_KEYWORDS,
+    TARGET_KEYWORDS,
+    parse_request,
+)
+
+FILLER = (
+    "the", "a", "all", "from", "to", "into", "for", "with", "in", "current",
+    "project", "digital", "approved", "express", "sheets", "files", "daily",
+    "printers", "shipping", "parameters", "family", "openings", "workset",
+)
+
+
+def substring_parse_request(user_input: str) -> dict:
+    """Previous implementation: ordered substring checks."""
+    text = user_input.lower()
+
+    def first(table, default):
+        for label, keywords in table:
+            if any(w in text for w in keywords):
+                return label
+        return default
+
+    return {
+        "namespace": first(NAMESPACE_KEYWORDS, "Data"),
+        "action": first(ACTION_KEYWORDS, "Read"),
+        "target": first(TARGET_KEYWORDS, "Resource"),
+        "qualifier": first(QUALIFIER_KEYWORDS, None),
+    }
+
+
+def make_descriptions(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    vocabulary = [keyword for table in (NAMESPACE_KEYWORDS, ACTION_KEYWORDS,
+                                        TARGET_KEYWORDS, QUALIFIER_KEYWORDS)
+                  for _, keywords in table for keyword in keywords]
+    descriptions = []
+    for _ in range(count):
+        words = rng.sample(vocabulary, rng.randint(1, 4)) + rng.sample(FILLER, rng.randint(2, 8))
+        rng.shuffle(words)
+        description = " ".join(words)
+        descriptions.append(description.capitalize() if rng.random() < 0.5 else description)
+    return descriptions
+
+
+def measure(parse, descriptions, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for description in descriptions:
+            parse(description)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "best_s": round(best, 4),
+        "median_s": round(statistics.median(timings), 4),
+        "per_second": round(len(descriptions) / best),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000, help="Descriptions to parse (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per implementation (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    descriptions = make_descriptions(args.count)
+    results = {
+        "descriptions": len(descriptions),
+        "substring": measure(substring_parse_request, descriptions, args.repeat),
+        "compiled": measure(parse_request, descriptions, args.repeat),
+    }
+    results["speedup"] = round(results["substring"]["best_s"] / results["compiled"]["best_s"], 2)
+
+    changed = Counter()
+    for description in descriptions:
+        old, new = substring_parse_request(description), parse_request(description)
+        changed.update(field for field in old if old[field] != new[field])
+    results["changed_fields"] = dict(changed)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{results['descriptions']} descriptions, best of {args.repeat}")
+    for name in ("substring", "compiled"):
+        r = results[name]
+        print(f"  {name:<10} {r['best_s']:8.3f}s  (median {r['median_s']:.3f}s)  {r['per_second']:>9}/s")
+    print(f"  speedup    {results['speedup']}x")
+    print(f"  changed    {results['changed_fields'] or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
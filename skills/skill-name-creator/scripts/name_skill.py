@@ -6,6 +6,11 @@ ASIS Skill Namer - Generates ASIS-compliant identifiers and OpenCode skill names
 import re
 import sys
 import json
+import os
+import argparse
+import multiprocessing
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
 
 NAMESPACES_CORE = {"File", "Shell", "Net", "Data", "Logic"}
@@ -39,98 +44,139 @@ VERB_MAP = {
     "know": None,
 }
 
+# Keyword tables for parse_request, in priority order: the first label with a
+# keyword in the request wins, whatever its position in the text.
+NAMESPACE_KEYWORDS = (
+    ("Revit", ("revit", "autodesk")),
+    ("GitHub", ("github", "pr", "pull request", "issue")),
+    ("Git", ("git", "commit", "branch", "repo")),
+    ("Docker", ("docker", "container", "image")),
+    ("AWS", ("aws", "cloud", "lambda", "s3")),
+    ("Chrome", ("chrome", "browser", "web", "page")),
+    ("File", ("file", "directory", "folder", "path")),
+    ("Shell", ("shell", "command", "terminal", "bash", "powershell")),
+    ("Net", ("network", "url", "http", "download", "fetch")),
+)
+
+ACTION_KEYWORDS = (
+    ("Write", ("create", "make", "add", "new")),
+    ("Delete", ("delete", "remove", "clear", "clean")),
+    ("Update", ("update", "change", "modify", "edit")),
+    ("List", ("list", "show", "display", "view")),
+    ("Search", ("search", "find", "grep", "query")),
+    ("Execute", ("execute", "run", "start")),
+    ("Launch", ("launch", "open", "start")),
+    ("Sync", ("sync", "push", "pull", "fetch")),
+    ("Build", ("build", "compile", "make")),
+    ("Deploy", ("deploy", "release", "ship")),
+    ("Connect", ("connect", "auth", "login")),
+    ("Backup", ("backup", "save", "copy")),
+    ("Scan", ("scan", "lint", "check", "validate", "analyze")),
+)
+
+TARGET_KEYWORDS = (
+    ("Skill", ("skill", "tool", "function")),
+    ("File", ("file", "text", "content", "code")),
+    ("Directory", ("folder", "directory", "path")),
+    ("Repo", ("repo", "repository", "branch", "commit")),
+    ("PullRequest", ("pr", "pull request")),
+    ("Issue", ("issue", "ticket")),
+    ("Image", ("image", "photo", "picture")),
+    ("Sheet", ("sheet", "view", "drawing")),
+    ("Cache", ("cache", "temp", "tmp")),
+    ("Model", ("model", "revit", "project")),
+    ("Url", ("url", "link", "web", "page")),
+)
+
+QUALIFIER_KEYWORDS = (
+    ("Json", ("json",)),
+    ("Pdf", ("pdf",)),
+    ("Full", ("full",)),
+    ("Incremental", ("incremental",)),
+)
+
+FIELD_KEYWORDS = (
+    ("namespace", NAMESPACE_KEYWORDS, "Data"),
+    ("action", ACTION_KEYWORDS, "Read"),
+    ("target", TARGET_KEYWORDS, "Resource"),
+    ("qualifier", QUALIFIER_KEYWORDS, None),
+)
+
+# Short keywords that begin many unrelated words ("project", "address",
+# "news") only match these whole words. The others also match the start of a
+# word: "docker" in "Dockerfile", "web" in "webpage".
+WHOLE_WORD_KEYWORDS = {
+    "pr": ("pr", "prs"),
+    "s3": ("s3",),
+    "git": ("git",),
+    "aws": ("aws",),
+    "add": ("add", "adds", "added", "adding"),
+    "new": ("new",),
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Words whose keyword matches are kept, per classifier
+WORD_CACHE_SIZE = 8192
+
+class KeywordClassifier:
+    """First-match classifier for several (label, keywords) tables at once.
+
+    Keywords of ``whole_words`` only match the listed words ("pr" matches
+    "open a PR" but not "project"); the others match any word they
+    start ("files", "filesystem"). A phrase matches when its last word does
+    and the words before it are equal. The matches of the last
+    ``WORD_CACHE_SIZE`` distinct words are cached, so a request mostly costs
+    a cache lookup per word. Per field,
+    the label that comes first in its table wins, whatever its position in
+    the text.
+    """
+
+    def __init__(self, fields, whole_words=WHOLE_WORD_KEYWORDS):
+        self.fields = [(name, [label for label, _ in table], default) for name, table, default in fields]
+        self.words, self.prefixes, self.phrases = {}, {}, {}
+        for name, table, _ in fields:
+            for priority, (_, keywords) in enumerate(table):
+                for keyword in keywords:
+                    *head, last = keyword.split()
+                    forms = whole_words.get(keyword)
+                    if head:
+                        self.phrases.setdefault(head[0], []).append(
+                            (head, last, forms, ((name, priority),)))
+                        continue
+                    for form in forms or [last]:
+                        entries = (self.words if forms else self.prefixes).setdefault(form, {})
+                        entries[name] = min(entries.get(name, priority), priority)
+        # Prefix lengths to cut each word at
+        self.cuts = sorted({len(prefix) for prefix in self.prefixes})
+        self._word_matches = lru_cache(maxsize=WORD_CACHE_SIZE)(self._lookup_word)
+
+    def _lookup_word(self, word):
+        found = [self.words.get(word, {})]
+        found += [self.prefixes.get(word[:cut], {}) for cut in self.cuts if cut <= len(word)]
+        return tuple(entry for entries in found for entry in entries.items())
+
+    def classify(self, text: str) -> dict:
+        tokens = _TOKEN.findall(text.lower())
+        best = {}
+        for i, token in enumerate(tokens):
+            matches = self._word_matches(token)
+            for head, last, forms, entries in self.phrases.get(token, ()):
+                end = i + len(head)
+                if end < len(tokens) and tokens[i:end] == head and (
+                        tokens[end] in forms if forms else tokens[end].startswith(last)):
+                    matches += entries
+            for name, priority in matches:
+                if priority < best.get(name, priority + 1):
+                    best[name] = priority
+        return {name: labels[best[name]] if name in best else default
+                for name, labels, default in self.fields}
+
+CLASSIFIER = KeywordClassifier(FIELD_KEYWORDS)
+
 def parse_request(user_input: str) -> dict:
     """Extract components from user request."""
-    text = user_input.lower()
-
-    namespace = "Data"
-    if any(w in text for w in ["revit", "autodesk"]):
-        namespace = "Revit"
-    elif any(w in text for w in ["github", "pr", "pull request", "issue"]):
-        namespace = "GitHub"
-    elif any(w in text for w in ["git", "commit", "branch", "repo"]):
-        namespace = "Git"
-    elif any(w in text for w in ["docker", "container", "image"]):
-        namespace = "Docker"
-    elif any(w in text for w in ["aws", "cloud", "lambda", "s3"]):
-        namespace = "AWS"
-    elif any(w in text for w in ["chrome", "browser", "web", "page"]):
-        namespace = "Chrome"
-    elif any(w in text for w in ["file", "directory", "folder", "path"]):
-        namespace = "File"
-    elif any(w in text for w in ["shell", "command", "terminal", "bash", "powershell"]):
-        namespace = "Shell"
-    elif any(w in text for w in ["network", "url", "http", "download", "fetch"]):
-        namespace = "Net"
-
-    action = "Read"
-    if any(w in text for w in ["create", "make", "add", "new"]):
-        action = "Write"
-    elif any(w in text for w in ["delete", "remove", "clear", "clean"]):
-        action = "Delete"
-    elif any(w in text for w in ["update", "change", "modify", "edit"]):
-        action = "Update"
-    elif any(w in text for w in ["list", "show", "display", "view"]):
-        action = "List"
-    elif any(w in text for w in ["search", "find", "grep", "query"]):
-        action = "Search"
-    elif any(w in text for w in ["execute", "run", "start"]):
-        action = "Execute"
-    elif any(w in text for w in ["launch", "open", "start"]):
-        action = "Launch"
-    elif any(w in text for w in ["sync", "push", "pull", "fetch"]):
-        action = "Sync"
-    elif any(w in text for w in ["build", "compile", "make"]):
-        action = "Build"
-    elif any(w in text for w in ["deploy", "release", "ship"]):
-        action = "Deploy"
-    elif any(w in text for w in ["connect", "auth", "login"]):
-        action = "Connect"
-    elif any(w in text for w in ["backup", "save", "copy"]):
-        action = "Backup"
-    elif any(w in text for w in ["scan", "lint", "check", "validate", "analyze"]):
-        action = "Scan"
-
-    target = "Resource"
-    if any(w in text for w in ["skill", "tool", "function"]):
-        target = "Skill"
-    elif any(w in text for w in ["file", "text", "content", "code"]):
-        target = "File"
-    elif any(w in text for w in ["folder", "directory", "path"]):
-        target = "Directory"
-    elif any(w in text for w in ["repo", "repository", "branch", "commit"]):
-        target = "Repo"
-    elif any(w in text for w in ["pr", "pull request"]):
-        target = "PullRequest"
-    elif any(w in text for w in ["issue", "ticket"]):
-        target = "Issue"
-    elif any(w in text for w in ["image", "photo", "picture"]):
-        target = "Image"
-    elif any(w in text for w in ["sheet", "view", "drawing"]):
-        target = "Sheet"
-    elif any(w in text for w in ["cache", "temp", "tmp"]):
-        target = "Cache"
-    elif any(w in text for w in ["model", "revit", "project"]):
-        target = "Model"
-    elif any(w in text for w in ["url", "link", "web", "page"]):
-        target = "Url"
-
-    qualifier = None
-    if "json" in text:
-        qualifier = "Json"
-    elif "pdf" in text:
-        qualifier = "Pdf"
-    elif "full" in text:
-        qualifier = "Full"
-    elif "incremental" in text:
-        qualifier = "Incremental"
-
-    return {
-        "namespace": namespace,
-        "action": action,
-        "target": target,
-        "qualifier": qualifier
-    }
+    return CLASSIFIER.classify(user_input)
 
 def build_asis(namespace: str, action: str, target: str, qualifier: Optional[str] = None) -> str:
     """Build ASIS identifier from components."""
@@ -163,42 +209,98 @@ def asis_to_opencode(asis_id: str) -> str:
         parts.extend(tokens)
     return "-".join(parts)
 
-def run_compliance_test(asis_id: str) -> tuple:
-    """Run ASIS compliance test. Returns (PASS/FAIL, errors, warnings)."""
-    errors = []
-    warnings = []
+# Compliance error codes, in the order run_compliance_test reports them
+ERROR_CODES = (
+    "ERR_SYNTAX_CASE",
+    "ERR_SEGMENT_COUNT",
+    "ERR_NAMESPACE_INVALID",
+    "ERR_ACTION_INVALID",
+    "ERR_TARGET_ABSTRACT",
+    "ERR_QUALIFIER_INVALID",
+    "ERR_NON_DETERMINISTIC",
+)
+(ERR_SYNTAX_CASE, ERR_SEGMENT_COUNT, ERR_NAMESPACE_INVALID, ERR_ACTION_INVALID,
+ ERR_TARGET_ABSTRACT, ERR_QUALIFIER_INVALID, ERR_NON_DETERMINISTIC) = (1 << n for n in range(len(ERROR_CODES)))
+
+SYNTAX_RE = re.compile(r"^[A-Z][a-zA-Z0-9]*(?:_[A-Z][a-zA-Z0-9]*)*$")
+QUALIFIER_RE = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
+NON_DETERMINISTIC_RE = re.compile(r"Think|Understand|Improve")
 
-    phase1 = r"^[A-Z][a-zA-Z0-9]*(?:_[A-Z][a-zA-Z0-9]*)*$"
-    if not re.match(phase1, asis_id):
-        errors.append("ERR_SYNTAX_CASE")
+# Identifiers whose compliance result is kept (auditor and bulk naming
+# check the same few thousand identifiers over and over)
+COMPLIANCE_CACHE_SIZE = 8192
+
+@lru_cache(maxsize=COMPLIANCE_CACHE_SIZE)
+def compliance_mask(asis_id: str) -> int:
+    """ASIS compliance errors of an identifier, as a bitmask of ERROR_CODES."""
+    mask = 0
+    if not SYNTAX_RE.match(asis_id):
+        mask |= ERR_SYNTAX_CASE
 
     segments = asis_id.split("_")
     if not (3 <= len(segments) <= 4):
-        errors.append("ERR_SEGMENT_COUNT")
+        mask |= ERR_SEGMENT_COUNT
 
-    namespace = segments[0] if segments else ""
+    namespace = segments[0]
     if namespace and namespace not in NAMESPACES:
-        errors.append("ERR_NAMESPACE_INVALID")
+        mask |= ERR_NAMESPACE_INVALID
+
+    if len(segments) > 1 and segments[1] and segments[1] not in ACTIONS:
+        mask |= ERR_ACTION_INVALID
+
+    if len(segments) > 2 and segments[2] in ABSTRACT_TARGETS:
+        mask |= ERR_TARGET_ABSTRACT
+
+    if len(segments) == 4 and segments[3] and not QUALIFIER_RE.match(segments[3]):
+        mask |= ERR_QUALIFIER_INVALID
+
+    if NON_DETERMINISTIC_RE.search(asis_id):
+        mask |= ERR_NON_DETERMINISTIC
+    return mask
+
+@lru_cache(maxsize=None)
+def _mask_codes(mask: int) -> tuple:
+    return tuple(code for n, code in enumerate(ERROR_CODES) if mask >> n & 1)
+
+def error_codes(mask: int) -> list:
+    """Error codes set in a compliance bitmask."""
+    return list(_mask_codes(mask))
 
-    if len(segments) > 1:
-        action = segments[1]
-        if action and action not in ACTIONS:
-            errors.append("ERR_ACTION_INVALID")
+def run_compliance_test(asis_id: str) -> tuple:
+    """Run ASIS compliance test. Returns (PASS/FAIL, errors, warnings)."""
+    mask = compliance_mask(asis_id)
+    return ("PASS" if not mask else "FAIL", error_codes(mask), [])
 
-    if len(segments) > 2:
-        target = segments[2]
-        if target in ABSTRACT_TARGETS:
-            errors.append("ERR_TARGET_ABSTRACT")
+def run_compliance_many(asis_ids) -> dict:
+    """Run the ASIS compliance test over a whole registry of identifiers.
 
-    if len(segments) == 4:
-        qualifier = segments[3]
-        if qualifier and not re.match(r"^[A-Z][a-zA-Z0-9]*$", qualifier):
-            errors.append("ERR_QUALIFIER_INVALID")
+    Returns a report with one row per identifier, in input order, of 0/1
+    flags for each of the "codes" columns, and the namespace collisions:
+    identifiers listed more than once ("duplicates") and distinct
+    identifiers that map to the same OpenCode skill name ("collisions").
+    """
+    asis_ids = list(asis_ids)
+    codes = range(len(ERROR_CODES))
+    masks = [compliance_mask(asis_id) for asis_id in asis_ids]
 
-    if "Think" in asis_id or "Understand" in asis_id or "Improve" in asis_id:
-        errors.append("ERR_NON_DETERMINISTIC")
+    counts = {}
+    for asis_id in asis_ids:
+        counts[asis_id] = counts.get(asis_id, 0) + 1
+    names = {}
+    for asis_id in counts:
+        names.setdefault(asis_to_opencode(asis_id), []).append(asis_id)
 
-    return ("PASS" if not errors else "FAIL", errors, warnings)
+    failed = sum(1 for mask in masks if mask)
+    return {
+        "codes": list(ERROR_CODES),
+        "identifiers": asis_ids,
+        "matrix": [[mask >> n & 1 for n in codes] for mask in masks],
+        "passed": len(masks) - failed,
+        "failed": failed,
+        "duplicates": {asis_id: count for asis_id, count in counts.items() if count > 1},
+        "collisions": [{"opencode_skill_name": name, "asis_identifiers": ids}
+                       for name, ids in names.items() if len(ids) > 1]
+    }
 
 def generate_name(user_input: str) -> dict:
     """Generate ASIS identifier and OpenCode name from user request."""
@@ -226,23 +328,155 @@ def generate_name(user_input: str) -> dict:
         "notes": notes
     }
 
-if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        user_input = " ".join(sys.argv[1:])
+NO_INPUT_RESULT = {
+    "asis_identifier": "",
+    "opencode_skill_name": "",
+    "folder_path": "",
+    "result": "FAIL",
+    "errors": ["ERR_NO_INPUT"],
+    "warnings": [],
+    "notes": "No input provided"
+}
+
+# Lines named per batch in --jsonl mode, and new descriptions a batch needs
+# before the worker pool is started (small inputs never pay its startup)
+BATCH_SIZE = 5000
+PARALLEL_MIN = 2000
+
+def read_descriptions(lines):
+    """Yield (id, description) for each non-blank JSONL line.
+
+    A line is a JSON object with a "description" (and an optional "id"), a
+    JSON string, or plain text. The id defaults to the line number.
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError:
+            value = line
+        if isinstance(value, dict):
+            yield value.get("id", number), str(value.get("description") or "").strip()
+        elif isinstance(value, str):
+            yield number, value.strip()
+        else:
+            yield number, line
+
+def _name_record(description: str) -> tuple:
+    """generate_name result as (asis_identifier, JSON members without braces)."""
+    result = generate_name(description)
+    return result["asis_identifier"], json.dumps(result)[1:-1]
+
+def name_jsonl(lines, out, jobs: int = 1, examples: int = 5) -> dict:
+    """Name every description in lines, writing one JSON record per line to out.
+
+    Records keep the input order and carry the input "id". Identical
+    descriptions are named once and served from a memo of serialized
+    results. With jobs > 1, batches with many new descriptions are named in
+    a multiprocessing pool.
+
+    Returns a report with line counts and the collisions: identifiers
+    produced by different descriptions, with up to `examples` of them.
+    """
+    memo = {"": (None, json.dumps(NO_INPUT_RESULT)[1:-1])}
+    identifiers = {}
+    lines_named = 0
+    pool = None
+    descriptions = read_descriptions(lines)
+    try:
+        while True:
+            batch = list(islice(descriptions, BATCH_SIZE))
+            if not batch:
+                break
+            new = list(dict.fromkeys(d for _, d in batch if d not in memo))
+            if pool is None and jobs > 1 and len(new) >= PARALLEL_MIN:
+                pool = multiprocessing.Pool(jobs)
+            if pool is not None:
+                named = pool.imap(_name_record, new, chunksize=max(1, len(new) // (jobs * 4)))
+            else:
+                named = map(_name_record, new)
+            for description, record in zip(new, named):
+                memo[description] = record
+                entry = identifiers.setdefault(record[0], [0, []])
+                entry[0] += 1
+                if len(entry[1]) < examples:
+                    entry[1].append(description)
+            out.write("".join(f'{{"id": {json.dumps(record_id)}, {memo[d][1]}}}\n' for record_id, d in batch))
+            out.flush()
+            lines_named += len(batch)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    collisions = sorted(
+        ({"asis_identifier": identifier, "descriptions": count, "examples": sample}
+         for identifier, (count, sample) in identifiers.items() if count > 1),
+        key=lambda item: (-item["descriptions"], item["asis_identifier"]))
+    return {
+        "lines": lines_named,
+        "unique_descriptions": len(memo) - 1,
+        "identifiers": len(identifiers),
+        "collisions": collisions
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate ASIS identifiers and OpenCode skill names.")
+    parser.add_argument("description", nargs="*", help="Capability to name (default: read from stdin)")
+    parser.add_argument("--jsonl", nargs="?", const="-", metavar="FILE",
+                        help="Name one description per line of FILE (default: stdin) and print one "
+                             "JSON record per line, then a collision report to stderr")
+    parser.add_argument("--check", nargs="?", const="-", metavar="FILE",
+                        help="Run the compliance test on every identifier of FILE (default: stdin), "
+                             "one per line, and print the error matrix and namespace collisions")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for --jsonl (0: one per CPU, default: 1)")
+    parser.add_argument("--examples", type=int, default=5,
+                        help="Descriptions listed per collision in the --jsonl report (default: 5)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.jsonl:
+        jobs = args.jobs or os.cpu_count() or 1
+        if args.jsonl == "-":
+            report = name_jsonl(sys.stdin, sys.stdout, jobs, args.examples)
+        else:
+            with open(args.jsonl, encoding="utf-8") as f:
+                report = name_jsonl(f, sys.stdout, jobs, args.examples)
+        print(json.dumps(report, indent=2), file=sys.stderr)
+        return 0
+
+    if args.check:
+        if args.check == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.check, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        report = run_compliance_many(line.strip() for line in lines if line.strip())
+        print(json.dumps(report))
+        return 1 if report["failed"] or report["duplicates"] or report["collisions"] else 0
+
+    if args.description:
+        user_input = " ".join(args.description)
     else:
         user_input = sys.stdin.read().strip()
 
     if not user_input:
-        print(json.dumps({
-            "asis_identifier": "",
-            "opencode_skill_name": "",
-            "folder_path": "",
-            "result": "FAIL",
-            "errors": ["ERR_NO_INPUT"],
-            "warnings": [],
-            "notes": "No input provided"
-        }))
-        sys.exit(1)
+        print(json.dumps(NO_INPUT_RESULT))
+        return 1
 
     result = generate_name(user_input)
     print(json.dumps(result, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # Output consumer exited early (`--jsonl | head`)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,14 @@
+"""Tests of the skill namer.
+
+    python -m pytest skills/skill-name-creator/tests
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
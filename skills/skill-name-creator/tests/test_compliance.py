@@ -0,0 +1,49 @@
+"""The ASIS compliance test, one identifier at a time and over a registry."""
+
+import random
+
+import pytest
+
+from name_skill import ERROR_CODES, run_compliance_many, run_compliance_test
+
+SEGMENTS = ["File", "Revit", "Files", "file", "Read", "ReadAll", "Think", "Data", "Resource",
+            "Json", "Pdf2", "pdf", "", "Sheet", "Improve", "Git", "Sync", "Repo", "Knowledge", "X9"]
+
+
+def random_ids(seed, count=500):
+    rng = random.Random(seed)
+    ids = []
+    for _ in range(count):
+        asis_id = "_".join(rng.choice(SEGMENTS) for _ in range(rng.randint(1, 5)))
+        if rng.random() < 0.1:
+            asis_id = asis_id.replace("_", rng.choice(["-", " ", "__"]))
+        ids.append(asis_id)
+    return ids
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_many_matches_single(seed):
+    asis_ids = random_ids(seed)
+    report = run_compliance_many(asis_ids)
+    results = [run_compliance_test(asis_id) for asis_id in asis_ids]
+    assert report["codes"] == list(ERROR_CODES) and report["identifiers"] == asis_ids
+    assert [[code for code, flag in zip(ERROR_CODES, row) if flag] for row in report["matrix"]] == \
+        [errors for _, errors, _ in results]
+    assert report["passed"] == sum(1 for result, _, _ in results if result == "PASS")
+    assert report["failed"] == sum(1 for result, _, _ in results if result == "FAIL") > 0
+
+
+def test_known_errors():
+    assert run_compliance_test("File_Read_File") == ("PASS", [], [])
+    result, errors, _ = run_compliance_test("Files_Think_Knowledge")
+    assert result == "FAIL"
+    assert set(errors) == {"ERR_NAMESPACE_INVALID", "ERR_ACTION_INVALID", "ERR_TARGET_ABSTRACT",
+                           "ERR_NON_DETERMINISTIC"}
+
+
+def test_duplicates_and_collisions():
+    report = run_compliance_many(["File_Read_File", "Git_Sync_Repo", "File_ReadFile", "File_Read_File"])
+    assert report["duplicates"] == {"File_Read_File": 2}
+    assert report["collisions"] == [
+        {"opencode_skill_name": "file-read-file", "asis_identifiers": ["File_Read_File", "File_ReadFile"]}]
+    assert run_compliance_many([])["matrix"] == []
@@ -0,0 +1,64 @@
+"""Bulk naming of JSONL descriptions."""
+
+import io
+import json
+import multiprocessing
+
+import name_skill
+from name_skill import generate_name, name_jsonl
+
+DESCRIPTIONS = [
+    "build the Dockerfile",
+    "list files in a folder",
+    "open a PR",
+    "read the files in a folder",
+    "sync the git repo",
+]
+
+
+def lines_of(descriptions):
+    return [json.dumps({"id": "d{}".format(n), "description": d}) + "\n" for n, d in enumerate(descriptions)]
+
+
+def run(descriptions, **kwargs):
+    out = io.StringIO()
+    report = name_jsonl(lines_of(descriptions), out, **kwargs)
+    return [json.loads(line) for line in out.getvalue().splitlines()], report
+
+
+def test_records(monkeypatch):
+    named = []
+    name_record = name_skill._name_record
+    monkeypatch.setattr(name_skill, "_name_record", lambda d: named.append(d) or name_record(d))
+    descriptions = DESCRIPTIONS * 3 + [""]
+    records, report = run(descriptions)
+    assert [record["id"] for record in records] == ["d{}".format(n) for n in range(len(descriptions))]
+    assert records[0] == dict(generate_name(DESCRIPTIONS[0]), id="d0")
+    assert records[-1]["errors"] == ["ERR_NO_INPUT"]
+    # Repeated descriptions are named once and served from the memo
+    assert named == DESCRIPTIONS
+    assert (report["lines"], report["unique_descriptions"]) == (16, 5)
+
+
+def test_collisions():
+    descriptions = DESCRIPTIONS + ["list files in a folder", "list all the files"]
+    _, report = run(descriptions, examples=1)
+    assert report["identifiers"] == 5
+    # Identical descriptions are one description
+    assert report["collisions"] == [
+        {"asis_identifier": "File_List_File", "descriptions": 2, "examples": ["list files in a folder"]}]
+
+
+def test_pool_keeps_order(monkeypatch):
+    pools = []
+    pool = multiprocessing.Pool
+    monkeypatch.setattr(multiprocessing, "Pool", lambda jobs: pools.append(jobs) or pool(jobs))
+    monkeypatch.setattr(name_skill, "BATCH_SIZE", 7)
+    monkeypatch.setattr(name_skill, "PARALLEL_MIN", 3)
+    descriptions = ["{} number {}".format(DESCRIPTIONS[n % 5], n) for n in range(40)] + DESCRIPTIONS
+    records, report = run(descriptions, jobs=2)
+    assert pools == [2]
+    assert [record["id"] for record in records] == ["d{}".format(n) for n in range(len(descriptions))]
+    expected, _ = run(descriptions)
+    assert records == expected
+    assert report["unique_descriptions"] == 45
@@ -0,0 +1,36 @@
+"""Keyword classification of skill requests."""
+
+import pytest
+
+from name_skill import CLASSIFIER, WORD_CACHE_SIZE, parse_request
+
+
+@pytest.mark.parametrize("request_text, expected", [
+    # Keywords at the start of compound words
+    ("build the Dockerfile", {"namespace": "Docker", "action": "Build"}),
+    ("parse filesystem entries", {"namespace": "File", "target": "File"}),
+    ("screenshot of the webpage", {"namespace": "Chrome", "target": "Url"}),
+    ("list files in a folder", {"namespace": "File", "action": "List", "target": "File"}),
+    ("open pull requests", {"namespace": "GitHub", "target": "PullRequest"}),
+    # Short keywords only as whole words
+    ("open a PR", {"namespace": "GitHub", "target": "PullRequest"}),
+    ("added two PRs", {"namespace": "GitHub", "action": "Write", "target": "PullRequest"}),
+    ("upload to S3", {"namespace": "AWS"}),
+    ("read the project address", {"namespace": "Data", "action": "Read"}),
+    ("digital news", {"namespace": "Data", "action": "Read"}),
+    # The first label of a table wins, wherever it is in the text
+    ("sync the git repo to github", {"namespace": "GitHub", "action": "Sync", "target": "Repo"}),
+    ("export a pdf", {"qualifier": "Pdf"}),
+    ("nothing to see", {"namespace": "Data", "action": "Read", "target": "Resource", "qualifier": None}),
+])
+def test_parse_request(request_text, expected):
+    result = parse_request(request_text)
+    assert {field: result[field] for field in expected} == expected
+
+
+def test_word_cache_is_bounded():
+    for n in range(WORD_CACHE_SIZE + 10):
+        parse_request("read file{}".format(n))
+    info = CLASSIFIER._word_matches.cache_info()
+    assert info.currsize == info.maxsize == WORD_CACHE_SIZE
+    assert parse_request("read file7")["target"] == "File"